@@ -0,0 +1,78 @@
+"""Micro-benchmark of the per-call overhead of hot database access
+functions (statement construction, compilation, and execution against
+an in-memory SQLite database, so that the Python-side overhead is not
+hidden by network round trips).
+
+Run with "PYTHONPATH=. python benchmarks/database_statements.py".
+
+"""
+import itertools
+import timeit
+import unittest.mock
+import uuid
+
+import sqlalchemy
+import sqlalchemy.orm
+import sqlalchemy.pool
+from pantos.common.blockchains.enums import Blockchain
+
+# The database access module only needs a configuration when accessing
+# the database
+with unittest.mock.patch('pantos.servicenode.configuration.config'):
+    from pantos.servicenode.database import access as database_access
+    from pantos.servicenode.database.enums import TransferStatus
+    from tests.database.conftest import create_embedded_database_models
+
+_NUMBER = 5000
+
+_SENDER_ADDRESS = '0x' + 'a1' * 20
+
+_RECIPIENT_ADDRESS = '0x' + 'b2' * 20
+
+_TOKEN_ADDRESS = '0x' + 'c3' * 20
+
+_HUB_ADDRESS = '0x' + 'd4' * 20
+
+_FORWARDER_ADDRESS = '0x' + 'e5' * 20
+
+_sender_nonces = itertools.count()
+
+
+def _create_transfer() -> int:
+    return database_access.create_transfer(
+        Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, _SENDER_ADDRESS,
+        _RECIPIENT_ADDRESS, _TOKEN_ADDRESS, _TOKEN_ADDRESS, 10**18, 10**16,
+        next(_sender_nonces), 'f6' * 65, _HUB_ADDRESS, _FORWARDER_ADDRESS)
+
+
+def _benchmark(name: str, statement: str) -> None:
+    seconds = timeit.timeit(statement, globals=globals(), number=_NUMBER)
+    print(f'{name:<48}{seconds / _NUMBER * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    sql_engine = sqlalchemy.create_engine('sqlite://',
+                                          poolclass=sqlalchemy.pool.StaticPool)
+    create_embedded_database_models(sql_engine)
+    session_maker = sqlalchemy.orm.sessionmaker(bind=sql_engine)
+    with unittest.mock.patch(
+            'pantos.servicenode.database.access.get_session_maker',
+            return_value=session_maker), unittest.mock.patch(
+                'pantos.servicenode.database.access.get_session',
+                side_effect=session_maker), unittest.mock.patch(
+                    'pantos.servicenode.database.access.'
+                    'get_replica_session_maker', return_value=None):
+        internal_transfer_id = _create_transfer()
+        task_id = uuid.uuid4()
+        database_access.update_transfer_task_id(internal_transfer_id, task_id)
+        database_access.update_transfer_status(internal_transfer_id,
+                                               TransferStatus.SUBMITTED)
+        _benchmark('create_transfer', '_create_transfer()')
+        _benchmark(
+            'update_transfer_nonce',
+            'database_access.update_transfer_nonce(internal_transfer_id, '
+            'Blockchain.ETHEREUM, 0)')
+        _benchmark('read_transfer_by_task_id',
+                   'database_access.read_transfer_by_task_id(task_id)')
+        transfer = database_access.read_transfer_by_task_id(task_id)
+        assert transfer is not None and transfer.id == internal_transfer_id
@@ -0,0 +1,61 @@
+"""Micro-benchmark of the JSON serialization of the transfer status and
+bids responses.
+
+Run with "PYTHONPATH=. python benchmarks/json_responses.py".
+
+"""
+import json
+import timeit
+import unittest.mock
+import uuid
+
+# The REST API module only needs a configuration when handling requests
+with unittest.mock.patch('pantos.servicenode.configuration.config'):
+    from pantos.servicenode.restapi import _encode_json
+    from pantos.servicenode.restapi import _TransferStatusResponseSchema
+
+_NUMBER = 100000
+
+_BIDS_COUNT = 10
+
+_TRANSFER_STATUS = {
+    'task_id': str(uuid.uuid4()),
+    'source_blockchain_id': 1,
+    'destination_blockchain_id': 3,
+    'sender_address': '0x' + 'a1' * 20,
+    'recipient_address': '0x' + 'b2' * 20,
+    'source_token_address': '0x' + 'c3' * 20,
+    'destination_token_address': '0x' + 'd4' * 20,
+    'amount': 10**18,
+    'fee': 10**16,
+    'status': 'confirmed',
+    'transfer_id': 123456,
+    'transaction_id': '0x' + 'e5' * 32
+}
+
+_BIDS = [{
+    'fee': 10**16 + i,
+    'execution_time': 600 + i,
+    'valid_until': 1700000000 + i,
+    'signature': 'f6' * 64
+} for i in range(_BIDS_COUNT)]
+
+
+def _benchmark(name: str, statement: str) -> None:
+    seconds = timeit.timeit(statement, globals=globals(), number=_NUMBER)
+    print(f'{name:<48}{seconds / _NUMBER * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    schema = _TransferStatusResponseSchema()
+    encoded_transfer_status = _encode_json(_TRANSFER_STATUS)
+    _benchmark('transfer status: marshmallow dump + json.dumps',
+               'json.dumps(schema.dump(_TRANSFER_STATUS)).encode()')
+    _benchmark('transfer status: pre-shaped dict + encoder',
+               '_encode_json(_TRANSFER_STATUS)')
+    _benchmark('transfer status: cached encoded response',
+               'encoded_transfer_status')
+    _benchmark(f'bids ({_BIDS_COUNT}): json.dumps',
+               'json.dumps(_BIDS).encode()')
+    _benchmark(f'bids ({_BIDS_COUNT}): encoder', '_encode_json(_BIDS)')
+    assert json.loads(encoded_transfer_status) == schema.dump(_TRANSFER_STATUS)
@@ -73,9 +73,28 @@ if port < 1024:
                   file=sys.stderr)
     port = default_port
 
+# size the worker processes based on the CPU count if not configured
+workers = application_config['workers']
+if workers == 0:
+    workers = 2 * (os.cpu_count() or 1) + 1
+worker_class = application_config['worker_class']
+threads = application_config['threads']
+# sync workers are killed if a request (e.g. a transfers export) takes
+# longer than the timeout, gthread workers only if they are unresponsive
+timeout = application_config['timeout']
+print(f'Using {workers} {worker_class} workers with {threads} threads each')
+
 # build the port command (along with the ssl certificate info if requested)
-gunicorn_command = (f"python -m gunicorn --bind {host}:{port} --workers 1 "
-                    "pantos.servicenode.application:create_application()")
+# the application is preloaded so that the startup work (e.g. database
+# migrations and registration updates) is done only once by the master
+# process; the worker processes are reinitialized after forking by the
+# hooks of the Gunicorn configuration module
+gunicorn_command = (
+    f"python -m gunicorn --bind {host}:{port} --workers {workers} "
+    f"--worker-class {worker_class} --threads {threads} "
+    f"--timeout {timeout} --preload "
+    "--config python:pantos.servicenode.gunicorn "
+    "pantos.servicenode.application:create_application()")
 if ssl_certificate:
     gunicorn_command += (
         f" --certfile {ssl_certificate} --keyfile {ssl_private_key} ")
@@ -87,6 +106,9 @@ server_run_command = ['runuser', '-u', USER_NAME, '--'
 
 if os.getenv('DEV_MODE', False) == 'true':
     print('Running in development mode')
+    # reloading the application code requires it to be loaded by the
+    # worker processes
+    server_run_command.remove('--preload')
     server_run_command = server_run_command + [
         '--reload', '--log-level', 'debug'
     ]
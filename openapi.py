@@ -10,8 +10,13 @@ from flasgger import Swagger
 
 from pantos.servicenode.restapi import _BidSchema
 from pantos.servicenode.restapi import _BidsSchema
+from pantos.servicenode.restapi import _StatsResponseSchema
+from pantos.servicenode.restapi import _StatsSchema
 from pantos.servicenode.restapi import _TransferResponseSchema
 from pantos.servicenode.restapi import _TransferSchema
+from pantos.servicenode.restapi import _TransfersExportSchema
+from pantos.servicenode.restapi import _TransfersResponseSchema
+from pantos.servicenode.restapi import _TransfersSchema
 from pantos.servicenode.restapi import _TransferStatusResponseSchema
 from pantos.servicenode.restapi import _TransferStatusSchema
 from pantos.servicenode.restapi import flask_app
@@ -27,7 +32,9 @@ spec = APISpec("Pantos Service Node APISpec", '1.0', "3.0.2", plugins=plugins)
 template = spec.to_flasgger(
     flask_app, definitions=[
         _BidSchema, _BidsSchema, _TransferSchema, _TransferResponseSchema,
-        _TransferStatusSchema, _TransferStatusResponseSchema
+        _TransferStatusSchema, _TransferStatusResponseSchema, _TransfersSchema,
+        _TransfersResponseSchema, _TransfersExportSchema, _StatsSchema,
+        _StatsResponseSchema
     ])
 
 swagger = Swagger(flask_app, template=template, parse=True)
@@ -1,3 +1,3 @@
 #! /bin/sh
 
-celery -A pantos.servicenode worker -l INFO -n pantos.servicenode -Q transfers,bids,transactions
+celery -A pantos.servicenode worker -l INFO -n pantos.servicenode -Q transfers,bids,transactions,maintenance
@@ -7,6 +7,7 @@ import sys
 
 import flask
 import semantic_version  # type: ignore
+import werkzeug.middleware.proxy_fix
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.logging import LogFile
 from pantos.common.logging import LogFormat
@@ -17,10 +18,13 @@ from pantos.servicenode.blockchains.factory import get_blockchain_client
 from pantos.servicenode.blockchains.factory import \
     initialize_blockchain_clients
 from pantos.servicenode.business.node import NodeInteractor
+from pantos.servicenode.business.ratelimits import initialize_token_buckets
 from pantos.servicenode.configuration import config
 from pantos.servicenode.configuration import get_blockchain_config
 from pantos.servicenode.configuration import get_signer_config
 from pantos.servicenode.configuration import load_config
+from pantos.servicenode.database import get_engine
+from pantos.servicenode.database import get_replica_engine
 from pantos.servicenode.database import \
     initialize_package as initialize_database_package
 from pantos.servicenode.plugins import initialize_plugins
@@ -41,6 +45,18 @@ def create_application() -> flask.Flask:
     initialize_plugins(start_worker=False)
     # Imported here to prevent a circular import
     from pantos.servicenode.restapi import flask_app
+    flask_app.config['MAX_CONTENT_LENGTH'] = config['application'][
+        'max_request_body_size']
+    trusted_proxy_count = config['application']['trusted_proxy_count']
+    if trusted_proxy_count > 0:
+        # The client addresses (e.g. for rate limiting) are taken from
+        # the X-Forwarded-For headers set by the trusted proxies
+        wsgi_app = werkzeug.middleware.proxy_fix.ProxyFix(
+            flask_app.wsgi_app, x_for=trusted_proxy_count)
+        flask_app.wsgi_app = wsgi_app  # type: ignore
+    # Created before the web server's worker processes are forked, so
+    # that the rate limits apply across all of them
+    initialize_token_buckets()
     return flask_app
 
 
@@ -95,6 +111,33 @@ def initialize_application(is_flask_app: bool = False) -> None:
     check_protocol_version_compatibility()
 
 
+def initialize_worker_process() -> None:
+    """Initialize a web server worker process after it has been forked
+    from the master process that created the service node application.
+
+    """
+    # Database connections must not be shared across processes; the
+    # connections of the master process are left untouched
+    try:
+        get_engine().dispose(close=False)
+        replica_engine = get_replica_engine()
+        if replica_engine is not None:
+            replica_engine.dispose(close=False)
+    except Exception:
+        _logger.critical('unable to reset the database connection pool',
+                         exc_info=True)
+        sys.exit(1)
+    # The blockchain clients hold connections to the blockchain nodes
+    try:
+        initialize_blockchain_clients()
+    except Exception:
+        _logger.critical('unable to initialize the blockchain clients',
+                         exc_info=True)
+        sys.exit(1)
+    # The signer only holds the in-memory private key and can therefore
+    # be inherited from the master process
+
+
 def check_protocol_version_compatibility() -> None:
     try:
         check_hub_contract = (semantic_version.Version(config['protocol'])
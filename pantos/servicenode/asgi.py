@@ -0,0 +1,184 @@
+"""Provides the Pantos service node application for deployments on
+ASGI-compliant web servers (e.g. "uvicorn
+pantos.servicenode.asgi:application").
+
+Client connections are held by the server's event loop, so a single
+process can keep many (idle or slow) connections open. Requests to the
+REST API endpoints are handled by the same resources, schemas and
+interactors as for WSGI deployments, adapted by asgiref's WSGI-to-ASGI
+wrapper. Each request is handled in a thread of the event loop's
+default executor, so that requests of the same process are handled
+concurrently.
+Response bodies are streamed to the client chunk by chunk. Liveness
+requests are answered directly on the event loop.
+
+"""
+import asyncio
+import logging
+import typing
+
+import asgiref.sync
+import asgiref.wsgi
+import flask
+
+from pantos.servicenode.application import create_application
+from pantos.servicenode.configuration import config
+
+_HEALTH_LIVE_PATH: typing.Final[str] = '/health/live'
+"""Path of the liveness endpoint."""
+
+_flask_app: typing.Optional[flask.Flask] = None
+"""The service node application (created on startup)."""
+
+_flask_app_lock: typing.Optional[asyncio.Lock] = None
+"""Lock for creating the service node application only once."""
+
+_logger = logging.getLogger(__name__)
+"""Logger for this module."""
+
+_Scope = typing.Dict[str, typing.Any]
+_Message = typing.Dict[str, typing.Any]
+_Receive = typing.Callable[[], typing.Awaitable[_Message]]
+_Send = typing.Callable[[_Message], typing.Awaitable[None]]
+_Headers = typing.List[typing.Tuple[bytes, bytes]]
+
+
+async def application(scope: _Scope, receive: _Receive, send: _Send) -> None:
+    """ASGI application of the service node.
+
+    Parameters
+    ----------
+    scope : dict
+        The connection scope.
+    receive : callable
+        Awaitable for receiving the next event message.
+    send : callable
+        Awaitable for sending an event message.
+
+    """
+    if scope['type'] == 'lifespan':
+        await _handle_lifespan(receive, send)
+    elif scope['type'] == 'http':
+        await _handle_http(scope, receive, send)
+    else:
+        raise NotImplementedError(
+            f'unsupported ASGI scope type {scope["type"]}')
+
+
+async def _handle_lifespan(receive: _Receive, send: _Send) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                await _get_flask_app()
+            except BaseException:
+                _logger.critical('unable to create the application',
+                                 exc_info=True)
+                await send({
+                    'type': 'lifespan.startup.failed',
+                    'message': 'unable to create the application'
+                })
+                return
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def _handle_http(scope: _Scope, receive: _Receive, send: _Send) -> None:
+    if scope['method'] == 'GET' and scope['path'] == _HEALTH_LIVE_PATH:
+        # Same response as the Flask resource, without occupying a
+        # thread
+        await _send_response(send, 200,
+                             [(b'content-type', b'application/json')],
+                             b'null\n')
+        return
+    flask_app = await _get_flask_app()
+    # The request body is read completely before the request is handled
+    # (as by any WSGI server), so its size must be bounded
+    body = await _read_body(scope, receive,
+                            config['application']['max_request_body_size'])
+    if body is None:
+        await _send_response(send, 413,
+                             [(b'content-type', b'application/json')],
+                             b'{"message":"request body too large"}\n')
+        return
+    # The WSGI environment needs the length of the (possibly chunked)
+    # request body
+    headers = [(name, value) for name, value in scope.get('headers', [])
+               if name.lower() != b'content-length']
+    headers.append((b'content-length', str(len(body)).encode()))
+    wsgi_application = _WsgiToAsgiInstance(flask_app)
+    await wsgi_application(scope | {'headers': headers},
+                           _create_receive(body, receive), send)
+
+
+class _WsgiToAsgiInstance(asgiref.wsgi.WsgiToAsgiInstance):
+    """asgiref's wrapper runs the WSGI application in thread-sensitive
+    mode, i.e. all requests of a process in a single shared thread. The
+    requests are run in the threads of the default executor instead
+    (with the response still streamed chunk by chunk).
+
+    """
+    async def run_wsgi_app(self, body: typing.BinaryIO) -> None:
+        run_wsgi_app = vars(asgiref.wsgi.WsgiToAsgiInstance)['run_wsgi_app']
+        await asgiref.sync.sync_to_async(run_wsgi_app.func,
+                                         thread_sensitive=False)(self, body)
+
+
+async def _get_flask_app() -> flask.Flask:
+    global _flask_app
+    global _flask_app_lock
+    if _flask_app is None:
+        if _flask_app_lock is None:
+            _flask_app_lock = asyncio.Lock()
+        async with _flask_app_lock:
+            if _flask_app is None:
+                _flask_app = await asyncio.to_thread(create_application)
+    return _flask_app
+
+
+async def _read_body(scope: _Scope, receive: _Receive,
+                     max_body_size: int) -> typing.Optional[bytes]:
+    for name, value in scope.get('headers', []):
+        if (name.lower() == b'content-length' and value.isdigit()
+                and int(value) > max_body_size):
+            return None
+    chunks = []
+    body_size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunk = message.get('body', b'')
+        body_size += len(chunk)
+        if body_size > max_body_size:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            break
+    return b''.join(chunks)
+
+
+def _create_receive(body: bytes, receive: _Receive) -> _Receive:
+    body_received = False
+
+    async def receive_body() -> _Message:
+        nonlocal body_received
+        if body_received:
+            # Later messages (e.g. disconnects) come from the server
+            return await receive()
+        body_received = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return receive_body
+
+
+async def _send_response(send: _Send, status_code: int, headers: _Headers,
+                         body: bytes) -> None:
+    await send({
+        'type': 'http.response.start',
+        'status': status_code,
+        'headers': headers + [(b'content-length', str(len(body)).encode())]
+    })
+    await send({'type': 'http.response.body', 'body': body})
@@ -215,6 +215,80 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    @dataclasses.dataclass
+    class TransferSignatureVerificationRequest:
+        """Request data for verifying a sender's token transfer
+        signature locally (i.e. without communicating with a blockchain
+        node).
+
+        Attributes
+        ----------
+        destination_blockchain : Blockchain
+            The token transfer's destination blockchain.
+        sender_address : str
+            The sender's address on the source blockchain.
+        recipient_address : str
+            The recipient's address on the destination blockchain.
+        source_token_address : str
+            The transferred token's address on the source blockchain.
+        destination_token_address : str
+            The transferred token's address on the destination
+            blockchain.
+        amount : int
+            The transferred token amount (in 10^-d units, where d is the
+            token's number of decimals).
+        fee : int
+            The fee in 10^-8 PAN a user has to pay for the token
+            transfer.
+        sender_nonce : int
+            The unique nonce of the sender for the token transfer on the
+            source blockchain.
+        valid_until : int
+            The timestamp until when the token transfer is valid on the
+            source blockchain (in seconds since the epoch).
+        signature : str
+            The sender's token transfer signature.
+
+        """
+        destination_blockchain: Blockchain
+        sender_address: str
+        recipient_address: str
+        source_token_address: str
+        destination_token_address: str
+        amount: int
+        fee: int
+        sender_nonce: int
+        valid_until: int
+        signature: str
+
+    @abc.abstractmethod
+    def is_valid_transfer_signature(
+            self, request: TransferSignatureVerificationRequest) -> bool:
+        """Determine if a sender's token transfer signature is valid,
+        i.e. if it has been created by the sender for a transfer to be
+        submitted by this service node. The check is performed locally
+        and is equivalent to the signature verification done by the
+        Pantos Forwarder contract.
+
+        Parameters
+        ----------
+        request : TransferSignatureVerificationRequest
+            The request data.
+
+        Returns
+        -------
+        bool
+            True if the signature has been created by the sender for
+            the given token transfer, else False.
+
+        Raises
+        ------
+        BlockchainClientError
+            If the signature cannot be verified.
+
+        """
+        pass  # pragma: no cover
+
     @dataclasses.dataclass
     class ExternalTokenRecordRequest:
         """Request data for reading an external token record.
@@ -6,6 +6,7 @@ import logging
 import typing
 import uuid
 
+import eth_account.messages
 import semantic_version  # type: ignore
 import web3
 import web3.contract.contract
@@ -48,6 +49,15 @@ _HUB_UPDATE_SERVICE_NODE_URL_GAS = 250000
 _TOKEN_APPROVE_FUNCTION_SELECTOR = '0x095ea7b3'
 _TOKEN_APPROVE_GAS = 100000
 
+_TRANSFER_MESSAGE_TYPES = [
+    'uint256', 'address', 'address', 'address', 'uint256', 'address',
+    'uint256', 'uint256', 'uint256', 'address', 'address', 'address'
+]
+_TRANSFER_FROM_MESSAGE_TYPES = [
+    'uint256', 'uint256', 'address', 'string', 'address', 'string', 'uint256',
+    'address', 'uint256', 'uint256', 'uint256', 'address', 'address', 'address'
+]
+
 _INSUFFICIENT_BALANCE_ERROR = 'PantosHub: insufficient balance of sender'
 _INVALID_SIGNATURE_ERROR = 'PantosForwarder: invalid signature'
 
@@ -110,6 +120,27 @@ class EthereumClient(BlockchainClient):
         is_zero_address = int(recipient_address, 0) == 0
         return not is_zero_address
 
+    def is_valid_transfer_signature(
+            self,
+            request: BlockchainClient.TransferSignatureVerificationRequest) \
+            -> bool:
+        # Docstring inherited
+        try:
+            message = self.__create_transfer_message(request)
+        except Exception:
+            raise self._create_error('unable to verify a transfer signature',
+                                     request=request)
+        try:
+            signer_address = eth_account.Account.recover_message(
+                message, signature=request.signature)
+        except Exception:
+            # A malformed signature can never be valid
+            _logger.warning('malformed transfer signature',
+                            extra=vars(request), exc_info=True)
+            return False
+        return signer_address == web3.Web3.to_checksum_address(
+            request.sender_address)
+
     def read_external_token_record(
             self, request: BlockchainClient.ExternalTokenRecordRequest) \
             -> BlockchainClient.ExternalTokenRecordResponse:
@@ -471,6 +502,45 @@ class EthereumClient(BlockchainClient):
         provider_timeout = self._get_config()['provider_timeout']
         return self._get_utilities().create_node_connections(provider_timeout)
 
+    def __create_transfer_message(
+            self,
+            request: BlockchainClient.TransferSignatureVerificationRequest) \
+            -> eth_account.messages.SignableMessage:
+        # Same message as the one verified by the Pantos Forwarder
+        # contract (the service node, Pantos Hub, Pantos Forwarder, and
+        # PAN token addresses are part of the signed message)
+        to_checksum_address = web3.Web3.to_checksum_address
+        sender_address = to_checksum_address(request.sender_address)
+        source_token_address = to_checksum_address(
+            request.source_token_address)
+        service_node_address = to_checksum_address(self.__address)
+        contract_addresses = [
+            to_checksum_address(self._get_config()['hub']),
+            to_checksum_address(self._get_config()['forwarder']),
+            to_checksum_address(self._get_config()['pan_token'])
+        ]
+        if request.destination_blockchain is self.get_blockchain():
+            abi_types = _TRANSFER_MESSAGE_TYPES
+            values = [
+                self.get_blockchain().value, sender_address,
+                to_checksum_address(request.recipient_address),
+                source_token_address, request.amount, service_node_address,
+                request.fee, request.sender_nonce, request.valid_until
+            ]
+        else:
+            abi_types = _TRANSFER_FROM_MESSAGE_TYPES
+            values = [
+                self.get_blockchain().value,
+                request.destination_blockchain.value, sender_address,
+                request.recipient_address, source_token_address,
+                request.destination_token_address, request.amount,
+                service_node_address, request.fee, request.sender_nonce,
+                request.valid_until
+            ]
+        values += contract_addresses
+        message_hash = web3.Web3.solidity_keccak(abi_types, values)
+        return eth_account.messages.encode_defunct(primitive=message_hash)
+
     def __get_nonce(self, node_connections: NodeConnections,
                     internal_transfer_id: int) -> int:
         transaction_count = node_connections.eth.get_transaction_count(
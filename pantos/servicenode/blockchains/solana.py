@@ -49,6 +49,13 @@ class SolanaClient(BlockchainClient):
         # Docstring inherited
         raise NotImplementedError  # pragma: no cover
 
+    def is_valid_transfer_signature(
+            self,
+            request: BlockchainClient.TransferSignatureVerificationRequest) \
+            -> bool:
+        # Docstring inherited
+        raise NotImplementedError  # pragma: no cover
+
     def read_external_token_record(
             self, request: BlockchainClient.ExternalTokenRecordRequest) \
             -> BlockchainClient.ExternalTokenRecordResponse:
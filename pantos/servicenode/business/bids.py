@@ -1,15 +1,44 @@
 """Business logic for managing service node bids.
 
 """
+import collections.abc
+import dataclasses
 import logging
+import threading
+import time
+import types
+import typing
 
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.signer import get_signer
 
 from pantos.servicenode.business.base import Interactor
 from pantos.servicenode.business.base import InteractorError
+from pantos.servicenode.configuration import config
 from pantos.servicenode.configuration import get_signer_config
 from pantos.servicenode.database import access as database_access
+from pantos.servicenode.database.notifications import BIDS_NOTIFICATION_CHANNEL
+from pantos.servicenode.database.notifications import NotificationListener
+
+_SignedBid = dict[str, int | str]
+
+
+@dataclasses.dataclass(frozen=True)
+class _BidsSnapshot:
+    version: int
+    bids: collections.abc.Mapping[tuple[int, int],
+                                  tuple[collections.abc.Mapping[str,
+                                                                int | str],
+                                        ...]]
+
+
+_bids_snapshot: typing.Optional[_BidsSnapshot] = None
+"""Immutable in-memory snapshot of the signed bids of all source and
+destination blockchains (replaced as a whole whenever the bids
+version changes)."""
+
+_bids_snapshot_lock = threading.Lock()
+"""Lock for loading the first bids snapshot of the current process."""
 
 _logger = logging.getLogger(__name__)
 
@@ -34,7 +63,9 @@ class BidInteractor(Interactor):
             self, source_blockchain_id: int,
             destination_blockchain_id: int) -> list[dict[str, int | str]]:
         """Get the current bids for a given source and destination
-        blockchain.
+        blockchain. Unless disabled, the signed bids are served from an
+        in-memory snapshot of the process, which is refreshed when the
+        bids change.
 
         Parameters
         ----------
@@ -55,6 +86,12 @@ class BidInteractor(Interactor):
 
         """
         try:
+            if config['application']['bids_snapshot_refresh_interval'] > 0:
+                bids_snapshot = _get_bids_snapshot()
+                return [
+                    dict(signed_bid) for signed_bid in bids_snapshot.bids.get((
+                        source_blockchain_id, destination_blockchain_id), ())
+                ]
             _logger.info(
                 'reading bids from database', extra={
                     'source_blockchain': Blockchain(source_blockchain_id),
@@ -63,26 +100,86 @@ class BidInteractor(Interactor):
                 })
             raw_bids = database_access.read_bids(source_blockchain_id,
                                                  destination_blockchain_id)
-            bids = []
-            signer_config = get_signer_config()
-            signer = get_signer(signer_config['pem'],
-                                signer_config['pem_password'])
-            for bid in raw_bids:
-                bid_message = signer.build_message('', int(bid.fee),
-                                                   int(bid.valid_until),
-                                                   source_blockchain_id,
-                                                   destination_blockchain_id,
-                                                   int(bid.execution_time))
-                signature = signer.sign_message(bid_message)
-                bids.append({
-                    'fee': int(bid.fee),
-                    'execution_time': int(bid.execution_time),
-                    'valid_until': int(bid.valid_until),
-                    'signature': signature
-                })
+            return list(_sign_bids(raw_bids))
         except Exception:
             raise self._create_error(
                 'unable to get the current bids',
                 source_blockchain_id=source_blockchain_id,
                 destination_blockchain_id=destination_blockchain_id)
-        return bids
+
+
+def _get_bids_snapshot() -> _BidsSnapshot:
+    if _bids_snapshot is None:
+        with _bids_snapshot_lock:
+            if _bids_snapshot is None:
+                _refresh_bids_snapshot()
+                # Started lazily so that each (forked) web server
+                # process has its own refresher thread
+                threading.Thread(
+                    target=_refresh_bids_snapshot_continuously,
+                    args=(config['application']
+                          ['bids_snapshot_refresh_interval'], ),
+                    name='bids-snapshot-refresher', daemon=True).start()
+    assert _bids_snapshot is not None
+    return _bids_snapshot
+
+
+def _refresh_bids_snapshot() -> None:
+    global _bids_snapshot
+    if (_bids_snapshot is not None
+            and database_access.read_bids_version() == _bids_snapshot.version):
+        return
+    version, raw_bids = database_access.read_bids_snapshot()
+    bids: dict[tuple[int, int], list[collections.abc.Mapping[str,
+                                                             int | str]]] = {}
+    for raw_bid, signed_bid in zip(raw_bids, _sign_bids(raw_bids)):
+        bids.setdefault((int(raw_bid.source_blockchain_id),
+                         int(raw_bid.destination_blockchain_id)),
+                        []).append(types.MappingProxyType(signed_bid))
+    # Readers either see the old or the new snapshot as a whole
+    _bids_snapshot = _BidsSnapshot(
+        version,
+        types.MappingProxyType({
+            blockchain_ids: tuple(signed_bids)
+            for blockchain_ids, signed_bids in bids.items()
+        }))
+    _logger.info('bids snapshot loaded', extra={
+        'version': version,
+        'bids': len(raw_bids)
+    })
+
+
+def _refresh_bids_snapshot_continuously(refresh_interval: float) -> None:
+    # The snapshot is refreshed whenever a change of the bids is
+    # notified, and periodically in case a notification is missed
+    listener = NotificationListener(BIDS_NOTIFICATION_CHANNEL)
+    while True:
+        try:
+            listener.wait(refresh_interval)
+        except Exception:
+            _logger.warning('unable to listen for bid changes', exc_info=True)
+            time.sleep(refresh_interval)
+        try:
+            _refresh_bids_snapshot()
+        except Exception:
+            _logger.error('unable to refresh the bids snapshot', exc_info=True)
+
+
+def _sign_bids(
+    raw_bids: collections.abc.Sequence[typing.Any]
+) -> collections.abc.Iterator[_SignedBid]:
+    signer_config = get_signer_config()
+    signer = get_signer(signer_config['pem'], signer_config['pem_password'])
+    for bid in raw_bids:
+        bid_message = signer.build_message('', int(bid.fee),
+                                           int(bid.valid_until),
+                                           int(bid.source_blockchain_id),
+                                           int(bid.destination_blockchain_id),
+                                           int(bid.execution_time))
+        signature = signer.sign_message(bid_message)
+        yield {
+            'fee': int(bid.fee),
+            'execution_time': int(bid.execution_time),
+            'valid_until': int(bid.valid_until),
+            'signature': signature
+        }
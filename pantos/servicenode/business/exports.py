@@ -0,0 +1,179 @@
+"""Business logic for exporting the transfer history (e.g. for
+accounting).
+
+"""
+import csv
+import dataclasses
+import datetime
+import enum
+import io
+import json
+import typing
+
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.base import Interactor
+from pantos.servicenode.business.base import InteractorError
+from pantos.servicenode.database import access as database_access
+from pantos.servicenode.database.enums import TransferStatus
+
+_EXPORT_BATCH_SIZE: typing.Final[int] = 1000
+"""Number of transfers fetched from the database and emitted as one
+chunk of an export."""
+
+EXPORT_FIELD_NAMES: typing.Final[tuple[str, ...]] = (
+    'task_id', 'source_blockchain_id', 'destination_blockchain_id',
+    'sender_address', 'recipient_address', 'source_token_address',
+    'destination_token_address', 'amount', 'fee', 'sender_nonce',
+    'hub_address', 'forwarder_address', 'transfer_id', 'transaction_id',
+    'status', 'created', 'updated')
+"""Names of the fields of an exported transfer (in the order of the CSV
+columns)."""
+
+
+class ExportFormat(enum.Enum):
+    """Enumeration of the supported formats of transfer exports.
+
+    """
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+
+class ExportInteractorError(InteractorError):
+    """Exception class for all export interactor errors.
+
+    """
+    pass
+
+
+class ExportInteractor(Interactor):
+    """Interactor for exporting the transfer history.
+
+    """
+    @dataclasses.dataclass
+    class ExportTransfersRequest:
+        """Request data for exporting token transfers.
+
+        Attributes
+        ----------
+        export_format : ExportFormat
+            The format of the export.
+        created_from : datetime.datetime, optional
+            Only token transfers accepted at or after this point in
+            time are exported (no lower bound if not given).
+        created_until : datetime.datetime, optional
+            Only token transfers accepted before this point in time
+            are exported (no upper bound if not given).
+        source_blockchain : Blockchain, optional
+            The source blockchain of the token transfers (any
+            blockchain if not given).
+        destination_blockchain : Blockchain, optional
+            The destination blockchain of the token transfers (any
+            blockchain if not given).
+
+        """
+        export_format: ExportFormat
+        created_from: typing.Optional[datetime.datetime] = None
+        created_until: typing.Optional[datetime.datetime] = None
+        source_blockchain: typing.Optional[Blockchain] = None
+        destination_blockchain: typing.Optional[Blockchain] = None
+
+    @classmethod
+    def get_error_class(cls) -> type[InteractorError]:
+        # Docstring inherited
+        return ExportInteractorError
+
+    def export_transfers(
+            self, request: ExportTransfersRequest
+    ) -> typing.Generator[str, None, None]:
+        """Export the archived and the non-archived token transfers.
+        The export is generated lazily in chunks of a fixed number of
+        token transfers (the first chunk of a CSV export starting with
+        the header line), so that exporting any number of token
+        transfers requires constant memory.
+
+        Parameters
+        ----------
+        request : ExportTransfersRequest
+            The request data for exporting token transfers.
+
+        Returns
+        -------
+        generator of str
+            The chunks of the export (the generator can be closed to
+            stop the export early).
+
+        Raises
+        ------
+        ExportInteractorError
+            If the token transfers cannot be exported (raised while
+            iterating over the chunks).
+
+        """
+        try:
+            rows = database_access.read_transfer_exports(
+                request.created_from, request.created_until,
+                request.source_blockchain, request.destination_blockchain,
+                _EXPORT_BATCH_SIZE)
+            try:
+                yield from _format_transfers(rows, request.export_format)
+            finally:
+                # Release the database session early when the consumer
+                # stops iterating (e.g. a disconnected client)
+                rows.close()
+        except Exception:
+            raise self._create_error('unable to export the token transfers',
+                                     request=request)
+
+
+def _format_transfers(rows: typing.Iterator[typing.Any],
+                      export_format: ExportFormat) -> typing.Iterator[str]:
+    buffer = io.StringIO()
+    csv_writer = csv.writer(buffer, lineterminator='\n')
+    if export_format is ExportFormat.CSV:
+        csv_writer.writerow(EXPORT_FIELD_NAMES)
+    record_count = 0
+    for row in rows:
+        record = _create_record(row)
+        if export_format is ExportFormat.CSV:
+            csv_writer.writerow('' if value is None else value
+                                for value in record.values())
+        else:
+            buffer.write(json.dumps(record, separators=(',', ':')))
+            buffer.write('\n')
+        record_count += 1
+        if record_count % _EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell() > 0:
+        yield buffer.getvalue()
+
+
+def _create_record(row: typing.Any) -> dict[str, typing.Any]:
+    # Shaped like the transfer status response of the REST API, with
+    # amounts as integers and timestamps in ISO 8601 format
+    return {
+        'task_id': row.task_id,
+        'source_blockchain_id': row.source_blockchain_id,
+        'destination_blockchain_id': row.destination_blockchain_id,
+        'sender_address': row.sender_address,
+        'recipient_address': row.recipient_address,
+        'source_token_address': row.source_token_address,
+        'destination_token_address': row.destination_token_address,
+        'amount': int(row.amount),
+        'fee': int(row.fee),
+        'sender_nonce': _to_optional_int(row.sender_nonce),
+        'hub_address': row.hub_address,
+        'forwarder_address': row.forwarder_address,
+        'transfer_id': _to_optional_int(row.on_chain_transfer_id),
+        'transaction_id': row.transaction_id,
+        'status': TransferStatus(
+            row.status_id).to_public_status().name.lower(),
+        'created': row.created.isoformat(),
+        'updated': None if row.updated is None else row.updated.isoformat()
+    }
+
+
+def _to_optional_int(value: typing.Any) -> typing.Optional[int]:
+    return None if value is None else int(value)
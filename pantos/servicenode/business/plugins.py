@@ -39,7 +39,9 @@ class BidPluginInteractor(Interactor):
 
     def replace_bids(self, source_blockchain: Blockchain) -> int:
         """Replace the old bids with new bids given by the bid plugin.
-        Additionally, the Validator fee is added to the bid fee.
+        Additionally, the Validator fee is added to the bid fee. The
+        bids for all destination blockchains are replaced in a single
+        database transaction.
 
         Returns
         -------
@@ -64,6 +66,9 @@ class BidPluginInteractor(Interactor):
             source_blockchain_client.get_validator_fee_factor(
                 source_blockchain)
         delay = _DEFAULT_DELAY
+        # The bids of destination blockchains for which the bid plugin
+        # fails are kept
+        bids_by_destination: dict[int, list[dict]] = {}
         for destination_blockchain in Blockchain:
             _logger.debug(f'Executing bid plugin for {source_blockchain} and '
                           f'{destination_blockchain}')
@@ -77,15 +82,21 @@ class BidPluginInteractor(Interactor):
                 if source_blockchain is not destination_blockchain:
                     self.__add_validator_fee(bids, source_blockchain_factor,
                                              destination_blockchain_factor)
-                _logger.debug(f'Saving {len(bids)} bids in database')
-                bids = [dataclasses.asdict(bid) for bid in bids]
-                replace_bids(source_blockchain.value,
-                             destination_blockchain.value, bids)
+                bids_by_destination[destination_blockchain.value] = [
+                    dataclasses.asdict(bid) for bid in bids
+                ]
             except BidPluginError:
                 _logger.debug('unable to execute the bid plugin',
                               exc_info=True)
             except Exception:
-                _logger.critical('unable to replace the bids', exc_info=True)
+                _logger.critical('unable to calculate the bids', exc_info=True)
+        _logger.debug(
+            f'Saving bids for {len(bids_by_destination)} destination '
+            'blockchains in database')
+        try:
+            replace_bids(source_blockchain.value, bids_by_destination)
+        except Exception:
+            _logger.critical('unable to replace the bids', exc_info=True)
         return delay
 
     def __add_validator_fee(self, bids: collections.abc.Iterable[Bid],
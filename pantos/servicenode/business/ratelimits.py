@@ -0,0 +1,187 @@
+"""Business logic for rate limiting REST API clients.
+
+"""
+import hashlib
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+import typing
+
+from pantos.servicenode.business.base import Interactor
+from pantos.servicenode.business.base import InteractorError
+from pantos.servicenode.configuration import config
+
+_TOKEN_BUCKET_STRUCT: typing.Final[struct.Struct] = struct.Struct('=Qdd')
+"""Memory layout of a token bucket: the hash of its client key (0 for
+an unused slot), its number of tokens, and the (monotonic) time of its
+last update."""
+
+_TOKEN_BUCKET_PROBES: typing.Final[int] = 8
+"""Number of consecutive slots searched for the token bucket of a client
+key."""
+
+_token_buckets: dict[str, '_SharedTokenBuckets'] = {}
+"""Token buckets per endpoint."""
+
+_token_buckets_lock = threading.Lock()
+"""Lock for creating the token buckets of an endpoint."""
+
+
+class RateLimitInteractorError(InteractorError):
+    """Exception class for all rate limit interactor errors.
+
+    """
+    pass
+
+
+class RateLimitInteractorLimitExceededError(RateLimitInteractorError):
+    """Exception class for requests that exceed the rate limit of a
+    client.
+
+    """
+    pass
+
+
+class RateLimitInteractor(Interactor):
+    """Interactor for rate limiting REST API clients. Each client has a
+    token bucket per endpoint. The buckets are held in shared memory,
+    so that checking a rate limit does not require any database access.
+    If the buckets are initialized by the web server's master process
+    before forking the worker processes (see initialize_token_buckets),
+    the configured limits apply across all worker processes; otherwise,
+    they apply per web server process.
+
+    """
+    @classmethod
+    def get_error_class(cls) -> type[InteractorError]:
+        # Docstring inherited
+        return RateLimitInteractorError
+
+    def consume_tokens(self, endpoint: str, client_keys: list[str]) -> None:
+        """Consume a token from the buckets of all given clients for an
+        endpoint. The buckets are refilled according to the time
+        elapsed since their last update first, and created (full) if
+        they do not exist yet.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the endpoint in the rate limits configuration.
+        client_keys : list of str
+            The keys identifying the client (e.g. by IP address or
+            sender address).
+
+        Raises
+        ------
+        RateLimitInteractorLimitExceededError
+            If there is no token left in any of the client's buckets.
+
+        """
+        rate_limit = config['application']['rate_limits'][endpoint]
+        capacity = rate_limit['capacity']
+        refill_rate = rate_limit['refill_rate']
+        if capacity == 0 or refill_rate == 0:
+            return
+        remaining_tokens = _get_token_buckets(endpoint).consume_tokens(
+            client_keys, capacity, refill_rate, time.monotonic())
+        minimum_remaining_tokens = min(remaining_tokens)
+        if minimum_remaining_tokens < 0:
+            retry_after = math.ceil(
+                (1 - minimum_remaining_tokens) / refill_rate)
+            raise RateLimitInteractorLimitExceededError(
+                'rate limit exceeded', endpoint=endpoint,
+                client_keys=client_keys, retry_after=retry_after)
+
+
+def initialize_token_buckets() -> None:
+    """Create the token buckets of all rate-limited endpoints. Must be
+    called by the web server's master process before it forks the
+    worker processes, so that the worker processes share the buckets.
+
+    """
+    for endpoint, rate_limit in config['application']['rate_limits'].items():
+        if rate_limit['capacity'] > 0 and rate_limit['refill_rate'] > 0:
+            _get_token_buckets(endpoint)
+
+
+class _SharedTokenBuckets:
+    """Fixed-size hash table of token buckets in an anonymous shared
+    memory mapping, which is inherited by forked child processes (as is
+    the lock). When all slots searched for a client key are in use, the
+    least recently updated bucket is evicted. This is harmless for
+    buckets that have been refilled completely in the meantime, which
+    are equivalent to missing ones.
+
+    """
+    def __init__(self, size: int):
+        assert size > 0
+        self.__size = size
+        self.__memory = mmap.mmap(-1, size * _TOKEN_BUCKET_STRUCT.size)
+        self.__lock = multiprocessing.Lock()
+
+    def consume_tokens(self, client_keys: list[str], capacity: int,
+                       refill_rate: float, timestamp: float) -> list[float]:
+        remaining_tokens = []
+        with self.__lock:
+            for client_key in client_keys:
+                key_hash = _hash_client_key(client_key)
+                offset, token_bucket = self.__find(key_hash)
+                if token_bucket is None:
+                    tokens = float(capacity)
+                else:
+                    tokens, updated = token_bucket
+                    # The monotonic clock is system-wide, i.e. the same
+                    # for all processes
+                    tokens = min(
+                        float(capacity),
+                        tokens + max(timestamp - updated, 0) * refill_rate)
+                # A rejected request leaves the bucket with at most one
+                # missing token, so that clients can retry after a
+                # bounded time
+                tokens = -1.0 if tokens < 0 else tokens - 1
+                _TOKEN_BUCKET_STRUCT.pack_into(self.__memory, offset, key_hash,
+                                               tokens, timestamp)
+                remaining_tokens.append(tokens)
+        return remaining_tokens
+
+    def __find(
+            self,
+            key_hash: int) -> tuple[int, typing.Optional[tuple[float, float]]]:
+        eviction_offset = -1
+        eviction_updated = math.inf
+        for probe in range(min(_TOKEN_BUCKET_PROBES, self.__size)):
+            offset = ((key_hash + probe) % self.__size *
+                      _TOKEN_BUCKET_STRUCT.size)
+            slot_key_hash, tokens, updated = \
+                _TOKEN_BUCKET_STRUCT.unpack_from(self.__memory, offset)
+            if slot_key_hash == key_hash:
+                return offset, (tokens, updated)
+            if slot_key_hash == 0:
+                # Slots are never freed, so that the bucket cannot be
+                # in any of the following slots
+                return offset, None
+            if updated < eviction_updated:
+                eviction_offset = offset
+                eviction_updated = updated
+        return eviction_offset, None
+
+
+def _get_token_buckets(endpoint: str) -> _SharedTokenBuckets:
+    with _token_buckets_lock:
+        token_buckets = _token_buckets.get(endpoint)
+        if token_buckets is None:
+            token_buckets = _SharedTokenBuckets(
+                config['application']['rate_limit_cache_size'])
+            _token_buckets[endpoint] = token_buckets
+        return token_buckets
+
+
+def _hash_client_key(client_key: str) -> int:
+    # Stable across processes (unlike the built-in hash function), and
+    # never 0 (which marks unused slots)
+    key_hash = int.from_bytes(
+        hashlib.blake2b(client_key.encode(), digest_size=8).digest(), 'little')
+    return key_hash or 1
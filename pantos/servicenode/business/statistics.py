@@ -0,0 +1,210 @@
+"""Business logic for the pre-aggregated transfer statistics.
+
+"""
+import dataclasses
+import datetime
+import logging
+import typing
+
+import celery  # type: ignore
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.base import Interactor
+from pantos.servicenode.business.base import InteractorError
+from pantos.servicenode.configuration import config
+from pantos.servicenode.database import access as database_access
+from pantos.servicenode.database.enums import TransferStatus
+
+_logger = logging.getLogger(__name__)
+"""Logger for this module."""
+
+
+class StatisticsInteractorError(InteractorError):
+    """Exception class for all statistics interactor errors.
+
+    """
+    pass
+
+
+class StatisticsInteractor(Interactor):
+    """Interactor for the pre-aggregated transfer statistics.
+
+    """
+    @dataclasses.dataclass
+    class FindTransferStatisticsRequest:
+        """Request data for finding transfer statistics.
+
+        Attributes
+        ----------
+        hour_from : datetime.datetime, optional
+            Only statistics of hours starting at or after this point in
+            time are found (no lower bound if not given).
+        hour_until : datetime.datetime, optional
+            Only statistics of hours starting before this point in time
+            are found (no upper bound if not given).
+        source_blockchain : Blockchain, optional
+            The source blockchain of the token transfers (any
+            blockchain if not given).
+        destination_blockchain : Blockchain, optional
+            The destination blockchain of the token transfers (any
+            blockchain if not given).
+
+        """
+        hour_from: typing.Optional[datetime.datetime] = None
+        hour_until: typing.Optional[datetime.datetime] = None
+        source_blockchain: typing.Optional[Blockchain] = None
+        destination_blockchain: typing.Optional[Blockchain] = None
+
+    @dataclasses.dataclass
+    class TransferStatistics:
+        """Statistics of the token transfers of a token from a source
+        to a destination blockchain that have been accepted within an
+        hour and currently have the same public status.
+
+        Attributes
+        ----------
+        hour : datetime.datetime
+            The start of the hour (UTC).
+        source_blockchain : Blockchain
+            The token transfers' source blockchain.
+        destination_blockchain : Blockchain
+            The token transfers' destination blockchain.
+        source_token_address : str
+            The transferred token's address on the source blockchain.
+        status : TransferStatus
+            The public status of the token transfers.
+        transfer_count : int
+            The number of token transfers.
+        amount : int
+            The total transferred token amount (in 10^-d units, where d
+            is the token's number of decimals).
+        fee : int
+            The total fee paid for the token transfers.
+
+        """
+        hour: datetime.datetime
+        source_blockchain: Blockchain
+        destination_blockchain: Blockchain
+        source_token_address: str
+        status: TransferStatus
+        transfer_count: int
+        amount: int
+        fee: int
+
+    @classmethod
+    def get_error_class(cls) -> type[InteractorError]:
+        # Docstring inherited
+        return StatisticsInteractorError
+
+    def find_transfer_statistics(
+        self, request: FindTransferStatisticsRequest
+    ) -> list['StatisticsInteractor.TransferStatistics']:
+        """Find the statistics of the (archived and non-archived) token
+        transfers. The statistics are read from the pre-aggregated
+        statistics, which lag behind the token transfers by up to the
+        configured rollup interval.
+
+        Parameters
+        ----------
+        request : FindTransferStatisticsRequest
+            The request data for finding transfer statistics.
+
+        Returns
+        -------
+        list of TransferStatistics
+            The non-empty transfer statistics ordered by their hour.
+
+        Raises
+        ------
+        StatisticsInteractorError
+            If the transfer statistics cannot be found.
+
+        """
+        try:
+            hour_from = (None if request.hour_from is None else _to_utc(
+                request.hour_from))
+            hour_until = (None if request.hour_until is None else _to_utc(
+                request.hour_until))
+            rows = database_access.read_transfer_statistics(
+                hour_from, hour_until, request.source_blockchain,
+                request.destination_blockchain)
+            return [
+                StatisticsInteractor.TransferStatistics(
+                    _to_utc(row.hour), Blockchain(row.source_blockchain_id),
+                    Blockchain(row.destination_blockchain_id),
+                    row.source_token_address, TransferStatus(row.status_id),
+                    int(row.transfer_count), int(row.amount), int(row.fee))
+                for row in rows
+            ]
+        except Exception:
+            raise self._create_error('unable to find transfer statistics',
+                                     request=request)
+
+    def roll_up_transfer_statistics(self) -> int:
+        """Roll up the status changes of the token transfers since the
+        last rollup into the transfer statistics. The token transfers
+        are rolled up in bounded batches (each in its own database
+        transaction), and at most the configured number of batches is
+        rolled up per call.
+
+        Returns
+        -------
+        int
+            The number of rolled up token transfers.
+
+        Raises
+        ------
+        StatisticsInteractorError
+            If the transfer statistics cannot be rolled up.
+
+        """
+        rollup_config = config['tasks']['roll_up_transfer_statistics']
+        batch_size = rollup_config['batch_size']
+        number_rolled_up_transfers = 0
+        try:
+            for _ in range(rollup_config['max_batches']):
+                number_batch_transfers = \
+                    database_access.roll_up_transfer_statistics(batch_size)
+                number_rolled_up_transfers += number_batch_transfers
+                if number_batch_transfers < batch_size:
+                    break
+        except Exception:
+            raise self._create_error(
+                'unable to roll up transfer statistics',
+                number_rolled_up_transfers=number_rolled_up_transfers)
+        return number_rolled_up_transfers
+
+
+def _to_utc(timestamp: datetime.datetime) -> datetime.datetime:
+    if timestamp.tzinfo is None:
+        # Timestamps without a time zone are UTC (e.g. read from SQLite)
+        return timestamp.replace(tzinfo=datetime.UTC)
+    return timestamp.astimezone(datetime.UTC)
+
+
+@celery.current_app.task
+def roll_up_transfer_statistics_task() -> int:
+    """Celery task for rolling up the status changes of token transfers
+    into the transfer statistics. The task reschedules itself after the
+    configured interval.
+
+    Returns
+    -------
+    int
+        The number of rolled up token transfers.
+
+    """
+    number_rolled_up_transfers = 0
+    try:
+        number_rolled_up_transfers = \
+            StatisticsInteractor().roll_up_transfer_statistics()
+        _logger.info(f'{number_rolled_up_transfers} token transfers rolled '
+                     'up into the transfer statistics')
+    except StatisticsInteractorError as error:
+        _logger.error('unable to roll up transfer statistics',
+                      extra=error.details, exc_info=True)
+    finally:
+        roll_up_transfer_statistics_task.apply_async(
+            countdown=config['tasks']['roll_up_transfer_statistics']
+            ['interval'])
+    return number_rolled_up_transfers
@@ -2,13 +2,16 @@
 
 """
 import dataclasses
+import datetime
 import logging
 import math
+import threading
 import time
 import typing
 import uuid
 
 import celery  # type: ignore
+import celery.states  # type: ignore
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.entities import ServiceNodeBid
 from pantos.common.entities import TransactionStatus
@@ -23,17 +26,65 @@ from pantos.servicenode.blockchains.factory import get_blockchain_client
 from pantos.servicenode.business.base import Interactor
 from pantos.servicenode.business.base import InteractorError
 from pantos.servicenode.business.bids import BidInteractorError
+from pantos.servicenode.business.ratelimits import RateLimitInteractor
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.cache import LruCache
 from pantos.servicenode.configuration import config
 from pantos.servicenode.configuration import get_blockchain_config
 from pantos.servicenode.configuration import get_signer_config
 from pantos.servicenode.database import access as database_access
+from pantos.servicenode.database.access import TransferUpdate
 from pantos.servicenode.database.enums import TransferStatus
 from pantos.servicenode.database.exceptions import SenderNonceNotUniqueError
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.notifications import \
+    TRANSFERS_NOTIFICATION_CHANNEL
+from pantos.servicenode.database.notifications import NotificationListener
+from pantos.servicenode.database.notifications import \
+    parse_transfer_notification_payload
 from pantos.servicenode.plugins import get_bid_plugin
 
 _logger = logging.getLogger(__name__)
 """Logger for this module."""
 
+_idempotency_key_cache: typing.Optional[LruCache[str, tuple[str,
+                                                            uuid.UUID]]] = None
+"""In-memory cache of the request hashes and task IDs of already
+accepted transfer requests, keyed by their idempotency keys."""
+
+_PENDING_TRANSFER_COUNT_TIME_TO_LIVE: typing.Final[float] = 1.0
+"""Time (in seconds) for which the number of pending transfers of a
+source blockchain is cached for admission control."""
+
+_pending_transfer_counts: LruCache[Blockchain, int] = LruCache(
+    len(Blockchain), time_to_live=_PENDING_TRANSFER_COUNT_TIME_TO_LIVE)
+"""In-memory cache of the number of pending transfers per source
+blockchain."""
+
+TransferNotificationSubscriber = typing.Callable[[uuid.UUID, TransferStatus],
+                                                 None]
+"""Type of the subscribers to the notified transfer changes (called
+with the task ID and the current status of a changed transfer)."""
+
+_TRANSFER_NOTIFICATION_LISTENER_TIMEOUT: typing.Final[float] = 60.0
+"""Maximum time (in seconds) for which the transfer notification
+listener waits for a notification at once."""
+
+_transfer_notification_subscribers: tuple[TransferNotificationSubscriber,
+                                          ...] = ()
+"""Subscribers to the notified transfer changes of the current process
+(replaced as a whole on each subscription change)."""
+
+_transfer_notification_subscribers_lock = threading.Lock()
+"""Lock for changing the subscribers and starting the transfer
+notification listener of the current process."""
+
+_transfer_notification_listener_started = False
+"""Whether the transfer notification listener thread of the current
+process has been started."""
+
 
 class TransferInteractorError(InteractorError):
     """Exception class for all transfer interactor errors.
@@ -50,6 +101,31 @@ class TransferInteractorBidNotAcceptedError(TransferInteractorError):
     pass
 
 
+class TransferInteractorInvalidSignatureError(TransferInteractorError):
+    """Exception class for transfer requests with a sender signature
+    that is not valid for the requested token transfer.
+
+    """
+    pass
+
+
+class TransferInteractorIdempotencyKeyConflictError(TransferInteractorError):
+    """Exception class for transfer requests with an idempotency key
+    that has already been used for a different transfer request.
+
+    """
+    pass
+
+
+class TransferInteractorOverloadedError(TransferInteractorError):
+    """Exception class for transfer requests that are refused because
+    the service node has too many pending transfers on the source
+    blockchain.
+
+    """
+    pass
+
+
 class TransferInteractorResourceNotFoundError(TransferInteractorError):
     """Exception class for transfer resource not found errors.
 
@@ -132,10 +208,10 @@ class TransferInteractor(Interactor):
             except UnresolvableTransferSubmissionError:
                 _logger.error('token transfer failed', extra=extra_info,
                               exc_info=True)
-                database_access.reset_transfer_nonce(
-                    request.internal_transfer_id)
-                database_access.update_transfer_status(
-                    request.internal_transfer_id, TransferStatus.FAILED)
+                database_access.update_transfer(
+                    TransferUpdate(request.internal_transfer_id,
+                                   status=TransferStatus.FAILED,
+                                   reset_nonce=True))
                 return True
             if not status_response.transaction_submission_completed:
                 _logger.info('token transfer not yet confirmed',
@@ -155,12 +231,12 @@ class TransferInteractor(Interactor):
             assert on_chain_transfer_id is not None
             extra_info |= {'on_chain_transfer_id': on_chain_transfer_id}
             _logger.info('token transfer confirmed', extra=extra_info)
-            database_access.update_transfer_transaction_id(
-                request.internal_transfer_id, transaction_id)
-            database_access.update_on_chain_transfer_id(
-                request.internal_transfer_id, on_chain_transfer_id)
-            database_access.update_transfer_status(
-                request.internal_transfer_id, TransferStatus.CONFIRMED)
+            # All confirmation data is stored in a single transaction
+            database_access.update_transfer(
+                TransferUpdate(request.internal_transfer_id,
+                               status=TransferStatus.CONFIRMED,
+                               transaction_id=transaction_id,
+                               on_chain_transfer_id=on_chain_transfer_id))
             return True
         except Exception:
             raise self._create_error(
@@ -216,7 +292,9 @@ class TransferInteractor(Interactor):
         valid_until: int
         signature: str
 
-    def execute_transfer(self, request: ExecuteTransferRequest) -> uuid.UUID:
+    def execute_transfer(
+            self,
+            request: ExecuteTransferRequest) -> typing.Optional[uuid.UUID]:
         """Execute a token transfer.
 
         Parameters
@@ -226,8 +304,10 @@ class TransferInteractor(Interactor):
 
         Returns
         -------
-        uuid.UUID
-            The unique internal transaction ID.
+        uuid.UUID or None
+            The unique internal transaction ID, or None if the execution
+            has been skipped because the token transfer is already being
+            executed or has already been executed by another task.
 
         Raises
         ------
@@ -237,8 +317,20 @@ class TransferInteractor(Interactor):
             If the token transfer cannot be executed or retried.
 
         """
+        execution_claimed = False
         try:
             _logger.info('executing a token transfer', extra=vars(request))
+            # The transfer may already be executed by another task (e.g.
+            # if the task has been re-driven by the recovery of orphaned
+            # transfers while it was still queued). A claim is abandoned
+            # when the transfer would be considered orphaned itself.
+            claimed_before = (
+                datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+                    seconds=config['tasks']['recover_transfers']['stale_age']))
+            execution_claimed = database_access.claim_transfer_execution(
+                request.internal_transfer_id, claimed_before)
+            if not execution_claimed:
+                return None
             if request.valid_until < time.time():
                 database_access.update_transfer_status(
                     request.internal_transfer_id, TransferStatus.FAILED)
@@ -249,15 +341,35 @@ class TransferInteractor(Interactor):
                 internal_transaction_id = self.__single_chain_transfer(request)
             else:
                 internal_transaction_id = self.__cross_chain_transfer(request)
-            database_access.update_transfer_status(
-                request.internal_transfer_id, TransferStatus.SUBMITTED)
+            # The internal transaction ID is stored for confirming the
+            # transfer again if its confirmation task is lost
+            database_access.update_transfer(
+                TransferUpdate(
+                    request.internal_transfer_id,
+                    status=TransferStatus.SUBMITTED,
+                    internal_transaction_id=internal_transaction_id))
             return internal_transaction_id
         except TransferInteractorUnrecoverableError:
             raise
         except Exception:
+            if execution_claimed:
+                # Released so that the retried task can claim it again
+                self.__release_transfer_execution(request)
             raise self._create_error('unable to execute a token transfer',
                                      request=request)
 
+    def __release_transfer_execution(self,
+                                     request: ExecuteTransferRequest) -> None:
+        try:
+            database_access.release_transfer_execution(
+                request.internal_transfer_id)
+        except Exception:
+            # The claim is abandoned and can be claimed again once the
+            # transfer is re-driven by the recovery of orphaned transfers
+            _logger.error(
+                'unable to release the execution of a token transfer',
+                extra=vars(request), exc_info=True)
+
     def __single_chain_transfer(self,
                                 request: ExecuteTransferRequest) -> uuid.UUID:
         if request.source_token_address != request.destination_token_address:
@@ -616,6 +728,252 @@ class TransferInteractor(Interactor):
         transfer_id: typing.Optional[int] = None
         transaction_id: typing.Optional[str] = None
 
+    def find_idempotent_transfer(
+            self, idempotency_key: str,
+            request_hash: str) -> typing.Optional[uuid.UUID]:
+        """Find a token transfer that has already been initiated by a
+        transfer request with the same idempotency key. The in-memory
+        cache of the process is searched first, then the database.
+
+        Parameters
+        ----------
+        idempotency_key : str
+            The idempotency key supplied by the client.
+        request_hash : str
+            The hash of the current transfer request.
+
+        Returns
+        -------
+        uuid.UUID or None
+            The unique task ID of the already initiated token transfer,
+            or None if the idempotency key has not been used before.
+
+        Raises
+        ------
+        TransferInteractorIdempotencyKeyConflictError
+            If the idempotency key has already been used for a different
+            transfer request.
+        TransferInteractorError
+            If the token transfer cannot be searched for.
+
+        """
+        try:
+            idempotency_key_cache = _get_idempotency_key_cache()
+            cache_entry = idempotency_key_cache.get(idempotency_key)
+            if cache_entry is None:
+                idempotency_key_expiry = config['application'][
+                    'idempotency_key_expiry']
+                idempotency_key_record = database_access.read_idempotency_key(
+                    idempotency_key,
+                    datetime.datetime.now(datetime.UTC) -
+                    datetime.timedelta(seconds=idempotency_key_expiry))
+                if idempotency_key_record is None:
+                    return None
+                stored_task_id = uuid.UUID(
+                    typing.cast(str, idempotency_key_record.task_id))
+                cache_entry = (typing.cast(
+                    str, idempotency_key_record.request_hash), stored_task_id)
+                idempotency_key_cache.set(idempotency_key, cache_entry)
+            stored_request_hash, task_id = cache_entry
+            if stored_request_hash != request_hash:
+                raise TransferInteractorIdempotencyKeyConflictError(
+                    'idempotency key already used for a different transfer '
+                    'request', idempotency_key=idempotency_key)
+            return task_id
+        except TransferInteractorIdempotencyKeyConflictError:
+            raise
+        except Exception:
+            raise self._create_error(
+                'unable to search for an idempotent token transfer',
+                idempotency_key=idempotency_key)
+
+    def delete_expired_idempotency_keys(self) -> int:
+        """Delete the idempotency keys that are older than the
+        configured expiry. Expired keys are already ignored when
+        searching for idempotent token transfers, so they are only
+        deleted to keep the database table small.
+
+        Returns
+        -------
+        int
+            The number of deleted idempotency keys.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the idempotency keys cannot be deleted.
+
+        """
+        created_before = (
+            datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+                seconds=config['application']['idempotency_key_expiry']))
+        try:
+            return database_access.delete_idempotency_keys(created_before)
+        except Exception:
+            raise self._create_error(
+                'unable to delete expired idempotency keys',
+                created_before=created_before)
+
+    def archive_transfers(self) -> int:
+        """Move terminal token transfers that have not been updated
+        within the configured retention age to the archive. The
+        transfers are moved in bounded batches (each in its own
+        database transaction), and at most the configured number of
+        batches is moved per call.
+
+        Returns
+        -------
+        int
+            The number of archived token transfers.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the token transfers cannot be archived.
+
+        """
+        archive_config = config['tasks']['archive_transfers']
+        retention_age = archive_config['retention_age']
+        batch_size = archive_config['batch_size']
+        if retention_age == 0:
+            return 0
+        updated_before = (datetime.datetime.now(datetime.UTC) -
+                          datetime.timedelta(seconds=retention_age))
+        number_archived_transfers = 0
+        try:
+            for _ in range(archive_config['max_batches']):
+                number_batch_transfers = database_access.archive_transfers(
+                    updated_before, batch_size)
+                number_archived_transfers += number_batch_transfers
+                if number_batch_transfers < batch_size:
+                    break
+        except Exception:
+            raise self._create_error(
+                'unable to archive token transfers',
+                updated_before=updated_before,
+                number_archived_transfers=number_archived_transfers)
+        return number_archived_transfers
+
+    def recover_transfers(self) -> int:
+        """Re-drive in-flight token transfers whose Celery task has
+        been lost, e.g. because a worker died between accepting a
+        transfer and publishing its execution task, or because a
+        confirmation task has exceeded its maximum number of retries.
+        A token transfer is considered orphaned if it has not been
+        updated within the configured stale age. Accepted transfers
+        are executed again (unless their execution task is still
+        scheduled to be retried), and submitted transfers are confirmed
+        again. The orphaned transfers are claimed in bounded batches
+        per source blockchain, and the re-driven tasks are spread out
+        according to the configured maximum rate.
+
+        Re-driving a token transfer is idempotent: a claimed transfer
+        is not claimed again before it is stale again, a re-driven
+        execution is skipped if the transfer is being or has already
+        been executed by its original task, and confirming a transfer
+        multiple times leads to the same result. A stale submitted
+        transfer is not confirmed again while its confirmation task
+        (identified by the transfer's internal transaction ID) is
+        scheduled to poll again.
+
+        Returns
+        -------
+        int
+            The number of re-driven token transfers.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the token transfers cannot be recovered.
+
+        """
+        recover_config = config['tasks']['recover_transfers']
+        stale_age = recover_config['stale_age']
+        batch_size = recover_config['batch_size']
+        if stale_age == 0:
+            return 0
+        updated_before = (datetime.datetime.now(datetime.UTC) -
+                          datetime.timedelta(seconds=stale_age))
+        number_recovered_transfers = 0
+        try:
+            for source_blockchain in Blockchain:
+                if not get_blockchain_config(source_blockchain)['active']:
+                    continue
+                # Number of tasks re-driven for the source blockchain
+                # (determining the delay of the next task)
+                number_tasks = 0
+                for _ in range(recover_config['max_batches']):
+                    transfers = database_access.claim_stale_transfers(
+                        source_blockchain, updated_before, batch_size)
+                    for transfer in transfers:
+                        countdown = number_tasks / recover_config['max_rate']
+                        if self.__recover_transfer(transfer, countdown):
+                            number_tasks += 1
+                    if len(transfers) < batch_size:
+                        break
+                number_recovered_transfers += number_tasks
+        except Exception:
+            raise self._create_error(
+                'unable to recover token transfers',
+                updated_before=updated_before,
+                number_recovered_transfers=number_recovered_transfers)
+        return number_recovered_transfers
+
+    def __recover_transfer(self, transfer: Transfer, countdown: float) -> bool:
+        status = TransferStatus(typing.cast(int, transfer.status_id))
+        extra_info = {
+            'internal_transfer_id': transfer.id,
+            'task_id': transfer.task_id,
+            'status': status.name
+        }
+        if status is TransferStatus.SUBMITTED:
+            if transfer.internal_transaction_id is None:
+                _logger.warning(
+                    'unable to recover a token transfer without an internal '
+                    'transaction ID', extra=extra_info)
+                return False
+            confirm_task_id = str(transfer.internal_transaction_id)
+            if (confirm_transfer_task.AsyncResult(confirm_task_id).state ==
+                    celery.states.RETRY):
+                # The confirmation task is still polling
+                return False
+            _logger.warning('confirming an orphaned token transfer again',
+                            extra=extra_info)
+            confirm_transfer_task.apply_async(
+                args=(transfer.id, transfer.source_blockchain_id,
+                      transfer.destination_blockchain_id, confirm_task_id),
+                task_id=confirm_task_id, countdown=countdown)
+            return True
+        if transfer.valid_until is None:
+            _logger.warning(
+                'unable to recover a token transfer without a validity',
+                extra=extra_info)
+            return False
+        if (transfer.task_id is not None and execute_transfer_task.AsyncResult(
+                str(transfer.task_id)).state == celery.states.RETRY):
+            # The broker keeps the messages of tasks scheduled to be
+            # retried until they are executed (even if a worker dies)
+            return False
+        _logger.warning('executing an orphaned token transfer again',
+                        extra=extra_info)
+        task_result = execute_transfer_task.apply_async(
+            args=(transfer.id, transfer.source_blockchain_id,
+                  transfer.destination_blockchain_id, transfer.sender_address,
+                  transfer.recipient_address,
+                  transfer.source_token_contract.address,
+                  transfer.destination_token_contract.address,
+                  int(transfer.amount), int(transfer.fee),
+                  int(transfer.sender_nonce), transfer.valid_until,
+                  transfer.signature),
+            # The task ID already known to clients is kept
+            task_id=(None
+                     if transfer.task_id is None else str(transfer.task_id)),
+            countdown=countdown)
+        if transfer.task_id is None:
+            database_access.update_transfer_task_id(transfer.id,
+                                                    uuid.UUID(task_result.id))
+        return True
+
     def find_transfer(self, task_id: uuid.UUID) -> FindTransferResponse:
         """Find a token transfer by its unique task ID.
 
@@ -641,19 +999,7 @@ class TransferInteractor(Interactor):
             if transfer is None:
                 raise TransferInteractorResourceNotFoundError(
                     f'resource with task_id "{task_id}" not found')
-            return TransferInteractor.FindTransferResponse(
-                Blockchain(typing.cast(int, transfer.source_blockchain_id)),
-                Blockchain(typing.cast(int,
-                                       transfer.destination_blockchain_id)),
-                typing.cast(str, transfer.sender_address),
-                typing.cast(str, transfer.recipient_address),
-                transfer.source_token_contract.address,
-                transfer.destination_token_contract.address,
-                int(transfer.amount), int(transfer.fee),
-                TransferStatus(typing.cast(int, transfer.status_id)),
-                None if transfer.on_chain_transfer_id is None else int(
-                    transfer.on_chain_transfer_id),
-                typing.cast(str, transfer.transaction_id))
+            return self.__create_find_transfer_response(transfer)
         except TransferInteractorResourceNotFoundError:
             raise
         except Exception:
@@ -733,6 +1079,14 @@ class TransferInteractor(Interactor):
         TransferInteractorBidNotAcceptedError
             If the bid is not accepted by the service node maintainer due to
             custom reasons.
+        TransferInteractorInvalidSignatureError
+            If the sender's signature is not valid for the token
+            transfer.
+        TransferInteractorOverloadedError
+            If the service node has too many pending transfers on the
+            source blockchain.
+        RateLimitInteractorLimitExceededError
+            If the sender has exceeded its rate limit.
         TransferInteractorError
             If the token transfer cannot be initiated.
 
@@ -757,6 +1111,7 @@ class TransferInteractor(Interactor):
                 request.destination_token_address)
             assert request.amount > 0
             assert request.time_received < time.time()
+            self.__check_admission(request, source_blockchain_config)
             if not get_bid_plugin().accept_bid(request.bid):
                 _logger.info('bid declined by plugin', extra=vars(request.bid))
                 raise TransferInteractorBidNotAcceptedError('bid not accepted')
@@ -767,6 +1122,13 @@ class TransferInteractor(Interactor):
             self.__check_valid_bid(request.bid,
                                    request.source_blockchain.value,
                                    request.destination_blockchain.value)
+            self.__check_valid_transfer_signature(source_blockchain_client,
+                                                  request)
+            # The sender address can only be trusted (and therefore be
+            # rate limited) after the sender's signature has been
+            # validated
+            RateLimitInteractor().consume_tokens(
+                'transfer', [f'sender:{request.sender_address.lower()}'])
             # Write the transfer request data to the database
             internal_transfer_id = database_access.create_transfer(
                 request.source_blockchain, request.destination_blockchain,
@@ -774,7 +1136,7 @@ class TransferInteractor(Interactor):
                 request.source_token_address,
                 request.destination_token_address, request.amount,
                 int(request.bid.fee), request.nonce, request.signature,
-                source_blockchain_config['hub'],
+                request.valid_until, source_blockchain_config['hub'],
                 source_blockchain_config['forwarder'])
             # Schedule a new transfer task
             task_result = execute_transfer_task.delay(
@@ -794,10 +1156,442 @@ class TransferInteractor(Interactor):
             raise
         except TransferInteractorBidNotAcceptedError:
             raise
+        except TransferInteractorInvalidSignatureError:
+            raise
+        except TransferInteractorOverloadedError:
+            raise
+        except RateLimitInteractorLimitExceededError:
+            raise
         except Exception:
             raise self._create_error('unable to initiate a new token transfer',
                                      request=request)
 
+    @dataclasses.dataclass
+    class ListTransfersRequest:
+        """Request data for listing token transfers.
+
+        Attributes
+        ----------
+        limit : int
+            The maximum number of token transfers to list.
+        sender_address : str, optional
+            The sender's address on the source blockchain (token
+            transfers of any sender if not given).
+        status : TransferStatus, optional
+            The public status of the token transfers (token transfers
+            with any status if not given).
+        after : int, optional
+            The cursor returned for the previous page of token
+            transfers (starting from the first token transfer if not
+            given).
+
+        """
+        limit: int
+        sender_address: typing.Optional[str] = None
+        status: typing.Optional[TransferStatus] = None
+        after: typing.Optional[int] = None
+
+    @dataclasses.dataclass
+    class ListedTransfer:
+        """Data of a listed token transfer.
+
+        Attributes
+        ----------
+        task_id : uuid.UUID
+            The unique task ID of the token transfer.
+        transfer : FindTransferResponse
+            The token transfer data.
+
+        """
+        task_id: uuid.UUID
+        transfer: 'TransferInteractor.FindTransferResponse'
+
+    @dataclasses.dataclass
+    class ListTransfersResponse:
+        """Response data for listing token transfers.
+
+        Attributes
+        ----------
+        transfers : list of ListedTransfer
+            The listed token transfers.
+        next_after : int, optional
+            The cursor for requesting the next page of token transfers
+            (None if there are no further token transfers).
+
+        """
+        transfers: list['TransferInteractor.ListedTransfer']
+        next_after: typing.Optional[int] = None
+
+    def list_transfers(self,
+                       request: ListTransfersRequest) -> ListTransfersResponse:
+        """List token transfers ordered by their acceptance by the
+        service node. The token transfers are paginated by the cursor
+        returned for the previous page.
+
+        Parameters
+        ----------
+        request : ListTransfersRequest
+            The request data for listing token transfers.
+
+        Returns
+        -------
+        ListTransfersResponse
+            The listed token transfers.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the token transfers cannot be listed.
+
+        """
+        assert request.limit > 0
+        assert request.status is None or request.status == \
+            request.status.to_public_status()
+        statuses = None if request.status is None else [
+            status for status in TransferStatus
+            if status.to_public_status() == request.status
+        ]
+        try:
+            # One more transfer is read to determine if there is a
+            # next page
+            transfers = database_access.read_transfers(request.sender_address,
+                                                       statuses, request.after,
+                                                       request.limit + 1)
+            listed_transfers = [
+                TransferInteractor.ListedTransfer(
+                    uuid.UUID(typing.cast(str, transfer.task_id)),
+                    self.__create_find_transfer_response(transfer))
+                for transfer in transfers[:request.limit]
+            ]
+            next_after = (typing.cast(int, transfers[request.limit - 1].id)
+                          if len(transfers) > request.limit else None)
+            return TransferInteractor.ListTransfersResponse(
+                listed_transfers, next_after)
+        except Exception:
+            raise self._create_error('unable to list token transfers',
+                                     request=request)
+
+    def __check_admission(
+            self, request: InitiateTransferRequest,
+            source_blockchain_config: dict[str, typing.Any]) -> None:
+        """Check if a new token transfer can be admitted given the
+        transfers from the same source blockchain that are still
+        waiting to be submitted.
+
+        Parameters
+        ----------
+        request : InitiateTransferRequest
+            The token transfer initiation request data.
+        source_blockchain_config : dict
+            The configuration of the token transfer's source blockchain.
+
+        Raises
+        ------
+        TransferInteractorOverloadedError
+            If the configured maximum number of pending transfers on
+            the source blockchain has been reached.
+        TransferInteractorBidNotAcceptedError
+            If the pending transfers cannot be worked off within the
+            execution time of the bid.
+
+        """
+        max_pending_transfers = source_blockchain_config[
+            'max_pending_transfers']
+        pending_transfer_drain_time = source_blockchain_config[
+            'pending_transfer_drain_time']
+        if max_pending_transfers == 0 and pending_transfer_drain_time == 0:
+            return
+        pending_transfers = _pending_transfer_counts.get(
+            request.source_blockchain)
+        if pending_transfers is None:
+            pending_transfers = database_access.read_pending_transfer_count(
+                request.source_blockchain)
+            _pending_transfer_counts.set(request.source_blockchain,
+                                         pending_transfers)
+        if (max_pending_transfers > 0
+                and pending_transfers >= max_pending_transfers):
+            excess_transfers = pending_transfers - max_pending_transfers + 1
+            retry_after = max(
+                1, excess_transfers *
+                pending_transfer_drain_time if pending_transfer_drain_time > 0
+                else source_blockchain_config['average_block_time'])
+            _logger.warning(
+                'new transfer request: too many pending transfers', extra={
+                    'source_blockchain': request.source_blockchain.name,
+                    'pending_transfers': pending_transfers,
+                    'max_pending_transfers': max_pending_transfers
+                })
+            raise TransferInteractorOverloadedError(
+                'too many pending transfers',
+                source_blockchain=request.source_blockchain,
+                retry_after=retry_after)
+        if (pending_transfer_drain_time > 0
+                and (pending_transfers + 1) * pending_transfer_drain_time
+                > request.bid.execution_time):
+            _logger.warning(
+                'new transfer request: bid execution time cannot be met',
+                extra={
+                    'source_blockchain': request.source_blockchain.name,
+                    'pending_transfers': pending_transfers,
+                    'execution_time': request.bid.execution_time
+                })
+            raise TransferInteractorBidNotAcceptedError(
+                'execution time cannot be met')
+
+    def store_idempotent_transfer(self, idempotency_key: str,
+                                  request_hash: str,
+                                  task_id: uuid.UUID) -> None:
+        """Store the idempotency key of an initiated token transfer, so
+        that replays of the transfer request are answered with the
+        same task ID. Since the token transfer has already been
+        initiated, errors are only logged.
+
+        Parameters
+        ----------
+        idempotency_key : str
+            The idempotency key supplied by the client.
+        request_hash : str
+            The hash of the transfer request.
+        task_id : uuid.UUID
+            The unique task ID of the initiated token transfer.
+
+        """
+        try:
+            if database_access.create_idempotency_key(idempotency_key,
+                                                      request_hash, task_id):
+                _get_idempotency_key_cache().set(idempotency_key,
+                                                 (request_hash, task_id))
+            else:
+                _logger.warning(
+                    'idempotency key already stored by another request',
+                    extra={
+                        'idempotency_key': idempotency_key,
+                        'task_id': task_id
+                    })
+        except Exception:
+            _logger.error(
+                'unable to store the idempotency key of a token transfer',
+                extra={
+                    'idempotency_key': idempotency_key,
+                    'task_id': task_id
+                }, exc_info=True)
+
+    def __create_find_transfer_response(
+        self, transfer: typing.Union[Transfer, ArchivedTransfer]
+    ) -> FindTransferResponse:
+        return TransferInteractor.FindTransferResponse(
+            Blockchain(typing.cast(int, transfer.source_blockchain_id)),
+            Blockchain(typing.cast(int, transfer.destination_blockchain_id)),
+            typing.cast(str, transfer.sender_address),
+            typing.cast(str, transfer.recipient_address),
+            transfer.source_token_contract.address,
+            transfer.destination_token_contract.address, int(transfer.amount),
+            int(transfer.fee),
+            TransferStatus(typing.cast(int, transfer.status_id)),
+            None if transfer.on_chain_transfer_id is None else int(
+                transfer.on_chain_transfer_id),
+            typing.cast(str, transfer.transaction_id))
+
+    def __check_valid_transfer_signature(
+            self, source_blockchain_client: BlockchainClient,
+            request: InitiateTransferRequest) -> None:
+        """Check if the sender's signature is valid for a new token
+        transfer. This is done locally before any database record or
+        Celery task is created, so that transfer requests with invalid
+        signatures neither reach the workers nor consume any blockchain
+        node requests.
+
+        Parameters
+        ----------
+        source_blockchain_client : BlockchainClient
+            The blockchain client of the token transfer's source
+            blockchain.
+        request : InitiateTransferRequest
+            The token transfer initiation request data.
+
+        Raises
+        ------
+        TransferInteractorInvalidSignatureError
+            If the sender's signature is not valid for the token
+            transfer.
+
+        """
+        verification_request = \
+            BlockchainClient.TransferSignatureVerificationRequest(
+                request.destination_blockchain, request.sender_address,
+                request.recipient_address, request.source_token_address,
+                request.destination_token_address, request.amount,
+                int(request.bid.fee), request.nonce, request.valid_until,
+                request.signature)
+        if not source_blockchain_client.is_valid_transfer_signature(
+                verification_request):
+            _logger.warning('new transfer request: invalid sender signature',
+                            extra=vars(verification_request))
+            raise TransferInteractorInvalidSignatureError(
+                'sender signature is invalid',
+                sender_address=request.sender_address)
+
+
+def _get_idempotency_key_cache() -> LruCache[str, tuple[str, uuid.UUID]]:
+    global _idempotency_key_cache
+    if _idempotency_key_cache is None:
+        _idempotency_key_cache = LruCache(
+            config['application']['idempotency_cache_size'],
+            time_to_live=config['application']['idempotency_key_expiry'])
+    return _idempotency_key_cache
+
+
+def subscribe_to_transfer_notifications(
+        subscriber: TransferNotificationSubscriber) -> None:
+    """Subscribe to the notified changes of the transfers' statuses,
+    on-chain transfer IDs, and transaction IDs. The notifications are
+    received by a single listener thread per process (started with the
+    first subscription) and fanned out to all subscribers.
+
+    Subscribers are called from the listener thread and must therefore
+    be thread-safe and return quickly. Notifications may be missed while
+    the listener's database connection is reestablished, and are never
+    received for databases other than PostgreSQL.
+
+    Parameters
+    ----------
+    subscriber : TransferNotificationSubscriber
+        The subscriber to call for each notified transfer change.
+
+    """
+    global _transfer_notification_listener_started
+    global _transfer_notification_subscribers
+    with _transfer_notification_subscribers_lock:
+        _transfer_notification_subscribers += (subscriber, )
+        if not _transfer_notification_listener_started:
+            _transfer_notification_listener_started = True
+            threading.Thread(target=_dispatch_transfer_notifications,
+                             name='transfer-notification-listener',
+                             daemon=True).start()
+
+
+def unsubscribe_from_transfer_notifications(
+        subscriber: TransferNotificationSubscriber) -> None:
+    """Unsubscribe from the notified changes of the transfers.
+
+    Parameters
+    ----------
+    subscriber : TransferNotificationSubscriber
+        The previously subscribed subscriber.
+
+    """
+    global _transfer_notification_subscribers
+    with _transfer_notification_subscribers_lock:
+        _transfer_notification_subscribers = tuple(
+            subscriber_ for subscriber_ in _transfer_notification_subscribers
+            if subscriber_ != subscriber)
+
+
+def _dispatch_transfer_notifications() -> None:
+    listener = NotificationListener(TRANSFERS_NOTIFICATION_CHANNEL)
+    while True:
+        try:
+            payloads = listener.receive(
+                _TRANSFER_NOTIFICATION_LISTENER_TIMEOUT)
+        except Exception:
+            _logger.warning('unable to listen for transfer changes',
+                            exc_info=True)
+            time.sleep(_TRANSFER_NOTIFICATION_LISTENER_TIMEOUT)
+            continue
+        for payload in payloads:
+            _dispatch_transfer_notification(payload)
+
+
+def _dispatch_transfer_notification(payload: str) -> None:
+    try:
+        task_id, status = parse_transfer_notification_payload(payload)
+    except ValueError:
+        _logger.error('invalid transfer notification',
+                      extra={'payload': payload})
+        return
+    # The subscribers may change while they are called
+    for subscriber in _transfer_notification_subscribers:
+        try:
+            subscriber(task_id, status)
+        except Exception:
+            _logger.error('unable to notify a transfer change subscriber',
+                          extra={'task_id': str(task_id)}, exc_info=True)
+
+
+@celery.current_app.task
+def archive_transfers_task() -> int:
+    """Celery task for archiving terminal token transfers. The task
+    reschedules itself after the configured interval.
+
+    Returns
+    -------
+    int
+        The number of archived token transfers.
+
+    """
+    number_archived_transfers = 0
+    try:
+        number_archived_transfers = TransferInteractor().archive_transfers()
+        _logger.info(f'{number_archived_transfers} token transfers archived')
+    except TransferInteractorError as error:
+        _logger.error('unable to archive token transfers', extra=error.details,
+                      exc_info=True)
+    finally:
+        archive_transfers_task.apply_async(
+            countdown=config['tasks']['archive_transfers']['interval'])
+    return number_archived_transfers
+
+
+@celery.current_app.task
+def delete_expired_idempotency_keys_task() -> int:
+    """Celery task for deleting expired idempotency keys. The task
+    reschedules itself after the configured interval.
+
+    Returns
+    -------
+    int
+        The number of deleted idempotency keys.
+
+    """
+    number_deleted_keys = 0
+    try:
+        number_deleted_keys = \
+            TransferInteractor().delete_expired_idempotency_keys()
+        _logger.info(f'{number_deleted_keys} expired idempotency keys deleted')
+    except TransferInteractorError as error:
+        _logger.error('unable to delete expired idempotency keys',
+                      extra=error.details, exc_info=True)
+    finally:
+        delete_expired_idempotency_keys_task.apply_async(
+            countdown=config['tasks']['delete_expired_idempotency_keys']
+            ['interval'])
+    return number_deleted_keys
+
+
+@celery.current_app.task
+def recover_transfers_task() -> int:
+    """Celery task for re-driving orphaned token transfers. The task
+    reschedules itself after the configured interval.
+
+    Returns
+    -------
+    int
+        The number of re-driven token transfers.
+
+    """
+    number_recovered_transfers = 0
+    try:
+        number_recovered_transfers = TransferInteractor().recover_transfers()
+        _logger.info(
+            f'{number_recovered_transfers} orphaned token transfers re-driven')
+    except TransferInteractorError as error:
+        _logger.error('unable to recover token transfers', extra=error.details,
+                      exc_info=True)
+    finally:
+        recover_transfers_task.apply_async(
+            countdown=config['tasks']['recover_transfers']['interval'])
+    return number_recovered_transfers
+
 
 @celery.current_app.task(bind=True, max_retries=100)
 def confirm_transfer_task(self, internal_transfer_id: int,
@@ -909,11 +1703,22 @@ def execute_transfer_task(self, internal_transfer_id: int,
     try:
         internal_transaction_id = TransferInteractor().execute_transfer(
             execute_transfer_request)
+        if internal_transaction_id is None:
+            # E.g. a re-driven task of a transfer that is still being
+            # executed by its original task
+            _logger.info(
+                'token transfer already executed or being executed - '
+                'skipped', extra=vars(execute_transfer_request))
+            return True
         confirm_transfer_interval = config['tasks']['confirm_transfer'][
             'interval']
+        # The internal transaction ID is used as task ID, so that the
+        # recovery of orphaned transfers can determine the state of the
+        # confirmation task
         confirm_transfer_task.apply_async(
             args=(internal_transfer_id, source_blockchain_id,
                   destination_blockchain_id, str(internal_transaction_id)),
+            task_id=str(internal_transaction_id),
             countdown=confirm_transfer_interval)
         return True
     except TransferInteractorUnrecoverableError as error:
@@ -0,0 +1,107 @@
+"""Module for process-local in-memory caches.
+
+"""
+import collections
+import threading
+import time
+import typing
+
+K = typing.TypeVar('K')
+V = typing.TypeVar('V')
+
+
+class LruCache(typing.Generic[K, V]):
+    """Thread-safe, size-bounded in-memory cache with a least recently
+    used eviction policy. Entries can optionally expire after a given
+    time to live.
+
+    """
+    def __init__(self, max_size: int,
+                 time_to_live: typing.Optional[float] = None):
+        """Construct a cache instance.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of entries held by the cache.
+        time_to_live : float or None
+            The time (in seconds) after which an entry expires (entries
+            never expire if None).
+
+        """
+        assert max_size > 0
+        assert time_to_live is None or time_to_live > 0
+        self.__max_size = max_size
+        self.__time_to_live = time_to_live
+        self.__entries: collections.OrderedDict[K, tuple[
+            V, typing.Optional[float]]] = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+    def get(self, key: K) -> typing.Optional[V]:
+        """Get the value of a cache entry.
+
+        Parameters
+        ----------
+        key : K
+            The key of the cache entry.
+
+        Returns
+        -------
+        V or None
+            The cached value, or None if there is no (unexpired) entry
+            for the given key.
+
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            value, expiry_time = entry
+            if expiry_time is not None and expiry_time <= time.monotonic():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Add or replace a cache entry. If the cache is full, the least
+        recently used entry is evicted.
+
+        Parameters
+        ----------
+        key : K
+            The key of the cache entry.
+        value : V
+            The value to be cached.
+
+        """
+        expiry_time = (None if self.__time_to_live is None else
+                       time.monotonic() + self.__time_to_live)
+        with self.__lock:
+            self.__entries[key] = (value, expiry_time)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def remove(self, key: K) -> None:
+        """Remove a cache entry (if it exists).
+
+        Parameters
+        ----------
+        key : K
+            The key of the cache entry.
+
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cache entries.
+
+        """
+        with self.__lock:
+            self.__entries.clear()
@@ -5,9 +5,13 @@ import logging
 import os
 import pathlib
 import sys
+import threading
+import time
+import typing
 
 import amqp  # type: ignore
 import celery  # type: ignore
+import celery.concurrency  # type: ignore
 import certifi  # type: ignore
 from pantos.common.logging import LogFile
 from pantos.common.logging import LogFormat
@@ -17,11 +21,22 @@ from pantos.servicenode.application import initialize_application
 from pantos.servicenode.configuration import config
 from pantos.servicenode.configuration import load_config
 from pantos.servicenode.database import get_engine
+from pantos.servicenode.database import get_pool_metrics
+from pantos.servicenode.database import get_replica_engine
+from pantos.servicenode.database import initialize_pools
+from pantos.servicenode.database.pools import ProcessRole
 from pantos.servicenode.plugins import initialize_plugins
 
 _TRANSFERS_QUEUE_NAME = 'transfers'
 _BIDS_QUEUE_NAME = 'bids'
 _TRANSACTIONS_QUEUE_NAME = 'transactions'
+_MAINTENANCE_QUEUE_NAME = 'maintenance'
+
+_SINGLE_TASK_POOL_MODULES = [
+    'celery.concurrency.prefork', 'celery.concurrency.solo'
+]
+"""Modules of the Celery execution pools whose worker processes each
+execute a single task at a time."""
 
 _logger = logging.getLogger(__name__)
 """Logger for this module."""
@@ -72,7 +87,8 @@ celery_app = celery.Celery(
     backend=config['celery']['backend'], include=[
         'pantos.common.blockchains.tasks',
         'pantos.servicenode.business.transfers',
-        'pantos.servicenode.business.plugins'
+        'pantos.servicenode.business.plugins',
+        'pantos.servicenode.business.statistics'
     ], broker_use_ssl=ca_certs)
 """Celery application instance."""
 
@@ -85,6 +101,20 @@ celery_app.conf.update(
         'pantos.servicenode.business.plugins.execute_bid_plugin': {
             'queue': _BIDS_QUEUE_NAME
         },
+        'pantos.servicenode.business.transfers.archive_transfers_task': {
+            'queue': _MAINTENANCE_QUEUE_NAME
+        },
+        'pantos.servicenode.business.transfers.recover_transfers_task': {
+            'queue': _MAINTENANCE_QUEUE_NAME
+        },
+        'pantos.servicenode.business.transfers.'
+        'delete_expired_idempotency_keys_task': {
+            'queue': _MAINTENANCE_QUEUE_NAME
+        },
+        'pantos.servicenode.business.statistics.'
+        'roll_up_transfer_statistics_task': {
+            'queue': _MAINTENANCE_QUEUE_NAME
+        },
         'pantos.servicenode.business.transfers.*': {
             'queue': _TRANSFERS_QUEUE_NAME
         },
@@ -104,13 +134,36 @@ celery_app.conf.update(
     broker_connection_retry_on_startup=False)
 
 if is_main_module():  # pragma: no cover
-    # purge the bids queue at startup
+    # purge the bids and maintenance queues at startup (the periodic
+    # tasks are restarted below)
     with celery_app.connection_for_write() as connection:
-        try:
-            connection.default_channel.queue_purge(_BIDS_QUEUE_NAME)
-        except amqp.exceptions.NotFound as error:
-            _logger.warning(str(error))
+        for queue_name in [_BIDS_QUEUE_NAME, _MAINTENANCE_QUEUE_NAME]:
+            try:
+                connection.default_channel.queue_purge(queue_name)
+            except amqp.exceptions.NotFound as error:
+                _logger.warning(str(error))
     initialize_plugins(start_worker=True)
+    if config['tasks']['archive_transfers']['retention_age'] > 0:
+        # Imported here to prevent a circular import
+        from pantos.servicenode.business.transfers import \
+            archive_transfers_task
+        archive_transfers_task.delay()
+    if config['tasks']['recover_transfers']['stale_age'] > 0:
+        # Imported here to prevent a circular import
+        from pantos.servicenode.business.transfers import \
+            recover_transfers_task
+
+        # Orphaned transfers (e.g. of a previously crashed worker) are
+        # re-driven right at startup
+        recover_transfers_task.delay()
+    # Imported here to prevent a circular import
+    from pantos.servicenode.business.transfers import \
+        delete_expired_idempotency_keys_task
+    delete_expired_idempotency_keys_task.delay()
+    # Imported here to prevent a circular import
+    from pantos.servicenode.business.statistics import \
+        roll_up_transfer_statistics_task
+    roll_up_transfer_statistics_task.delay()
 
 
 @celery.signals.after_setup_task_logger.connect  # Celery task logger
@@ -154,3 +207,62 @@ def prep_db_pool(**kwargs):
     https://docs.sqlalchemy.org/en/latest/core/pooling.html#using-connection-pools-with-multiprocessing
     """ # noqa
     get_engine().dispose()  # pragma: no cover
+    replica_engine = get_replica_engine()  # pragma: no cover
+    if replica_engine is not None:  # pragma: no cover
+        replica_engine.dispose()
+    _start_pool_metrics_logging()  # pragma: no cover
+
+
+@celery.signals.worker_init.connect
+def initialize_worker_pools(sender: typing.Any, **kwargs):
+    """Sent before the Celery worker starts its execution pool. Used to
+    size the database connection pools according to the queues the
+    worker consumes from and its concurrency (child processes of a
+    prefork pool inherit the sizing).
+
+    Parameters
+    ----------
+    sender : celery.worker.WorkController
+        The Celery worker.
+
+    """
+    queue_names = set(sender.app.amqp.queues.consume_from)
+    process_role = (ProcessRole.BID_WORKER if queue_names
+                    == {_BIDS_QUEUE_NAME} else ProcessRole.TRANSFER_WORKER)
+    pool_module = celery.concurrency.get_implementation(
+        sender.pool_cls).__module__
+    is_single_task_pool = pool_module in _SINGLE_TASK_POOL_MODULES
+    initialize_pools(process_role,
+                     1 if is_single_task_pool else sender.concurrency)
+    if pool_module != 'celery.concurrency.prefork':
+        # Tasks are executed in the worker process itself
+        _start_pool_metrics_logging()
+
+
+def _start_pool_metrics_logging() -> None:
+    interval = config['database']['pool_metrics_log_interval']
+    if interval > 0:
+        threading.Thread(target=_log_pool_metrics_periodically,
+                         args=(interval, ), daemon=True).start()
+
+
+def _log_pool_metrics_periodically(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            _log_pool_metrics()
+        except Exception:
+            _logger.error('unable to log the database pool metrics',
+                          exc_info=True)
+
+
+def _log_pool_metrics() -> None:
+    for engine_name, metrics in get_pool_metrics().items():
+        mean_wait_time = (0.0 if metrics.checkouts == 0 else
+                          metrics.checkout_wait_time / metrics.checkouts)
+        _logger.info(
+            'database pool %s: %i of %i connections checked out '
+            '(saturation %.2f), %i checkouts (mean wait time %.4f s), %i '
+            'checkout timeouts', engine_name, metrics.checked_out,
+            metrics.pool_size + metrics.max_overflow, metrics.saturation,
+            metrics.checkouts, mean_wait_time, metrics.checkout_timeouts)
@@ -104,6 +104,16 @@ _VALIDATION_SCHEMA_BLOCKCHAIN = {
         'deposit': {
             'type': 'integer',
             'required': True
+        },
+        'max_pending_transfers': {
+            'type': 'integer',
+            'min': 0,
+            'default': 0
+        },
+        'pending_transfer_drain_time': {
+            'type': 'integer',
+            'min': 0,
+            'default': 0
         }
     }
 }
@@ -155,6 +165,25 @@ _VALIDATION_SCHEMA_LOG = {
 }
 """Schema for validating a log entry in the configuration file."""
 
+_VALIDATION_SCHEMA_RATE_LIMIT = {
+    'type': 'dict',
+    'default': {},
+    'schema': {
+        'capacity': {
+            'type': 'integer',
+            'min': 0,
+            'default': 0
+        },
+        'refill_rate': {
+            'type': 'float',
+            'min': 0,
+            'default': 0.0
+        }
+    }
+}
+"""Schema for validating a rate limit entry in the configuration
+file."""
+
 _VALIDATION_SCHEMA = {
     'protocol': {
         'type': 'string',
@@ -197,6 +226,82 @@ _VALIDATION_SCHEMA = {
                 'required': True,
                 'empty': False
             },
+            'workers': {
+                'type': 'integer',
+                'min': 0,
+                'default': 0
+            },
+            'worker_class': {
+                'type': 'string',
+                'allowed': ['sync', 'gthread'],
+                'default': 'sync'
+            },
+            'threads': {
+                'type': 'integer',
+                'min': 1,
+                'default': 1
+            },
+            'timeout': {
+                'type': 'integer',
+                'min': 0,
+                'default': 30
+            },
+            'max_request_body_size': {
+                'type': 'integer',
+                'min': 1,
+                'default': 65536
+            },
+            'idempotency_cache_size': {
+                'type': 'integer',
+                'min': 1,
+                'default': 10000
+            },
+            'idempotency_key_expiry': {
+                'type': 'integer',
+                'min': 1,
+                'default': 86400
+            },
+            'transfer_status_cache_size': {
+                'type': 'integer',
+                'min': 1,
+                'default': 10000
+            },
+            'transfer_status_cache_time_to_live': {
+                'type': 'float',
+                'min': 0,
+                'default': 1.0
+            },
+            'bids_snapshot_refresh_interval': {
+                'type': 'float',
+                'min': 0,
+                'default': 60.0
+            },
+            'transfers_export_enabled': {
+                'type': 'boolean',
+                'default': False
+            },
+            'trusted_proxy_count': {
+                'type': 'integer',
+                'min': 0,
+                'default': 0
+            },
+            'rate_limit_cache_size': {
+                'type': 'integer',
+                'min': 1,
+                'default': 100000
+            },
+            'rate_limits': {
+                'type': 'dict',
+                'default': {},
+                'schema': {
+                    'transfer': _VALIDATION_SCHEMA_RATE_LIMIT,
+                    'transfer_status': _VALIDATION_SCHEMA_RATE_LIMIT,
+                    'bids': _VALIDATION_SCHEMA_RATE_LIMIT,
+                    'transfers': _VALIDATION_SCHEMA_RATE_LIMIT,
+                    'transfers_export': _VALIDATION_SCHEMA_RATE_LIMIT,
+                    'stats': _VALIDATION_SCHEMA_RATE_LIMIT
+                }
+            },
             'log': _VALIDATION_SCHEMA_LOG
         }
     },
@@ -209,18 +314,56 @@ _VALIDATION_SCHEMA = {
                 'required': True,
                 'empty': False
             },
+            'replica_url': {
+                'type': 'string',
+                'empty': False
+            },
+            'direct_url': {
+                'type': 'string',
+                'empty': False
+            },
+            'transaction_pooling': {
+                'type': 'boolean',
+                'default': False
+            },
             'pool_size': {
                 'type': 'integer',
-                'required': True
+                'min': 1
             },
             'max_overflow': {
                 'type': 'integer',
-                'required': True
+                'min': 0
+            },
+            'transfer_worker_pool_size': {
+                'type': 'integer',
+                'min': 1
+            },
+            'transfer_worker_max_overflow': {
+                'type': 'integer',
+                'min': 0
+            },
+            'bid_worker_pool_size': {
+                'type': 'integer',
+                'min': 1
+            },
+            'bid_worker_max_overflow': {
+                'type': 'integer',
+                'min': 0
+            },
+            'pool_metrics_log_interval': {
+                'type': 'integer',
+                'min': 0,
+                'default': 60
             },
             'echo': {
                 'type': 'boolean',
                 'default': False
             },
+            'prepare_threshold': {
+                'type': 'integer',
+                'min': 0,
+                'default': 5
+            },
             'alembic_config': {
                 'type': 'string',
                 'required': True,
@@ -309,6 +452,95 @@ _VALIDATION_SCHEMA = {
                         'required': True
                     }
                 }
+            },
+            'archive_transfers': {
+                'type': 'dict',
+                'default': {},
+                'schema': {
+                    'retention_age': {
+                        'type': 'integer',
+                        'min': 0,
+                        'default': 2592000
+                    },
+                    'batch_size': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 1000
+                    },
+                    'max_batches': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 10
+                    },
+                    'interval': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 3600
+                    }
+                }
+            },
+            'delete_expired_idempotency_keys': {
+                'type': 'dict',
+                'default': {},
+                'schema': {
+                    'interval': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 3600
+                    }
+                }
+            },
+            'roll_up_transfer_statistics': {
+                'type': 'dict',
+                'default': {},
+                'schema': {
+                    'batch_size': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 1000
+                    },
+                    'max_batches': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 10
+                    },
+                    'interval': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 60
+                    }
+                }
+            },
+            'recover_transfers': {
+                'type': 'dict',
+                'default': {},
+                'schema': {
+                    'stale_age': {
+                        'type': 'integer',
+                        'min': 0,
+                        'default': 3600
+                    },
+                    'batch_size': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 100
+                    },
+                    'max_batches': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 10
+                    },
+                    'max_rate': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 10
+                    },
+                    'interval': {
+                        'type': 'integer',
+                        'min': 1,
+                        'default': 600
+                    }
+                }
             }
         }
     },
@@ -322,6 +554,10 @@ _VALIDATION_SCHEMA = {
 }
 """Schema for validating the configuration file."""
 
+_active_registered_blockchains: typing.Optional[frozenset[Blockchain]] = None
+"""Blockchains which are active and where the service node is
+registered (derived once from the loaded configuration)."""
+
 
 def get_blockchain_config(blockchain: Blockchain) -> \
         typing.Dict[str, typing.Any]:
@@ -389,6 +625,26 @@ def get_blockchains_rpc_nodes() \
     return rpc_nodes
 
 
+def get_active_registered_blockchains() -> frozenset[Blockchain]:
+    """Get the blockchains which are active and where the service node
+    is registered. The result is determined only once for each loaded
+    configuration.
+
+    Returns
+    -------
+    frozenset of Blockchain
+        The active blockchains with a service node registration.
+
+    """
+    global _active_registered_blockchains
+    if _active_registered_blockchains is None:
+        _active_registered_blockchains = frozenset(
+            blockchain for blockchain in Blockchain
+            if get_blockchain_config(blockchain)['active']
+            and get_blockchain_config(blockchain)['registered'])
+    return _active_registered_blockchains
+
+
 def load_config(file_path: typing.Optional[str] = None,
                 reload: bool = True) -> None:
     """Load the configuration from a configuration file.
@@ -413,5 +669,7 @@ def load_config(file_path: typing.Optional[str] = None,
     Config.load
 
     """
+    global _active_registered_blockchains
     if reload or not config.is_loaded():
         config.load(_VALIDATION_SCHEMA, file_path)
+        _active_registered_blockchains = None
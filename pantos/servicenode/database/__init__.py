@@ -6,7 +6,9 @@ import typing
 
 import sqlalchemy
 import sqlalchemy.exc
+import sqlalchemy.ext.asyncio
 import sqlalchemy.orm
+import sqlalchemy.pool
 from alembic import command
 from alembic.config import Config
 from pantos.common.blockchains.enums import Blockchain
@@ -18,9 +20,24 @@ from pantos.servicenode.database.exceptions import DatabaseError
 from pantos.servicenode.database.models import Blockchain as Blockchain_
 from pantos.servicenode.database.models import \
     TransferStatus as TransferStatus_
+from pantos.servicenode.database.pools import MeteredAsyncAdaptedQueuePool
+from pantos.servicenode.database.pools import MeteredQueuePool
+from pantos.servicenode.database.pools import PoolMetrics
+from pantos.servicenode.database.pools import ProcessRole
 
 _session_maker: typing.Optional[sqlalchemy.orm.sessionmaker] = None
 _sql_engine: typing.Optional[sqlalchemy.engine.base.Engine] = None
+_replica_session_maker: typing.Optional[sqlalchemy.orm.sessionmaker] = None
+_replica_sql_engine: typing.Optional[sqlalchemy.engine.base.Engine] = None
+_async_session_maker: typing.Optional[
+    sqlalchemy.ext.asyncio.async_sessionmaker] = None
+_async_sql_engine: typing.Optional[sqlalchemy.ext.asyncio.AsyncEngine] = None
+_async_replica_session_maker: typing.Optional[
+    sqlalchemy.ext.asyncio.async_sessionmaker] = None
+_async_replica_sql_engine: typing.Optional[
+    sqlalchemy.ext.asyncio.AsyncEngine] = None
+_process_role = ProcessRole.WEB
+_process_concurrency = 1
 _logger = logging.getLogger(__name__)
 
 
@@ -82,6 +99,214 @@ def get_session() -> sqlalchemy.orm.Session:
     return get_session_maker()()
 
 
+def get_replica_engine() -> typing.Optional[sqlalchemy.engine.base.Engine]:
+    """Get the session engine of the read replica, used to clean up
+    connections.
+
+    Returns
+    -------
+    sqlalchemy.engine.base.Engine or None
+        The session engine of the read replica, or None if no read
+        replica is configured (or the database package has not been
+        initialized).
+
+    """
+    return _replica_sql_engine
+
+
+def get_replica_session_maker(
+) -> typing.Optional[sqlalchemy.orm.sessionmaker]:
+    """Get the session maker for making sessions for read-only
+    operations on the read replica. Data read from the replica may lag
+    slightly behind the primary database.
+
+    Returns
+    -------
+    sqlalchemy.orm.sessionmaker or None
+        The session maker of the read replica, or None if no read
+        replica is configured (or the database package has not been
+        initialized).
+
+    """
+    return _replica_session_maker
+
+
+def get_async_engine() -> sqlalchemy.ext.asyncio.AsyncEngine:
+    """Get the asyncio session engine, used to clean up connections.
+    The engine is created on first use since it requires an async
+    database driver (e.g. psycopg for PostgreSQL).
+
+    Returns
+    -------
+    sqlalchemy.ext.asyncio.AsyncEngine
+        The asyncio session engine.
+
+    Raises
+    ------
+    DatabaseError
+        If the database package has not been initialized.
+
+    """
+    global _async_sql_engine
+    if _async_sql_engine is None:
+        if _sql_engine is None:
+            raise DatabaseError('database package not yet initialized')
+        _async_sql_engine = _create_async_engine(config['database']['url'])
+    return _async_sql_engine
+
+
+def get_async_session_maker() -> sqlalchemy.ext.asyncio.async_sessionmaker:
+    """Get the session maker for making asyncio sessions for managing
+    persistence operations for ORM-mapped objects.
+
+    Returns
+    -------
+    sqlalchemy.ext.asyncio.async_sessionmaker
+        The asyncio session maker.
+
+    Raises
+    ------
+    DatabaseError
+        If the database package has not been initialized.
+
+    """
+    global _async_session_maker
+    if _async_session_maker is None:
+        _async_session_maker = sqlalchemy.ext.asyncio.async_sessionmaker(
+            bind=get_async_engine())
+    return _async_session_maker
+
+
+def get_async_replica_session_maker(
+) -> typing.Optional[sqlalchemy.ext.asyncio.async_sessionmaker]:
+    """Get the session maker for making asyncio sessions for read-only
+    operations on the read replica. Data read from the replica may lag
+    slightly behind the primary database.
+
+    Returns
+    -------
+    sqlalchemy.ext.asyncio.async_sessionmaker or None
+        The asyncio session maker of the read replica, or None if no
+        read replica is configured (or the database package has not
+        been initialized).
+
+    """
+    global _async_replica_sql_engine
+    global _async_replica_session_maker
+    if (_async_replica_session_maker is None
+            and _replica_sql_engine is not None):
+        _async_replica_sql_engine = _create_async_engine(
+            config['database']['replica_url'])
+        _async_replica_session_maker = \
+            sqlalchemy.ext.asyncio.async_sessionmaker(
+                bind=_async_replica_sql_engine)
+    return _async_replica_session_maker
+
+
+def get_direct_url() -> typing.Optional[str]:
+    """Get the URL for database connections that require session-level
+    state (e.g. for listening to notifications), which must not be
+    established through a transaction-pooling proxy.
+
+    Returns
+    -------
+    str or None
+        The direct URL of the primary database, or None if the service
+        node connects to the database through a transaction-pooling
+        proxy and no direct URL is configured.
+
+    """
+    direct_url = config['database'].get('direct_url')
+    if direct_url is None and not config['database']['transaction_pooling']:
+        direct_url = config['database']['url']
+    return direct_url
+
+
+def get_process_role() -> ProcessRole:
+    """Get the role of the current process, according to which its
+    database connection pools are sized.
+
+    Returns
+    -------
+    ProcessRole
+        The role of the current process.
+
+    """
+    return _process_role
+
+
+def get_pool_metrics() -> dict[str, PoolMetrics]:
+    """Get the metrics of the database connection pools of the
+    current process.
+
+    Returns
+    -------
+    dict
+        The metrics of each connection pool, by the name of its engine
+        ("primary", "replica", "async_primary", or "async_replica").
+        Engines without a connection pool of their own (e.g. when
+        connecting through a transaction-pooling proxy) and engines
+        that have not been created yet are omitted.
+
+    """
+    sql_engines = {
+        'primary': _sql_engine,
+        'replica': _replica_sql_engine,
+        'async_primary': _async_sql_engine,
+        'async_replica': _async_replica_sql_engine
+    }
+    pool_metrics = {}
+    for engine_name, sql_engine in sql_engines.items():
+        pool = None if sql_engine is None else sql_engine.pool
+        if isinstance(pool, (MeteredQueuePool, MeteredAsyncAdaptedQueuePool)):
+            pool_metrics[engine_name] = pool.get_metrics()
+    return pool_metrics
+
+
+def initialize_pools(process_role: ProcessRole,
+                     process_concurrency: int = 1) -> None:
+    """Size the database connection pools of the current process
+    according to its role. Existing connections are closed, and the
+    engines are recreated with the new pool size.
+
+    Parameters
+    ----------
+    process_role : ProcessRole
+        The role of the current process.
+    process_concurrency : int
+        The number of tasks the process executes concurrently.
+
+    Raises
+    ------
+    DatabaseError
+        If the database package has not been initialized.
+
+    """
+    if _sql_engine is None:
+        raise DatabaseError('database package not yet initialized')
+    global _process_role
+    _process_role = process_role
+    global _process_concurrency
+    _process_concurrency = process_concurrency
+    pool_size, max_overflow = _get_pool_size()
+    _logger.info(
+        'database connection pools sized for role %s: pool size %i, '
+        'max overflow %i', process_role.value, pool_size, max_overflow)
+    _sql_engine.dispose()
+    if _replica_sql_engine is not None:
+        _replica_sql_engine.dispose()
+    _create_engines()
+    # The asyncio engines are recreated on first use
+    global _async_sql_engine
+    global _async_session_maker
+    global _async_replica_sql_engine
+    global _async_replica_session_maker
+    _async_sql_engine = None
+    _async_session_maker = None
+    _async_replica_sql_engine = None
+    _async_replica_session_maker = None
+
+
 def run_migrations(config_path: str, dsn: str) -> None:
     _logger.info('running DB migrations using %r', config_path)
     alembic_cfg = Config(config_path)
@@ -94,18 +319,20 @@ def initialize_package(is_flask_app: bool = False) -> None:
     # Before connecting, run alembic to ensure
     # the database schema is up to date
     if is_flask_app and config['database']['apply_migrations']:
-        run_migrations(config['database']['alembic_config'],
-                       config['database']['url'])
+        run_migrations(
+            config['database']['alembic_config'],
+            config['database'].get('direct_url', config['database']['url']))
 
-    global _sql_engine
-    _sql_engine = sqlalchemy.create_engine(
-        config['database']['url'], pool_size=config['database']['pool_size'],
-        max_overflow=config['database']['max_overflow'], pool_pre_ping=True,
-        echo=config['database']['echo'])
-    global _session_maker
-    _session_maker = sqlalchemy.orm.sessionmaker(bind=_sql_engine)
+    global _process_role
+    _process_role = (ProcessRole.WEB
+                     if is_flask_app else ProcessRole.TRANSFER_WORKER)
+    global _process_concurrency
+    _process_concurrency = (config['application']['threads']
+                            if is_flask_app else 1)
+    _create_engines()
     # Initialize the tables
     if is_flask_app:
+        assert _session_maker is not None
         with _session_maker.begin() as session:
             assert isinstance(session, Session)
             # Blockchain table
@@ -127,3 +354,83 @@ def initialize_package(is_flask_app: bool = False) -> None:
                     session.add(
                         TransferStatus_(id=transfer_status.value,
                                         name=transfer_status.name))
+
+
+def _create_engines() -> None:
+    global _sql_engine
+    _sql_engine = _create_engine(config['database']['url'])
+    global _session_maker
+    _session_maker = sqlalchemy.orm.sessionmaker(bind=_sql_engine)
+    replica_url = config['database'].get('replica_url')
+    if replica_url is not None:
+        global _replica_sql_engine
+        _replica_sql_engine = _create_engine(replica_url)
+        global _replica_session_maker
+        _replica_session_maker = sqlalchemy.orm.sessionmaker(
+            bind=_replica_sql_engine)
+
+
+def _create_engine(url: str) -> sqlalchemy.engine.base.Engine:
+    return sqlalchemy.create_engine(url, **_get_engine_arguments(url, False))
+
+
+def _create_async_engine(url: str) -> sqlalchemy.ext.asyncio.AsyncEngine:
+    # Synchronous driver names are mapped to their asyncio variants
+    # (e.g. "postgresql+psycopg" to "postgresql+psycopg_async")
+    return sqlalchemy.ext.asyncio.create_async_engine(
+        url, **_get_engine_arguments(url, True))
+
+
+def _get_pool_size() -> tuple[int, int]:
+    database_config = config['database']
+    key_prefix = ('' if _process_role is ProcessRole.WEB else
+                  f'{_process_role.value}_')
+    # Unless configured explicitly, the pools of a process are sized to
+    # the number of requests (web server) or tasks (Celery workers) the
+    # process handles concurrently (with the same number of overflow
+    # connections, e.g. for reading the primary database while a replica
+    # session is open)
+    pool_size = database_config.get(f'{key_prefix}pool_size',
+                                    _process_concurrency)
+    max_overflow = database_config.get(f'{key_prefix}max_overflow',
+                                       _process_concurrency)
+    return pool_size, max_overflow
+
+
+def _get_engine_arguments(url: str, is_async: bool) -> dict[str, typing.Any]:
+    database_config = config['database']
+    is_psycopg = \
+        sqlalchemy.engine.make_url(url).get_driver_name() == 'psycopg'
+    connect_args: dict[str, typing.Any] = {}
+    arguments: dict[str, typing.Any] = {
+        'echo': database_config['echo'],
+        'connect_args': connect_args
+    }
+    if database_config['transaction_pooling']:
+        # Behind a transaction-pooling proxy (e.g. PgBouncer), the
+        # transactions of a client connection may each be run on a
+        # different server connection. Therefore, the proxy does all
+        # the pooling, and no server-side prepared statements are
+        # created.
+        arguments['poolclass'] = sqlalchemy.pool.NullPool
+        if is_psycopg:
+            connect_args['prepare_threshold'] = None
+    else:
+        # The pools are sized according to the role of the process
+        # (see the initialize_pools function)
+        pool_size, max_overflow = _get_pool_size()
+        arguments |= {
+            'poolclass': (MeteredAsyncAdaptedQueuePool
+                          if is_async else MeteredQueuePool),
+            'pool_size': pool_size,
+            'max_overflow': max_overflow,
+            'pool_pre_ping': True
+        }
+        if is_psycopg:
+            # psycopg prepares a statement on the server once it has
+            # been executed the given number of times on a connection
+            # (which only pays off for statements with bound parameters
+            # instead of literals, see the access module)
+            connect_args['prepare_threshold'] = \
+                database_config['prepare_threshold']
+    return arguments
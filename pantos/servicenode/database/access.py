@@ -3,32 +3,190 @@ records.
 
 """
 import datetime
-import logging
 import typing
 import uuid
 
 import sqlalchemy
+import sqlalchemy.dialects.postgresql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.exc
 import sqlalchemy.orm
 from pantos.common.blockchains.enums import Blockchain
-from pantos.common.types import BlockchainAddress
 
+from pantos.servicenode.database import get_replica_session_maker
 from pantos.servicenode.database import get_session
 from pantos.servicenode.database import get_session_maker
+from pantos.servicenode.database import operations
 from pantos.servicenode.database.enums import TransferStatus
-from pantos.servicenode.database.exceptions import DatabaseError
-from pantos.servicenode.database.exceptions import SenderNonceNotUniqueError
-from pantos.servicenode.database.models import UNIQUE_SENDER_NONCE_CONSTRAINT
+from pantos.servicenode.database.models import EXECUTABLE_TRANSFER_STATUS_IDS
+from pantos.servicenode.database.models import IN_FLIGHT_TRANSFER_STATUS_IDS
+from pantos.servicenode.database.models import TERMINAL_TRANSFER_STATUS_IDS
+from pantos.servicenode.database.models import ArchivedTransfer
 from pantos.servicenode.database.models import Base
 from pantos.servicenode.database.models import Bid
+from pantos.servicenode.database.models import BidVersion
 from pantos.servicenode.database.models import ForwarderContract
 from pantos.servicenode.database.models import HubContract
+from pantos.servicenode.database.models import IdempotencyKey
 from pantos.servicenode.database.models import TokenContract
 from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.models import TransferStatistics
+from pantos.servicenode.database.models import status_id_in
+from pantos.servicenode.database.notifications import BIDS_NOTIFICATION_CHANNEL
+from pantos.servicenode.database.operations import TransferUpdate
+
+_NON_ARCHIVED_TRANSFER_COLUMNS: typing.Final[frozenset[str]] = frozenset(
+    Transfer.__table__.columns.keys()) - frozenset(
+        ArchivedTransfer.__table__.columns.keys())
+"""Names of the columns of the "transfers" table that are not copied to
+the "transfers_archive" table."""
+
+
+def archive_transfers(updated_before: datetime.datetime,
+                      batch_size: int) -> int:
+    """Move a batch of terminal transfer database records that have not
+    been updated since a given point in time to the "transfers_archive"
+    table. Failed transfers are only archived if their nonce cannot be
+    reused anymore, and transfers are only archived after their status
+    has been rolled up into the transfer statistics.
 
-_logger = logging.getLogger(__name__)
+    Parameters
+    ----------
+    updated_before : datetime.datetime
+        The point in time before which the transfers have last been
+        updated (or created if they have never been updated).
+    batch_size : int
+        The maximum number of transfers to archive.
+
+    Returns
+    -------
+    int
+        The number of archived transfers.
+
+    """
+    transfer_columns = [
+        column.name for column in Transfer.__table__.columns
+        if column.name not in _NON_ARCHIVED_TRANSFER_COLUMNS
+    ]
+    select_statement = sqlalchemy.select(Transfer.id).where(
+        status_id_in(Transfer.status_id, TERMINAL_TRANSFER_STATUS_IDS),
+        sqlalchemy.or_(Transfer.status_id != TransferStatus.FAILED.value,
+                       Transfer.nonce.is_(None)),
+        Transfer.statistics_status_id == Transfer.status_id,
+        sqlalchemy.func.coalesce(Transfer.updated, Transfer.created)
+        < updated_before).order_by(
+            Transfer.id).limit(batch_size).with_for_update(skip_locked=True)
+    with get_session_maker().begin() as session:
+        internal_transfer_ids = session.execute(
+            select_statement).scalars().all()
+        if len(internal_transfer_ids) == 0:
+            return 0
+        archived = datetime.datetime.now(datetime.UTC)
+        transfer_values = sqlalchemy.select(
+            *[getattr(Transfer, column) for column in transfer_columns],
+            sqlalchemy.literal(archived)).where(
+                Transfer.id.in_(internal_transfer_ids))
+        session.execute(
+            sqlalchemy.insert(ArchivedTransfer).from_select(
+                transfer_columns + ['archived'], transfer_values))
+        session.execute(
+            sqlalchemy.delete(Transfer).where(
+                Transfer.id.in_(internal_transfer_ids)),
+            execution_options=sqlalchemy.util._collections.immutabledict(
+                {'synchronize_session': False}))
+        return len(internal_transfer_ids)
+
+
+def claim_stale_transfers(source_blockchain: Blockchain,
+                          updated_before: datetime.datetime,
+                          limit: int) -> list[Transfer]:
+    """Claim a batch of in-flight transfer database records of a source
+    blockchain that have not been updated since a given point in time.
+    The claimed records are marked as updated in the same transaction,
+    so that they are not claimed again before they are stale again
+    (also not by concurrent callers, which skip locked records).
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the transfers.
+    updated_before : datetime.datetime
+        The point in time before which the transfers have last been
+        updated (or created if they have never been updated).
+    limit : int
+        The maximum number of transfers to claim.
+
+    Returns
+    -------
+    list of Transfer
+        The claimed transfers (ordered by their internal ID).
+
+    """
+    assert limit > 0
+    # Restricted to the predicate of the partial in-flight transfers
+    # index so that only the in-flight transfers are scanned
+    select_statement = sqlalchemy.select(Transfer.id).where(
+        Transfer.source_blockchain_id == source_blockchain.value,
+        status_id_in(Transfer.status_id, IN_FLIGHT_TRANSFER_STATUS_IDS),
+        sqlalchemy.func.coalesce(Transfer.updated, Transfer.created)
+        < updated_before).order_by(
+            Transfer.id).limit(limit).with_for_update(skip_locked=True)
+    with get_session_maker().begin() as session:
+        internal_transfer_ids = session.execute(
+            select_statement).scalars().all()
+        if len(internal_transfer_ids) == 0:
+            return []
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id.in_(internal_transfer_ids)).values(
+                    updated=datetime.datetime.now(datetime.UTC)),
+            execution_options=sqlalchemy.util._collections.immutabledict(
+                {'synchronize_session': False}))
+        transfers = list(
+            session.execute(
+                sqlalchemy.select(Transfer).where(
+                    Transfer.id.in_(internal_transfer_ids)).order_by(
+                        Transfer.id)).unique().scalars())
+        session.expunge_all()
+        return transfers
+
+
+def claim_transfer_execution(internal_transfer_id: int,
+                             claimed_before: datetime.datetime) -> bool:
+    """Claim the execution of a transfer that is still to be submitted.
+    The transfer is claimed by a single conditional UPDATE statement,
+    so that it is executed by at most one task at a time (also if its
+    execution task has been re-driven while the original task is still
+    queued or running). The claimed record is marked as updated in the
+    same statement.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    claimed_before : datetime.datetime
+        The point in time before which an existing claim is considered
+        to be abandoned (e.g. because the worker executing the transfer
+        died), so that the transfer can be claimed again.
 
-B = typing.TypeVar('B', bound=Base)
+    Returns
+    -------
+    bool
+        True if the execution of the transfer has been claimed, False
+        if there is no such transfer, if it is not to be submitted
+        anymore, or if its execution has already been claimed.
+
+    """
+    now = datetime.datetime.now(datetime.UTC)
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id,
+        status_id_in(Transfer.status_id, EXECUTABLE_TRANSFER_STATUS_IDS),
+        sqlalchemy.or_(Transfer.execution_claimed.is_(None),
+                       Transfer.execution_claimed < claimed_before)).values(
+                           execution_claimed=now,
+                           updated=now).returning(Transfer.id)
+    with get_session_maker().begin() as session:
+        return session.execute(statement).one_or_none() is not None
 
 
 def create_bid(source_blockchain: Blockchain,
@@ -61,40 +219,124 @@ def create_bid(source_blockchain: Blockchain,
         session.add(bid)
 
 
-def replace_bids(source_blockchain_id: int, destination_blockchain_id: int,
-                 bids: typing.List[typing.Dict[typing.Any, typing.Any]]):
-    """Deletes all bids which are used for the given source and destination
-    blockchains and adds new one for those blockchains.
+def create_idempotency_key(idempotency_key: str, request_hash: str,
+                           task_id: uuid.UUID) -> bool:
+    """Create an idempotency key database record. If there already is a
+    record for the given idempotency key, it is left unchanged.
+
+    Parameters
+    ----------
+    idempotency_key : str
+        The idempotency key supplied by the client.
+    request_hash : str
+        The hash of the transfer request the key has been used for.
+    task_id : uuid.UUID
+        The unique task ID of the transfer initiated by the request.
+
+    Returns
+    -------
+    bool
+        True if the record has been created, False if there already was
+        a record for the given idempotency key.
+
+    """
+    idempotency_key_ = IdempotencyKey(
+        key=idempotency_key, request_hash=request_hash, task_id=str(task_id),
+        created=datetime.datetime.now(datetime.UTC))
+    try:
+        with get_session_maker().begin() as session:
+            session.add(idempotency_key_)
+    except sqlalchemy.exc.IntegrityError:
+        return False
+    return True
+
+
+def replace_bids(source_blockchain_id: int,
+                 bids: typing.Mapping[int,
+                                      typing.List[typing.Dict[typing.Any,
+                                                              typing.Any]]]):
+    """Replace the bids for a given source blockchain and the given
+    destination blockchains in a single transaction. Only bids that
+    have been added, removed, or changed are written. The bids for
+    other destination blockchains are left unchanged. If any bid has
+    been changed, the bids version is incremented and the change is
+    notified to listeners on the bids notification channel.
 
     Parameters
     ----------
     source_blockchain_id : int
-        The bid's source blockchain.
-    destination_blockchain_id : int
-        The bid's destination blockchain.
-    bids : List of dict
-        A list of dicts, containing the fee, execution time and valid until
-        attributes of a bid.
+        The bids' source blockchain.
+    bids : Mapping of int to list of dict
+        The new bids by destination blockchain ID. Each bid is given as
+        a dict containing the source blockchain ID, destination
+        blockchain ID, fee, execution time and valid until attributes.
 
     """
+    if len(bids) == 0:
+        return
+    # A bid is identified by its execution time (for a given source and
+    # destination blockchain), so later bids with the same execution
+    # time take precedence
+    new_bids = {
+        (destination_blockchain_id, bid['execution_time']): bid
+        for destination_blockchain_id, destination_bids in bids.items()
+        for bid in destination_bids
+    }
     delete_statement = sqlalchemy.delete(Bid).where(
-        sqlalchemy.and_(
-            Bid.source_blockchain_id == source_blockchain_id,
-            Bid.destination_blockchain_id == destination_blockchain_id))
-    _bids = [Bid(**bid) for bid in bids]
+        Bid.source_blockchain_id == source_blockchain_id,
+        sqlalchemy.or_(*[
+            sqlalchemy.and_(
+                Bid.destination_blockchain_id == destination_blockchain_id,
+                Bid.execution_time.not_in([
+                    execution_time
+                    for destination_blockchain_id_, execution_time in new_bids
+                    if destination_blockchain_id_ == destination_blockchain_id
+                ])) for destination_blockchain_id in bids
+        ]))
     with get_session_maker().begin() as session:
-        session.execute(delete_statement)
-        # based on https://github.com/sqlalchemy/sqlalchemy/issues/2501
-        session.flush()
-        session.bulk_save_objects(_bids)
+        changed_bids = session.execute(delete_statement).rowcount
+        if len(new_bids) > 0:
+            insert_statement = _insert(session, Bid).values([{
+                **bid, 'source_blockchain_id': source_blockchain_id,
+                'destination_blockchain_id': destination_blockchain_id
+            } for (destination_blockchain_id, _), bid in new_bids.items()])
+            # Unchanged bids are not updated to avoid dead rows and
+            # needless bid version increments
+            upsert_statement = insert_statement.on_conflict_do_update(
+                index_elements=[
+                    Bid.source_blockchain_id, Bid.destination_blockchain_id,
+                    Bid.execution_time
+                ], set_={
+                    'fee': insert_statement.excluded.fee,
+                    'valid_until': insert_statement.excluded.valid_until
+                }, where=sqlalchemy.or_(
+                    Bid.fee.is_distinct_from(insert_statement.excluded.fee),
+                    Bid.valid_until.is_distinct_from(
+                        insert_statement.excluded.valid_until)))
+            changed_bids += session.execute(upsert_statement).rowcount
+        if changed_bids == 0:
+            return
+        version_statement = _insert(session, BidVersion).values(
+            source_blockchain_id=source_blockchain_id,
+            version=1).on_conflict_do_update(
+                index_elements=[BidVersion.source_blockchain_id],
+                set_={'version': BidVersion.version + 1})
+        session.execute(version_statement)
+        if session.get_bind().dialect.name == 'postgresql':
+            # The notification is delivered when the transaction is
+            # committed
+            session.execute(
+                sqlalchemy.select(
+                    sqlalchemy.func.pg_notify(BIDS_NOTIFICATION_CHANNEL,
+                                              str(source_blockchain_id))))
 
 
 def create_transfer(source_blockchain: Blockchain,
                     destination_blockchain: Blockchain, sender_address: str,
                     recipient_address: str, source_token_address: str,
                     destination_token_address: str, amount: int, fee: int,
-                    sender_nonce: int, signature: str, hub_address: str,
-                    forwarder_address: str) -> int:
+                    sender_nonce: int, signature: str, valid_until: int,
+                    hub_address: str, forwarder_address: str) -> int:
     """Create a transfer database record.
 
     Parameters
@@ -120,6 +362,9 @@ def create_transfer(source_blockchain: Blockchain,
         source blockchain.
     signature : str
         The signature of the sender for the transfer.
+    valid_until : int
+        The timestamp until when the transfer is valid on the source
+        blockchain (in seconds since the epoch).
     hub_address : str
         The address of the Pantos Hub contract on the token transfer's
         source blockchain.
@@ -138,49 +383,42 @@ def create_transfer(source_blockchain: Blockchain,
         If the sender nonce is not unique.
 
     """
-    transfer_status = TransferStatus.ACCEPTED
     try:
         with get_session_maker().begin() as session:
-            source_token_contract_id = _read_token_contract_id(
-                session, source_blockchain, source_token_address)
-            if source_token_contract_id is None:
-                source_token_contract_id = _create_token_contract(
-                    session, source_blockchain, source_token_address)
-            destination_token_contract_id = _read_token_contract_id(
-                session, destination_blockchain, destination_token_address)
-            if destination_token_contract_id is None:
-                destination_token_contract_id = _create_token_contract(
-                    session, destination_blockchain, destination_token_address)
-            hub_contract_id = _read_hub_contract_id(session, source_blockchain,
-                                                    hub_address)
-            if hub_contract_id is None:
-                hub_contract_id = _create_hub_contract(session,
-                                                       source_blockchain,
-                                                       hub_address)
-            forwarder_contract_id = _read_forwarder_contract_id(
-                session, source_blockchain, forwarder_address)
-            if forwarder_contract_id is None:
-                forwarder_contract_id = _create_forwarder_contract(
-                    session, source_blockchain, forwarder_address)
-            statement = sqlalchemy.insert(Transfer).values(
-                source_blockchain_id=source_blockchain.value,
-                destination_blockchain_id=destination_blockchain.value,
-                sender_address=sender_address,
-                recipient_address=recipient_address,
-                source_token_contract_id=source_token_contract_id,
-                destination_token_contract_id=destination_token_contract_id,
-                amount=amount, fee=fee, sender_nonce=sender_nonce,
-                signature=signature, hub_contract_id=hub_contract_id,
-                forwarder_contract_id=forwarder_contract_id,
-                status_id=transfer_status.value).returning(Transfer.id)
-            return session.execute(statement).scalar_one()
+            return operations.create_transfer(
+                session, source_blockchain, destination_blockchain,
+                sender_address, recipient_address, source_token_address,
+                destination_token_address, amount, fee, sender_nonce,
+                signature, valid_until, hub_address, forwarder_address)
     except sqlalchemy.exc.IntegrityError as error:
-        if UNIQUE_SENDER_NONCE_CONSTRAINT in str(error):
-            raise SenderNonceNotUniqueError(source_blockchain, sender_address,
-                                            sender_nonce)
+        operations.raise_sender_nonce_not_unique_error(error,
+                                                       source_blockchain,
+                                                       sender_address,
+                                                       sender_nonce)
         raise
 
 
+def delete_idempotency_keys(created_before: datetime.datetime) -> int:
+    """Delete all idempotency key database records created before a
+    given point in time.
+
+    Parameters
+    ----------
+    created_before : datetime.datetime
+        The point in time before which the records have been created.
+
+    Returns
+    -------
+    int
+        The number of deleted records.
+
+    """
+    statement = sqlalchemy.delete(IdempotencyKey).where(
+        IdempotencyKey.created < created_before)
+    with get_session_maker().begin() as session:
+        return session.execute(statement).rowcount
+
+
 def read_bids(source_blockchain_id: int,
               destination_blockchain_id: int) -> list[Bid]:
     """Read the bid records for a given source and destination
@@ -199,17 +437,111 @@ def read_bids(source_blockchain_id: int,
         The bid records.
 
     """
-    statement = sqlalchemy.select(Bid).filter_by(
-        source_blockchain_id=source_blockchain_id,
-        destination_blockchain_id=destination_blockchain_id)
+    with _get_read_only_session() as session:
+        return operations.read_bids(session, source_blockchain_id,
+                                    destination_blockchain_id)
+
+
+def read_bids_snapshot() -> typing.Tuple[int, list[Bid]]:
+    """Read all bid records together with the current bids version.
+
+    Returns
+    -------
+    int
+        The bids version.
+    list of Bid
+        The bid records.
+
+    """
     with get_session() as session:
-        bids = session.execute(statement).scalars().all()
+        # The version is read first so that bids changed in between are
+        # at worst read again with the next snapshot
+        version = _read_bids_version(session)
+        bids = session.execute(sqlalchemy.select(Bid)).scalars().all()
         session.expunge_all()
-        return list(bids)
+        return version, list(bids)
+
+
+def read_bids_version() -> int:
+    """Read the current bids version. The version is incremented
+    whenever the bids of any source blockchain are changed.
+
+    Returns
+    -------
+    int
+        The bids version.
 
+    """
+    with get_session() as session:
+        return _read_bids_version(session)
 
-def read_transfer_by_task_id(task_id: uuid.UUID) -> typing.Optional[Transfer]:
-    """Read a transfer database record.
+
+def read_idempotency_key(
+        idempotency_key: str,
+        created_after: datetime.datetime) -> typing.Optional[IdempotencyKey]:
+    """Read an unexpired idempotency key database record.
+
+    Parameters
+    ----------
+    idempotency_key : str
+        The idempotency key supplied by the client.
+    created_after : datetime.datetime
+        The point in time after which the record must have been created
+        (i.e. older records are considered expired, even if they have
+        not been deleted yet).
+
+    Returns
+    -------
+    IdempotencyKey or None
+        The idempotency key record, or None if the key is unknown or
+        expired.
+
+    """
+    statement = sqlalchemy.select(IdempotencyKey).where(
+        IdempotencyKey.key == idempotency_key, IdempotencyKey.created
+        >= created_after)
+    with get_session() as session:
+        idempotency_key_ = session.execute(statement).scalar_one_or_none()
+        if idempotency_key_ is None:
+            return None
+        session.expunge(idempotency_key_)
+        return idempotency_key_
+
+
+def read_pending_transfer_count(source_blockchain: Blockchain) -> int:
+    """Read the number of transfers from a source blockchain that have
+    been accepted but not yet submitted.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The source blockchain of the transfers.
+
+    Returns
+    -------
+    int
+        The number of pending transfers.
+
+    """
+    statement = sqlalchemy.select(
+        sqlalchemy.func.count()).select_from(Transfer).filter(
+            Transfer.source_blockchain_id == source_blockchain.value,
+            status_id_in(Transfer.status_id, [
+                TransferStatus.ACCEPTED.value,
+                TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value
+            ]))
+    with get_session() as session:
+        return session.execute(statement).scalar_one()
+
+
+def read_transfer_by_task_id(
+    task_id: uuid.UUID
+) -> typing.Optional[typing.Union[Transfer, ArchivedTransfer]]:
+    """Read a transfer database record. If there is no such record in
+    the "transfers" table, the transfer is searched for among the
+    archived transfers. The record is read from the read replica (if
+    configured), and only from the primary database if the replica
+    does not have it (yet).
 
     Parameters
     ----------
@@ -218,17 +550,18 @@ def read_transfer_by_task_id(task_id: uuid.UUID) -> typing.Optional[Transfer]:
 
     Returns
     -------
-    Transfer
+    Transfer or ArchivedTransfer
         The transfer with the given task ID.
 
     """
-    with get_session() as session:
-        transfer = session.query(Transfer).filter_by(
-            task_id=str(task_id)).first()
-        if transfer is None:
-            return None
-        session.expunge(transfer)
-        return transfer
+    with _get_read_only_session() as session:
+        transfer = operations.read_transfer_by_task_id(session, task_id)
+    if transfer is None and get_replica_session_maker() is not None:
+        # A transfer that has just been created may not have been
+        # replicated yet
+        with get_session() as session:
+            transfer = operations.read_transfer_by_task_id(session, task_id)
+    return transfer
 
 
 def read_transfer_nonce(internal_transfer_id: int) -> int | None:
@@ -248,14 +581,169 @@ def read_transfer_nonce(internal_transfer_id: int) -> int | None:
         transfer.
 
     """
-    statement = sqlalchemy.select(
-        Transfer.nonce).filter(Transfer.id == internal_transfer_id)
     with get_session() as session:
-        return session.execute(statement).scalar_one_or_none()
+        return operations.read_transfer_nonce(session, internal_transfer_id)
+
+
+def read_transfer_exports(
+        created_from: typing.Optional[datetime.datetime],
+        created_until: typing.Optional[datetime.datetime],
+        source_blockchain: typing.Optional[Blockchain],
+        destination_blockchain: typing.Optional[Blockchain],
+        batch_size: int) -> typing.Generator[sqlalchemy.Row, None, None]:
+    """Read the archived and the non-archived transfer database records
+    (joined with the addresses of their token, hub, and forwarder
+    contracts) for exporting them. The records are read from the read
+    replica (if configured) and streamed in batches from a server-side
+    cursor, so that the memory usage does not depend on the number of
+    exported records. The archived transfers are read first, each group
+    ordered by the internal IDs of the transfers.
 
+    Parameters
+    ----------
+    created_from : datetime.datetime or None
+        Only transfers created at or after this point in time are read
+        (no lower bound if None).
+    created_until : datetime.datetime or None
+        Only transfers created before this point in time are read (no
+        upper bound if None).
+    source_blockchain : Blockchain or None
+        The source blockchain of the transfers (any blockchain if
+        None).
+    destination_blockchain : Blockchain or None
+        The destination blockchain of the transfers (any blockchain if
+        None).
+    batch_size : int
+        The number of records fetched from the database at once.
+
+    Yields
+    ------
+    sqlalchemy.Row
+        The rows of the matching transfers with an assigned task ID,
+        with the columns id, task_id, source_blockchain_id,
+        destination_blockchain_id, sender_address, recipient_address,
+        source_token_address, destination_token_address, amount, fee,
+        sender_nonce, hub_address, forwarder_address,
+        on_chain_transfer_id, transaction_id, status_id, created, and
+        updated. The database session is closed when the generator is
+        exhausted or closed.
+
+    """
+    assert batch_size > 0
+    with _get_read_only_session() as session:
+        if session.get_bind().dialect.name == 'postgresql':
+            # Both tables are read from the same snapshot so that
+            # transfers archived in the meantime are neither missed nor
+            # exported twice
+            session.connection(
+                execution_options={'isolation_level': 'REPEATABLE READ'})
+        models: tuple[typing.Union[type[ArchivedTransfer], type[Transfer]],
+                      ...] = (ArchivedTransfer, Transfer)
+        for model in models:
+            statement = _create_read_transfer_exports_statement(
+                model, created_from, created_until, source_blockchain,
+                destination_blockchain)
+            yield from session.execute(
+                statement, execution_options={'yield_per': batch_size})
+
+
+def read_transfer_statistics(
+    hour_from: typing.Optional[datetime.datetime],
+    hour_until: typing.Optional[datetime.datetime],
+    source_blockchain: typing.Optional[Blockchain],
+    destination_blockchain: typing.Optional[Blockchain]
+) -> list[sqlalchemy.Row]:
+    """Read the transfer statistics database records (joined with the
+    addresses of their token contracts). The records are read from the
+    read replica (if configured).
+
+    Parameters
+    ----------
+    hour_from : datetime.datetime or None
+        Only statistics of hours starting at or after this point in
+        time are read (no lower bound if None).
+    hour_until : datetime.datetime or None
+        Only statistics of hours starting before this point in time are
+        read (no upper bound if None).
+    source_blockchain : Blockchain or None
+        The source blockchain of the statistics (any blockchain if
+        None).
+    destination_blockchain : Blockchain or None
+        The destination blockchain of the statistics (any blockchain if
+        None).
+
+    Returns
+    -------
+    list of sqlalchemy.Row
+        The rows of the matching non-empty statistics ordered by their
+        hour, with the columns hour, source_blockchain_id,
+        destination_blockchain_id, source_token_address, status_id,
+        transfer_count, amount, and fee.
+
+    """
+    statement = sqlalchemy.select(
+        TransferStatistics.hour, TransferStatistics.source_blockchain_id,
+        TransferStatistics.destination_blockchain_id,
+        TokenContract.address.label('source_token_address'),
+        TransferStatistics.status_id, TransferStatistics.transfer_count,
+        TransferStatistics.amount, TransferStatistics.fee).join(
+            TokenContract, TransferStatistics.source_token_contract_id ==
+            TokenContract.id).filter(TransferStatistics.transfer_count > 0)
+    if hour_from is not None:
+        statement = statement.filter(TransferStatistics.hour >= hour_from)
+    if hour_until is not None:
+        statement = statement.filter(TransferStatistics.hour < hour_until)
+    if source_blockchain is not None:
+        statement = statement.filter(
+            TransferStatistics.source_blockchain_id == source_blockchain.value)
+    if destination_blockchain is not None:
+        statement = statement.filter(
+            TransferStatistics.destination_blockchain_id ==
+            destination_blockchain.value)
+    statement = statement.order_by(
+        TransferStatistics.hour, TransferStatistics.source_blockchain_id,
+        TransferStatistics.destination_blockchain_id,
+        TransferStatistics.source_token_contract_id,
+        TransferStatistics.status_id)
+    with _get_read_only_session() as session:
+        return list(session.execute(statement).all())
+
+
+def read_transfers(sender_address: typing.Optional[str],
+                   statuses: typing.Optional[list[TransferStatus]],
+                   after_id: typing.Optional[int],
+                   limit: int) -> list[Transfer]:
+    """Read transfer database records ordered by their internal IDs. The
+    records are paginated by the ID of the last record of the previous
+    page (keyset pagination).
+
+    Parameters
+    ----------
+    sender_address : str or None
+        The sender address of the transfers (any sender if None).
+    statuses : list of TransferStatus or None
+        The allowed statuses of the transfers (any status if None).
+    after_id : int or None
+        Only transfers with a greater internal ID are read (starting
+        from the first transfer if None).
+    limit : int
+        The maximum number of transfers to read.
+
+    Returns
+    -------
+    list of Transfer
+        The matching transfers with an assigned task ID.
+
+    """
+    with _get_read_only_session() as session:
+        return operations.read_transfers(session, sender_address, statuses,
+                                         after_id, limit)
 
-def reset_transfer_nonce(internal_transfer_id: int) -> None:
-    """Update a transfer by setting its transaction nonce to NULL.
+
+def release_transfer_execution(internal_transfer_id: int) -> None:
+    """Release the claimed execution of a transfer (see
+    claim_transfer_execution), so that it can be claimed again
+    immediately.
 
     Parameters
     ----------
@@ -264,14 +752,142 @@ def reset_transfer_nonce(internal_transfer_id: int) -> None:
 
     """
     statement = sqlalchemy.update(Transfer).where(
-        Transfer.id == internal_transfer_id).values(nonce=sqlalchemy.null())
+        Transfer.id == internal_transfer_id).values(
+            execution_claimed=sqlalchemy.null())
     with get_session_maker().begin() as session:
         session.execute(statement)
 
 
+def reset_transfer_nonce(internal_transfer_id: int) -> None:
+    """Update a transfer by setting its transaction nonce to NULL.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    """
+    with get_session_maker().begin() as session:
+        operations.reset_transfer_nonce(session, internal_transfer_id)
+
+
+def roll_up_transfer_statistics(batch_size: int) -> int:
+    """Roll up the status changes of a batch of transfer database
+    records into the "transfer_statistics" table. Each transfer is
+    moved from the statistics of the status it has last been counted
+    with (if any) to the statistics of its current public status, in
+    the hour in which it has been created.
+
+    Parameters
+    ----------
+    batch_size : int
+        The maximum number of transfers to roll up.
+
+    Returns
+    -------
+    int
+        The number of rolled up transfers.
+
+    """
+    select_statement = sqlalchemy.select(
+        Transfer.id, Transfer.source_blockchain_id,
+        Transfer.destination_blockchain_id, Transfer.source_token_contract_id,
+        Transfer.amount, Transfer.fee, Transfer.status_id,
+        Transfer.statistics_status_id, Transfer.created).where(
+            Transfer.statistics_status_id.is_distinct_from(
+                Transfer.status_id)).order_by(
+                    Transfer.id).limit(batch_size).with_for_update(
+                        skip_locked=True)
+    with get_session_maker().begin() as session:
+        transfers = session.execute(select_statement).all()
+        if len(transfers) == 0:
+            return 0
+        statistics_deltas: dict[tuple[typing.Any, ...], list[int]] = {}
+        for transfer in transfers:
+            hour = _truncate_to_hour(transfer.created)
+            for status_id, sign in ((transfer.statistics_status_id, -1),
+                                    (transfer.status_id, 1)):
+                if status_id is None:
+                    continue
+                statistics_delta = statistics_deltas.setdefault(
+                    (hour, transfer.source_blockchain_id,
+                     transfer.destination_blockchain_id,
+                     transfer.source_token_contract_id,
+                     TransferStatus(status_id).to_public_status().value),
+                    [0, 0, 0])
+                statistics_delta[0] += sign
+                statistics_delta[1] += sign * int(transfer.amount)
+                statistics_delta[2] += sign * int(transfer.fee)
+        # Sorted to always lock the statistics records in the same order
+        statistics_values = [{
+            'hour': key[0],
+            'source_blockchain_id': key[1],
+            'destination_blockchain_id': key[2],
+            'source_token_contract_id': key[3],
+            'status_id': key[4],
+            'transfer_count': statistics_delta[0],
+            'amount': statistics_delta[1],
+            'fee': statistics_delta[2]
+        } for key, statistics_delta in sorted(statistics_deltas.items())
+                             if any(statistics_delta)]
+        if len(statistics_values) > 0:
+            insert_statement = _insert(
+                session, TransferStatistics).values(statistics_values)
+            session.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=[
+                        TransferStatistics.hour,
+                        TransferStatistics.source_blockchain_id,
+                        TransferStatistics.destination_blockchain_id,
+                        TransferStatistics.source_token_contract_id,
+                        TransferStatistics.status_id
+                    ], set_={
+                        'transfer_count': TransferStatistics.transfer_count +
+                        insert_statement.excluded.transfer_count,
+                        'amount': TransferStatistics.amount +
+                        insert_statement.excluded.amount,
+                        'fee': TransferStatistics.fee +
+                        insert_statement.excluded.fee
+                    }))
+        # The selected transfers are locked, so that their status has
+        # not changed in the meantime
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id.in_([
+                    transfer.id for transfer in transfers
+                ])).values(statistics_status_id=Transfer.status_id),
+            execution_options=sqlalchemy.util._collections.immutabledict(
+                {'synchronize_session': False}))
+        return len(transfers)
+
+
+def update_transfer(transfer_update: TransferUpdate) -> None:
+    """Apply all field updates of a unit of work to a transfer database
+    record (in a single UPDATE statement and transaction). Updates of
+    the status, the on-chain transfer ID, or the transaction ID are
+    notified to the listeners of the transfers notification channel.
+
+    Parameters
+    ----------
+    transfer_update : TransferUpdate
+        The unit of work with the field updates.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    with get_session_maker().begin() as session:
+        operations.update_transfer(session, transfer_update)
+
+
 def update_on_chain_transfer_id(internal_transfer_id: int,
                                 on_chain_transfer_id: int) -> None:
     """Update the on-chain transfer ID of a transfer database record.
+    The update is notified to the listeners of the transfers
+    notification channel.
 
     Parameters
     ----------
@@ -289,14 +905,8 @@ def update_on_chain_transfer_id(internal_transfer_id: int,
 
     """
     with get_session_maker().begin() as session:
-        transfer = session.get(Transfer, internal_transfer_id)
-        if transfer is None:
-            raise DatabaseError(
-                f'unknown internal transfer ID: {internal_transfer_id}')
-        transfer.on_chain_transfer_id = typing.cast(sqlalchemy.Column,
-                                                    on_chain_transfer_id)
-        transfer.updated = typing.cast(sqlalchemy.Column,
-                                       datetime.datetime.now(datetime.UTC))
+        operations.update_on_chain_transfer_id(session, internal_transfer_id,
+                                               on_chain_transfer_id)
 
 
 def update_transfer_nonce(internal_transfer_id: int, blockchain: Blockchain,
@@ -313,59 +923,15 @@ def update_transfer_nonce(internal_transfer_id: int, blockchain: Blockchain,
         The latest nonce on the blockchain.
 
     """
-    failed_transactions_expression = sqlalchemy.and_(
-        Transfer.source_blockchain_id == blockchain.value,
-        Transfer.nonce.is_not(None),  # noqa: E711
-        sqlalchemy.or_(Transfer.status_id == TransferStatus.FAILED.value,
-                       Transfer.status_id == TransferStatus.ACCEPTED.value))
-
-    count_failed_nonces_subquery = sqlalchemy.select(
-        sqlalchemy.func.count()).filter(
-            failed_transactions_expression).scalar_subquery()
-
-    minimum_failed_nonce_cte = sqlalchemy.select(
-        sqlalchemy.func.min(Transfer.nonce).label('min')).filter(
-            failed_transactions_expression).cte('minimum_failed_nonce_cte')
-
-    maximum_transfer_nonce_subquery = sqlalchemy.select(
-        sqlalchemy.func.max(
-            Transfer.nonce)).filter(Transfer.source_blockchain_id ==
-                                    blockchain.value).scalar_subquery()
-
-    statement = sqlalchemy.update(Transfer).where(
-        sqlalchemy.or_(
-            Transfer.id == internal_transfer_id,
-            sqlalchemy.and_(
-                Transfer.source_blockchain_id == blockchain.value,
-                Transfer.nonce == minimum_failed_nonce_cte.c.min))).values({
-                    Transfer.nonce: sqlalchemy.case(
-                        (count_failed_nonces_subquery == 0,
-                         sqlalchemy.case((maximum_transfer_nonce_subquery
-                                          >= latest_blockchain_nonce,
-                                          maximum_transfer_nonce_subquery + 1),
-                                         else_=latest_blockchain_nonce)),
-                        (Transfer.id == internal_transfer_id,
-                         minimum_failed_nonce_cte.c.min),
-                        else_=sqlalchemy.null()),
-                    Transfer.status_id: sqlalchemy.case(
-                        (Transfer.id == internal_transfer_id,
-                         TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value),
-                        else_=sqlalchemy.case(
-                            (Transfer.status_id == TransferStatus.FAILED.value,
-                             TransferStatus.FAILED.value),
-                            else_=TransferStatus.ACCEPTED.value))
-                })
     with get_session_maker().begin() as session:
-        # Execute the transaction
-        session.execute(
-            statement,
-            execution_options=sqlalchemy.util._collections.immutabledict(
-                {'synchronize_session': False}))
+        operations.update_transfer_nonce(session, internal_transfer_id,
+                                         blockchain, latest_blockchain_nonce)
 
 
 def update_transfer_status(internal_transfer_id: int,
                            status: TransferStatus) -> None:
-    """Update the status of a transfer database record.
+    """Update the status of a transfer database record. The update is
+    notified to the listeners of the transfers notification channel.
 
     Parameters
     ----------
@@ -382,24 +948,15 @@ def update_transfer_status(internal_transfer_id: int,
 
     """
     with get_session_maker().begin() as session:
-        transfer = session.get(Transfer, internal_transfer_id)
-        if transfer is None:
-            raise DatabaseError(
-                f'unknown internal transfer ID: {internal_transfer_id}')
-        transfer.status_id = typing.cast(sqlalchemy.Column, status.value)
-        if (status is TransferStatus.FAILED
-                or status is TransferStatus.REVERTED):
-            # In case of a failed or reverted transfer, the sender nonce
-            # can be used again, which should thus not be excluded by
-            # the unique sender nonce constraint
-            transfer.sender_nonce = typing.cast(sqlalchemy.Column, None)
-        transfer.updated = typing.cast(sqlalchemy.Column,
-                                       datetime.datetime.now(datetime.UTC))
+        operations.update_transfer_status(session, internal_transfer_id,
+                                          status)
 
 
 def update_transfer_transaction_id(internal_transfer_id: int,
                                    transaction_id: str) -> None:
     """Update the transaction ID/hash of a transfer database record.
+    The update is notified to the listeners of the transfers
+    notification channel.
 
     Parameters
     ----------
@@ -417,14 +974,9 @@ def update_transfer_transaction_id(internal_transfer_id: int,
 
     """
     with get_session_maker().begin() as session:
-        transfer = session.get(Transfer, internal_transfer_id)
-        if transfer is None:
-            raise DatabaseError(
-                f'unknown internal transfer ID: {internal_transfer_id}')
-        transfer.transaction_id = typing.cast(sqlalchemy.Column,
-                                              transaction_id)
-        transfer.updated = typing.cast(sqlalchemy.Column,
-                                       datetime.datetime.now(datetime.UTC))
+        operations.update_transfer_transaction_id(session,
+                                                  internal_transfer_id,
+                                                  transaction_id)
 
 
 def update_transfer_task_id(internal_transfer_id: int,
@@ -446,73 +998,83 @@ def update_transfer_task_id(internal_transfer_id: int,
 
     """
     with get_session_maker().begin() as session:
-        transfer = session.get(Transfer, internal_transfer_id)
-        if transfer is None:
-            raise DatabaseError(
-                f'unknown internal transfer ID: {internal_transfer_id}')
-        transfer.task_id = typing.cast(sqlalchemy.Column, str(task_id))
-        transfer.updated = typing.cast(sqlalchemy.Column,
-                                       datetime.datetime.now(datetime.UTC))
-
-
-def _read_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
-             **kwargs: typing.Any) -> int | None:
-    statement = sqlalchemy.select(model.id).filter_by(**kwargs)
-    return session.execute(statement).scalar_one_or_none()
-
-
-def _read_forwarder_contract_id(session: sqlalchemy.orm.Session,
-                                blockchain: Blockchain,
-                                address: BlockchainAddress) -> int | None:
-    return _read_id(session, ForwarderContract, blockchain_id=blockchain.value,
-                    address=address)
-
+        operations.update_transfer_task_id(session, internal_transfer_id,
+                                           task_id)
 
-def _read_hub_contract_id(session: sqlalchemy.orm.Session,
-                          blockchain: Blockchain,
-                          address: BlockchainAddress) -> int | None:
-    return _read_id(session, HubContract, blockchain_id=blockchain.value,
-                    address=address)
 
-
-def _read_token_contract_id(session: sqlalchemy.orm.Session,
-                            blockchain: Blockchain,
-                            address: BlockchainAddress) -> int | None:
-    return _read_id(session, TokenContract, blockchain_id=blockchain.value,
-                    address=address)
-
-
-def _create_with_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
-                    **kwargs: typing.Any) -> int:
-    statement = sqlalchemy.insert(model).values(**kwargs).returning(model.id)
-    try:
-        with session.begin_nested():
-            return session.execute(statement).scalar_one()
-    except sqlalchemy.exc.IntegrityError:
-        # Non-critical error that can happen in a parallel execution
-        # environment due to a race condition
-        _logger.warning('instance already created', exc_info=True)
-        id_ = _read_id(session, model, **kwargs)
-        assert id_ is not None
-        return id_
-
-
-def _create_forwarder_contract(session: sqlalchemy.orm.Session,
-                               blockchain: Blockchain,
-                               address: BlockchainAddress) -> int:
-    return _create_with_id(session, ForwarderContract,
-                           blockchain_id=blockchain.value, address=address)
-
-
-def _create_hub_contract(session: sqlalchemy.orm.Session,
-                         blockchain: Blockchain,
-                         address: BlockchainAddress) -> int:
-    return _create_with_id(session, HubContract,
-                           blockchain_id=blockchain.value, address=address)
-
-
-def _create_token_contract(session: sqlalchemy.orm.Session,
-                           blockchain: Blockchain,
-                           address: BlockchainAddress) -> int:
-    return _create_with_id(session, TokenContract,
-                           blockchain_id=blockchain.value, address=address)
+def _read_bids_version(session: sqlalchemy.orm.Session) -> int:
+    # The sum of the versions of all source blockchains increases
+    # whenever the bids of any source blockchain are changed
+    statement = sqlalchemy.select(
+        sqlalchemy.func.coalesce(sqlalchemy.func.sum(BidVersion.version), 0))
+    return int(session.execute(statement).scalar_one())
+
+
+def _insert(
+    session: sqlalchemy.orm.Session, model: type[Base]
+) -> typing.Union[sqlalchemy.dialects.postgresql.Insert,
+                  sqlalchemy.dialects.sqlite.Insert]:
+    # Both dialect-specific INSERT constructs support upserts (INSERT
+    # ... ON CONFLICT DO UPDATE), the generic one does not
+    if session.get_bind().dialect.name == 'postgresql':
+        return sqlalchemy.dialects.postgresql.insert(model)
+    return sqlalchemy.dialects.sqlite.insert(model)
+
+
+def _create_read_transfer_exports_statement(
+        model: typing.Union[type[Transfer], type[ArchivedTransfer]],
+        created_from: typing.Optional[datetime.datetime],
+        created_until: typing.Optional[datetime.datetime],
+        source_blockchain: typing.Optional[Blockchain],
+        destination_blockchain: typing.Optional[Blockchain]
+) -> sqlalchemy.Select:
+    # Core statement (instead of ORM entities) so that the rows can be
+    # streamed without building up an identity map
+    source_token_contract = sqlalchemy.orm.aliased(TokenContract)
+    destination_token_contract = sqlalchemy.orm.aliased(TokenContract)
+    statement = sqlalchemy.select(
+        model.id, model.task_id, model.source_blockchain_id,
+        model.destination_blockchain_id, model.sender_address,
+        model.recipient_address,
+        source_token_contract.address.label('source_token_address'),
+        destination_token_contract.address.label('destination_token_address'),
+        model.amount, model.fee, model.sender_nonce,
+        HubContract.address.label('hub_address'),
+        ForwarderContract.address.label('forwarder_address'),
+        model.on_chain_transfer_id, model.transaction_id, model.status_id,
+        model.created, model.updated).join(
+            source_token_contract,
+            model.source_token_contract_id == source_token_contract.id).join(
+                destination_token_contract, model.destination_token_contract_id
+                == destination_token_contract.id).join(
+                    HubContract, model.hub_contract_id == HubContract.id).join(
+                        ForwarderContract, model.forwarder_contract_id
+                        == ForwarderContract.id).filter(
+                            model.task_id.is_not(None))
+    if created_from is not None:
+        statement = statement.filter(model.created >= created_from)
+    if created_until is not None:
+        statement = statement.filter(model.created < created_until)
+    if source_blockchain is not None:
+        statement = statement.filter(
+            model.source_blockchain_id == source_blockchain.value)
+    if destination_blockchain is not None:
+        statement = statement.filter(
+            model.destination_blockchain_id == destination_blockchain.value)
+    return statement.order_by(model.id)
+
+
+def _truncate_to_hour(timestamp: datetime.datetime) -> datetime.datetime:
+    if timestamp.tzinfo is None:
+        # SQLite does not store time zones (all timestamps are UTC)
+        timestamp = timestamp.replace(tzinfo=datetime.UTC)
+    return timestamp.astimezone(datetime.UTC).replace(minute=0, second=0,
+                                                      microsecond=0)
+
+
+def _get_read_only_session() -> sqlalchemy.orm.Session:
+    # Reads that tolerate a slight replication lag are routed to the
+    # read replica (if configured) to take load off the primary
+    replica_session_maker = get_replica_session_maker()
+    return (get_session()
+            if replica_session_maker is None else replica_session_maker())
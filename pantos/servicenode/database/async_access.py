@@ -0,0 +1,363 @@
+"""Module for creating, reading, and updating transfer and bid database
+records from asyncio code (e.g. an async web server or confirmation
+engine).
+
+The functions are the asyncio counterparts of the equally named
+functions of the access module. Both modules execute the same
+operations of the operations module, which this module runs on an
+asyncio session (using an async database driver, e.g. psycopg for
+PostgreSQL), so that both modules behave identically.
+
+"""
+import typing
+import uuid
+
+import sqlalchemy
+import sqlalchemy.exc
+import sqlalchemy.ext.asyncio
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database import get_async_replica_session_maker
+from pantos.servicenode.database import get_async_session_maker
+from pantos.servicenode.database import operations
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Bid
+from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.operations import TransferUpdate
+
+
+async def create_transfer(source_blockchain: Blockchain,
+                          destination_blockchain: Blockchain,
+                          sender_address: str, recipient_address: str,
+                          source_token_address: str,
+                          destination_token_address: str, amount: int,
+                          fee: int, sender_nonce: int, signature: str,
+                          valid_until: int, hub_address: str,
+                          forwarder_address: str) -> int:
+    """Create a transfer database record.
+
+    Parameters
+    ----------
+    source_blockchain : Blockchain
+        The token transfer's source blockchain.
+    destination_blockchain : Blockchain
+        The token transfer's destination blockchain.
+    sender_address : str
+        The address of the sender on the source blockchain.
+    recipient_address : str
+        The address of the recipient on the destination blockchain.
+    source_token_address : str
+        The address of the token on the source blockchain.
+    destination_token_address : str
+        The address of the token on the destination blockchain.
+    amount : int
+        The amount of tokens sent by the sender to the recipient.
+    fee : int
+        The fee for the transfer (in PAN) payed by the sender.
+    sender_nonce : int
+        The nonce of the sender at the Pantos Forwarder contract of the
+        source blockchain.
+    signature : str
+        The signature of the sender for the transfer.
+    valid_until : int
+        The timestamp until when the transfer is valid on the source
+        blockchain (in seconds since the epoch).
+    hub_address : str
+        The address of the Pantos Hub contract on the token transfer's
+        source blockchain.
+    forwarder_address : str
+        The address of the Pantos Forwarder contract on the token
+        transfer's source blockchain.
+
+    Returns
+    -------
+    int
+        The assigned ID of the created record.
+
+    Raises
+    ------
+    SenderNonceNotUniqueError
+        If the sender nonce is not unique.
+
+    """
+    try:
+        async with get_async_session_maker().begin() as session:
+            return await session.run_sync(
+                operations.create_transfer, source_blockchain,
+                destination_blockchain, sender_address, recipient_address,
+                source_token_address, destination_token_address, amount, fee,
+                sender_nonce, signature, valid_until, hub_address,
+                forwarder_address)
+    except sqlalchemy.exc.IntegrityError as error:
+        operations.raise_sender_nonce_not_unique_error(error,
+                                                       source_blockchain,
+                                                       sender_address,
+                                                       sender_nonce)
+        raise
+
+
+async def read_bids(source_blockchain_id: int,
+                    destination_blockchain_id: int) -> list[Bid]:
+    """Read the bid records for a given source and destination
+    blockchain.
+
+    Parameters
+    ----------
+    source_blockchain_id : int
+        The ID of the source blockchain.
+    destination_blockchain_id : int
+        The ID of the destination blockchain.
+
+    Returns
+    -------
+    list of Bid
+        The bid records.
+
+    """
+    async with _get_read_only_session() as session:
+        return await session.run_sync(operations.read_bids,
+                                      source_blockchain_id,
+                                      destination_blockchain_id)
+
+
+async def read_transfer_by_task_id(
+    task_id: uuid.UUID
+) -> typing.Optional[typing.Union[Transfer, ArchivedTransfer]]:
+    """Read a transfer database record. If there is no such record in
+    the "transfers" table, the transfer is searched for among the
+    archived transfers. The record is read from the read replica (if
+    configured), and only from the primary database if the replica
+    does not have it (yet).
+
+    Parameters
+    ----------
+    task_id : uuid.UUID
+        The unique task ID of the transfer.
+
+    Returns
+    -------
+    Transfer or ArchivedTransfer
+        The transfer with the given task ID.
+
+    """
+    async with _get_read_only_session() as session:
+        transfer = await session.run_sync(operations.read_transfer_by_task_id,
+                                          task_id)
+    if transfer is None and get_async_replica_session_maker() is not None:
+        # A transfer that has just been created may not have been
+        # replicated yet
+        async with get_async_session_maker()() as session:
+            transfer = await session.run_sync(
+                operations.read_transfer_by_task_id, task_id)
+    return transfer
+
+
+async def read_transfer_nonce(internal_transfer_id: int) -> int | None:
+    """Read the nonce for a transfer transaction submitted to the source
+    blockchain.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    Returns
+    -------
+    int or None
+        The nonce for the transfer transaction on the source blockchain,
+        or None if no blockchain nonce has been assigned to the
+        transfer.
+
+    """
+    async with get_async_session_maker()() as session:
+        return await session.run_sync(operations.read_transfer_nonce,
+                                      internal_transfer_id)
+
+
+async def read_transfers(sender_address: typing.Optional[str],
+                         statuses: typing.Optional[list[TransferStatus]],
+                         after_id: typing.Optional[int],
+                         limit: int) -> list[Transfer]:
+    """Read transfer database records ordered by their internal IDs. The
+    records are paginated by the ID of the last record of the previous
+    page (keyset pagination).
+
+    Parameters
+    ----------
+    sender_address : str or None
+        The sender address of the transfers (any sender if None).
+    statuses : list of TransferStatus or None
+        The allowed statuses of the transfers (any status if None).
+    after_id : int or None
+        Only transfers with a greater internal ID are read (starting
+        from the first transfer if None).
+    limit : int
+        The maximum number of transfers to read.
+
+    Returns
+    -------
+    list of Transfer
+        The matching transfers with an assigned task ID.
+
+    """
+    async with _get_read_only_session() as session:
+        return await session.run_sync(operations.read_transfers,
+                                      sender_address, statuses, after_id,
+                                      limit)
+
+
+async def reset_transfer_nonce(internal_transfer_id: int) -> None:
+    """Update a transfer by setting its transaction nonce to NULL.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.reset_transfer_nonce,
+                               internal_transfer_id)
+
+
+async def update_on_chain_transfer_id(internal_transfer_id: int,
+                                      on_chain_transfer_id: int) -> None:
+    """Update the on-chain transfer ID of a transfer database record.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    on_chain_transfer_id : int
+        The Pantos transfer ID assigned by the Pantos Hub contract on
+        the source blockchain.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_on_chain_transfer_id,
+                               internal_transfer_id, on_chain_transfer_id)
+
+
+async def update_transfer(transfer_update: TransferUpdate) -> None:
+    """Apply all field updates of a unit of work to a transfer database
+    record (in a single UPDATE statement and transaction).
+
+    Parameters
+    ----------
+    transfer_update : TransferUpdate
+        The unit of work with the field updates.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_transfer, transfer_update)
+
+
+async def update_transfer_nonce(internal_transfer_id: int,
+                                blockchain: Blockchain,
+                                latest_blockchain_nonce: int) -> None:
+    """Update the nonce of a transfer database record.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    blockchain : Blockchain
+        The blockchain on which the nonce is considered.
+    latest_blockchain_nonce : int
+        The latest nonce on the blockchain.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_transfer_nonce,
+                               internal_transfer_id, blockchain,
+                               latest_blockchain_nonce)
+
+
+async def update_transfer_status(internal_transfer_id: int,
+                                 status: TransferStatus) -> None:
+    """Update the status of a transfer database record.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    status : TransferStatus
+        The new status of the transfer.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_transfer_status,
+                               internal_transfer_id, status)
+
+
+async def update_transfer_transaction_id(internal_transfer_id: int,
+                                         transaction_id: str) -> None:
+    """Update the transaction ID/hash of a transfer database record.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    transaction_id : str
+        The ID/hash of the token transfer's transaction on the
+        source blockchain.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_transfer_transaction_id,
+                               internal_transfer_id, transaction_id)
+
+
+async def update_transfer_task_id(internal_transfer_id: int,
+                                  task_id: uuid.UUID) -> None:
+    """Update the task ID of a transfer database record.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    task_id : uuid.UUID
+        The unique task ID of the transfer.
+
+    Raises
+    ------
+    DatabaseError
+        If there is no transfer database record for the given internal
+        transfer ID.
+
+    """
+    async with get_async_session_maker().begin() as session:
+        await session.run_sync(operations.update_transfer_task_id,
+                               internal_transfer_id, task_id)
+
+
+def _get_read_only_session() -> sqlalchemy.ext.asyncio.AsyncSession:
+    # Same routing as for the synchronous reads
+    replica_session_maker = get_async_replica_session_maker()
+    return (get_async_session_maker()()
+            if replica_session_maker is None else replica_session_maker())
@@ -0,0 +1,161 @@
+"""compact_task_ids_and_addresses
+
+Revision ID: 6b9f0e2d4a71
+Revises: 8c2e4b7a9d15
+Create Date: 2026-10-19 18:05:33.472109
+
+The column type conversions rewrite the contract and transfer tables
+(including their indexes) while holding an ACCESS EXCLUSIVE lock on
+them, i.e. all reads and writes of the tables are blocked until the
+migration has finished. The service node (including its Celery
+workers) must be stopped during the upgrade, whose duration is
+proportional to the number of transfers.
+
+"""
+import alembic
+import sqlalchemy as sa  # type: ignore
+
+# revision identifiers, used by Alembic.
+revision = '6b9f0e2d4a71'
+down_revision = '8c2e4b7a9d15'
+branch_labels = None
+depends_on = None
+
+_EVM_ADDRESS_REGEX = '^0x[0-9a-fA-F]{40}$'
+
+_CONTRACT_TABLES = {
+    'hub_contracts': ['hub_contract_id'],
+    'forwarder_contracts': ['forwarder_contract_id'],
+    'token_contracts': [
+        'source_token_contract_id', 'destination_token_contract_id'
+    ]
+}
+
+_TRANSFER_TABLES = ['transfers', 'transfers_archive']
+
+_TRANSFER_ADDRESS_COLUMNS = ['sender_address', 'recipient_address']
+
+_ARCHIVED_TRANSFER_COLUMNS = [
+    'id', 'source_blockchain_id', 'destination_blockchain_id',
+    'sender_address', 'recipient_address', 'source_token_contract_id',
+    'destination_token_contract_id', 'amount', 'fee', 'sender_nonce',
+    'signature', 'hub_contract_id', 'forwarder_contract_id', 'task_id',
+    'on_chain_transfer_id', 'transaction_id', 'nonce', 'status_id', 'created',
+    'updated'
+]
+
+# Must match pantos.servicenode.database.enums.TransferStatus (FAILED
+# and REVERTED)
+_FAILED_TRANSFER_STATUS_IDS = [1, 3]
+
+
+def _encode_address(column: str) -> str:
+    # Must match pantos.servicenode.database.models.BlockchainAddressType
+    return (f"CASE WHEN {column} ~ '{_EVM_ADDRESS_REGEX}' "
+            f"THEN '\\x00'::bytea || decode(substr({column}, 3), 'hex') "
+            f"ELSE '\\x01'::bytea || convert_to({column}, 'UTF8') END")
+
+
+def _decode_address(column: str) -> str:
+    # EVM-compatible addresses are restored in lower case
+    return (f"CASE WHEN get_byte({column}, 0) = 0 "
+            f"THEN '0x' || encode(substr({column}, 2), 'hex') "
+            f"ELSE convert_from(substr({column}, 2), 'UTF8') END")
+
+
+def _normalize_address(column: sa.ColumnClause) -> sa.ColumnElement:
+    # EVM-compatible addresses that only differ in case become equal
+    # when stored as bytes
+    return sa.case(
+        (column.regexp_match(_EVM_ADDRESS_REGEX), sa.func.lower(column)),
+        else_=column)
+
+
+def _merge_duplicate_contracts(table: str, reference_columns: list[str]):
+    contracts = sa.table(table, sa.column('id'), sa.column('blockchain_id'),
+                         sa.column('address'))
+    duplicates = sa.select(
+        contracts.c.id,
+        sa.func.min(contracts.c.id).over(
+            partition_by=(contracts.c.blockchain_id,
+                          _normalize_address(contracts.c.address)
+                          )).label('kept_id')).subquery('duplicates')
+    for transfer_table in _TRANSFER_TABLES:
+        transfers = sa.table(
+            transfer_table,
+            *(sa.column(column) for column in reference_columns))
+        for reference_column in reference_columns:
+            alembic.op.execute(
+                sa.update(transfers).values({
+                    reference_column: duplicates.c.kept_id
+                }).where(transfers.c[reference_column] == duplicates.c.id,
+                         duplicates.c.id != duplicates.c.kept_id))
+    alembic.op.execute(
+        sa.delete(contracts).where(
+            contracts.c.id.in_(
+                sa.select(duplicates.c.id).where(
+                    duplicates.c.id != duplicates.c.kept_id))))
+
+
+def _archive_sender_nonce_duplicates():
+    # Transfers of the same forwarder contract, sender, and sender nonce
+    # violate the unique sender nonce constraint once the sender
+    # addresses (and the merged forwarder contracts) become equal. Since
+    # the forwarder contract accepts each sender nonce only once, at most
+    # one of them can succeed: a transfer that has not failed (or
+    # reverted) is kept, the others are moved to the archive (which is
+    # not subject to the constraint)
+    transfers = sa.table(
+        'transfers',
+        *(sa.column(column) for column in _ARCHIVED_TRANSFER_COLUMNS))
+    transfers_archive = sa.table(
+        'transfers_archive',
+        *(sa.column(column)
+          for column in _ARCHIVED_TRANSFER_COLUMNS + ['archived']))
+    duplicates = sa.select(
+        transfers.c.id,
+        sa.func.row_number().over(
+            partition_by=(transfers.c.forwarder_contract_id,
+                          _normalize_address(transfers.c.sender_address),
+                          transfers.c.sender_nonce),
+            order_by=(transfers.c.status_id.in_(_FAILED_TRANSFER_STATUS_IDS),
+                      transfers.c.id)).label('rank')).where(
+                          transfers.c.sender_nonce.is_not(None)).subquery(
+                              'duplicates')
+    duplicate_ids = sa.select(duplicates.c.id).where(duplicates.c.rank > 1)
+    alembic.op.execute(
+        sa.insert(transfers_archive).from_select(
+            _ARCHIVED_TRANSFER_COLUMNS + ['archived'],
+            sa.select(
+                *(transfers.c[column]
+                  for column in _ARCHIVED_TRANSFER_COLUMNS),
+                sa.func.now()).where(transfers.c.id.in_(duplicate_ids))))
+    alembic.op.execute(
+        sa.delete(transfers).where(transfers.c.id.in_(duplicate_ids)))
+
+
+def upgrade() -> None:
+    for table, reference_columns in _CONTRACT_TABLES.items():
+        _merge_duplicate_contracts(table, reference_columns)
+    _archive_sender_nonce_duplicates()
+    for table in _CONTRACT_TABLES:
+        alembic.op.alter_column(table, 'address', type_=sa.LargeBinary(),
+                                postgresql_using=_encode_address('address'))
+    for table in _TRANSFER_TABLES:
+        for column in _TRANSFER_ADDRESS_COLUMNS:
+            alembic.op.alter_column(table, column, type_=sa.LargeBinary(),
+                                    postgresql_using=_encode_address(column))
+        alembic.op.alter_column(table, 'task_id', type_=sa.Uuid(),
+                                postgresql_using='task_id::uuid')
+
+
+def downgrade() -> None:
+    for table in _TRANSFER_TABLES:
+        alembic.op.alter_column(table, 'task_id', type_=sa.Text(),
+                                postgresql_using='task_id::text')
+        for column in _TRANSFER_ADDRESS_COLUMNS:
+            alembic.op.alter_column(table, column, type_=sa.Text(),
+                                    postgresql_using=_decode_address(column))
+    for table in _CONTRACT_TABLES:
+        alembic.op.alter_column(table, 'address', type_=sa.Text(),
+                                postgresql_using=_decode_address('address'))
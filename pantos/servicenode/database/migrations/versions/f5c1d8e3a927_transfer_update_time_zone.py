@@ -0,0 +1,43 @@
+"""transfer_update_time_zone
+
+Revision ID: f5c1d8e3a927
+Revises: c7d14e9b2a58
+Create Date: 2026-10-20 11:07:52.364019
+
+"""
+import alembic
+import sqlalchemy as sa  # type: ignore
+
+# revision identifiers, used by Alembic.
+revision = 'f5c1d8e3a927'
+down_revision = 'c7d14e9b2a58'
+branch_labels = None
+depends_on = None
+
+_TRANSFER_TABLES = ['transfers', 'transfers_archive']
+
+
+def upgrade() -> None:
+    # The update timestamps have been stored in UTC; with UTC as the
+    # session time zone, they are converted without rewriting the tables
+    alembic.op.execute("SET LOCAL TIME ZONE 'UTC'")
+    for table in _TRANSFER_TABLES:
+        alembic.op.alter_column(table, 'updated',
+                                type_=sa.DateTime(timezone=True))
+    # Built concurrently (outside of a transaction), so that the
+    # archive is not locked for writes meanwhile
+    with alembic.op.get_context().autocommit_block():
+        alembic.op.create_index(
+            'ix_transfers_archive_sender_nonce', 'transfers_archive',
+            ['forwarder_contract_id', 'sender_address', 'sender_nonce'],
+            unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with alembic.op.get_context().autocommit_block():
+        alembic.op.drop_index('ix_transfers_archive_sender_nonce',
+                              table_name='transfers_archive',
+                              postgresql_concurrently=True)
+    alembic.op.execute("SET LOCAL TIME ZONE 'UTC'")
+    for table in _TRANSFER_TABLES:
+        alembic.op.alter_column(table, 'updated', type_=sa.DateTime())
@@ -2,18 +2,116 @@
 
 """
 import datetime
+import functools
+import re
 import typing
 
 import sqlalchemy  # type: ignore
 import sqlalchemy.orm  # type: ignore
+import web3
+
+from pantos.servicenode.database import enums
 
 UNIQUE_SENDER_NONCE_CONSTRAINT = 'unique_sender_nonce'
 """Name of the unique sender nonce constraint."""
 
+IN_FLIGHT_TRANSFER_STATUS_IDS: typing.Final[tuple[int, ...]] = (
+    enums.TransferStatus.ACCEPTED.value,
+    enums.TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value,
+    enums.TransferStatus.SUBMITTED.value)
+"""IDs of the statuses of transfers that are still to be submitted or
+confirmed."""
+
+EXECUTABLE_TRANSFER_STATUS_IDS: typing.Final[tuple[int, ...]] = (
+    enums.TransferStatus.ACCEPTED.value,
+    enums.TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value)
+"""IDs of the statuses of transfers that are still to be submitted."""
+
+REUSABLE_NONCE_TRANSFER_STATUS_IDS: typing.Final[tuple[int, ...]] = (
+    enums.TransferStatus.ACCEPTED.value, enums.TransferStatus.FAILED.value)
+"""IDs of the statuses of transfers whose assigned nonce can be reused
+for another transfer."""
+
+TERMINAL_TRANSFER_STATUS_IDS: typing.Final[tuple[int, ...]] = (
+    enums.TransferStatus.FAILED.value, enums.TransferStatus.REVERTED.value,
+    enums.TransferStatus.CONFIRMED.value)
+"""IDs of the statuses of transfers that will not be updated anymore
+(unless a failed transfer's nonce is reused)."""
+
 Base: typing.Any = sqlalchemy.orm.declarative_base()
 """SQLAlchemy base class for declarative class definitions."""
 
 
+def status_id_in(status_id: typing.Any,
+                 status_ids: typing.Iterable[int]) -> typing.Any:
+    """Create an expression that checks if a status ID is one of the
+    given status IDs. The status IDs are rendered as literals (instead
+    of bound parameters) so that the database can match the expression
+    against the predicates of partial indexes even for prepared
+    statements.
+
+    Parameters
+    ----------
+    status_id : sqlalchemy.Column
+        The status ID column.
+    status_ids : iterable of int
+        The status IDs to check for.
+
+    Returns
+    -------
+    sqlalchemy.ColumnElement
+        The expression.
+
+    """
+    return status_id.in_([
+        sqlalchemy.literal_column(str(int(status_id_)))
+        for status_id_ in status_ids
+    ])
+
+
+class BlockchainAddressType(sqlalchemy.types.TypeDecorator):
+    """Column type for blockchain addresses. EVM-compatible addresses
+    (0x-prefixed hex strings of 20 bytes) are stored as their 20 raw
+    bytes, all other addresses as their UTF-8 encoding, each preceded by
+    a single tag byte. EVM-compatible addresses are returned in their
+    checksum representation.
+
+    """
+    impl = sqlalchemy.LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: typing.Optional[str],
+                           dialect: typing.Any) -> typing.Optional[bytes]:
+        return None if value is None else _encode_blockchain_address(value)
+
+    def process_result_value(self, value: typing.Optional[bytes],
+                             dialect: typing.Any) -> typing.Optional[str]:
+        return None if value is None else _decode_blockchain_address(
+            bytes(value))
+
+
+_EVM_ADDRESS_TAG: typing.Final[bytes] = b'\x00'
+
+_OTHER_ADDRESS_TAG: typing.Final[bytes] = b'\x01'
+
+_EVM_ADDRESS_PATTERN: typing.Final[re.Pattern] = re.compile(
+    '0x[0-9a-fA-F]{40}')
+
+
+def _encode_blockchain_address(address: str) -> bytes:
+    if _EVM_ADDRESS_PATTERN.fullmatch(address) is not None:
+        return _EVM_ADDRESS_TAG + bytes.fromhex(address[2:])
+    return _OTHER_ADDRESS_TAG + address.encode()
+
+
+@functools.lru_cache(maxsize=10000)
+def _decode_blockchain_address(encoded_address: bytes) -> str:
+    if encoded_address[:1] == _EVM_ADDRESS_TAG:
+        return web3.Web3.to_checksum_address(encoded_address[1:])
+    assert encoded_address[:1] == _OTHER_ADDRESS_TAG
+    return encoded_address[1:].decode()
+
+
 class Blockchain(Base):
     """Model class for the "blockchains" database table. Each instance
     represents a blockchain supported by Pantos.
@@ -59,7 +157,7 @@ class HubContract(Base):
     blockchain_id = sqlalchemy.Column(sqlalchemy.Integer,
                                       sqlalchemy.ForeignKey('blockchains.id'),
                                       nullable=False)
-    address = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    address = sqlalchemy.Column(BlockchainAddressType, nullable=False)
     blockchain = sqlalchemy.orm.relationship('Blockchain',
                                              back_populates='hub_contracts')
     __table_args__ = (sqlalchemy.UniqueConstraint(blockchain_id, address), )
@@ -86,7 +184,7 @@ class ForwarderContract(Base):
     blockchain_id = sqlalchemy.Column(sqlalchemy.Integer,
                                       sqlalchemy.ForeignKey('blockchains.id'),
                                       nullable=False)
-    address = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    address = sqlalchemy.Column(BlockchainAddressType, nullable=False)
     blockchain = sqlalchemy.orm.relationship(
         'Blockchain', back_populates='forwarder_contracts')
     __table_args__ = (sqlalchemy.UniqueConstraint(blockchain_id, address), )
@@ -112,7 +210,7 @@ class TokenContract(Base):
     blockchain_id = sqlalchemy.Column(sqlalchemy.Integer,
                                       sqlalchemy.ForeignKey('blockchains.id'),
                                       nullable=False)
-    address = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    address = sqlalchemy.Column(BlockchainAddressType, nullable=False)
     blockchain = sqlalchemy.orm.relationship('Blockchain',
                                              back_populates='token_contracts')
     __table_args__ = (sqlalchemy.schema.Index(
@@ -164,6 +262,27 @@ class Bid(Base):
         'Blockchain', foreign_keys=[destination_blockchain_id])
 
 
+class BidVersion(Base):
+    """Model class for the "bid_versions" database table. Each instance
+    represents the version of the bids for a source blockchain, which
+    is incremented whenever the bids are changed.
+
+    Attributes
+    ----------
+    source_blockchain_id : sqlalchemy.Column
+        The ID of the bids' source blockchain (primary key, foreign
+        key).
+    version : sqlalchemy.Column
+        The version of the bids.
+
+    """
+    __tablename__ = 'bid_versions'
+    source_blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
+        primary_key=True)
+    version = sqlalchemy.Column(sqlalchemy.BigInteger, nullable=False)
+
+
 class TransferStatus(Base):
     """Model class for the "transfer_status" database table. Each
     instance represents a possible status of Pantos transfers.
@@ -239,6 +358,22 @@ class Transfer(Base):
         The timestamp when the transfer request was received.
     updated : sqlalchemy.Column
         The timestamp when the transfer was last updated.
+    statistics_status_id : sqlalchemy.Column
+        The ID of the transfer status the transfer is currently counted
+        with in the "transfer_statistics" table (NULL if the transfer
+        has not been counted yet).
+    valid_until : sqlalchemy.Column
+        The timestamp until when the transfer is valid on the source
+        blockchain (in seconds since the epoch; NULL if unknown).
+    internal_transaction_id : sqlalchemy.Column
+        The unique internal ID of the transfer's transaction submission
+        on the source blockchain (NULL if the transfer has not been
+        submitted yet).
+    execution_claimed : sqlalchemy.Column
+        The timestamp when the execution of the transfer has been
+        claimed by a Celery transfer task (NULL if the execution has not
+        been claimed, or if the claim has been released to retry the
+        execution).
 
     """
     __tablename__ = 'transfers'
@@ -249,8 +384,9 @@ class Transfer(Base):
     destination_blockchain_id = sqlalchemy.Column(
         sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
         nullable=False)
-    sender_address = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
-    recipient_address = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    sender_address = sqlalchemy.Column(BlockchainAddressType, nullable=False)
+    recipient_address = sqlalchemy.Column(BlockchainAddressType,
+                                          nullable=False)
     source_token_contract_id = sqlalchemy.Column(
         sqlalchemy.Integer, sqlalchemy.ForeignKey('token_contracts.id'),
         nullable=False)
@@ -275,7 +411,7 @@ class Transfer(Base):
     forwarder_contract_id = sqlalchemy.Column(
         sqlalchemy.Integer, sqlalchemy.ForeignKey('forwarder_contracts.id'),
         nullable=False)
-    task_id = sqlalchemy.Column(sqlalchemy.Text, unique=True)
+    task_id = sqlalchemy.Column(sqlalchemy.Uuid(as_uuid=False), unique=True)
     on_chain_transfer_id = sqlalchemy.Column(
         # Large enough for a 256-bit unsigned integer
         sqlalchemy.Numeric(precision=78, scale=0))
@@ -284,10 +420,14 @@ class Transfer(Base):
     status_id = sqlalchemy.Column(sqlalchemy.Integer,
                                   sqlalchemy.ForeignKey('transfer_status.id'),
                                   nullable=False)
-    created = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True),
-                                nullable=False,
-                                default=datetime.datetime.now(datetime.UTC))
-    updated = sqlalchemy.Column(sqlalchemy.DateTime)
+    created = sqlalchemy.Column(
+        sqlalchemy.DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.datetime.now(datetime.UTC))
+    updated = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True))
+    statistics_status_id = sqlalchemy.Column(sqlalchemy.Integer)
+    valid_until = sqlalchemy.Column(sqlalchemy.BigInteger)
+    internal_transaction_id = sqlalchemy.Column(sqlalchemy.Uuid(as_uuid=False))
+    execution_claimed = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True))
     source_blockchain = sqlalchemy.orm.relationship(
         'Blockchain',
         primaryjoin='Transfer.source_blockchain_id==Blockchain.id')
@@ -317,4 +457,195 @@ class Transfer(Base):
         sqlalchemy.schema.Index(
             'ix_transfers_source_blockchain_id_nonce_status_id',
             source_blockchain_id, nonce.desc(), status_id),
+        # Keyset pagination of transfer listings
+        sqlalchemy.schema.Index('ix_transfers_sender_address_id',
+                                sender_address, id),
+        sqlalchemy.schema.Index('ix_transfers_status_id_id', status_id, id),
+        # Partial indexes that only cover the (comparatively few) transfers
+        # that are still in flight
+        sqlalchemy.schema.Index(
+            'ix_transfers_in_flight', source_blockchain_id, status_id,
+            postgresql_where=status_id_in(status_id,
+                                          IN_FLIGHT_TRANSFER_STATUS_IDS),
+            sqlite_where=status_id_in(status_id,
+                                      IN_FLIGHT_TRANSFER_STATUS_IDS)),
+        sqlalchemy.schema.Index(
+            'ix_transfers_reusable_nonces', source_blockchain_id, nonce,
+            postgresql_where=sqlalchemy.and_(
+                nonce.is_not(None),
+                status_id_in(status_id, REUSABLE_NONCE_TRANSFER_STATUS_IDS)),
+            sqlite_where=sqlalchemy.and_(
+                nonce.is_not(None),
+                status_id_in(status_id, REUSABLE_NONCE_TRANSFER_STATUS_IDS))),
+        # Transfers whose status changes are still to be rolled up into
+        # the transfer statistics
+        sqlalchemy.schema.Index(
+            'ix_transfers_statistics_pending', id,
+            postgresql_where=statistics_status_id.is_distinct_from(status_id),
+            sqlite_where=statistics_status_id.is_distinct_from(status_id)),
     )
+
+
+class ArchivedTransfer(Base):
+    """Model class for the "transfers_archive" database table. Each
+    instance represents a terminal Pantos token transfer that has been
+    moved out of the "transfers" table after the configured retention
+    age.
+
+    Attributes
+    ----------
+    id : sqlalchemy.Column
+        The blockchain-independent unique ID of the transfer (primary
+        key, equal to the ID the transfer had in the "transfers"
+        table).
+    archived : sqlalchemy.Column
+        The timestamp when the transfer was archived.
+
+    Notes
+    -----
+    All other attributes are equal to the ones of the Transfer model
+    class (except for the statistics status ID, since only transfers
+    already counted in the transfer statistics are archived, and the
+    validity and the internal transaction ID, which are only needed for
+    recovering in-flight transfers). There are no constraints on the
+    sender nonce and the transaction ID since archived transfers are
+    never updated. The uniqueness of the sender nonces of new transfers
+    is checked against the archived transfers when they are created.
+
+    """
+    __tablename__ = 'transfers_archive'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True,
+                           autoincrement=False)
+    source_blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
+        nullable=False)
+    destination_blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
+        nullable=False)
+    sender_address = sqlalchemy.Column(BlockchainAddressType, nullable=False)
+    recipient_address = sqlalchemy.Column(BlockchainAddressType,
+                                          nullable=False)
+    source_token_contract_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('token_contracts.id'),
+        nullable=False)
+    destination_token_contract_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('token_contracts.id'),
+        nullable=False)
+    amount = sqlalchemy.Column(sqlalchemy.Numeric(precision=78, scale=0),
+                               nullable=False)
+    fee = sqlalchemy.Column(sqlalchemy.Numeric(precision=78, scale=0),
+                            nullable=False)
+    sender_nonce = sqlalchemy.Column(sqlalchemy.Numeric(precision=78, scale=0))
+    signature = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    hub_contract_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('hub_contracts.id'),
+        nullable=False)
+    forwarder_contract_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('forwarder_contracts.id'),
+        nullable=False)
+    task_id = sqlalchemy.Column(sqlalchemy.Uuid(as_uuid=False), unique=True)
+    on_chain_transfer_id = sqlalchemy.Column(
+        sqlalchemy.Numeric(precision=78, scale=0))
+    transaction_id = sqlalchemy.Column(sqlalchemy.Text)
+    nonce = sqlalchemy.Column(sqlalchemy.BigInteger)
+    status_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                  sqlalchemy.ForeignKey('transfer_status.id'),
+                                  nullable=False)
+    created = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True),
+                                nullable=False)
+    updated = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True))
+    archived = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True),
+                                 nullable=False)
+    source_token_contract = sqlalchemy.orm.relationship(
+        'TokenContract',
+        primaryjoin='ArchivedTransfer.source_token_contract_id'
+        '==TokenContract.id', lazy='joined')
+    destination_token_contract = sqlalchemy.orm.relationship(
+        'TokenContract',
+        primaryjoin='ArchivedTransfer.destination_token_contract_id'
+        '==TokenContract.id', lazy='joined')
+    __table_args__ = (
+        # Sender nonce uniqueness check of new transfers
+        sqlalchemy.schema.Index('ix_transfers_archive_sender_nonce',
+                                forwarder_contract_id, sender_address,
+                                sender_nonce), )
+
+
+class TransferStatistics(Base):
+    """Model class for the "transfer_statistics" database table. Each
+    instance represents the aggregated (archived and non-archived)
+    transfers of a token from a source to a destination blockchain that
+    have been received within an hour and currently have a specific
+    public transfer status.
+
+    Attributes
+    ----------
+    hour : sqlalchemy.Column
+        The start of the hour (UTC) in which the transfers have been
+        received (primary key).
+    source_blockchain_id : sqlalchemy.Column
+        The unique ID of the source blockchain (primary key, foreign
+        key).
+    destination_blockchain_id : sqlalchemy.Column
+        The unique ID of the destination blockchain (primary key,
+        foreign key).
+    source_token_contract_id : sqlalchemy.Column
+        The unique token contract ID of the token on the source
+        blockchain (primary key, foreign key).
+    status_id : sqlalchemy.Column
+        The ID of the public transfer status (primary key, foreign
+        key).
+    transfer_count : sqlalchemy.Column
+        The number of transfers.
+    amount : sqlalchemy.Column
+        The total amount of tokens sent by the transfers.
+    fee : sqlalchemy.Column
+        The total fee paid for the transfers.
+
+    """
+    __tablename__ = 'transfer_statistics'
+    hour = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True),
+                             primary_key=True)
+    source_blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
+        primary_key=True)
+    destination_blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('blockchains.id'),
+        primary_key=True)
+    source_token_contract_id = sqlalchemy.Column(
+        sqlalchemy.Integer, sqlalchemy.ForeignKey('token_contracts.id'),
+        primary_key=True)
+    status_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                  sqlalchemy.ForeignKey('transfer_status.id'),
+                                  primary_key=True)
+    transfer_count = sqlalchemy.Column(sqlalchemy.BigInteger, nullable=False)
+    amount = sqlalchemy.Column(sqlalchemy.Numeric(precision=78, scale=0),
+                               nullable=False)
+    fee = sqlalchemy.Column(sqlalchemy.Numeric(precision=78, scale=0),
+                            nullable=False)
+
+
+class IdempotencyKey(Base):
+    """Model class for the "idempotency_keys" database table. Each
+    instance represents a client-supplied idempotency key of a transfer
+    request that has already been accepted by the service node.
+
+    Attributes
+    ----------
+    key : sqlalchemy.Column
+        The idempotency key supplied by the client (primary key).
+    request_hash : sqlalchemy.Column
+        The SHA-256 hash of the transfer request the key has been used
+        for.
+    task_id : sqlalchemy.Column
+        The unique task ID of the transfer initiated by the request.
+    created : sqlalchemy.Column
+        The timestamp when the idempotency key was stored.
+
+    """
+    __tablename__ = 'idempotency_keys'
+    key = sqlalchemy.Column(sqlalchemy.Text, primary_key=True)
+    request_hash = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    task_id = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    created = sqlalchemy.Column(sqlalchemy.DateTime(timezone=True),
+                                nullable=False, index=True)
@@ -0,0 +1,215 @@
+"""Module for listening to database notifications (PostgreSQL LISTEN
+and NOTIFY).
+
+"""
+import logging
+import time
+import typing
+import uuid
+
+import sqlalchemy
+import sqlalchemy.pool
+
+from pantos.servicenode.database import get_direct_url
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.exceptions import DatabaseError
+
+BIDS_NOTIFICATION_CHANNEL: typing.Final[str] = 'pantos_service_node_bids'
+"""Channel on which changes of the bids are notified (with the ID of
+the source blockchain as payload)."""
+
+TRANSFERS_NOTIFICATION_CHANNEL: typing.Final[str] = \
+    'pantos_service_node_transfers'
+"""Channel on which changes of the transfers are notified (with the
+task ID and the status ID of the transfer as payload)."""
+
+_logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    """Listener for the notifications on a database channel. Each
+    listener holds a dedicated database connection (outside of the
+    connection pool) as long as it is listening.
+
+    For databases other than PostgreSQL, no notifications are ever
+    received. The same holds if the service node connects to the
+    database through a transaction-pooling proxy and no direct URL is
+    configured (since listening is a session-level state).
+
+    """
+    def __init__(self, channel: str):
+        """Construct a listener instance.
+
+        Parameters
+        ----------
+        channel : str
+            The name of the notification channel.
+
+        """
+        self.__channel = channel
+        self.__sql_engine: typing.Optional[sqlalchemy.engine.Engine] = None
+        self.__connection: typing.Optional[sqlalchemy.Connection] = None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the next notification on the channel. Notifications
+        that have arrived since the last call are returned immediately.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time to wait (in seconds).
+
+        Returns
+        -------
+        bool
+            True if there has been a notification, False if the timeout
+            has expired.
+
+        Raises
+        ------
+        DatabaseError
+            If the listener's database connection is broken (it is
+            reestablished with the next call, and notifications may
+            have been missed in between).
+
+        """
+        return len(self.receive(timeout)) > 0
+
+    def receive(self, timeout: float) -> list[str]:
+        """Wait for the next notification on the channel and receive the
+        payloads of all notifications that have arrived so far.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time to wait (in seconds).
+
+        Returns
+        -------
+        list of str
+            The payloads of the received notifications (empty if the
+            timeout has expired).
+
+        Raises
+        ------
+        DatabaseError
+            If the listener's database connection is broken (it is
+            reestablished with the next call, and notifications may
+            have been missed in between).
+
+        """
+        try:
+            connection = self.__get_connection()
+            if connection is None:
+                time.sleep(timeout)
+                return []
+            # Notifications arriving in the same packet as the first
+            # one are received as well
+            return [
+                notification.payload for notification in connection.notifies(
+                    timeout=timeout, stop_after=1)
+            ]
+        except Exception:
+            self.close()
+            raise DatabaseError(
+                f'unable to wait for notifications on {self.__channel}')
+
+    def close(self) -> None:
+        """Stop listening and close the listener's database connection.
+
+        """
+        if self.__connection is not None:
+            try:
+                self.__connection.close()
+            except Exception:
+                _logger.warning('unable to close the listener connection',
+                                exc_info=True)
+            self.__connection = None
+
+    def __get_connection(self) -> typing.Any:
+        if self.__connection is None:
+            if self.__sql_engine is None:
+                direct_url = get_direct_url()
+                if direct_url is None:
+                    return None
+                self.__sql_engine = sqlalchemy.create_engine(
+                    direct_url, poolclass=sqlalchemy.pool.NullPool)
+            if self.__sql_engine.dialect.name != 'postgresql':
+                return None
+            self.__connection = self.__sql_engine.connect().execution_options(
+                isolation_level='AUTOCOMMIT')
+            self.__connection.exec_driver_sql(f'LISTEN {self.__channel}')
+        return self.__connection.connection.driver_connection
+
+
+def create_transfer_notification_payload(task_id: uuid.UUID,
+                                         status: TransferStatus) -> str:
+    """Create the compact payload of a transfer notification.
+
+    Parameters
+    ----------
+    task_id : uuid.UUID
+        The unique task ID of the transfer.
+    status : TransferStatus
+        The (new) status of the transfer.
+
+    Returns
+    -------
+    str
+        The notification payload.
+
+    """
+    return f'{task_id.hex}:{status.value}'
+
+
+def create_transfer_notification_payload_expression(
+        task_id: sqlalchemy.ColumnElement[typing.Any],
+        status_id: sqlalchemy.ColumnElement[int]
+) -> sqlalchemy.ColumnElement[str]:
+    """Create the SQL expression of the compact payload of a transfer
+    notification (see create_transfer_notification_payload), for
+    notifying a transfer update within the updating statement.
+
+    Parameters
+    ----------
+    task_id : sqlalchemy.ColumnElement
+        The expression of the unique task ID of the transfer.
+    status_id : sqlalchemy.ColumnElement
+        The expression of the (new) status ID of the transfer.
+
+    Returns
+    -------
+    sqlalchemy.ColumnElement
+        The expression of the notification payload.
+
+    """
+    return sqlalchemy.func.concat(
+        sqlalchemy.func.replace(sqlalchemy.cast(task_id, sqlalchemy.Text), '-',
+                                ''), ':',
+        sqlalchemy.cast(status_id, sqlalchemy.Text))
+
+
+def parse_transfer_notification_payload(
+        payload: str) -> tuple[uuid.UUID, TransferStatus]:
+    """Parse the payload of a transfer notification.
+
+    Parameters
+    ----------
+    payload : str
+        The notification payload.
+
+    Returns
+    -------
+    tuple of uuid.UUID and TransferStatus
+        The unique task ID and the (new) status of the transfer.
+
+    Raises
+    ------
+    ValueError
+        If the payload is malformed.
+
+    """
+    task_id, separator, status_id = payload.partition(':')
+    if separator != ':':
+        raise ValueError(f'malformed transfer notification: {payload}')
+    return uuid.UUID(task_id), TransferStatus(int(status_id))
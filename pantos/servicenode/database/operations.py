@@ -0,0 +1,540 @@
+"""Module with the database operations shared by the access and
+async_access modules. Each operation is executed within a given
+session, which is the synchronous facade of an asyncio session if
+called from the async_access module (see AsyncSession.run_sync). The
+operations do not commit or roll back the session's transaction.
+
+"""
+import dataclasses
+import datetime
+import functools
+import logging
+import typing
+import uuid
+
+import sqlalchemy
+import sqlalchemy.exc
+import sqlalchemy.orm
+from pantos.common.blockchains.enums import Blockchain
+from pantos.common.types import BlockchainAddress
+
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.exceptions import DatabaseError
+from pantos.servicenode.database.exceptions import SenderNonceNotUniqueError
+from pantos.servicenode.database.models import \
+    REUSABLE_NONCE_TRANSFER_STATUS_IDS
+from pantos.servicenode.database.models import UNIQUE_SENDER_NONCE_CONSTRAINT
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Base
+from pantos.servicenode.database.models import Bid
+from pantos.servicenode.database.models import ForwarderContract
+from pantos.servicenode.database.models import HubContract
+from pantos.servicenode.database.models import TokenContract
+from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.models import status_id_in
+from pantos.servicenode.database.notifications import \
+    TRANSFERS_NOTIFICATION_CHANNEL
+from pantos.servicenode.database.notifications import \
+    create_transfer_notification_payload_expression
+
+_logger = logging.getLogger(__name__)
+
+B = typing.TypeVar('B', bound=Base)
+
+
+@dataclasses.dataclass
+class TransferUpdate:
+    """Unit of work for a transfer database record. All field updates
+    collected in an instance are applied with a single UPDATE statement
+    in a single transaction (see update_transfer).
+
+    Attributes
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    status : TransferStatus or None
+        The new status of the transfer (unchanged if None).
+    transaction_id : str or None
+        The new ID/hash of the token transfer's transaction on the
+        source blockchain (unchanged if None).
+    on_chain_transfer_id : int or None
+        The new Pantos transfer ID assigned by the Pantos Hub contract
+        on the source blockchain (unchanged if None).
+    task_id : uuid.UUID or None
+        The new unique task ID of the transfer (unchanged if None).
+    internal_transaction_id : uuid.UUID or None
+        The new unique internal ID of the transfer's transaction
+        submission on the source blockchain (unchanged if None).
+    reset_nonce : bool
+        True if the transaction nonce of the transfer is to be set to
+        NULL.
+
+    """
+    internal_transfer_id: int
+    status: typing.Optional[TransferStatus] = None
+    transaction_id: typing.Optional[str] = None
+    on_chain_transfer_id: typing.Optional[int] = None
+    task_id: typing.Optional[uuid.UUID] = None
+    internal_transaction_id: typing.Optional[uuid.UUID] = None
+    reset_nonce: bool = False
+
+
+def _create_update_transfer_nonce_statement() -> sqlalchemy.Update:
+    internal_transfer_id = sqlalchemy.bindparam('internal_transfer_id',
+                                                type_=sqlalchemy.Integer)
+    blockchain_id = sqlalchemy.bindparam('blockchain_id',
+                                         type_=sqlalchemy.Integer)
+    latest_blockchain_nonce = sqlalchemy.bindparam('latest_blockchain_nonce',
+                                                   type_=sqlalchemy.BigInteger)
+
+    # Restricted to the predicate of the partial reusable nonces index
+    # so that only in-flight transfers are scanned
+    reusable_nonces_expression = sqlalchemy.and_(
+        Transfer.source_blockchain_id == blockchain_id,
+        Transfer.nonce.is_not(None),
+        status_id_in(Transfer.status_id, REUSABLE_NONCE_TRANSFER_STATUS_IDS))
+
+    minimum_reusable_nonce_cte = sqlalchemy.select(
+        sqlalchemy.func.min(Transfer.nonce).label('min')).filter(
+            reusable_nonces_expression).cte('minimum_reusable_nonce_cte')
+
+    # Answered by a backward scan of the source_blockchain_id/nonce index
+    maximum_transfer_nonce_subquery = sqlalchemy.select(
+        sqlalchemy.func.max(Transfer.nonce)).filter(
+            Transfer.source_blockchain_id == blockchain_id).scalar_subquery()
+
+    return sqlalchemy.update(Transfer).where(
+        sqlalchemy.or_(
+            Transfer.id == internal_transfer_id,
+            sqlalchemy.and_(
+                reusable_nonces_expression,
+                Transfer.nonce == minimum_reusable_nonce_cte.c.min))).values({
+                    Transfer.nonce: sqlalchemy.case(
+                        (minimum_reusable_nonce_cte.c.min.is_(None),
+                         sqlalchemy.case((maximum_transfer_nonce_subquery
+                                          >= latest_blockchain_nonce,
+                                          maximum_transfer_nonce_subquery + 1),
+                                         else_=latest_blockchain_nonce)),
+                        (Transfer.id == internal_transfer_id,
+                         minimum_reusable_nonce_cte.c.min),
+                        else_=sqlalchemy.null()),
+                    Transfer.status_id: sqlalchemy.case(
+                        (Transfer.id == internal_transfer_id,
+                         TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value),
+                        else_=sqlalchemy.case(
+                            (Transfer.status_id == TransferStatus.FAILED.value,
+                             TransferStatus.FAILED.value),
+                            else_=TransferStatus.ACCEPTED.value))
+                })
+
+
+def _create_read_contract_id_statement(
+    model: typing.Union[type[ForwarderContract], type[HubContract],
+                        type[TokenContract]]
+) -> sqlalchemy.Select:
+    return sqlalchemy.select(model.id).filter(
+        model.blockchain_id == sqlalchemy.bindparam('blockchain_id'),
+        model.address == sqlalchemy.bindparam('address'))
+
+
+def _create_read_transfer_by_task_id_statement(
+    model: typing.Union[type[Transfer], type[ArchivedTransfer]]
+) -> sqlalchemy.Select:
+    return sqlalchemy.select(model).filter(
+        model.task_id == sqlalchemy.bindparam('task_id'))
+
+
+# Statements of hot queries are constructed only once, with bound
+# parameters instead of literal values. This way, the statements'
+# cache keys (for looking up their compiled forms in the engine's
+# compiled cache) are memoized, and the generated SQL is identical for
+# each call so that the driver can prepare it on the server.
+
+_CREATE_TRANSFER_STATEMENT = sqlalchemy.insert(Transfer).returning(Transfer.id)
+
+_READ_CONTRACT_ID_STATEMENTS: dict[type[Base], sqlalchemy.Select] = {
+    ForwarderContract: _create_read_contract_id_statement(ForwarderContract),
+    HubContract: _create_read_contract_id_statement(HubContract),
+    TokenContract: _create_read_contract_id_statement(TokenContract)
+}
+
+_READ_TRANSFER_BY_TASK_ID_STATEMENTS: tuple[sqlalchemy.Select, ...] = (
+    _create_read_transfer_by_task_id_statement(Transfer),
+    _create_read_transfer_by_task_id_statement(ArchivedTransfer))
+
+_UPDATE_TRANSFER_NONCE_STATEMENT = _create_update_transfer_nonce_statement()
+
+
+def create_transfer(session: sqlalchemy.orm.Session,
+                    source_blockchain: Blockchain,
+                    destination_blockchain: Blockchain, sender_address: str,
+                    recipient_address: str, source_token_address: str,
+                    destination_token_address: str, amount: int, fee: int,
+                    sender_nonce: int, signature: str, valid_until: int,
+                    hub_address: str, forwarder_address: str) -> int:
+    """Create a transfer database record (see
+    access.create_transfer).
+
+    """
+    transfer_status = TransferStatus.ACCEPTED
+    source_token_contract_id = _read_token_contract_id(session,
+                                                       source_blockchain,
+                                                       source_token_address)
+    if source_token_contract_id is None:
+        source_token_contract_id = _create_token_contract(
+            session, source_blockchain, source_token_address)
+    destination_token_contract_id = _read_token_contract_id(
+        session, destination_blockchain, destination_token_address)
+    if destination_token_contract_id is None:
+        destination_token_contract_id = _create_token_contract(
+            session, destination_blockchain, destination_token_address)
+    hub_contract_id = _read_hub_contract_id(session, source_blockchain,
+                                            hub_address)
+    if hub_contract_id is None:
+        hub_contract_id = _create_hub_contract(session, source_blockchain,
+                                               hub_address)
+    forwarder_contract_id = _read_forwarder_contract_id(
+        session, source_blockchain, forwarder_address)
+    if forwarder_contract_id is None:
+        forwarder_contract_id = _create_forwarder_contract(
+            session, source_blockchain, forwarder_address)
+    elif _is_sender_nonce_archived(session, forwarder_contract_id,
+                                   sender_address, sender_nonce):
+        # Archived transfers are not covered by the unique sender nonce
+        # constraint of the "transfers" table
+        raise SenderNonceNotUniqueError(source_blockchain, sender_address,
+                                        sender_nonce)
+    return session.execute(
+        _CREATE_TRANSFER_STATEMENT, {
+            'source_blockchain_id': source_blockchain.value,
+            'destination_blockchain_id': destination_blockchain.value,
+            'sender_address': sender_address,
+            'recipient_address': recipient_address,
+            'source_token_contract_id': source_token_contract_id,
+            'destination_token_contract_id': destination_token_contract_id,
+            'amount': amount,
+            'fee': fee,
+            'sender_nonce': sender_nonce,
+            'signature': signature,
+            'valid_until': valid_until,
+            'hub_contract_id': hub_contract_id,
+            'forwarder_contract_id': forwarder_contract_id,
+            'status_id': transfer_status.value
+        }).scalar_one()
+
+
+def raise_sender_nonce_not_unique_error(error: sqlalchemy.exc.IntegrityError,
+                                        source_blockchain: Blockchain,
+                                        sender_address: str,
+                                        sender_nonce: int) -> None:
+    """Raise a SenderNonceNotUniqueError if an integrity error is
+    caused by the unique sender nonce constraint.
+
+    """
+    if UNIQUE_SENDER_NONCE_CONSTRAINT in str(error):
+        raise SenderNonceNotUniqueError(source_blockchain, sender_address,
+                                        sender_nonce)
+
+
+def read_bids(session: sqlalchemy.orm.Session, source_blockchain_id: int,
+              destination_blockchain_id: int) -> list[Bid]:
+    """Read the bid records for a given source and destination
+    blockchain (see access.read_bids).
+
+    """
+    statement = sqlalchemy.select(Bid).filter_by(
+        source_blockchain_id=source_blockchain_id,
+        destination_blockchain_id=destination_blockchain_id)
+    bids = session.execute(statement).scalars().all()
+    session.expunge_all()
+    return list(bids)
+
+
+def read_transfer_by_task_id(
+    session: sqlalchemy.orm.Session, task_id: uuid.UUID
+) -> typing.Optional[typing.Union[Transfer, ArchivedTransfer]]:
+    """Read a transfer or archived transfer database record (see
+    access.read_transfer_by_task_id).
+
+    """
+    for statement in _READ_TRANSFER_BY_TASK_ID_STATEMENTS:
+        transfer = session.execute(statement, {
+            'task_id': str(task_id)
+        }).scalar_one_or_none()
+        if transfer is not None:
+            session.expunge(transfer)
+            return transfer
+    return None
+
+
+def read_transfer_nonce(session: sqlalchemy.orm.Session,
+                        internal_transfer_id: int) -> int | None:
+    """Read the nonce for a transfer transaction submitted to the source
+    blockchain (see access.read_transfer_nonce).
+
+    """
+    statement = sqlalchemy.select(
+        Transfer.nonce).filter(Transfer.id == internal_transfer_id)
+    return session.execute(statement).scalar_one_or_none()
+
+
+def read_transfers(session: sqlalchemy.orm.Session,
+                   sender_address: typing.Optional[str],
+                   statuses: typing.Optional[list[TransferStatus]],
+                   after_id: typing.Optional[int],
+                   limit: int) -> list[Transfer]:
+    """Read transfer database records ordered by their internal IDs
+    (see access.read_transfers).
+
+    """
+    assert limit > 0
+    statement = sqlalchemy.select(Transfer).filter(
+        Transfer.task_id.is_not(None))
+    if sender_address is not None:
+        statement = statement.filter(Transfer.sender_address == sender_address)
+    if after_id is not None:
+        statement = statement.filter(Transfer.id > after_id)
+    if statuses is not None:
+        # A single ordered scan of the (status_id, id) index is only
+        # possible for a single status, so the first matching IDs are
+        # searched for each status separately and merged afterwards
+        status_id_subqueries = [
+            statement.with_only_columns(Transfer.id).filter(
+                Transfer.status_id == status.value).order_by(
+                    Transfer.id).limit(limit).subquery() for status in statuses
+        ]
+        if len(status_id_subqueries) == 0:
+            return []
+        status_ids = sqlalchemy.union_all(
+            *(sqlalchemy.select(subquery.c.id)
+              for subquery in status_id_subqueries))
+        statement = sqlalchemy.select(Transfer).filter(
+            Transfer.id.in_(status_ids))
+    statement = statement.order_by(Transfer.id).limit(limit)
+    transfers = list(session.execute(statement).unique().scalars())
+    session.expunge_all()
+    return transfers
+
+
+def reset_transfer_nonce(session: sqlalchemy.orm.Session,
+                         internal_transfer_id: int) -> None:
+    """Update a transfer by setting its transaction nonce to NULL (see
+    access.reset_transfer_nonce).
+
+    """
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).values(nonce=sqlalchemy.null())
+    session.execute(statement)
+
+
+def update_on_chain_transfer_id(session: sqlalchemy.orm.Session,
+                                internal_transfer_id: int,
+                                on_chain_transfer_id: int) -> None:
+    """Update the on-chain transfer ID of a transfer database record
+    (see access.update_on_chain_transfer_id).
+
+    """
+    update_transfer(
+        session,
+        TransferUpdate(internal_transfer_id,
+                       on_chain_transfer_id=on_chain_transfer_id))
+
+
+def update_transfer(session: sqlalchemy.orm.Session,
+                    transfer_update: TransferUpdate) -> None:
+    """Apply all field updates of a unit of work to a transfer database
+    record (see access.update_transfer).
+
+    """
+    values: dict[str, typing.Any] = {
+        'updated': datetime.datetime.now(datetime.UTC)
+    }
+    status = transfer_update.status
+    if status is not None:
+        values['status_id'] = status.value
+        if (status is TransferStatus.FAILED
+                or status is TransferStatus.REVERTED):
+            # In case of a failed or reverted transfer, the sender nonce
+            # can be used again, which should thus not be excluded by
+            # the unique sender nonce constraint
+            values['sender_nonce'] = None
+    if transfer_update.transaction_id is not None:
+        values['transaction_id'] = transfer_update.transaction_id
+    if transfer_update.on_chain_transfer_id is not None:
+        values['on_chain_transfer_id'] = transfer_update.on_chain_transfer_id
+    if transfer_update.task_id is not None:
+        values['task_id'] = str(transfer_update.task_id)
+    if transfer_update.internal_transaction_id is not None:
+        values['internal_transaction_id'] = str(
+            transfer_update.internal_transaction_id)
+    if transfer_update.reset_nonce:
+        values['nonce'] = None
+    # Only updates visible to clients are notified
+    notify = ((status is not None or transfer_update.transaction_id is not None
+               or transfer_update.on_chain_transfer_id is not None)
+              and session.get_bind().dialect.name == 'postgresql')
+    statement = _get_update_transfer_statement(tuple(values), notify)
+    parameters = {f'new_{name}': value for name, value in values.items()}
+    parameters['internal_transfer_id'] = transfer_update.internal_transfer_id
+    row = session.execute(statement, parameters).one_or_none()
+    if row is None:
+        raise DatabaseError('unknown internal transfer ID: '
+                            f'{transfer_update.internal_transfer_id}')
+
+
+def update_transfer_nonce(session: sqlalchemy.orm.Session,
+                          internal_transfer_id: int, blockchain: Blockchain,
+                          latest_blockchain_nonce: int) -> None:
+    """Update the nonce of a transfer database record (see
+    access.update_transfer_nonce).
+
+    """
+    session.execute(
+        _UPDATE_TRANSFER_NONCE_STATEMENT, {
+            'internal_transfer_id': internal_transfer_id,
+            'blockchain_id': blockchain.value,
+            'latest_blockchain_nonce': latest_blockchain_nonce
+        }, execution_options=sqlalchemy.util._collections.immutabledict(
+            {'synchronize_session': False}))
+
+
+def update_transfer_status(session: sqlalchemy.orm.Session,
+                           internal_transfer_id: int,
+                           status: TransferStatus) -> None:
+    """Update the status of a transfer database record (see
+    access.update_transfer_status).
+
+    """
+    update_transfer(session, TransferUpdate(internal_transfer_id,
+                                            status=status))
+
+
+def update_transfer_task_id(session: sqlalchemy.orm.Session,
+                            internal_transfer_id: int,
+                            task_id: uuid.UUID) -> None:
+    """Update the task ID of a transfer database record (see
+    access.update_transfer_task_id).
+
+    """
+    update_transfer(session,
+                    TransferUpdate(internal_transfer_id, task_id=task_id))
+
+
+def update_transfer_transaction_id(session: sqlalchemy.orm.Session,
+                                   internal_transfer_id: int,
+                                   transaction_id: str) -> None:
+    """Update the transaction ID/hash of a transfer database record
+    (see access.update_transfer_transaction_id).
+
+    """
+    update_transfer(
+        session,
+        TransferUpdate(internal_transfer_id, transaction_id=transaction_id))
+
+
+def _is_sender_nonce_archived(session: sqlalchemy.orm.Session,
+                              forwarder_contract_id: int, sender_address: str,
+                              sender_nonce: int) -> bool:
+    statement = sqlalchemy.select(sqlalchemy.exists().where(
+        ArchivedTransfer.forwarder_contract_id == forwarder_contract_id,
+        ArchivedTransfer.sender_address == sender_address,
+        ArchivedTransfer.sender_nonce == sender_nonce))
+    return session.execute(statement).scalar_one()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_update_transfer_statement(
+        column_names: tuple[str, ...],
+        notify: bool) -> typing.Union[sqlalchemy.Update, sqlalchemy.Select]:
+    # One statement per combination of updated columns (of which there
+    # are only a few in practice)
+    update_statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == sqlalchemy.bindparam('internal_transfer_id')).values({
+            column_name: sqlalchemy.bindparam(f'new_{column_name}')
+            for column_name in column_names
+        }).returning(Transfer.task_id, Transfer.status_id)
+    if not notify:
+        return update_statement
+    # The (PostgreSQL) notification is sent by the updating statement
+    # itself instead of a separate one, saving a round trip, and is
+    # delivered when the transaction is committed. Transfers without a
+    # task ID are not known to any client yet. The notification CTE must
+    # be referenced by the main query, since a CTE that does not modify
+    # any data is only evaluated if referenced.
+    updated_transfer = update_statement.cte('updated_transfer')
+    transfer_notification = sqlalchemy.select(
+        sqlalchemy.func.pg_notify(
+            TRANSFERS_NOTIFICATION_CHANNEL,
+            create_transfer_notification_payload_expression(
+                updated_transfer.c.task_id,
+                updated_transfer.c.status_id))).filter(
+                    updated_transfer.c.task_id.is_not(None)).cte(
+                        'transfer_notification')
+    return sqlalchemy.select(
+        updated_transfer.c.task_id, updated_transfer.c.status_id,
+        sqlalchemy.select(
+            sqlalchemy.func.count()).select_from(transfer_notification).
+        scalar_subquery().label('notification_count'))
+
+
+def _read_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
+             **kwargs: typing.Any) -> int | None:
+    return session.execute(_READ_CONTRACT_ID_STATEMENTS[model],
+                           kwargs).scalar_one_or_none()
+
+
+def _read_forwarder_contract_id(session: sqlalchemy.orm.Session,
+                                blockchain: Blockchain,
+                                address: BlockchainAddress) -> int | None:
+    return _read_id(session, ForwarderContract, blockchain_id=blockchain.value,
+                    address=address)
+
+
+def _read_hub_contract_id(session: sqlalchemy.orm.Session,
+                          blockchain: Blockchain,
+                          address: BlockchainAddress) -> int | None:
+    return _read_id(session, HubContract, blockchain_id=blockchain.value,
+                    address=address)
+
+
+def _read_token_contract_id(session: sqlalchemy.orm.Session,
+                            blockchain: Blockchain,
+                            address: BlockchainAddress) -> int | None:
+    return _read_id(session, TokenContract, blockchain_id=blockchain.value,
+                    address=address)
+
+
+def _create_with_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
+                    **kwargs: typing.Any) -> int:
+    statement = sqlalchemy.insert(model).values(**kwargs).returning(model.id)
+    try:
+        with session.begin_nested():
+            return session.execute(statement).scalar_one()
+    except sqlalchemy.exc.IntegrityError:
+        # Non-critical error that can happen in a parallel execution
+        # environment due to a race condition
+        _logger.warning('instance already created', exc_info=True)
+        id_ = _read_id(session, model, **kwargs)
+        assert id_ is not None
+        return id_
+
+
+def _create_forwarder_contract(session: sqlalchemy.orm.Session,
+                               blockchain: Blockchain,
+                               address: BlockchainAddress) -> int:
+    return _create_with_id(session, ForwarderContract,
+                           blockchain_id=blockchain.value, address=address)
+
+
+def _create_hub_contract(session: sqlalchemy.orm.Session,
+                         blockchain: Blockchain,
+                         address: BlockchainAddress) -> int:
+    return _create_with_id(session, HubContract,
+                           blockchain_id=blockchain.value, address=address)
+
+
+def _create_token_contract(session: sqlalchemy.orm.Session,
+                           blockchain: Blockchain,
+                           address: BlockchainAddress) -> int:
+    return _create_with_id(session, TokenContract,
+                           blockchain_id=blockchain.value, address=address)
@@ -0,0 +1,171 @@
+"""Module for collecting metrics of the database connection pools,
+which are sized according to the role of a process.
+
+"""
+import bisect
+import dataclasses
+import enum
+import threading
+import time
+import typing
+
+import sqlalchemy.exc
+import sqlalchemy.pool
+
+CHECKOUT_WAIT_TIME_BUCKETS: typing.Final[tuple[float,
+                                               ...]] = (0.001, 0.005, 0.01,
+                                                        0.05, 0.1, 0.5, 1.0,
+                                                        5.0, 10.0, 30.0)
+"""Upper bounds (in seconds) of the histogram buckets of the connection
+checkout wait times."""
+
+
+class ProcessRole(enum.Enum):
+    """Enumeration of the roles of the service node processes, which
+    differ in the number of database connections they use concurrently.
+
+    """
+    WEB = 'web'
+    TRANSFER_WORKER = 'transfer_worker'
+    BID_WORKER = 'bid_worker'
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolMetrics:
+    """Metrics of a database connection pool.
+
+    Attributes
+    ----------
+    pool_size : int
+        The number of connections kept open in the pool.
+    max_overflow : int
+        The number of connections that may be opened in addition when
+        all connections of the pool are checked out.
+    checked_out : int
+        The number of currently checked out connections.
+    checkouts : int
+        The total number of successful connection checkouts.
+    checkout_timeouts : int
+        The total number of connection checkouts that have timed out
+        (because all connections of the pool have been checked out).
+    checkout_wait_time : float
+        The total time (in seconds) spent waiting for successful
+        connection checkouts.
+    checkout_wait_time_buckets : tuple of int
+        The cumulative numbers of successful connection checkouts with
+        a wait time less than or equal to the corresponding upper bound
+        of CHECKOUT_WAIT_TIME_BUCKETS.
+
+    """
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_time: float
+    checkout_wait_time_buckets: tuple[int, ...]
+
+    @property
+    def saturation(self) -> float:
+        """The ratio of checked out connections to the maximum number
+        of connections of the pool.
+
+        """
+        return self.checked_out / max(self.pool_size + self.max_overflow, 1)
+
+
+class _CheckoutStatistics:
+    """Thread-safe statistics of the connection checkouts of a pool.
+
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__wait_time = 0.0
+        self.__wait_time_buckets = [0] * len(CHECKOUT_WAIT_TIME_BUCKETS)
+
+    def record_checkout(self, wait_time: float) -> None:
+        bucket_index = bisect.bisect_left(CHECKOUT_WAIT_TIME_BUCKETS,
+                                          wait_time)
+        with self.__lock:
+            self.__checkouts += 1
+            self.__wait_time += wait_time
+            if bucket_index < len(self.__wait_time_buckets):
+                self.__wait_time_buckets[bucket_index] += 1
+
+    def record_timeout(self) -> None:
+        with self.__lock:
+            self.__timeouts += 1
+
+    def get(self) -> tuple[int, int, float, tuple[int, ...]]:
+        with self.__lock:
+            checkouts = self.__checkouts
+            timeouts = self.__timeouts
+            wait_time = self.__wait_time
+            wait_time_buckets = list(self.__wait_time_buckets)
+        for i in range(1, len(wait_time_buckets)):
+            wait_time_buckets[i] += wait_time_buckets[i - 1]
+        return checkouts, timeouts, wait_time, tuple(wait_time_buckets)
+
+
+class _MeteredPoolMixin:
+    """Mixin for queue pools that records the time it takes to check
+    out a connection (i.e. waiting for a connection to be returned to
+    the pool, or opening a new one).
+
+    """
+    def __init__(self, *args, **kwargs):
+        self._checkout_statistics = _CheckoutStatistics()
+        super().__init__(*args, **kwargs)
+
+    def connect(self) -> sqlalchemy.pool.PoolProxiedConnection:
+        start_time = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore
+        except sqlalchemy.exc.TimeoutError:
+            self._checkout_statistics.record_timeout()
+            raise
+        self._checkout_statistics.record_checkout(time.perf_counter() -
+                                                  start_time)
+        return connection
+
+    def recreate(self) -> sqlalchemy.pool.QueuePool:
+        # The statistics survive the disposal of an engine
+        pool = super().recreate()  # type: ignore
+        pool._checkout_statistics = self._checkout_statistics
+        return pool
+
+    def get_metrics(self) -> PoolMetrics:
+        """Get the current metrics of the pool.
+
+        Returns
+        -------
+        PoolMetrics
+            The metrics of the pool.
+
+        """
+        checkouts, timeouts, wait_time, wait_time_buckets = \
+            self._checkout_statistics.get()
+        return PoolMetrics(
+            self.size(),  # type: ignore
+            self._max_overflow,  # type: ignore
+            self.checkedout(),  # type: ignore
+            checkouts,
+            timeouts,
+            wait_time,
+            wait_time_buckets)
+
+
+class MeteredQueuePool(_MeteredPoolMixin, sqlalchemy.pool.QueuePool):
+    """Queue pool with connection checkout metrics.
+
+    """
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPoolMixin,
+                                   sqlalchemy.pool.AsyncAdaptedQueuePool):
+    """Queue pool (for asyncio engines) with connection checkout
+    metrics.
+
+    """
@@ -0,0 +1,115 @@
+"""Command for exporting the transfer history of the service node (e.g.
+for accounting).
+
+Run with "python -m pantos.servicenode.export --help" for the available
+options. The export is written to the standard output unless an output
+file is given.
+
+"""
+import argparse
+import datetime
+import logging
+import sys
+import typing
+
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.exports import ExportFormat
+from pantos.servicenode.business.exports import ExportInteractor
+from pantos.servicenode.configuration import load_config
+from pantos.servicenode.database import \
+    initialize_package as initialize_database_package
+
+_logger = logging.getLogger(__name__)
+"""Logger for this module."""
+
+
+def main(arguments: typing.Optional[list[str]] = None) -> int:
+    """Export the transfer history.
+
+    Parameters
+    ----------
+    arguments : list of str, optional
+        The command-line arguments (the ones of the current process if
+        not given).
+
+    Returns
+    -------
+    int
+        The exit status of the command.
+
+    """
+    parsed_arguments = _create_argument_parser().parse_args(arguments)
+    # Log messages must not be mixed with an export written to the
+    # standard output
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    try:
+        load_config(reload=False)
+        initialize_database_package(False)
+    except Exception:
+        _logger.critical('unable to initialize the database', exc_info=True)
+        return 1
+    request = ExportInteractor.ExportTransfersRequest(
+        ExportFormat(parsed_arguments.format), parsed_arguments.created_from,
+        parsed_arguments.created_until, parsed_arguments.source_blockchain,
+        parsed_arguments.destination_blockchain)
+    output = (sys.stdout if parsed_arguments.output is None else open(
+        parsed_arguments.output, 'w', encoding='utf-8', newline=''))
+    try:
+        for chunk in ExportInteractor().export_transfers(request):
+            output.write(chunk)
+    except Exception:
+        _logger.critical('unable to export the transfers', exc_info=True)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def _create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m pantos.servicenode.export',
+        description='Export all (including archived) transfers of the '
+        'service node, ordered by their acceptance.')
+    parser.add_argument(
+        '--format',
+        choices=[export_format.value for export_format in ExportFormat],
+        default=ExportFormat.CSV.value, help='format of the export')
+    parser.add_argument(
+        '--created-from', type=_parse_timestamp,
+        help='ISO 8601 timestamp of the first acceptance time to export '
+        '(inclusive, UTC if no offset is given)')
+    parser.add_argument(
+        '--created-until', type=_parse_timestamp,
+        help='ISO 8601 timestamp of the last acceptance time to export '
+        '(exclusive, UTC if no offset is given)')
+    parser.add_argument('--source-blockchain', type=_parse_blockchain,
+                        help='name or numeric ID of the source blockchain')
+    parser.add_argument(
+        '--destination-blockchain', type=_parse_blockchain,
+        help='name or numeric ID of the destination '
+        'blockchain')
+    parser.add_argument(
+        '--output', help='path of the output file (standard output '
+        'if not given)')
+    return parser
+
+
+def _parse_timestamp(value: str) -> datetime.datetime:
+    timestamp = datetime.datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.UTC)
+    return timestamp
+
+
+def _parse_blockchain(value: str) -> Blockchain:
+    try:
+        return (Blockchain(int(value))
+                if value.isdigit() else Blockchain[value.upper()])
+    except (KeyError, ValueError):
+        raise argparse.ArgumentTypeError(f'unknown blockchain: {value}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Gunicorn server hooks for running the service node application with
+multiple worker processes forked from a preloading master process.
+
+"""
+import typing
+
+from pantos.servicenode.application import initialize_worker_process
+
+
+def post_fork(server: typing.Any, worker: typing.Any) -> None:
+    """Called by Gunicorn in a worker process just after it has been
+    forked from the master process. If the application has been
+    preloaded by the master process, the worker process is
+    reinitialized.
+
+    Parameters
+    ----------
+    server : gunicorn.arbiter.Arbiter
+        The Gunicorn master process.
+    worker : gunicorn.workers.base.Worker
+        The forked worker process.
+
+    """
+    if server.cfg.preload_app:
+        initialize_worker_process()
@@ -1,7 +1,12 @@
 """Module that implements the service node's REST API.
 
 """
+import datetime
+import hashlib
+import itertools
+import json
 import logging
+import os
 import time
 import typing
 import uuid
@@ -24,13 +29,33 @@ from pantos.common.restapi import resource_not_found
 
 from pantos.servicenode.blockchains.factory import get_blockchain_client
 from pantos.servicenode.business.bids import BidInteractor
+from pantos.servicenode.business.exports import ExportFormat
+from pantos.servicenode.business.exports import ExportInteractor
+from pantos.servicenode.business.ratelimits import RateLimitInteractor
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.business.statistics import StatisticsInteractor
 from pantos.servicenode.business.transfers import SenderNonceNotUniqueError
 from pantos.servicenode.business.transfers import TransferInteractor
 from pantos.servicenode.business.transfers import \
     TransferInteractorBidNotAcceptedError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorIdempotencyKeyConflictError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorInvalidSignatureError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorOverloadedError
 from pantos.servicenode.business.transfers import \
     TransferInteractorResourceNotFoundError
-from pantos.servicenode.configuration import get_blockchain_config
+from pantos.servicenode.business.transfers import \
+    subscribe_to_transfer_notifications
+from pantos.servicenode.cache import LruCache
+from pantos.servicenode.configuration import config
+from pantos.servicenode.configuration import get_active_registered_blockchains
+from pantos.servicenode.database import get_pool_metrics
+from pantos.servicenode.database import get_process_role
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.pools import CHECKOUT_WAIT_TIME_BUCKETS
 
 flask_app = flask.Flask(__name__)
 """Flask application object."""
@@ -41,6 +66,73 @@ flask_cors.CORS(flask_app)
 _logger = logging.getLogger(__name__)
 """Logger for this module."""
 
+_IDEMPOTENCY_KEY_HEADER: typing.Final[str] = 'Idempotency-Key'
+"""Name of the HTTP header carrying a transfer request's idempotency
+key."""
+
+_MAX_IDEMPOTENCY_KEY_LENGTH: typing.Final[int] = 255
+"""Maximum length of an idempotency key."""
+
+_DEFAULT_TRANSFERS_LIMIT: typing.Final[int] = 20
+"""Default number of transfers per page of a transfers request."""
+
+_MAX_TRANSFERS_LIMIT: typing.Final[int] = 100
+"""Maximum number of transfers per page of a transfers request."""
+
+_json_encoder = json.JSONEncoder(check_circular=False, separators=(',', ':'))
+"""Compact JSON encoder for response payloads built from trusted internal
+data (i.e. without circular references)."""
+
+_SUPPORTED_BLOCKCHAIN_IDS: typing.Final[list[int]] = [
+    blockchain.value for blockchain in Blockchain
+]
+"""IDs of all blockchains supported by the service node."""
+
+_VALID_ADDRESSES_CACHE_SIZE: typing.Final[int] = 10000
+"""Maximum number of cached valid addresses."""
+
+_valid_addresses: LruCache[tuple[Blockchain, str, bool],
+                           bool] = LruCache(_VALID_ADDRESSES_CACHE_SIZE)
+"""In-memory cache of addresses that have been found to be valid, keyed
+by their blockchain, the address string, and whether they have been
+checked as a recipient address."""
+
+_TERMINAL_TRANSFER_STATUSES: typing.Final[frozenset[TransferStatus]] = \
+    frozenset({TransferStatus.CONFIRMED, TransferStatus.REVERTED,
+               TransferStatus.FAILED})
+"""Public transfer statuses which are never changed anymore."""
+
+_TERMINAL_CACHE_CONTROL: typing.Final[str] = \
+    'public, max-age=31536000, immutable'
+"""Cache-Control header value of transfer status responses for
+transfers with a terminal status."""
+
+_PROMETHEUS_TEXT_MIMETYPE: typing.Final[str] = 'text/plain; version=0.0.4'
+"""MIME type of the Prometheus text exposition format."""
+
+_POOL_METRICS_PREFIX: typing.Final[str] = \
+    'pantos_service_node_database_pool'
+"""Common prefix of the names of the database pool metrics."""
+
+_EXPORT_MIMETYPES: typing.Final[dict[ExportFormat, str]] = {
+    ExportFormat.CSV: 'text/csv',
+    ExportFormat.NDJSON: 'application/x-ndjson'
+}
+"""MIME types of the supported formats of transfer exports."""
+
+_TransferStatusResponseCache = LruCache[str, bytes]
+
+_terminal_transfer_status_responses: typing.Optional[
+    _TransferStatusResponseCache] = None
+"""In-memory cache of the encoded status responses of transfers with a
+terminal status, keyed by their task IDs."""
+
+_transfer_status_responses: typing.Optional[
+    _TransferStatusResponseCache] = None
+"""In-memory cache of the encoded status responses of transfers with a
+non-terminal status, keyed by their task IDs (entries are removed as
+soon as a change of the transfer is notified)."""
+
 
 class _BidSchema(marshmallow.Schema):
     """Validation schema for a bid within a transfer request.
@@ -73,18 +165,13 @@ class _TransferSchema(marshmallow.Schema):
 
     @marshmallow.validates("source_blockchain_id")
     def __validate_source_blockchain_id(self, blockchain_id: int) -> None:
-        supported_blockchains_ids = [
-            blockchain.value for blockchain in Blockchain
-        ]
-        if blockchain_id not in supported_blockchains_ids:
+        if blockchain_id not in _SUPPORTED_BLOCKCHAIN_IDS:
             raise marshmallow.ValidationError(
                 message='This is not a supported blockchain. '
-                f'Must be one of: {supported_blockchains_ids}.',
+                f'Must be one of: {_SUPPORTED_BLOCKCHAIN_IDS}.',
                 field_name='source_blockchain_id')
-        blockchain_config = get_blockchain_config(Blockchain(blockchain_id))
-        active = blockchain_config['active']
-        registered = blockchain_config['registered']
-        if not active or not registered:
+        if (Blockchain(blockchain_id)
+                not in get_active_registered_blockchains()):
             raise marshmallow.ValidationError(
                 message='This is not an active blockchain.',
                 field_name='source_blockchain_id')
@@ -110,8 +197,7 @@ class _TransferSchema(marshmallow.Schema):
 
     def __check_valid_sender_address(self, source_blockchain: Blockchain,
                                      sender_address: str) -> None:
-        if not get_blockchain_client(source_blockchain).is_valid_address(
-                sender_address):
+        if not _is_valid_address(source_blockchain, sender_address):
             _logger.warning('new transfer request: invalid sender address '
                             f'"{sender_address}"')
             raise marshmallow.ValidationError(
@@ -122,9 +208,8 @@ class _TransferSchema(marshmallow.Schema):
     def __check_valid_recipient_address(self,
                                         destination_blockchain: Blockchain,
                                         recipient_address: str) -> None:
-        if not get_blockchain_client(
-                destination_blockchain).is_valid_recipient_address(
-                    recipient_address):
+        if not _is_valid_address(destination_blockchain, recipient_address,
+                                 recipient=True):
             _logger.warning(
                 'new transfer request: invalid recipient address', extra={
                     'recipient_address': recipient_address,
@@ -138,8 +223,7 @@ class _TransferSchema(marshmallow.Schema):
 
     def __check_valid_source_token_address(self, source_blockchain: Blockchain,
                                            source_token_address: str) -> None:
-        if not get_blockchain_client(source_blockchain).is_valid_address(
-                source_token_address):
+        if not _is_valid_address(source_blockchain, source_token_address):
             _logger.warning('new transfer request: invalid source token '
                             f'address "{source_token_address}"')
             raise marshmallow.ValidationError(
@@ -150,8 +234,8 @@ class _TransferSchema(marshmallow.Schema):
     def __check_valid_destination_token_address(
             self, destination_blockchain: Blockchain,
             destination_token_address: str) -> None:
-        if not get_blockchain_client(destination_blockchain).is_valid_address(
-                destination_token_address):
+        if not _is_valid_address(destination_blockchain,
+                                 destination_token_address):
             _logger.warning('new transfer request: invalid destination token '
                             f'address "{destination_token_address}"')
             raise marshmallow.ValidationError(
@@ -238,6 +322,139 @@ class _BidsSchema(marshmallow.Schema):
             [blockchain.value for blockchain in Blockchain]))
 
 
+class _TransfersSchema(marshmallow.Schema):
+    """Validation schema for the transfers endpoint parameters.
+
+    """
+    sender = marshmallow.fields.String()
+    status = marshmallow.fields.String(validate=marshmallow.validate.OneOf([
+        status.name.lower() for status in TransferStatus
+        if status == status.to_public_status()
+    ]))
+    after = marshmallow.fields.Integer(validate=marshmallow.validate.Range(
+        min=0))
+    limit = marshmallow.fields.Integer(
+        load_default=_DEFAULT_TRANSFERS_LIMIT,
+        validate=marshmallow.validate.Range(min=1, max=_MAX_TRANSFERS_LIMIT))
+
+    @marshmallow.post_load
+    def make_list_transfers_request(
+            self, data: typing.Dict[str, typing.Any],
+            **kwargs) -> TransferInteractor.ListTransfersRequest:
+        status = data.get('status')
+        return TransferInteractor.ListTransfersRequest(
+            data['limit'], data.get('sender'),
+            None if status is None else TransferStatus[status.upper()],
+            data.get('after'))
+
+
+class _TransfersExportSchema(marshmallow.Schema):
+    """Validation schema for the transfers export endpoint parameters.
+
+    """
+    format = marshmallow.fields.String(
+        load_default=ExportFormat.CSV.value,
+        validate=marshmallow.validate.OneOf(
+            [export_format.value for export_format in ExportFormat]))
+    created_from = marshmallow.fields.AwareDateTime(
+        default_timezone=datetime.UTC)
+    created_until = marshmallow.fields.AwareDateTime(
+        default_timezone=datetime.UTC)
+    source_blockchain = marshmallow.fields.Integer(
+        validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+    destination_blockchain = marshmallow.fields.Integer(
+        validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+
+    @marshmallow.post_load
+    def make_export_transfers_request(
+            self, data: typing.Dict[str, typing.Any],
+            **kwargs) -> ExportInteractor.ExportTransfersRequest:
+        source_blockchain = data.get('source_blockchain')
+        destination_blockchain = data.get('destination_blockchain')
+        return ExportInteractor.ExportTransfersRequest(
+            ExportFormat(data['format']), data.get('created_from'),
+            data.get('created_until'), None if source_blockchain is None else
+            Blockchain(source_blockchain), None if destination_blockchain
+            is None else Blockchain(destination_blockchain))
+
+
+class _StatsSchema(marshmallow.Schema):
+    """Validation schema for the stats endpoint parameters.
+
+    """
+    hour_from = marshmallow.fields.AwareDateTime(default_timezone=datetime.UTC)
+    hour_until = marshmallow.fields.AwareDateTime(
+        default_timezone=datetime.UTC)
+    source_blockchain = marshmallow.fields.Integer(
+        validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+    destination_blockchain = marshmallow.fields.Integer(
+        validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+
+    @marshmallow.post_load
+    def make_find_transfer_statistics_request(
+            self, data: typing.Dict[str, typing.Any],
+            **kwargs) -> StatisticsInteractor.FindTransferStatisticsRequest:
+        source_blockchain = data.get('source_blockchain')
+        destination_blockchain = data.get('destination_blockchain')
+        return StatisticsInteractor.FindTransferStatisticsRequest(
+            data.get('hour_from'), data.get('hour_until'), None
+            if source_blockchain is None else Blockchain(source_blockchain),
+            None if destination_blockchain is None else
+            Blockchain(destination_blockchain))
+
+
+class _TransferStatisticsSchema(marshmallow.Schema):
+    """Validation schema for the statistics of the transfers of a token
+    from a source to a destination blockchain accepted within an hour
+    and currently having the same status.
+
+    """
+    hour = marshmallow.fields.AwareDateTime(required=True)
+    source_blockchain_id = marshmallow.fields.Integer(
+        required=True, validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+    destination_blockchain_id = marshmallow.fields.Integer(
+        required=True, validate=marshmallow.validate.OneOf(
+            [blockchain.value for blockchain in Blockchain]))
+    source_token_address = marshmallow.fields.String(required=True)
+    status = marshmallow.fields.String(required=True)
+    transfer_count = marshmallow.fields.Integer(required=True)
+    amount = marshmallow.fields.Integer(required=True)
+    fee = marshmallow.fields.Integer(required=True)
+
+
+class _StatsResponseSchema(marshmallow.Schema):
+    """Validation schema for the stats response.
+
+    """
+    statistics = marshmallow.fields.List(
+        marshmallow.fields.Nested(_TransferStatisticsSchema), required=True)
+
+
+class _TransfersResponseSchema(marshmallow.Schema):
+    """Validation schema for the transfers response.
+
+    """
+    transfers = marshmallow.fields.List(
+        marshmallow.fields.Nested(_TransferStatusResponseSchema),
+        required=True)
+    next = marshmallow.fields.Integer(required=True, allow_none=True)
+
+
+# The schemas are stateless and therefore instantiated only once
+_transfer_schema = _TransferSchema()
+_transfer_response_schema = _TransferResponseSchema()
+_transfer_status_schema = _TransferStatusSchema()
+_transfers_schema = _TransfersSchema()
+_transfers_export_schema = _TransfersExportSchema()
+_bids_schema = _BidsSchema()
+_stats_schema = _StatsSchema()
+
+
 class _Transfer(flask_restful.Resource):
     """RESTful resource for token transfer requests.
 
@@ -248,6 +465,15 @@ class _Transfer(flask_restful.Resource):
         ---
         tags:
           - Transfer
+        parameters:
+          - in: header
+            name: Idempotency-Key
+            schema:
+              type: string
+              maxLength: 255
+            required: false
+            description: Client-chosen key; replays of a request with the
+             same key return the originally assigned task ID
         requestBody:
           description: Transfer request
           required: true
@@ -272,27 +498,69 @@ class _Transfer(flask_restful.Resource):
                       type: string
                     example: {message': 'bid has been rejected by service \
 node: bid not accepted'}
+            400:
+              description: Invalid idempotency key
             409:
-              description: Sender nonce from transfer request is not unique
+              description: Sender nonce from transfer request is not unique,
+               or idempotency key already used for a different request
               content:
                 application/json:
                   schema:
                     type: string
                     example: {'message': 'sender nonce 1337 is not unique'}
+            429:
+              description: Rate limit exceeded, retry after the number of
+               seconds given in the Retry-After header
             500:
               description: Internal server error
+            503:
+              description: Too many pending transfers on the source
+               blockchain, retry after the number of seconds given in the
+               Retry-After header
         """
+        # The client's IP address is rate limited before any validation
+        # of the request (the sender address is rate limited only after
+        # the sender's signature has been validated)
+        _check_rate_limits('transfer')
+        idempotency_key = flask_restful.request.headers.get(
+            _IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is not None and not (0 < len(idempotency_key) <=
+                                                _MAX_IDEMPOTENCY_KEY_LENGTH):
+            _logger.warning('new transfer request: invalid idempotency key')
+            bad_request(f'{_IDEMPOTENCY_KEY_HEADER} header must have 1 to '
+                        f'{_MAX_IDEMPOTENCY_KEY_LENGTH} characters')
         try:
             time_received = time.time()
             arguments = flask_restful.request.json
-            initiate_transfer_request = _TransferSchema().load(
+            if idempotency_key is not None:
+                # Replayed requests are answered without being validated
+                # again
+                request_hash = _hash_transfer_request(arguments)
+                task_id = TransferInteractor().find_idempotent_transfer(
+                    idempotency_key, request_hash)
+                if task_id is not None:
+                    _logger.info(
+                        'replayed transfer request', extra={
+                            'idempotency_key': idempotency_key,
+                            'task_id': task_id
+                        })
+                    return ok_response(
+                        _transfer_response_schema.dump({'task_id': task_id}))
+            initiate_transfer_request = _transfer_schema.load(
                 arguments | {'time_received': time_received})
             _logger.info('new transfer request', extra=arguments)
             task_id = TransferInteractor().initiate_transfer(
                 initiate_transfer_request)
-            response = _TransferResponseSchema().dump({'task_id': task_id})
+            if idempotency_key is not None:
+                TransferInteractor().store_idempotent_transfer(
+                    idempotency_key, request_hash, task_id)
+            response = _transfer_response_schema.dump({'task_id': task_id})
         except marshmallow.ValidationError as error:
             not_acceptable(error.messages)
+        except TransferInteractorIdempotencyKeyConflictError as error:
+            _logger.warning(f'new transfer request: {error}')
+            conflict(f'{_IDEMPOTENCY_KEY_HEADER} has already been used for a '
+                     'different transfer request')
         except SenderNonceNotUniqueError as error:
             _logger.warning(f'new transfer request: {error}')
             conflict('sender nonce '
@@ -300,6 +568,19 @@ node: bid not accepted'}
         except TransferInteractorBidNotAcceptedError as error:
             _logger.warning(f'bid has been rejected by service node: {error}')
             not_acceptable(f'bid has been rejected by service node: {error}')
+        except TransferInteractorInvalidSignatureError as error:
+            _logger.warning(f'new transfer request: {error}')
+            not_acceptable('sender signature is invalid')
+        except RateLimitInteractorLimitExceededError as error:
+            _logger.warning(f'new transfer request: {error}')
+            _too_many_requests('rate limit exceeded',
+                               error.details['retry_after'])
+        except TransferInteractorOverloadedError as error:
+            _logger.warning(f'new transfer request: {error}')
+            _service_unavailable(
+                'service node has too many pending transfers on '
+                f'{initiate_transfer_request.source_blockchain.name}',
+                error.details['retry_after'])
         except Exception:
             _logger.critical('unable to process a transfer request',
                              exc_info=True)
@@ -339,14 +620,25 @@ class _TransferStatus(flask_restful.Resource):
                 schema:
                   type: string
                   example: {"message": "task ID 123 is unknown"}
+          429:
+            description: 'rate limit exceeded'
           500:
             description: 'internal server error'
         """
+        _check_rate_limits('transfer_status')
         try:
-            task_id_uuid = _TransferStatusSchema().load({'task_id': task_id})
+            task_id_uuid = _transfer_status_schema.load({'task_id': task_id})
             _logger.info(f'new transfer status request: {task_id}')
-            find_transfer_response = TransferInteractor().find_transfer(
-                task_id_uuid)
+            cache_key = str(task_id_uuid)
+            terminal_response_cache, response_cache = \
+                _get_transfer_status_response_caches()
+            response_body = terminal_response_cache.get(cache_key)
+            is_terminal = response_body is not None
+            if response_body is None and response_cache is not None:
+                response_body = response_cache.get(cache_key)
+            if response_body is None:
+                find_transfer_response = TransferInteractor().find_transfer(
+                    task_id_uuid)
         except marshmallow.ValidationError:
             _logger.warning('new transfer status request: task ID '
                             f'"{task_id}" is not a UUID')
@@ -360,27 +652,207 @@ class _TransferStatus(flask_restful.Resource):
                              exc_info=True)
             internal_server_error()
 
-        response = _TransferStatusResponseSchema().dump({
-            'task_id': str(task_id_uuid),
-            'source_blockchain_id': find_transfer_response.source_blockchain.
-            value,
-            'destination_blockchain_id': find_transfer_response.
-            destination_blockchain.value,
-            'sender_address': find_transfer_response.sender_address,
-            'recipient_address': find_transfer_response.recipient_address,
-            'source_token_address': find_transfer_response.
-            source_token_address,
-            'destination_token_address': find_transfer_response.
-            destination_token_address,
-            'amount': find_transfer_response.amount,
-            'fee': find_transfer_response.fee,
-            'status': find_transfer_response.status.to_public_status().name.
-            lower(),
-            'transfer_id': find_transfer_response.transfer_id,
-            'transaction_id': '' if find_transfer_response.transaction_id
-            is None else find_transfer_response.transaction_id
-        })
-        return ok_response(response)
+        if response_body is None:
+            public_status = find_transfer_response.status.to_public_status()
+            response_body = _encode_json(
+                _create_transfer_status_data(cache_key,
+                                             find_transfer_response))
+            is_terminal = public_status in _TERMINAL_TRANSFER_STATUSES
+            if is_terminal:
+                terminal_response_cache.set(cache_key, response_body)
+            elif response_cache is not None:
+                response_cache.set(cache_key, response_body)
+        response = _json_response(response_body)
+        if is_terminal:
+            # The status response of a transfer never changes once the
+            # transfer has reached a terminal status
+            response.headers['Cache-Control'] = _TERMINAL_CACHE_CONTROL
+        return response
+
+
+class _Transfers(flask_restful.Resource):
+    """RESTful resource for listing token transfers.
+
+    """
+    def get(self) -> flask.Response:
+        """
+        Endpoint that returns a page of transfers, optionally filtered by
+        sender address and status.
+        ---
+        tags:
+          - Transfers
+        parameters:
+          - in: query
+            name: sender
+            schema:
+              $ref: '#/components/schemas/_Transfers/properties/sender'
+            required: false
+            description: Address of the sender on the source blockchain
+          - in: query
+            name: status
+            schema:
+              $ref: '#/components/schemas/_Transfers/properties/status'
+            required: false
+            description: Public status of the transfers
+          - in: query
+            name: after
+            schema:
+              $ref: '#/components/schemas/_Transfers/properties/after'
+            required: false
+            description: Cursor returned as "next" for the previous page
+          - in: query
+            name: limit
+            schema:
+              $ref: '#/components/schemas/_Transfers/properties/limit'
+            required: false
+            description: Maximum number of transfers of the page
+        responses:
+          200:
+            description: Page of transfers ordered by their acceptance by
+             the service node
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/_TransfersResponse'
+          400:
+            description: 'bad request'
+            content:
+              application/json:
+                schema:
+                  type: string
+                  example: {"message": {"limit": \
+                    ["Must be greater than or equal to 1 and less than \
+or equal to 100."]}}
+          429:
+            description: 'rate limit exceeded'
+          500:
+            description: 'internal server error'
+        """
+        _check_rate_limits('transfers')
+        try:
+            query_arguments = flask_restful.request.args
+            list_transfers_request = _transfers_schema.load(query_arguments)
+            _logger.info('new transfers request', extra=query_arguments)
+            list_transfers_response = TransferInteractor().list_transfers(
+                list_transfers_request)
+        except marshmallow.ValidationError as error:
+            _logger.warning(f'new transfers request: {error.messages}')
+            bad_request(error.messages)
+        except Exception:
+            _logger.critical('unable to process a transfers request',
+                             exc_info=True)
+            internal_server_error()
+
+        return _json_response(
+            _encode_json({
+                'transfers': [
+                    _create_transfer_status_data(str(listed_transfer.task_id),
+                                                 listed_transfer.transfer)
+                    for listed_transfer in list_transfers_response.transfers
+                ],
+                'next': list_transfers_response.next_after
+            }))
+
+
+class _TransfersExport(flask_restful.Resource):
+    """RESTful resource for exporting token transfers.
+
+    """
+    def get(self) -> flask.Response:
+        """
+        Endpoint that streams all (including archived) token transfers,
+        optionally filtered by their acceptance time and blockchains,
+        as CSV or newline-delimited JSON. Large exports should be made
+        with the export command (python -m pantos.servicenode.export),
+        since a sync web server worker is killed if the export takes
+        longer than the worker timeout. The endpoint is only available
+        if enabled in the configuration.
+        ---
+        tags:
+          - Transfers
+        parameters:
+          - in: query
+            name: format
+            schema:
+              $ref: '#/components/schemas/_TransfersExport/properties/format'
+            required: false
+            description: Format of the export (CSV by default)
+          - in: query
+            name: created_from
+            schema:
+              $ref: \
+                '#/components/schemas/_TransfersExport/properties/created_from'
+            required: false
+            description: ISO 8601 timestamp (inclusive, UTC if no offset)
+          - in: query
+            name: created_until
+            schema:
+              $ref: \
+                '#/components/schemas/_TransfersExport/properties/created_until'
+            required: false
+            description: ISO 8601 timestamp (exclusive, UTC if no offset)
+          - in: query
+            name: source_blockchain
+            schema:
+              $ref: \
+                '#/components/schemas/_TransfersExport/properties/source_blockchain'
+            required: false
+            description: Numeric ID of the source blockchain
+          - in: query
+            name: destination_blockchain
+            schema:
+              $ref: \
+                '#/components/schemas/_TransfersExport/properties/destination_blockchain'
+            required: false
+            description: Numeric ID of the destination blockchain
+        responses:
+          200:
+            description: Token transfers ordered by their acceptance by the
+             service node (archived ones first)
+            content:
+              text/csv:
+                schema:
+                  type: string
+              application/x-ndjson:
+                schema:
+                  type: string
+          400:
+            description: 'bad request'
+          404:
+            description: 'transfers export disabled'
+          429:
+            description: 'rate limit exceeded'
+          500:
+            description: 'internal server error'
+        """
+        if not config['application']['transfers_export_enabled']:
+            resource_not_found('transfers export is disabled')
+        _check_rate_limits('transfers_export')
+        try:
+            query_arguments = flask_restful.request.args
+            export_transfers_request = _transfers_export_schema.load(
+                query_arguments)
+            _logger.info('new transfers export request', extra=query_arguments)
+            chunks = ExportInteractor().export_transfers(
+                export_transfers_request)
+            # The first chunk is generated before responding so that
+            # errors of the database query are still reported as such
+            first_chunk = next(chunks, '')
+        except marshmallow.ValidationError as error:
+            _logger.warning(f'new transfers export request: {error.messages}')
+            bad_request(error.messages)
+        except Exception:
+            _logger.critical('unable to process a transfers export request',
+                             exc_info=True)
+            internal_server_error()
+
+        export_format = export_transfers_request.export_format
+        response = flask.Response(itertools.chain([first_chunk],
+                                                  chunks), status=200,
+                                  mimetype=_EXPORT_MIMETYPES[export_format])
+        response.headers['Content-Disposition'] = \
+            f'attachment; filename=transfers.{export_format.value}'
+        return response
 
 
 class _Bids(flask_restful.Resource):
@@ -426,12 +898,15 @@ destination blockchain
                     ["Missing data for required field."], \
                     "destination_blockchain": \
                     ["Missing data for required field."]}}
+          429:
+            description: 'rate limit exceeded'
           500:
             description: 'internal server error'
         """
+        _check_rate_limits('bids')
         try:
             query_arguments = flask_restful.request.args
-            bids_parameter = _BidsSchema().load(query_arguments)
+            bids_parameter = _bids_schema.load(query_arguments)
             _logger.info('new bids request', extra=bids_parameter)
             bids = BidInteractor().get_current_bids(
                 bids_parameter['source_blockchain'],
@@ -443,7 +918,322 @@ destination blockchain
             _logger.critical('unable to process a bids request', exc_info=True)
             internal_server_error()
 
-        return ok_response(bids)
+        return _json_response(_encode_json(bids))
+
+
+class _Stats(flask_restful.Resource):
+    """RESTful resource for the pre-aggregated transfer statistics.
+
+    """
+    def get(self) -> flask.Response:
+        """
+        Endpoint that returns the number, the total amount, and the total
+        fee of all (including archived) transfers per hour of their
+        acceptance, source and destination blockchain, source token, and
+        status. The statistics are updated periodically by the Celery
+        workers.
+        ---
+        tags:
+          - Transfers
+        parameters:
+          - in: query
+            name: hour_from
+            schema:
+              $ref: '#/components/schemas/_Stats/properties/hour_from'
+            required: false
+            description: ISO 8601 timestamp (inclusive, UTC if no offset)
+          - in: query
+            name: hour_until
+            schema:
+              $ref: '#/components/schemas/_Stats/properties/hour_until'
+            required: false
+            description: ISO 8601 timestamp (exclusive, UTC if no offset)
+          - in: query
+            name: source_blockchain
+            schema:
+              $ref: '#/components/schemas/_Stats/properties/source_blockchain'
+            required: false
+            description: Numeric ID of the source blockchain
+          - in: query
+            name: destination_blockchain
+            schema:
+              $ref: \
+                '#/components/schemas/_Stats/properties/destination_blockchain'
+            required: false
+            description: Numeric ID of the destination blockchain
+        responses:
+          200:
+            description: Non-empty transfer statistics ordered by their hour
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/_StatsResponse'
+          400:
+            description: 'bad request'
+          429:
+            description: 'rate limit exceeded'
+          500:
+            description: 'internal server error'
+        """
+        _check_rate_limits('stats')
+        try:
+            query_arguments = flask_restful.request.args
+            find_transfer_statistics_request = _stats_schema.load(
+                query_arguments)
+            _logger.info('new stats request', extra=query_arguments)
+            transfer_statistics = \
+                StatisticsInteractor().find_transfer_statistics(
+                    find_transfer_statistics_request)
+        except marshmallow.ValidationError as error:
+            _logger.warning(f'new stats request: {error.messages}')
+            bad_request(error.messages)
+        except Exception:
+            _logger.critical('unable to process a stats request',
+                             exc_info=True)
+            internal_server_error()
+
+        return _json_response(
+            _encode_json({
+                'statistics': [{
+                    'hour': statistics.hour.isoformat(),
+                    'source_blockchain_id': statistics.source_blockchain.value,
+                    'destination_blockchain_id': statistics.
+                    destination_blockchain.value,
+                    'source_token_address': statistics.source_token_address,
+                    'status': statistics.status.name.lower(),
+                    'transfer_count': statistics.transfer_count,
+                    'amount': statistics.amount,
+                    'fee': statistics.fee
+                } for statistics in transfer_statistics]
+            }))
+
+
+class _Metrics(flask_restful.Resource):
+    """RESTful resource for the metrics of the serving process (in the
+    Prometheus text format).
+
+    """
+    def get(self) -> flask.Response:
+        """
+        Endpoint that returns the metrics of the database connection
+        pools of the web server process that serves the request.
+        ---
+        tags:
+          - Metrics
+        responses:
+          200:
+            description: Metrics in the Prometheus text exposition format
+            content:
+              text/plain:
+                schema:
+                  type: string
+          500:
+            description: 'internal server error'
+        """
+        try:
+            body = _format_pool_metrics()
+        except Exception:
+            _logger.critical('unable to process a metrics request',
+                             exc_info=True)
+            internal_server_error()
+        return flask.Response(body, status=200,
+                              mimetype=_PROMETHEUS_TEXT_MIMETYPE)
+
+
+def _check_rate_limits(endpoint: str) -> None:
+    """Consume a token from the rate limit bucket of the requesting
+    client's IP address for an endpoint.
+
+    Parameters
+    ----------
+    endpoint : str
+        The name of the endpoint in the rate limits configuration.
+
+    Raises
+    ------
+    HTTPException
+        HTTP exception raised with the code 429 if the client has
+        exceeded its rate limit.
+
+    """
+    client_keys = [f'ip:{flask.request.remote_addr}']
+    try:
+        RateLimitInteractor().consume_tokens(endpoint, client_keys)
+    except RateLimitInteractorLimitExceededError as error:
+        _logger.warning(f'{endpoint} request: {error}')
+        _too_many_requests('rate limit exceeded', error.details['retry_after'])
+
+
+def _too_many_requests(error_message: str, retry_after: int):
+    """Raise an HTTPException if a client has sent too many requests.
+
+    Parameters
+    ----------
+    error_message : str
+        The error message.
+    retry_after : int
+        The number of seconds after which the request can be retried.
+
+    Raises
+    ------
+    HTTPException
+        HTTP exception raised with the code 429.
+
+    """
+    response = flask.make_response({'message': error_message}, 429)
+    response.headers['Retry-After'] = str(retry_after)
+    flask.abort(response)
+
+
+def _service_unavailable(error_message: str, retry_after: int):
+    """Raise an HTTPException if the service node is temporarily unable
+    to handle a request.
+
+    Parameters
+    ----------
+    error_message : str
+        The error message.
+    retry_after : int
+        The number of seconds after which the request can be retried.
+
+    Raises
+    ------
+    HTTPException
+        HTTP exception raised with the code 503.
+
+    """
+    response = flask.make_response({'message': error_message}, 503)
+    response.headers['Retry-After'] = str(retry_after)
+    flask.abort(response)
+
+
+def _is_valid_address(blockchain: Blockchain, address: str,
+                      recipient: bool = False) -> bool:
+    # Only valid addresses are cached so that invalid requests cannot
+    # evict them
+    cache_key = (blockchain, address, recipient)
+    if _valid_addresses.get(cache_key) is not None:
+        return True
+    blockchain_client = get_blockchain_client(blockchain)
+    is_valid = (blockchain_client.is_valid_recipient_address(address)
+                if recipient else blockchain_client.is_valid_address(address))
+    if is_valid:
+        _valid_addresses.set(cache_key, True)
+    return is_valid
+
+
+def _get_transfer_status_response_caches(
+) -> tuple[_TransferStatusResponseCache,
+           typing.Optional[_TransferStatusResponseCache]]:
+    global _terminal_transfer_status_responses
+    global _transfer_status_responses
+    if _terminal_transfer_status_responses is None:
+        cache_size = config['application']['transfer_status_cache_size']
+        _terminal_transfer_status_responses = LruCache(cache_size)
+        time_to_live = config['application'][
+            'transfer_status_cache_time_to_live']
+        if time_to_live > 0:
+            _transfer_status_responses = LruCache(cache_size,
+                                                  time_to_live=time_to_live)
+            subscribe_to_transfer_notifications(
+                _remove_transfer_status_response)
+    return _terminal_transfer_status_responses, _transfer_status_responses
+
+
+def _remove_transfer_status_response(task_id: uuid.UUID,
+                                     status: TransferStatus) -> None:
+    # Called from the transfer notification listener thread
+    if _transfer_status_responses is not None:
+        _transfer_status_responses.remove(str(task_id))
+
+
+def _create_transfer_status_data(
+    task_id: str,
+    find_transfer_response: TransferInteractor.FindTransferResponse
+) -> dict[str, typing.Any]:
+    # The data is built from trusted internal data and therefore shaped
+    # like _TransferStatusResponseSchema without a marshmallow dump
+    return {
+        'task_id': task_id,
+        'source_blockchain_id': find_transfer_response.source_blockchain.value,
+        'destination_blockchain_id': find_transfer_response.
+        destination_blockchain.value,
+        'sender_address': find_transfer_response.sender_address,
+        'recipient_address': find_transfer_response.recipient_address,
+        'source_token_address': find_transfer_response.source_token_address,
+        'destination_token_address': find_transfer_response.
+        destination_token_address,
+        'amount': find_transfer_response.amount,
+        'fee': find_transfer_response.fee,
+        'status': find_transfer_response.status.to_public_status().name.lower(
+        ),
+        'transfer_id': find_transfer_response.transfer_id,
+        'transaction_id': '' if find_transfer_response.transaction_id is None
+        else find_transfer_response.transaction_id
+    }
+
+
+def _format_pool_metrics() -> str:
+    # Each web server process has its own connection pools, so the
+    # samples are labeled with the process ID
+    base_labels = (f'role="{get_process_role().value}",'
+                   f'pid="{os.getpid()}"')
+    lines: list[str] = []
+
+    def add_metric(name: str, type_: str, description: str,
+                   samples: list[tuple[str, str, float]]) -> None:
+        full_name = f'{_POOL_METRICS_PREFIX}_{name}'
+        lines.append(f'# HELP {full_name} {description}')
+        lines.append(f'# TYPE {full_name} {type_}')
+        for suffix, labels, value in samples:
+            lines.append(f'{full_name}{suffix}{{{labels}}} {value}')
+
+    pool_metrics = [(f'{base_labels},engine="{engine_name}"', metrics)
+                    for engine_name, metrics in get_pool_metrics().items()]
+    add_metric('connections_checked_out', 'gauge',
+               'Number of currently checked out connections.',
+               [('', labels, metrics.checked_out)
+                for labels, metrics in pool_metrics])
+    add_metric('connections_max', 'gauge',
+               'Maximum number of connections (pool size plus overflow).',
+               [('', labels, metrics.pool_size + metrics.max_overflow)
+                for labels, metrics in pool_metrics])
+    add_metric('saturation', 'gauge',
+               'Ratio of checked out connections to maximum connections.',
+               [('', labels, metrics.saturation)
+                for labels, metrics in pool_metrics])
+    add_metric('checkout_timeouts_total', 'counter',
+               'Number of connection checkouts that have timed out.',
+               [('', labels, metrics.checkout_timeouts)
+                for labels, metrics in pool_metrics])
+    wait_time_samples: list[tuple[str, str, float]] = []
+    for labels, metrics in pool_metrics:
+        for upper_bound, count in zip(CHECKOUT_WAIT_TIME_BUCKETS,
+                                      metrics.checkout_wait_time_buckets):
+            wait_time_samples.append(
+                ('_bucket', f'{labels},le="{upper_bound}"', count))
+        wait_time_samples.append(
+            ('_bucket', f'{labels},le="+Inf"', metrics.checkouts))
+        wait_time_samples.append(('_sum', labels, metrics.checkout_wait_time))
+        wait_time_samples.append(('_count', labels, metrics.checkouts))
+    add_metric('checkout_wait_seconds', 'histogram',
+               'Time spent waiting for a connection checkout.',
+               wait_time_samples)
+    return '\n'.join(lines) + '\n'
+
+
+def _encode_json(data: typing.Any) -> bytes:
+    return _json_encoder.encode(data).encode()
+
+
+def _json_response(body: bytes) -> flask.Response:
+    return flask.Response(body, status=200, mimetype='application/json')
+
+
+def _hash_transfer_request(arguments: typing.Any) -> str:
+    serialized_arguments = json.dumps(arguments, sort_keys=True,
+                                      separators=(',', ':'))
+    return hashlib.sha256(serialized_arguments.encode()).hexdigest()
 
 
 # Register the RESTful resources
@@ -451,4 +1241,8 @@ _restful_api = flask_restful.Api(flask_app)
 _restful_api.add_resource(Live, '/health/live')
 _restful_api.add_resource(_Transfer, '/transfer')
 _restful_api.add_resource(_TransferStatus, '/transfer/<string:task_id>/status')
+_restful_api.add_resource(_Transfers, '/transfers')
+_restful_api.add_resource(_TransfersExport, '/transfers/export')
 _restful_api.add_resource(_Bids, '/bids')
+_restful_api.add_resource(_Stats, '/stats')
+_restful_api.add_resource(_Metrics, '/metrics')
@@ -33,6 +33,11 @@ _PAN_TOKEN_CONTRACT_ADDRESS = 'pan_token_contract_address'
 
 _HUB_CONTRACT_ADDRESS = 'hub_contract_address'
 
+_HUB_CONTRACT_VALID_ADDRESS = '0x5e447968d4a177fE7bFB8877cA12aE20Bd60dD85'
+
+_FORWARDER_CONTRACT_VALID_ADDRESS = \
+    '0xce5FE7168424ED2246a3dd79214f2D69a7Edc0BB'
+
 _KEYSTORE_PATH = '/some/file/path'
 
 _KEYSTORE_PASSWORD = 'some_password'
@@ -68,6 +73,23 @@ _TRANSFER_VALID_UNTIL = 111
 
 _TRANSFER_SIGNATURE = 'signature'
 
+# Known-good signatures of the transfer messages verified by the Pantos
+# Forwarder contract (abi.encodePacked of the transfer data followed by
+# the service node, Pantos Hub, Pantos Forwarder, and PAN token
+# addresses, signed as an Ethereum signed message). They have been
+# computed independently of the client code by hand-encoding the packed
+# bytes and signing their digest with the signer's private key
+# 59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d.
+_TRANSFER_SIGNER_ADDRESS = '0x70997970C51812dc3A010C7d01b50e0d17dc79C8'
+_TRANSFER_SIGNATURES = {
+    Blockchain.ETHEREUM: (
+        '0xead656aa3c2ad2500a4032673733c6c0d1cc93fb33a346d9a4a325cf8fcdb327'
+        '088c2f249fb92e9629a9213f699b4e8e2c77c78369214f77a1974aa33821766c1b'),
+    Blockchain.BNB_CHAIN: (
+        '0x638776814475e3f5c31ccb54bc64c51908a0c736a6e40b3a7438634571f9de78'
+        '0fa8f9182cb09d2aaa4f0a3fe0e894c2051837bed9c6c6c0a3151eac466bc0f51c')
+}
+
 _TRANSFER_DESTIONATION_TOKEN_ADDRESS = 'destination_token'
 
 _TOKEN_ADDRESS = '0xa6fd6EB118BBdf6c4B31866542972d3D589b24C6'
@@ -873,3 +895,58 @@ def test_get_validator_fee_factor_error(ethereum_client,
 
     with pytest.raises(EthereumClientError):
         ethereum_client.get_validator_fee_factor(Blockchain.ETHEREUM)
+
+
+@pytest.mark.parametrize('destination_blockchain',
+                         [Blockchain.ETHEREUM, Blockchain.BNB_CHAIN])
+@pytest.mark.parametrize('signed_by_sender', [True, False])
+def test_is_valid_transfer_signature_correct(destination_blockchain,
+                                             signed_by_sender, ethereum_client,
+                                             mock_get_blockchain_config):
+    mock_get_blockchain_config.return_value = {
+        'hub': _HUB_CONTRACT_VALID_ADDRESS,
+        'forwarder': _FORWARDER_CONTRACT_VALID_ADDRESS,
+        'pan_token': _TOKEN_ADDRESS
+    }
+    sender_address = (_TRANSFER_SIGNER_ADDRESS
+                      if signed_by_sender else _WITHDRAWAL_ADDRESS)
+    signature = _TRANSFER_SIGNATURES[destination_blockchain]
+    request = BlockchainClient.TransferSignatureVerificationRequest(
+        destination_blockchain, sender_address, _EXTERNAL_TOKEN_ADDRESS,
+        _TOKEN_ADDRESS, _EXTERNAL_TOKEN_ADDRESS, _TRANSFER_AMOUNT,
+        _TRANSFER_FEE, _TRANSFER_NONCE, _TRANSFER_VALID_UNTIL, signature)
+
+    assert ethereum_client.is_valid_transfer_signature(
+        request) is signed_by_sender
+
+
+def test_is_valid_transfer_signature_malformed_signature(
+        ethereum_client, mock_get_blockchain_config, web3_account):
+    mock_get_blockchain_config.return_value = {
+        'hub': _HUB_CONTRACT_VALID_ADDRESS,
+        'forwarder': _FORWARDER_CONTRACT_VALID_ADDRESS,
+        'pan_token': _TOKEN_ADDRESS
+    }
+    request = BlockchainClient.TransferSignatureVerificationRequest(
+        Blockchain.ETHEREUM, web3_account.address, _EXTERNAL_TOKEN_ADDRESS,
+        _TOKEN_ADDRESS, _TOKEN_ADDRESS, _TRANSFER_AMOUNT, _TRANSFER_FEE,
+        _TRANSFER_NONCE, _TRANSFER_VALID_UNTIL, _TRANSFER_SIGNATURE)
+
+    assert not ethereum_client.is_valid_transfer_signature(request)
+
+
+def test_is_valid_transfer_signature_error(ethereum_client,
+                                           mock_get_blockchain_config,
+                                           web3_account):
+    mock_get_blockchain_config.return_value = {
+        'hub': _HUB_CONTRACT_ADDRESS,
+        'forwarder': _FORWARDER_CONTRACT_VALID_ADDRESS,
+        'pan_token': _TOKEN_ADDRESS
+    }
+    request = BlockchainClient.TransferSignatureVerificationRequest(
+        Blockchain.ETHEREUM, web3_account.address, _EXTERNAL_TOKEN_ADDRESS,
+        _TOKEN_ADDRESS, _TOKEN_ADDRESS, _TRANSFER_AMOUNT, _TRANSFER_FEE,
+        _TRANSFER_NONCE, _TRANSFER_VALID_UNTIL, _TRANSFER_SIGNATURE)
+
+    with pytest.raises(EthereumClientError):
+        ethereum_client.is_valid_transfer_signature(request)
@@ -7,19 +7,44 @@ from pantos.servicenode.business import bids as bids_module
 from pantos.servicenode.business.bids import BidInteractor
 from pantos.servicenode.business.bids import BidInteractorError
 
+_BIDS_VERSION = 5
+
 
 @dataclasses.dataclass
 class Bid:
+    source_blockchain_id: int
+    destination_blockchain_id: int
     execution_time: int
     valid_until: int
     fee: int
 
 
 class MockDatabaseAccess:
+    def __init__(self):
+        self.read_bids_snapshot_calls = 0
+
     def read_bids(self, source_blockchain_id, destination_blockchain_id):
         assert isinstance(source_blockchain_id, int)
         assert isinstance(destination_blockchain_id, int)
-        return [Bid(0, 0, 0), Bid(1, 1, 1)]
+        return [
+            Bid(source_blockchain_id, destination_blockchain_id, 0, 0, 0),
+            Bid(source_blockchain_id, destination_blockchain_id, 1, 1, 1)
+        ]
+
+    def read_bids_snapshot(self):
+        self.read_bids_snapshot_calls += 1
+        return _BIDS_VERSION, [
+            Bid(0, 1, 0, 0, 0),
+            Bid(0, 1, 1, 1, 1),
+            Bid(1, 0, 2, 2, 2)
+        ]
+
+    def read_bids_version(self):
+        return _BIDS_VERSION
+
+
+class _StopRefresher(BaseException):
+    pass
 
 
 @pytest.fixture(scope='module')
@@ -45,6 +70,15 @@ def mock_get_signer_config(monkeypatch):
 def mock_database_access(monkeypatch):
     mock_database_access = MockDatabaseAccess()
     monkeypatch.setattr(bids_module, 'database_access', mock_database_access)
+    return mock_database_access
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    config = {'application': {'bids_snapshot_refresh_interval': 0}}
+    monkeypatch.setattr(bids_module, 'config', config)
+    monkeypatch.setattr(bids_module, '_bids_snapshot', None)
+    return config
 
 
 @unittest.mock.patch('pantos.servicenode.business.bids.get_signer')
@@ -70,3 +104,58 @@ def test_get_current_bids_correct(mocked_get_signer, bid_interactor):
 def test_get_current_bids_error(mocked_db_read, bid_interactor):
     with pytest.raises(BidInteractorError):
         bid_interactor.get_current_bids(0, 1)
+
+
+@unittest.mock.patch('pantos.servicenode.business.bids.threading.Thread')
+@unittest.mock.patch('pantos.servicenode.business.bids.get_signer')
+def test_get_current_bids_snapshot_correct(mocked_get_signer, mocked_thread,
+                                           mock_config, mock_database_access,
+                                           bid_interactor):
+    mock_config['application']['bids_snapshot_refresh_interval'] = 60
+    mocked_get_signer.return_value.sign_message.return_value = 'sig'
+
+    bids = bid_interactor.get_current_bids(0, 1)
+    no_bids = bid_interactor.get_current_bids(1, 2)
+    bids_again = bid_interactor.get_current_bids(0, 1)
+
+    assert [bid['fee'] for bid in bids] == [0, 1]
+    assert all(bid['signature'] == 'sig' for bid in bids)
+    assert no_bids == []
+    assert bids_again == bids
+    assert mock_database_access.read_bids_snapshot_calls == 1
+    mocked_thread.assert_called_once()
+    mocked_thread.return_value.start.assert_called_once()
+
+
+@pytest.mark.parametrize('version_changed', [True, False])
+@unittest.mock.patch('pantos.servicenode.business.bids.get_signer')
+def test_refresh_bids_snapshot_correct(mocked_get_signer, version_changed,
+                                       mock_database_access):
+    bids_module._refresh_bids_snapshot()
+    old_snapshot = bids_module._bids_snapshot
+    if version_changed:
+        mock_database_access.read_bids_version = lambda: _BIDS_VERSION + 1
+
+    bids_module._refresh_bids_snapshot()
+
+    assert (bids_module._bids_snapshot is not old_snapshot) == version_changed
+    assert mock_database_access.read_bids_snapshot_calls == (
+        2 if version_changed else 1)
+
+
+@unittest.mock.patch('pantos.servicenode.business.bids.time.sleep')
+@unittest.mock.patch('pantos.servicenode.business.bids._refresh_bids_snapshot',
+                     side_effect=[None, Exception, _StopRefresher])
+@unittest.mock.patch('pantos.servicenode.business.bids.NotificationListener')
+def test_refresh_bids_snapshot_continuously_correct(
+        mocked_listener, mocked_refresh_bids_snapshot, mocked_sleep):
+    mocked_listener().wait.side_effect = [True, False, Exception]
+
+    with pytest.raises(_StopRefresher):
+        bids_module._refresh_bids_snapshot_continuously(30)
+
+    assert mocked_listener().wait.call_count == 3
+    mocked_listener().wait.assert_called_with(30)
+    assert mocked_refresh_bids_snapshot.call_count == 3
+    # Fall back to periodic refreshes if unable to listen
+    mocked_sleep.assert_called_once_with(30)
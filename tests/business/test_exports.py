@@ -0,0 +1,118 @@
+import datetime
+import decimal
+import json
+import types
+import unittest.mock
+import uuid
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.exports import EXPORT_FIELD_NAMES
+from pantos.servicenode.business.exports import ExportFormat
+from pantos.servicenode.business.exports import ExportInteractor
+from pantos.servicenode.business.exports import ExportInteractorError
+from pantos.servicenode.database.enums import TransferStatus
+
+_CREATED = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+def _create_row(index, status=TransferStatus.CONFIRMED):
+    return types.SimpleNamespace(
+        id=index, task_id=str(uuid.UUID(int=index)), source_blockchain_id=0,
+        destination_blockchain_id=1, sender_address='0xsender',
+        recipient_address='0xrecipient', source_token_address='0xtoken',
+        destination_token_address='0xtoken2', amount=decimal.Decimal(10**20),
+        fee=decimal.Decimal(10**18), sender_nonce=decimal.Decimal(index),
+        hub_address='0xhub', forwarder_address='0xforwarder',
+        on_chain_transfer_id=None if index % 2 else decimal.Decimal(index),
+        transaction_id=None, status_id=status.value, created=_CREATED,
+        updated=None)
+
+
+def _generate(rows):
+    yield from rows
+
+
+@unittest.mock.patch('pantos.servicenode.business.exports._EXPORT_BATCH_SIZE',
+                     2)
+@unittest.mock.patch('pantos.servicenode.business.exports.database_access')
+def test_export_transfers_csv_correct(mocked_database_access):
+    mocked_database_access.read_transfer_exports.return_value = _generate([
+        _create_row(0),
+        _create_row(1, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED),
+        _create_row(2)
+    ])
+    request = ExportInteractor.ExportTransfersRequest(ExportFormat.CSV,
+                                                      _CREATED, None,
+                                                      Blockchain.ETHEREUM,
+                                                      None)
+
+    chunks = list(ExportInteractor().export_transfers(request))
+
+    mocked_database_access.read_transfer_exports.assert_called_once_with(
+        _CREATED, None, Blockchain.ETHEREUM, None, 2)
+    assert len(chunks) == 2
+    lines = ''.join(chunks).splitlines()
+    assert lines[0] == ','.join(EXPORT_FIELD_NAMES)
+    assert lines[1] == (
+        f'{uuid.UUID(int=0)},0,1,0xsender,0xrecipient,0xtoken,0xtoken2,'
+        f'{10**20},{10**18},0,0xhub,0xforwarder,0,,confirmed,'
+        '2024-05-01T12:00:00+00:00,')
+    assert lines[2].split(',')[12] == ''
+    assert lines[2].split(',')[14] == 'accepted'
+    assert len(lines) == 4
+
+
+@unittest.mock.patch('pantos.servicenode.business.exports.database_access')
+def test_export_transfers_ndjson_correct(mocked_database_access):
+    mocked_database_access.read_transfer_exports.return_value = _generate(
+        [_create_row(0), _create_row(1)])
+    request = ExportInteractor.ExportTransfersRequest(ExportFormat.NDJSON)
+
+    chunks = list(ExportInteractor().export_transfers(request))
+
+    records = [json.loads(line) for line in ''.join(chunks).splitlines()]
+    assert len(records) == 2
+    assert tuple(records[0]) == EXPORT_FIELD_NAMES
+    assert records[0]['amount'] == 10**20
+    assert records[0]['transfer_id'] == 0
+    assert records[1]['transfer_id'] is None
+    assert records[1]['updated'] is None
+
+
+@unittest.mock.patch('pantos.servicenode.business.exports.database_access')
+def test_export_transfers_empty_correct(mocked_database_access):
+    mocked_database_access.read_transfer_exports.side_effect = \
+        lambda *args: _generate([])
+
+    csv_chunks = list(ExportInteractor().export_transfers(
+        ExportInteractor.ExportTransfersRequest(ExportFormat.CSV)))
+    ndjson_chunks = list(ExportInteractor().export_transfers(
+        ExportInteractor.ExportTransfersRequest(ExportFormat.NDJSON)))
+
+    assert csv_chunks == [','.join(EXPORT_FIELD_NAMES) + '\n']
+    assert ndjson_chunks == []
+
+
+@unittest.mock.patch('pantos.servicenode.business.exports.database_access')
+def test_export_transfers_closes_rows(mocked_database_access):
+    rows = unittest.mock.MagicMock()
+    rows.__iter__.return_value = iter([_create_row(0)] * 2000)
+    mocked_database_access.read_transfer_exports.return_value = rows
+
+    chunks = ExportInteractor().export_transfers(
+        ExportInteractor.ExportTransfersRequest(ExportFormat.CSV))
+    next(chunks)
+    chunks.close()
+
+    rows.close.assert_called_once_with()
+
+
+@unittest.mock.patch('pantos.servicenode.business.exports.database_access')
+def test_export_transfers_error(mocked_database_access):
+    mocked_database_access.read_transfer_exports.side_effect = Exception
+
+    with pytest.raises(ExportInteractorError):
+        list(ExportInteractor().export_transfers(
+            ExportInteractor.ExportTransfersRequest(ExportFormat.CSV)))
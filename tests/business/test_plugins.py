@@ -80,30 +80,57 @@ def test_replace_bids_correct(mocked_get_plugin_config, mocked_replace_bids,
     delay = bid_plugin_interactor.replace_bids(Blockchain.ETHEREUM)
 
     assert delay == 10
-    assert mocked_replace_bids.call_count == len(Blockchain)
     assert mocked_get_plugin_config.call_count == 1
+    mocked_replace_bids.assert_called_once()
+    assert mocked_replace_bids.call_args.args[0] == Blockchain.ETHEREUM.value
+    bids_by_destination = mocked_replace_bids.call_args.args[1]
+    assert len(bids_by_destination) == len(Blockchain)
     for bid in bids:
         bid.fee = bid.fee * 3
     bids_to_dics = [dataclasses.asdict(bid) for bid in bids]
-    mocked_replace_bids.assert_called_with(Blockchain.ETHEREUM.value,
-                                           Blockchain.CELO.value, bids_to_dics)
+    assert bids_by_destination[Blockchain.CELO.value] == bids_to_dics
 
 
 @unittest.mock.patch('pantos.servicenode.business.plugins.get_bid_plugin',
                      return_value=MockedBidPlugin(True))
 @unittest.mock.patch('pantos.servicenode.business.plugins.'
                      'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.plugins.replace_bids')
 @unittest.mock.patch('pantos.servicenode.business.plugins.get_plugin_config',
                      return_value={'bids': {
                          'arguments': {}
                      }})
 def test_replace_bids_plugin_error(mocked_get_plugin_config,
+                                   mocked_replace_bids,
                                    mocked_get_blockchain_client,
                                    mocked_get_bid_plugin):
     bid_plugin_interactor = BidPluginInteractor()
     mocked_get_blockchain_client().get_validator_fee_factor.return_value = 1
 
     assert bid_plugin_interactor.replace_bids(Blockchain.ETHEREUM) == 60
+    # The existing bids are kept
+    mocked_replace_bids.assert_called_once_with(Blockchain.ETHEREUM.value, {})
+
+
+@unittest.mock.patch('pantos.servicenode.business.plugins.get_bid_plugin',
+                     return_value=MockedBidPlugin(False))
+@unittest.mock.patch('pantos.servicenode.business.plugins.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.plugins.replace_bids',
+                     side_effect=Exception)
+@unittest.mock.patch('pantos.servicenode.business.plugins.get_plugin_config',
+                     return_value={'bids': {
+                         'arguments': {}
+                     }})
+def test_replace_bids_database_error(mocked_get_plugin_config,
+                                     mocked_replace_bids,
+                                     mocked_get_blockchain_client,
+                                     mocked_get_bid_plugin):
+    bid_plugin_interactor = BidPluginInteractor()
+    mocked_get_blockchain_client().get_validator_fee_factor.return_value = 1
+
+    assert bid_plugin_interactor.replace_bids(Blockchain.ETHEREUM) == 10
+    mocked_replace_bids.assert_called_once()
 
 
 @unittest.mock.patch('pantos.servicenode.business.plugins.get_bid_plugin')
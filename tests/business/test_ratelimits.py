@@ -0,0 +1,128 @@
+import multiprocessing
+import typing
+import unittest.mock
+
+import pytest
+
+from pantos.servicenode.business.ratelimits import RateLimitInteractor
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.business.ratelimits import initialize_token_buckets
+
+_ENDPOINT = 'transfer'
+
+_CLIENT_KEYS = ['ip:127.0.0.1', 'sender:0xabc']
+
+_TIMESTAMP = 1000.0
+
+
+def _rate_limits_config(capacity, refill_rate, cache_size=10):
+    return {
+        'application': {
+            'rate_limit_cache_size': cache_size,
+            'rate_limits': {
+                _ENDPOINT: {
+                    'capacity': capacity,
+                    'refill_rate': refill_rate
+                },
+                'bids': {
+                    'capacity': 0,
+                    'refill_rate': 0.0
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def token_buckets():
+    token_buckets: dict[str, typing.Any] = {}
+    with unittest.mock.patch(
+            'pantos.servicenode.business.ratelimits._token_buckets',
+            token_buckets):
+        yield token_buckets
+
+
+@pytest.mark.parametrize('capacity, refill_rate', [(0, 1.0), (10, 0.0)])
+def test_consume_tokens_disabled(capacity, refill_rate, token_buckets):
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(capacity, refill_rate)):
+        for _ in range(20):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+
+    assert len(token_buckets) == 0
+
+
+@unittest.mock.patch('pantos.servicenode.business.ratelimits.time')
+def test_consume_tokens_correct(mocked_time):
+    mocked_time.monotonic.return_value = _TIMESTAMP
+
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(3, 0.5)):
+        for _ in range(3):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+        with pytest.raises(RateLimitInteractorLimitExceededError) as exc_info:
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+        # Other clients are not affected
+        RateLimitInteractor().consume_tokens(_ENDPOINT, ['ip:127.0.0.2'])
+
+    assert exc_info.value.details['retry_after'] == 4
+
+
+@unittest.mock.patch('pantos.servicenode.business.ratelimits.time')
+def test_consume_tokens_refilled(mocked_time):
+    mocked_time.monotonic.return_value = _TIMESTAMP
+
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(2, 0.5)):
+        for _ in range(2):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+        mocked_time.monotonic.return_value = _TIMESTAMP + 2
+        RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+        with pytest.raises(RateLimitInteractorLimitExceededError):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+
+
+@unittest.mock.patch('pantos.servicenode.business.ratelimits.time')
+def test_consume_tokens_limit_exceeded_any_key(mocked_time):
+    mocked_time.monotonic.return_value = _TIMESTAMP
+
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(1, 1.0)):
+        RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS[:1])
+        with pytest.raises(RateLimitInteractorLimitExceededError) as exc_info:
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+
+    assert exc_info.value.details['client_keys'] == _CLIENT_KEYS
+    assert exc_info.value.details['retry_after'] == 2
+
+
+@unittest.mock.patch('pantos.servicenode.business.ratelimits.time')
+def test_consume_tokens_evicted(mocked_time):
+    mocked_time.monotonic.return_value = _TIMESTAMP
+
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(1, 0.001, cache_size=1)):
+        RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS[:1])
+        mocked_time.monotonic.return_value = _TIMESTAMP + 1
+        # The bucket of the first client is evicted
+        RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS[1:])
+        RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS[:1])
+        with pytest.raises(RateLimitInteractorLimitExceededError):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS[:1])
+
+
+def test_consume_tokens_shared_between_processes(token_buckets):
+    with unittest.mock.patch('pantos.servicenode.business.ratelimits.config',
+                             _rate_limits_config(1, 0.001)):
+        initialize_token_buckets()
+        process = multiprocessing.get_context('fork').Process(
+            target=RateLimitInteractor().consume_tokens,
+            args=(_ENDPOINT, _CLIENT_KEYS))
+        process.start()
+        process.join()
+        with pytest.raises(RateLimitInteractorLimitExceededError):
+            RateLimitInteractor().consume_tokens(_ENDPOINT, _CLIENT_KEYS)
+
+    assert process.exitcode == 0
+    assert list(token_buckets) == [_ENDPOINT]
@@ -0,0 +1,126 @@
+import datetime
+import types
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.statistics import StatisticsInteractor
+from pantos.servicenode.business.statistics import StatisticsInteractorError
+from pantos.servicenode.business.statistics import \
+    roll_up_transfer_statistics_task
+from pantos.servicenode.database.enums import TransferStatus
+
+_HOUR = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+def _mock_roll_up_transfer_statistics_config(mocked_config, batch_size=2,
+                                             max_batches=3, interval=60):
+    mocked_config_dict = {
+        'tasks': {
+            'roll_up_transfer_statistics': {
+                'batch_size': batch_size,
+                'max_batches': max_batches,
+                'interval': interval
+            }
+        }
+    }
+    mocked_config.__getitem__.side_effect = mocked_config_dict.__getitem__
+
+
+@unittest.mock.patch('pantos.servicenode.business.statistics.'
+                     'database_access')
+def test_find_transfer_statistics_correct(mocked_database_access):
+    mocked_database_access.read_transfer_statistics.return_value = [
+        types.SimpleNamespace(
+            # SQLite returns timestamps without a time zone
+            hour=_HOUR.replace(tzinfo=None),
+            source_blockchain_id=Blockchain.ETHEREUM.value,
+            destination_blockchain_id=Blockchain.BNB_CHAIN.value,
+            source_token_address='token_address',
+            status_id=TransferStatus.CONFIRMED.value,
+            transfer_count=3,
+            amount=300,
+            fee=3)
+    ]
+    hour_from = datetime.datetime(
+        2024, 5, 1, 14, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+
+    transfer_statistics = StatisticsInteractor().find_transfer_statistics(
+        StatisticsInteractor.FindTransferStatisticsRequest(
+            hour_from, None, Blockchain.ETHEREUM))
+
+    assert transfer_statistics == [
+        StatisticsInteractor.TransferStatistics(_HOUR, Blockchain.ETHEREUM,
+                                                Blockchain.BNB_CHAIN,
+                                                'token_address',
+                                                TransferStatus.CONFIRMED, 3,
+                                                300, 3)
+    ]
+    mocked_database_access.read_transfer_statistics.assert_called_once_with(
+        _HOUR, None, Blockchain.ETHEREUM, None)
+    assert transfer_statistics[0].hour.tzinfo == datetime.UTC
+
+
+@unittest.mock.patch('pantos.servicenode.business.statistics.'
+                     'database_access')
+def test_find_transfer_statistics_error(mocked_database_access):
+    mocked_database_access.read_transfer_statistics.side_effect = Exception
+
+    with pytest.raises(StatisticsInteractorError):
+        StatisticsInteractor().find_transfer_statistics(
+            StatisticsInteractor.FindTransferStatisticsRequest())
+
+
+@pytest.mark.parametrize('batch_results,expected_rolled_up', [([0], 0),
+                                                              ([2, 1], 3),
+                                                              ([2, 2, 2], 6)])
+@unittest.mock.patch('pantos.servicenode.business.statistics.config')
+@unittest.mock.patch('pantos.servicenode.business.statistics.'
+                     'database_access')
+def test_roll_up_transfer_statistics_correct(mocked_database_access,
+                                             mocked_config, batch_results,
+                                             expected_rolled_up):
+    _mock_roll_up_transfer_statistics_config(mocked_config)
+    mocked_database_access.roll_up_transfer_statistics.side_effect = \
+        batch_results
+
+    rolled_up = StatisticsInteractor().roll_up_transfer_statistics()
+
+    assert rolled_up == expected_rolled_up
+    assert mocked_database_access.roll_up_transfer_statistics.call_args_list \
+        == [unittest.mock.call(2)] * len(batch_results)
+
+
+@unittest.mock.patch('pantos.servicenode.business.statistics.config')
+@unittest.mock.patch('pantos.servicenode.business.statistics.'
+                     'database_access')
+def test_roll_up_transfer_statistics_error(mocked_database_access,
+                                           mocked_config):
+    _mock_roll_up_transfer_statistics_config(mocked_config)
+    mocked_database_access.roll_up_transfer_statistics.side_effect = Exception
+
+    with pytest.raises(StatisticsInteractorError):
+        StatisticsInteractor().roll_up_transfer_statistics()
+
+
+@pytest.mark.parametrize('roll_up_transfer_statistics_error', [False, True])
+@unittest.mock.patch('pantos.servicenode.business.statistics.config')
+@unittest.mock.patch('pantos.servicenode.business.statistics.'
+                     'roll_up_transfer_statistics_task')
+@unittest.mock.patch.object(StatisticsInteractor,
+                            'roll_up_transfer_statistics', return_value=5)
+def test_roll_up_transfer_statistics_task_correct(
+        mocked_roll_up_transfer_statistics,
+        mocked_roll_up_transfer_statistics_task, mocked_config,
+        roll_up_transfer_statistics_error):
+    _mock_roll_up_transfer_statistics_config(mocked_config)
+    if roll_up_transfer_statistics_error:
+        mocked_roll_up_transfer_statistics.side_effect = \
+            StatisticsInteractorError('')
+
+    result = roll_up_transfer_statistics_task()
+
+    assert result == (0 if roll_up_transfer_statistics_error else 5)
+    mocked_roll_up_transfer_statistics_task.apply_async.\
+        assert_called_once_with(countdown=60)
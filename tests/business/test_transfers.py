@@ -1,8 +1,10 @@
+import datetime
 import time
 import unittest.mock
 import uuid
 
 import celery.exceptions  # type: ignore
+import celery.states  # type: ignore
 import pytest
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.entities import TransactionStatus
@@ -12,16 +14,41 @@ from pantos.servicenode.blockchains.base import InvalidSignatureError
 from pantos.servicenode.blockchains.base import \
     UnresolvableTransferSubmissionError
 from pantos.servicenode.business.bids import BidInteractorError
+from pantos.servicenode.business.ratelimits import RateLimitInteractor
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
 from pantos.servicenode.business.transfers import TransferInteractor
+from pantos.servicenode.business.transfers import \
+    TransferInteractorBidNotAcceptedError
 from pantos.servicenode.business.transfers import TransferInteractorError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorIdempotencyKeyConflictError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorInvalidSignatureError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorOverloadedError
 from pantos.servicenode.business.transfers import \
     TransferInteractorResourceNotFoundError
 from pantos.servicenode.business.transfers import \
     TransferInteractorUnrecoverableError
+from pantos.servicenode.business.transfers import \
+    _dispatch_transfer_notification
+from pantos.servicenode.business.transfers import archive_transfers_task
 from pantos.servicenode.business.transfers import confirm_transfer_task
+from pantos.servicenode.business.transfers import \
+    delete_expired_idempotency_keys_task
 from pantos.servicenode.business.transfers import execute_transfer_task
+from pantos.servicenode.business.transfers import recover_transfers_task
+from pantos.servicenode.business.transfers import \
+    subscribe_to_transfer_notifications
+from pantos.servicenode.business.transfers import \
+    unsubscribe_from_transfer_notifications
+from pantos.servicenode.cache import LruCache
+from pantos.servicenode.database.access import TransferUpdate
 from pantos.servicenode.database.enums import TransferStatus
 from pantos.servicenode.database.exceptions import SenderNonceNotUniqueError
+from pantos.servicenode.database.models import TokenContract
+from pantos.servicenode.database.models import Transfer
 
 
 class MockBidPlugin:
@@ -29,11 +56,23 @@ class MockBidPlugin:
         return True
 
 
+_EXECUTE_TRANSFER_CONFIG = {
+    'tasks': {
+        'recover_transfers': {
+            'stale_age': 3600
+        }
+    }
+}
+
+
 @pytest.fixture(scope='module')
 def transfer_interactor():
     return TransferInteractor()
 
 
+@unittest.mock.patch.object(RateLimitInteractor, 'consume_tokens')
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_admission')
 @unittest.mock.patch('pantos.servicenode.business.transfers.get_bid_plugin')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'execute_transfer_task')
@@ -53,7 +92,8 @@ def test_initiate_transfer_correct(
         mocked_check_valid_bid, mocked_check_valid_until,
         mocked_get_blockchain_config, mocked_get_blockchain_client,
         mocked_database_access, mocked_execute_transfer_task,
-        mocked_get_bid_plugin, uuid_, initiate_transfer_request):
+        mocked_get_bid_plugin, mocked_check_admission, mocked_consume_tokens,
+        uuid_, initiate_transfer_request):
     mocked_get_bid_plugin.return_value = MockBidPlugin()
     mocked_execute_transfer_task.delay().id = uuid_
     get_blockchain_client_calls = [
@@ -75,6 +115,7 @@ def test_initiate_transfer_correct(
         initiate_transfer_request.destination_token_address,
         initiate_transfer_request.amount, initiate_transfer_request.bid.fee,
         initiate_transfer_request.nonce, initiate_transfer_request.signature,
+        initiate_transfer_request.valid_until,
         mocked_get_blockchain_config()['hub'],
         mocked_get_blockchain_config()['forwarder'])
     mocked_execute_transfer_task.delay.assert_called_with(
@@ -90,6 +131,39 @@ def test_initiate_transfer_correct(
         initiate_transfer_request.signature)
     mocked_database_access.update_transfer_task_id.assert_called_once_with(
         mocked_database_access.create_transfer(), uuid.UUID(uuid_))
+    mocked_consume_tokens.assert_called_once_with(
+        'transfer',
+        [f'sender:{initiate_transfer_request.sender_address.lower()}'])
+
+
+@unittest.mock.patch.object(
+    RateLimitInteractor, 'consume_tokens',
+    side_effect=RateLimitInteractorLimitExceededError('', retry_after=1))
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_admission')
+@unittest.mock.patch('pantos.servicenode.business.transfers.get_bid_plugin',
+                     return_value=MockBidPlugin())
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_config')
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_valid_until')
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_valid_bid')
+def test_initiate_transfer_sender_rate_limit_exceeded(
+        mocked_check_valid_bid, mocked_check_valid_until,
+        mocked_get_blockchain_config, mocked_get_blockchain_client,
+        mocked_database_access, mocked_get_bid_plugin, mocked_check_admission,
+        mocked_consume_tokens, initiate_transfer_request):
+    with pytest.raises(RateLimitInteractorLimitExceededError):
+        TransferInteractor().initiate_transfer(initiate_transfer_request)
+
+    mocked_get_blockchain_client().is_valid_transfer_signature.\
+        assert_called_once()
+    mocked_database_access.create_transfer.assert_not_called()
 
 
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -152,6 +226,122 @@ def test_initiate_transfer_request_bid_invalid(
         TransferInteractor().initiate_transfer(initiate_transfer_request)
 
 
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_admission')
+@unittest.mock.patch('pantos.servicenode.business.transfers.get_bid_plugin')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'execute_transfer_task')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_config')
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_valid_until',
+                            return_value=True)
+@unittest.mock.patch.object(TransferInteractor,
+                            '_TransferInteractor__check_valid_bid',
+                            return_value=True)
+def test_initiate_transfer_request_signature_invalid(
+        mocked_check_bid_valid, mocked_check_valid_until,
+        mocked_get_blockchain_config, mocked_get_blockchain_client,
+        mocked_database_access, mocked_execute_transfer_task,
+        mocked_get_bid_plugin, mocked_check_admission,
+        initiate_transfer_request):
+    mocked_get_bid_plugin.return_value = MockBidPlugin()
+    mocked_get_blockchain_client().is_valid_transfer_signature.return_value = \
+        False
+
+    with pytest.raises(TransferInteractorInvalidSignatureError):
+        TransferInteractor().initiate_transfer(initiate_transfer_request)
+
+    verification_request = mocked_get_blockchain_client(
+    ).is_valid_transfer_signature.call_args.args[0]
+    assert verification_request.sender_address == \
+        initiate_transfer_request.sender_address
+    assert verification_request.signature == \
+        initiate_transfer_request.signature
+    mocked_database_access.create_transfer.assert_not_called()
+    mocked_execute_transfer_task.delay.assert_not_called()
+
+
+@pytest.mark.parametrize('max_pending_transfers', [0, 10])
+@pytest.mark.parametrize('pending_transfer_drain_time', [0, 10])
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    '_pending_transfer_counts', new_callable=lambda: LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_check_admission_correct(mocked_database_access,
+                                 mocked_pending_transfer_counts,
+                                 pending_transfer_drain_time,
+                                 max_pending_transfers,
+                                 initiate_transfer_request):
+    mocked_database_access.read_pending_transfer_count.return_value = 9
+    source_blockchain_config = {
+        'max_pending_transfers': max_pending_transfers,
+        'pending_transfer_drain_time': pending_transfer_drain_time,
+        'average_block_time': 5
+    }
+
+    for _ in range(2):
+        TransferInteractor()._TransferInteractor__check_admission(
+            initiate_transfer_request, source_blockchain_config)
+
+    # The number of pending transfers is only read once (if at all)
+    assert mocked_database_access.read_pending_transfer_count.call_count \
+        == (0 if max_pending_transfers == 0
+            and pending_transfer_drain_time == 0 else 1)
+
+
+@pytest.mark.parametrize('pending_transfer_drain_time, retry_after', [(0, 5),
+                                                                      (7, 21)])
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    '_pending_transfer_counts', new_callable=lambda: LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_check_admission_overloaded_error(mocked_database_access,
+                                          mocked_pending_transfer_counts,
+                                          pending_transfer_drain_time,
+                                          retry_after,
+                                          initiate_transfer_request):
+    mocked_database_access.read_pending_transfer_count.return_value = 12
+    source_blockchain_config = {
+        'max_pending_transfers': 10,
+        'pending_transfer_drain_time': pending_transfer_drain_time,
+        'average_block_time': 5
+    }
+
+    with pytest.raises(TransferInteractorOverloadedError) as exc_info:
+        TransferInteractor()._TransferInteractor__check_admission(
+            initiate_transfer_request, source_blockchain_config)
+
+    assert exc_info.value.details['retry_after'] == retry_after
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    '_pending_transfer_counts', new_callable=lambda: LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_check_admission_execution_time_not_met(mocked_database_access,
+                                                mocked_pending_transfer_counts,
+                                                initiate_transfer_request):
+    execution_time = initiate_transfer_request.bid.execution_time
+    mocked_database_access.read_pending_transfer_count.return_value = 1
+    source_blockchain_config = {
+        'max_pending_transfers': 0,
+        'pending_transfer_drain_time': execution_time // 2 + 1,
+        'average_block_time': 5
+    }
+
+    with pytest.raises(TransferInteractorBidNotAcceptedError):
+        TransferInteractor()._TransferInteractor__check_admission(
+            initiate_transfer_request, source_blockchain_config)
+
+
 @unittest.mock.patch(
     'pantos.servicenode.business.transfers.get_blockchain_config',
     side_effect=Exception)
@@ -204,6 +394,197 @@ def test_find_transfer_error(mocked_database_access, uuid_):
         TransferInteractor().find_transfer(uuid_)
 
 
+def _create_mocked_transfer(internal_transfer_id, status, source_blockchain,
+                            destination_blockchain):
+    transfer = unittest.mock.MagicMock()
+    transfer.id = internal_transfer_id
+    transfer.task_id = str(uuid.uuid4())
+    transfer.source_blockchain_id = source_blockchain.value
+    transfer.destination_blockchain_id = destination_blockchain.value
+    transfer.amount = 1
+    transfer.fee = 2
+    transfer.status_id = status.value
+    transfer.on_chain_transfer_id = None
+    return transfer
+
+
+@pytest.mark.parametrize('more_transfers', [True, False])
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_list_transfers_correct(mocked_database_access, more_transfers,
+                                source_blockchain, destination_blockchain):
+    transfers = [
+        _create_mocked_transfer(internal_transfer_id, status,
+                                source_blockchain, destination_blockchain)
+        for internal_transfer_id, status in [(
+            3, TransferStatus.ACCEPTED
+        ), (5, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED
+            ), (8, TransferStatus.ACCEPTED)]
+    ]
+    mocked_database_access.read_transfers.return_value = (
+        transfers if more_transfers else transfers[:2])
+    request = TransferInteractor.ListTransfersRequest(
+        2, sender_address='sender', status=TransferStatus.ACCEPTED, after=1)
+
+    response = TransferInteractor().list_transfers(request)
+
+    mocked_database_access.read_transfers.assert_called_once_with(
+        'sender',
+        [TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED],
+        1, 3)
+    assert [listed_transfer.task_id for listed_transfer in response.transfers
+            ] == [uuid.UUID(transfer.task_id) for transfer in transfers[:2]]
+    assert [
+        listed_transfer.transfer.status
+        for listed_transfer in response.transfers
+    ] == [TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED]
+    assert response.next_after == (5 if more_transfers else None)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_list_transfers_no_filters(mocked_database_access):
+    mocked_database_access.read_transfers.return_value = []
+
+    response = TransferInteractor().list_transfers(
+        TransferInteractor.ListTransfersRequest(10))
+
+    mocked_database_access.read_transfers.assert_called_once_with(
+        None, None, None, 11)
+    assert response == TransferInteractor.ListTransfersResponse([], None)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_list_transfers_error(mocked_database_access):
+    mocked_database_access.read_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().list_transfers(
+            TransferInteractor.ListTransfersRequest(10))
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers._idempotency_key_cache',
+    LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 60
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_find_idempotent_transfer_correct(mocked_database_access, uuid_):
+    idempotency_key_record = \
+        mocked_database_access.read_idempotency_key.return_value
+    idempotency_key_record.request_hash = 'request_hash'
+    idempotency_key_record.task_id = uuid_
+
+    for _ in range(2):
+        task_id = TransferInteractor().find_idempotent_transfer(
+            'idempotency_key', 'request_hash')
+
+        assert task_id == uuid.UUID(uuid_)
+    # The second lookup is served by the in-memory cache
+    mocked_database_access.read_idempotency_key.assert_called_once()
+    idempotency_key, created_after = \
+        mocked_database_access.read_idempotency_key.call_args.args
+    assert idempotency_key == 'idempotency_key'
+    assert (datetime.datetime.now(datetime.UTC) - created_after
+            >= datetime.timedelta(seconds=60))
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers._idempotency_key_cache',
+    LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 60
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_find_idempotent_transfer_unknown_key(mocked_database_access):
+    mocked_database_access.read_idempotency_key.return_value = None
+
+    task_id = TransferInteractor().find_idempotent_transfer(
+        'idempotency_key', 'request_hash')
+
+    assert task_id is None
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers._idempotency_key_cache',
+    LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 60
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_find_idempotent_transfer_conflict_error(mocked_database_access,
+                                                 uuid_):
+    idempotency_key_record = \
+        mocked_database_access.read_idempotency_key.return_value
+    idempotency_key_record.request_hash = 'request_hash'
+    idempotency_key_record.task_id = uuid_
+
+    with pytest.raises(TransferInteractorIdempotencyKeyConflictError):
+        TransferInteractor().find_idempotent_transfer('idempotency_key',
+                                                      'other_request_hash')
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers._idempotency_key_cache',
+    LruCache(10))
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 60
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_find_idempotent_transfer_error(mocked_database_access):
+    mocked_database_access.read_idempotency_key.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().find_idempotent_transfer('idempotency_key',
+                                                      'request_hash')
+
+
+@pytest.mark.parametrize('created', [True, False])
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_store_idempotent_transfer_correct(mocked_database_access, created,
+                                           uuid_):
+    idempotency_key_cache: LruCache[str, tuple[str, uuid.UUID]] = \
+        LruCache(10)
+    mocked_database_access.create_idempotency_key.return_value = created
+    task_id = uuid.UUID(uuid_)
+
+    with unittest.mock.patch(
+            'pantos.servicenode.business.transfers._idempotency_key_cache',
+            idempotency_key_cache):
+        TransferInteractor().store_idempotent_transfer('idempotency_key',
+                                                       'request_hash', task_id)
+
+    mocked_database_access.delete_idempotency_keys.assert_not_called()
+    mocked_database_access.create_idempotency_key.assert_called_once_with(
+        'idempotency_key', 'request_hash', task_id)
+    assert idempotency_key_cache.get('idempotency_key') == (('request_hash',
+                                                             task_id) if
+                                                            created else None)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_store_idempotent_transfer_error(mocked_database_access, uuid_):
+    mocked_database_access.create_idempotency_key.side_effect = Exception
+
+    TransferInteractor().store_idempotent_transfer('idempotency_key',
+                                                   'request_hash',
+                                                   uuid.UUID(uuid_))
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -215,6 +596,7 @@ def test_execute_transfer_single_chain_correct(mocked_database_access,
                                                mocked_time,
                                                execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     execute_transfer_request.source_blockchain = \
         execute_transfer_request.destination_blockchain
     execute_transfer_request.source_token_address = \
@@ -235,13 +617,17 @@ def test_execute_transfer_single_chain_correct(mocked_database_access,
 
     mocked_get_blockchain_client().start_transfer_submission.\
         assert_called_with(expected_transfer_request)
-    mocked_database_access.update_transfer_status.assert_called_once_with(
-        execute_transfer_request.internal_transfer_id,
-        TransferStatus.SUBMITTED)
+    mocked_database_access.update_transfer_status.assert_not_called()
+    mocked_database_access.update_transfer.assert_called_once_with(
+        TransferUpdate(execute_transfer_request.internal_transfer_id,
+                       status=TransferStatus.SUBMITTED,
+                       internal_transaction_id=internal_transaction_id))
     assert (internal_transaction_id == mocked_get_blockchain_client().
             start_transfer_submission(expected_transfer_request))
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -249,6 +635,7 @@ def test_execute_transfer_single_chain_correct(mocked_database_access,
 def test_execute_transfer_single_chain_source_and_destination_token_error(
         mocked_database_access, mocked_time, execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     execute_transfer_request.source_blockchain = \
         execute_transfer_request.destination_blockchain
 
@@ -259,6 +646,8 @@ def test_execute_transfer_single_chain_source_and_destination_token_error(
         execute_transfer_request.internal_transfer_id, TransferStatus.FAILED)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -269,6 +658,7 @@ def test_execute_transfer_single_chain_unrecoverable_error(
         mocked_database_access, mocked_get_blockchain_client, mocked_time,
         execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().start_transfer_submission.side_effect = \
         InvalidSignatureError
     execute_transfer_request.source_blockchain = \
@@ -283,6 +673,8 @@ def test_execute_transfer_single_chain_unrecoverable_error(
         execute_transfer_request.internal_transfer_id, TransferStatus.FAILED)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -294,6 +686,7 @@ def test_execute_transfer_single_chain_error(mocked_database_access,
                                              mocked_time,
                                              execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().start_transfer_submission.side_effect = \
         Exception
     execute_transfer_request.source_blockchain = \
@@ -306,8 +699,12 @@ def test_execute_transfer_single_chain_error(mocked_database_access,
 
     mocked_database_access.update_transfer_status.assert_called_once_with(
         execute_transfer_request.internal_transfer_id, TransferStatus.ACCEPTED)
+    mocked_database_access.release_transfer_execution.assert_called_once_with(
+        execute_transfer_request.internal_transfer_id)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -319,6 +716,7 @@ def test_execute_transfer_cross_chain_correct(mocked_database_access,
                                               mocked_time,
                                               execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().read_external_token_record.return_value = \
         BlockchainClient.ExternalTokenRecordResponse(
             is_registration_active=True,
@@ -342,13 +740,17 @@ def test_execute_transfer_cross_chain_correct(mocked_database_access,
 
     mocked_get_blockchain_client().start_transfer_from_submission.\
         assert_called_with(expected_transfer_from_request)
-    mocked_database_access.update_transfer_status.assert_called_once_with(
-        execute_transfer_request.internal_transfer_id,
-        TransferStatus.SUBMITTED)
+    mocked_database_access.update_transfer_status.assert_not_called()
+    mocked_database_access.update_transfer.assert_called_once_with(
+        TransferUpdate(execute_transfer_request.internal_transfer_id,
+                       status=TransferStatus.SUBMITTED,
+                       internal_transaction_id=internal_transaction_id))
     assert (internal_transaction_id == mocked_get_blockchain_client().
             start_transfer_from_submission(expected_transfer_from_request))
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.time')
 @unittest.mock.patch(
     'pantos.servicenode.business.transfers.get_blockchain_client')
@@ -357,6 +759,7 @@ def test_execute_transfer_cross_chain_destination_token_inactive_error(
         mocked_database_access, mocked_get_blockchain_client, mocked_time,
         execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().read_external_token_record.return_value = \
         BlockchainClient.ExternalTokenRecordResponse(
             is_registration_active=False,
@@ -370,6 +773,8 @@ def test_execute_transfer_cross_chain_destination_token_inactive_error(
         execute_transfer_request.internal_transfer_id, TransferStatus.FAILED)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.time')
 @unittest.mock.patch(
     'pantos.servicenode.business.transfers.get_blockchain_client')
@@ -381,6 +786,7 @@ def test_execute_transfer_cross_chain_destination_token_address_invalid_error(
     assert (external_token_address
             != execute_transfer_request.destination_token_address)
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().read_external_token_record.return_value = \
         BlockchainClient.ExternalTokenRecordResponse(
             is_registration_active=True,
@@ -393,6 +799,8 @@ def test_execute_transfer_cross_chain_destination_token_address_invalid_error(
         execute_transfer_request.internal_transfer_id, TransferStatus.FAILED)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -403,6 +811,7 @@ def test_execute_transfer_cross_chain_unrecoverable_error(
         mocked_database_access, mocked_get_blockchain_client, mocked_time,
         execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
     mocked_get_blockchain_client().read_external_token_record.return_value = \
         BlockchainClient.ExternalTokenRecordResponse(
             is_registration_active=True,
@@ -418,6 +827,76 @@ def test_execute_transfer_cross_chain_unrecoverable_error(
         execute_transfer_request.internal_transfer_id, TransferStatus.FAILED)
 
 
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_execute_transfer_already_executed_skipped(
+        mocked_database_access, mocked_get_blockchain_client,
+        execute_transfer_request):
+    mocked_database_access.claim_transfer_execution.return_value = False
+
+    internal_transaction_id = TransferInteractor().execute_transfer(
+        execute_transfer_request)
+
+    assert internal_transaction_id is None
+
+    internal_transfer_id, claimed_before = \
+        mocked_database_access.claim_transfer_execution.call_args.args
+    assert internal_transfer_id == \
+        execute_transfer_request.internal_transfer_id
+    assert (datetime.datetime.now(datetime.UTC) - claimed_before
+            >= datetime.timedelta(seconds=3600))
+    mocked_get_blockchain_client.assert_not_called()
+    mocked_database_access.release_transfer_execution.assert_not_called()
+    mocked_database_access.update_transfer_status.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_execute_transfer_claim_error(mocked_database_access,
+                                      execute_transfer_request):
+    mocked_database_access.claim_transfer_execution.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().execute_transfer(execute_transfer_request)
+
+    # A claim of another task must not be released
+    mocked_database_access.release_transfer_execution.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'time')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_client')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_execute_transfer_release_error(mocked_database_access,
+                                        mocked_get_blockchain_client,
+                                        mocked_time, execute_transfer_request):
+    mocked_time.time.return_value = execute_transfer_request.valid_until - 1
+    mocked_database_access.claim_transfer_execution.return_value = True
+    mocked_database_access.release_transfer_execution.side_effect = Exception
+    mocked_get_blockchain_client().read_external_token_record.side_effect = \
+        Exception
+
+    with pytest.raises(TransferInteractorError) as exc_info:
+        TransferInteractor().execute_transfer(execute_transfer_request)
+
+    assert not isinstance(exc_info.value, TransferInteractorUnrecoverableError)
+    mocked_database_access.release_transfer_execution.assert_called_once_with(
+        execute_transfer_request.internal_transfer_id)
+    mocked_database_access.update_transfer.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     _EXECUTE_TRANSFER_CONFIG)
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
                      'time')
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -425,6 +904,7 @@ def test_execute_transfer_cross_chain_unrecoverable_error(
 def test_execute_transfer_validity_expired_unrecoverable_error(
         mocked_database_access, mocked_time, execute_transfer_request):
     mocked_time.time.return_value = execute_transfer_request.valid_until + 1
+    mocked_database_access.claim_transfer_execution.return_value = True
 
     with pytest.raises(TransferInteractorUnrecoverableError):
         TransferInteractor().execute_transfer(execute_transfer_request)
@@ -457,15 +937,11 @@ def test_confirm_transfer_confirmed_correct(mocked_database_access,
         assert_called_with(
             confirm_transfer_request.internal_transaction_id,
             confirm_transfer_request.destination_blockchain)
-    mocked_database_access.update_transfer_transaction_id.\
-        assert_called_once_with(
-            confirm_transfer_request.internal_transfer_id,
-            transaction_id)
-    mocked_database_access.update_on_chain_transfer_id.assert_called_once_with(
-        confirm_transfer_request.internal_transfer_id, transfer_on_chain_id)
-    mocked_database_access.update_transfer_status.assert_called_once_with(
-        confirm_transfer_request.internal_transfer_id,
-        TransferStatus.CONFIRMED)
+    mocked_database_access.update_transfer.assert_called_once_with(
+        TransferUpdate(confirm_transfer_request.internal_transfer_id,
+                       status=TransferStatus.CONFIRMED,
+                       transaction_id=transaction_id,
+                       on_chain_transfer_id=transfer_on_chain_id))
 
 
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -487,6 +963,7 @@ def test_confirm_transfer_unconfirmed_correct(mocked_database_access,
         assert_called_with(
             confirm_transfer_request.internal_transaction_id,
             confirm_transfer_request.destination_blockchain)
+    mocked_database_access.update_transfer.assert_not_called()
 
 
 @unittest.mock.patch('pantos.servicenode.business.transfers.'
@@ -533,10 +1010,9 @@ def test_confirm_transfer_unresolvable_submission_error(
         assert_called_with(
             confirm_transfer_request.internal_transaction_id,
             confirm_transfer_request.destination_blockchain)
-    mocked_database_access.reset_transfer_nonce.assert_called_once_with(
-        confirm_transfer_request.internal_transfer_id)
-    mocked_database_access.update_transfer_status.assert_called_once_with(
-        confirm_transfer_request.internal_transfer_id, TransferStatus.FAILED)
+    mocked_database_access.update_transfer.assert_called_once_with(
+        TransferUpdate(confirm_transfer_request.internal_transfer_id,
+                       status=TransferStatus.FAILED, reset_nonce=True))
 
 
 @unittest.mock.patch(
@@ -586,9 +1062,31 @@ def test_execute_transfer_task_correct(
         args=(transfer_internal_id, source_blockchain.value,
               destination_blockchain.value,
               str(mocked_execute_transfer(expected_execute_transfer_request))),
+        task_id=str(
+            mocked_execute_transfer(expected_execute_transfer_request)),
         countdown=confirm_retry_interval)
 
 
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.confirm_transfer_task')
+@unittest.mock.patch.object(TransferInteractor, 'execute_transfer',
+                            return_value=None)
+def test_execute_transfer_task_skipped(
+        mocked_execute_transfer, mocked_confirm_task, transfer_internal_id,
+        source_blockchain, destination_blockchain, sender_address,
+        recipient_address, source_token_address, destination_token_address,
+        amount, fee, nonce, valid_until, signature):
+    result = execute_transfer_task(
+        transfer_internal_id, source_blockchain.value,
+        destination_blockchain.value, sender_address, recipient_address,
+        source_token_address, destination_token_address, amount, fee, nonce,
+        valid_until, signature)
+
+    assert result is True
+    mocked_execute_transfer.assert_called_once()
+    mocked_confirm_task.apply_async.assert_not_called()
+
+
 @unittest.mock.patch('pantos.servicenode.business.transfers.config')
 @unittest.mock.patch.object(
     TransferInteractor, 'execute_transfer',
@@ -818,3 +1316,366 @@ def test_check_valid_bid_mismatch(bid, source_blockchain,
     with pytest.raises(TransferInteractorError):
         transfer_interactor._TransferInteractor__check_valid_bid(
             bid, Blockchain.CELO, Blockchain.POLYGON)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 86400
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_delete_expired_idempotency_keys_correct(mocked_database_access):
+    mocked_database_access.delete_idempotency_keys.return_value = 3
+
+    deleted = TransferInteractor().delete_expired_idempotency_keys()
+
+    assert deleted == 3
+    created_before = \
+        mocked_database_access.delete_idempotency_keys.call_args.args[0]
+    assert (datetime.datetime.now(datetime.UTC) - created_before
+            >= datetime.timedelta(seconds=86400))
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config',
+                     {'application': {
+                         'idempotency_key_expiry': 86400
+                     }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_delete_expired_idempotency_keys_error(mocked_database_access):
+    mocked_database_access.delete_idempotency_keys.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().delete_expired_idempotency_keys()
+
+
+@pytest.mark.parametrize('delete_error', [False, True])
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.config',
+    {'tasks': {
+        'delete_expired_idempotency_keys': {
+            'interval': 3600
+        }
+    }})
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'delete_expired_idempotency_keys_task')
+@unittest.mock.patch.object(TransferInteractor,
+                            'delete_expired_idempotency_keys', return_value=3)
+def test_delete_expired_idempotency_keys_task_correct(
+        mocked_delete_expired_idempotency_keys,
+        mocked_delete_expired_idempotency_keys_task, delete_error):
+    if delete_error:
+        mocked_delete_expired_idempotency_keys.side_effect = \
+            TransferInteractorError('')
+
+    result = delete_expired_idempotency_keys_task()
+
+    assert result == (0 if delete_error else 3)
+    mocked_delete_expired_idempotency_keys_task.apply_async.\
+        assert_called_once_with(countdown=3600)
+
+
+def _mock_archive_transfers_config(mocked_config, retention_age=86400,
+                                   batch_size=2, max_batches=3, interval=60):
+    mocked_config_dict = {
+        'tasks': {
+            'archive_transfers': {
+                'retention_age': retention_age,
+                'batch_size': batch_size,
+                'max_batches': max_batches,
+                'interval': interval
+            }
+        }
+    }
+    mocked_config.__getitem__.side_effect = mocked_config_dict.__getitem__
+
+
+@pytest.mark.parametrize('batch_results,expected_archived', [([0], 0),
+                                                             ([2, 1], 3),
+                                                             ([2, 2, 2], 6)])
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_archive_transfers_correct(mocked_database_access, mocked_config,
+                                   batch_results, expected_archived):
+    _mock_archive_transfers_config(mocked_config)
+    mocked_database_access.archive_transfers.side_effect = batch_results
+
+    archived = TransferInteractor().archive_transfers()
+
+    assert archived == expected_archived
+    assert mocked_database_access.archive_transfers.call_count == len(
+        batch_results)
+    updated_before, batch_size = \
+        mocked_database_access.archive_transfers.call_args.args
+    assert batch_size == 2
+    assert (datetime.datetime.now(datetime.UTC) - updated_before
+            >= datetime.timedelta(seconds=86400))
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_archive_transfers_disabled(mocked_database_access, mocked_config):
+    _mock_archive_transfers_config(mocked_config, retention_age=0)
+
+    archived = TransferInteractor().archive_transfers()
+
+    assert archived == 0
+    mocked_database_access.archive_transfers.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_archive_transfers_error(mocked_database_access, mocked_config):
+    _mock_archive_transfers_config(mocked_config)
+    mocked_database_access.archive_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().archive_transfers()
+
+
+@pytest.mark.parametrize('archive_transfers_error', [False, True])
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.archive_transfers_task')
+@unittest.mock.patch.object(TransferInteractor, 'archive_transfers',
+                            return_value=5)
+def test_archive_transfers_task_correct(mocked_archive_transfers,
+                                        mocked_archive_transfers_task,
+                                        mocked_config,
+                                        archive_transfers_error):
+    _mock_archive_transfers_config(mocked_config)
+    if archive_transfers_error:
+        mocked_archive_transfers.side_effect = TransferInteractorError('')
+
+    result = archive_transfers_task()
+
+    assert result == (0 if archive_transfers_error else 5)
+    mocked_archive_transfers_task.apply_async.assert_called_once_with(
+        countdown=60)
+
+
+def _mock_recover_transfers_config(mocked_config, stale_age=3600, batch_size=2,
+                                   max_batches=3, max_rate=10, interval=600):
+    mocked_config_dict = {
+        'tasks': {
+            'recover_transfers': {
+                'stale_age': stale_age,
+                'batch_size': batch_size,
+                'max_batches': max_batches,
+                'max_rate': max_rate,
+                'interval': interval
+            }
+        }
+    }
+    mocked_config.__getitem__.side_effect = mocked_config_dict.__getitem__
+
+
+def _create_stale_transfer(internal_transfer_id, status, task_id, valid_until,
+                           internal_transaction_id):
+    return Transfer(
+        id=internal_transfer_id,
+        source_blockchain_id=Blockchain.ETHEREUM.value,
+        destination_blockchain_id=Blockchain.BNB_CHAIN.value,
+        sender_address='sender_address', recipient_address='recipient_address',
+        source_token_contract=TokenContract(address='source_token_address'),
+        destination_token_contract=TokenContract(
+            address='destination_token_address'), amount=100, fee=10,
+        sender_nonce=internal_transfer_id, signature='signature',
+        task_id=task_id, status_id=status.value, valid_until=valid_until,
+        internal_transaction_id=internal_transaction_id)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'confirm_transfer_task')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'execute_transfer_task')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'get_blockchain_config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_recover_transfers_correct(mocked_database_access, mocked_config,
+                                   mocked_get_blockchain_config,
+                                   mocked_execute_transfer_task,
+                                   mocked_confirm_transfer_task, uuid_):
+    _mock_recover_transfers_config(mocked_config)
+    mocked_get_blockchain_config.side_effect = lambda blockchain: {
+        'active': blockchain is Blockchain.ETHEREUM
+    }
+    internal_transaction_id = str(uuid.uuid4())
+    polling_internal_transaction_id = str(uuid.uuid4())
+    retrying_task_id = str(uuid.uuid4())
+    orphaned_task_id = str(uuid.uuid4())
+    mocked_database_access.claim_stale_transfers.side_effect = [
+        [
+            # Lost before its execution task ID has been stored
+            _create_stale_transfer(1, TransferStatus.ACCEPTED, None, 1000,
+                                   None),
+            # Lost confirmation task
+            _create_stale_transfer(2, TransferStatus.SUBMITTED,
+                                   orphaned_task_id, 1000,
+                                   internal_transaction_id)
+        ],
+        [
+            # Execution task still scheduled to be retried
+            _create_stale_transfer(3, TransferStatus.ACCEPTED,
+                                   retrying_task_id, 1000, None),
+            # Lost execution task
+            _create_stale_transfer(4,
+                                   TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED,
+                                   orphaned_task_id, 1000, None)
+        ],
+        [
+            # Accepted before the validity has been stored
+            _create_stale_transfer(5, TransferStatus.ACCEPTED,
+                                   orphaned_task_id, None, None),
+            # Confirmation task still scheduled to poll again
+            _create_stale_transfer(6, TransferStatus.SUBMITTED,
+                                   orphaned_task_id, 1000,
+                                   polling_internal_transaction_id)
+        ]
+    ]
+    mocked_execute_transfer_task.AsyncResult.side_effect = \
+        lambda task_id: unittest.mock.Mock(state=(
+            celery.states.RETRY
+            if task_id == retrying_task_id else celery.states.STARTED))
+    mocked_confirm_transfer_task.AsyncResult.side_effect = \
+        lambda task_id: unittest.mock.Mock(state=(
+            celery.states.RETRY if task_id == polling_internal_transaction_id
+            else celery.states.STARTED))
+    mocked_execute_transfer_task.apply_async().id = uuid_
+    mocked_execute_transfer_task.apply_async.reset_mock()
+
+    recovered = TransferInteractor().recover_transfers()
+
+    assert recovered == 3
+    assert mocked_database_access.claim_stale_transfers.call_count == 3
+    source_blockchain, updated_before, batch_size = \
+        mocked_database_access.claim_stale_transfers.call_args.args
+    assert source_blockchain is Blockchain.ETHEREUM
+    assert batch_size == 2
+    assert (datetime.datetime.now(datetime.UTC) - updated_before
+            >= datetime.timedelta(seconds=3600))
+    execute_transfer_arguments = ('sender_address', 'recipient_address',
+                                  'source_token_address',
+                                  'destination_token_address', 100, 10)
+    assert mocked_execute_transfer_task.apply_async.call_args_list == [
+        unittest.mock.call(
+            args=(1, Blockchain.ETHEREUM.value, Blockchain.BNB_CHAIN.value,
+                  *execute_transfer_arguments, 1, 1000, 'signature'),
+            task_id=None, countdown=0.0),
+        unittest.mock.call(
+            args=(4, Blockchain.ETHEREUM.value, Blockchain.BNB_CHAIN.value,
+                  *execute_transfer_arguments, 4, 1000, 'signature'),
+            task_id=orphaned_task_id, countdown=0.2)
+    ]
+    mocked_database_access.update_transfer_task_id.assert_called_once_with(
+        1, uuid.UUID(uuid_))
+    mocked_confirm_transfer_task.apply_async.assert_called_once_with(
+        args=(2, Blockchain.ETHEREUM.value, Blockchain.BNB_CHAIN.value,
+              internal_transaction_id), task_id=internal_transaction_id,
+        countdown=0.1)
+
+
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_recover_transfers_disabled(mocked_database_access, mocked_config):
+    _mock_recover_transfers_config(mocked_config, stale_age=0)
+
+    recovered = TransferInteractor().recover_transfers()
+
+    assert recovered == 0
+    mocked_database_access.claim_stale_transfers.assert_not_called()
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    'get_blockchain_config', return_value={'active': True})
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch('pantos.servicenode.business.transfers.'
+                     'database_access')
+def test_recover_transfers_error(mocked_database_access, mocked_config,
+                                 mocked_get_blockchain_config):
+    _mock_recover_transfers_config(mocked_config)
+    mocked_database_access.claim_stale_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        TransferInteractor().recover_transfers()
+
+
+@pytest.mark.parametrize('recover_transfers_error', [False, True])
+@unittest.mock.patch('pantos.servicenode.business.transfers.config')
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.recover_transfers_task')
+@unittest.mock.patch.object(TransferInteractor, 'recover_transfers',
+                            return_value=5)
+def test_recover_transfers_task_correct(mocked_recover_transfers,
+                                        mocked_recover_transfers_task,
+                                        mocked_config,
+                                        recover_transfers_error):
+    _mock_recover_transfers_config(mocked_config)
+    if recover_transfers_error:
+        mocked_recover_transfers.side_effect = TransferInteractorError('')
+
+    result = recover_transfers_task()
+
+    assert result == (0 if recover_transfers_error else 5)
+    mocked_recover_transfers_task.apply_async.assert_called_once_with(
+        countdown=600)
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    '_transfer_notification_listener_started', False)
+@unittest.mock.patch(
+    'pantos.servicenode.business.transfers.'
+    '_transfer_notification_subscribers', ())
+@unittest.mock.patch('pantos.servicenode.business.transfers.threading.Thread')
+def test_subscribe_to_transfer_notifications_correct(mocked_thread):
+    first_subscriber = unittest.mock.Mock()
+    second_subscriber = unittest.mock.Mock()
+
+    subscribe_to_transfer_notifications(first_subscriber)
+    subscribe_to_transfer_notifications(second_subscriber)
+    unsubscribe_from_transfer_notifications(first_subscriber)
+    _dispatch_transfer_notification(f'{uuid.UUID(int=1).hex}:'
+                                    f'{TransferStatus.CONFIRMED.value}')
+
+    # The listener thread is started only once per process
+    mocked_thread.assert_called_once()
+    mocked_thread().start.assert_called_once()
+    first_subscriber.assert_not_called()
+    second_subscriber.assert_called_once_with(uuid.UUID(int=1),
+                                              TransferStatus.CONFIRMED)
+
+
+def test_dispatch_transfer_notification_subscriber_error():
+    failing_subscriber = unittest.mock.Mock(side_effect=Exception)
+    subscriber = unittest.mock.Mock()
+
+    subscribers = (failing_subscriber, subscriber)
+
+    with unittest.mock.patch(
+            'pantos.servicenode.business.transfers.'
+            '_transfer_notification_subscribers', subscribers):
+        _dispatch_transfer_notification(f'{uuid.UUID(int=1).hex}:'
+                                        f'{TransferStatus.SUBMITTED.value}')
+
+    failing_subscriber.assert_called_once()
+    subscriber.assert_called_once_with(uuid.UUID(int=1),
+                                       TransferStatus.SUBMITTED)
+
+
+def test_dispatch_transfer_notification_invalid_payload():
+    subscriber = unittest.mock.Mock()
+
+    with unittest.mock.patch(
+            'pantos.servicenode.business.transfers.'
+            '_transfer_notification_subscribers', (subscriber, )):
+        _dispatch_transfer_notification('invalid')
+
+    subscriber.assert_not_called()
@@ -1,19 +1,33 @@
 """Shared fixtures for all pantos.servicenode.database package tests.
 
 """
+import asyncio
+import contextlib
+import inspect
+import types
+import unittest.mock
+
 import pytest
 import sqlalchemy  # type: ignore
+import sqlalchemy.ext.asyncio  # type: ignore
 import sqlalchemy.orm  # type: ignore
+import sqlalchemy.pool  # type: ignore
 from pantos.common.blockchains.enums import Blockchain
 
+from pantos.servicenode.database import access
+from pantos.servicenode.database import async_access
 from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import ArchivedTransfer
 from pantos.servicenode.database.models import Base
 from pantos.servicenode.database.models import Bid
+from pantos.servicenode.database.models import BidVersion
 from pantos.servicenode.database.models import Blockchain as Blockchain_
 from pantos.servicenode.database.models import ForwarderContract
 from pantos.servicenode.database.models import HubContract
+from pantos.servicenode.database.models import IdempotencyKey
 from pantos.servicenode.database.models import TokenContract
 from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.models import TransferStatistics
 from pantos.servicenode.database.models import \
     TransferStatus as TransferStatus_
 
@@ -47,6 +61,30 @@ def populate_transfer_database(session, source_blockchain_ids, statuses,
     return transfer_ids
 
 
+def create_embedded_database_models(sql_engine):
+    """Create the tables of all database models in an embedded
+    database.
+
+    """
+    transfers_table: sqlalchemy.sql.schema.Table = Base.metadata.tables[
+        'transfers']
+    for constraint in transfers_table.constraints:
+        if constraint.name == \
+                'uq_transfers_source_blockchain_id_nonce_status_id':
+            constraint.deferrable = None
+    Blockchain_.__table__.create(sql_engine)
+    TokenContract.__table__.create(sql_engine)
+    HubContract.__table__.create(sql_engine)
+    ForwarderContract.__table__.create(sql_engine)
+    Bid.__table__.create(sql_engine)
+    BidVersion.__table__.create(sql_engine)
+    TransferStatus_.__table__.create(sql_engine)
+    Transfer.__table__.create(sql_engine)
+    ArchivedTransfer.__table__.create(sql_engine)
+    TransferStatistics.__table__.create(sql_engine)
+    IdempotencyKey.__table__.create(sql_engine)
+
+
 def initialize_database_models(session):
     """Initialize the database models with appropriate values.
 
@@ -67,9 +105,13 @@ def tear_down_all_models(session):
     """Delete all rows in all tables.
 
     """
+    session.execute(sqlalchemy.delete(IdempotencyKey))
     session.execute(sqlalchemy.delete(Transfer))
+    session.execute(sqlalchemy.delete(ArchivedTransfer))
+    session.execute(sqlalchemy.delete(TransferStatistics))
     session.execute(sqlalchemy.delete(TransferStatus_))
     session.execute(sqlalchemy.delete(Bid))
+    session.execute(sqlalchemy.delete(BidVersion))
     session.execute(sqlalchemy.delete(ForwarderContract))
     session.execute(sqlalchemy.delete(HubContract))
     session.execute(sqlalchemy.delete(TokenContract))
@@ -78,6 +120,74 @@ def tear_down_all_models(session):
     session.commit()
 
 
+class DatabaseAccess:
+    """Calls the functions of either the access or the async_access
+    module, so that the same tests can be run for both modules. The
+    coroutines of the async_access module are run to completion.
+
+    Attributes
+    ----------
+    module : types.ModuleType
+        The access or async_access module.
+    session : sqlalchemy.orm.Session
+        An initialized (synchronous) session of the database accessed
+        by the module's functions, for preparing and checking the
+        database records.
+
+    """
+    def __init__(self, module: types.ModuleType,
+                 session: sqlalchemy.orm.Session):
+        self.module = module
+        self.session = session
+
+    def __getattr__(self, name):
+        function = getattr(self.module, name)
+        if not inspect.iscoroutinefunction(function):
+            return function
+        return lambda *args: asyncio.run(function(*args))
+
+
+@contextlib.contextmanager
+def access_database(module_name, session_maker, async_session_maker):
+    """Let the functions of the access or async_access module (by
+    name) access the database of the given (synchronous or asyncio)
+    session maker, without a read replica.
+
+    """
+    module: types.ModuleType
+    if module_name == 'access':
+        module = access
+        patches = [
+            unittest.mock.patch(
+                'pantos.servicenode.database.access.get_session_maker',
+                return_value=session_maker),
+            unittest.mock.patch(
+                'pantos.servicenode.database.access.get_session',
+                side_effect=session_maker),
+            unittest.mock.patch(
+                'pantos.servicenode.database.access.'
+                'get_replica_session_maker', return_value=None)
+        ]
+    else:
+        module = async_access
+        patches = [
+            unittest.mock.patch(
+                'pantos.servicenode.database.async_access.'
+                'get_async_session_maker', return_value=async_session_maker),
+            unittest.mock.patch(
+                'pantos.servicenode.database.async_access.'
+                'get_async_replica_session_maker', return_value=None)
+        ]
+    initialize_database_models(session_maker())
+    try:
+        with contextlib.ExitStack() as exit_stack:
+            for patch in patches:
+                exit_stack.enter_context(patch)
+            yield DatabaseAccess(module, session_maker())
+    finally:
+        tear_down_all_models(session_maker())
+
+
 @pytest.fixture(scope='session')
 def embedded_db_engine():
     """Provides the engine of an embedded database.
@@ -95,19 +205,7 @@ def embedded_db_session_maker(embedded_db_engine):
     with all the models created.
 
     """
-    transfers_table: sqlalchemy.sql.schema.Table = Base.metadata.tables[
-        'transfers']
-    for constraint in transfers_table.constraints:
-        if constraint.name == \
-                'uq_transfers_source_blockchain_id_nonce_status_id':
-            constraint.deferrable = None
-    Blockchain_.__table__.create(embedded_db_engine)
-    TokenContract.__table__.create(embedded_db_engine)
-    HubContract.__table__.create(embedded_db_engine)
-    ForwarderContract.__table__.create(embedded_db_engine)
-    Bid.__table__.create(embedded_db_engine)
-    TransferStatus_.__table__.create(embedded_db_engine)
-    Transfer.__table__.create(embedded_db_engine)
+    create_embedded_database_models(embedded_db_engine)
     return sqlalchemy.orm.sessionmaker(bind=embedded_db_engine)
 
 
@@ -147,6 +245,18 @@ def postgres_db_session_maker(postgres_db_engine):
     return sqlalchemy.orm.sessionmaker(bind=postgres_db_engine)
 
 
+@pytest.fixture(scope='session')
+def async_postgres_db_session_maker(postgres_db_engine,
+                                    postgres_db_session_maker):
+    """Provides an asyncio session maker of an postgres database,
+    with all the models created.
+
+    """
+    sql_engine = sqlalchemy.ext.asyncio.create_async_engine(
+        postgres_db_engine.url, poolclass=sqlalchemy.pool.NullPool)
+    return sqlalchemy.ext.asyncio.async_sessionmaker(bind=sql_engine)
+
+
 @pytest.fixture()
 def postgres_db_initialized_session(postgres_db_session_maker):
     """Provides a session maker of an postgres database,
@@ -156,3 +266,15 @@ def postgres_db_initialized_session(postgres_db_session_maker):
     initialize_database_models(postgres_db_session_maker())
     yield postgres_db_session_maker()
     tear_down_all_models(postgres_db_session_maker())
+
+
+@pytest.fixture(params=['access', 'async_access'])
+def postgres_database_access(request, postgres_db_session_maker,
+                             async_postgres_db_session_maker):
+    """Provides the functions of the access and (in a second run of the
+    test) the async_access module, accessing a postgres database.
+
+    """
+    with access_database(request.param, postgres_db_session_maker,
+                         async_postgres_db_session_maker) as database_access:
+        yield database_access
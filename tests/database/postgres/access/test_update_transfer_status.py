@@ -0,0 +1,51 @@
+import uuid
+
+import sqlalchemy
+import sqlalchemy.event
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.notifications import \
+    TRANSFERS_NOTIFICATION_CHANNEL
+from pantos.servicenode.database.notifications import \
+    parse_transfer_notification_payload
+from tests.database.conftest import populate_transfer_database
+
+
+def test_update_transfer_status_notified_correct(postgres_db_engine,
+                                                 postgres_database_access):
+    task_id = uuid.uuid4()
+    transfer_id = populate_transfer_database(postgres_database_access.session,
+                                             [Blockchain.ETHEREUM],
+                                             [TransferStatus.SUBMITTED],
+                                             [None])[0]
+    postgres_database_access.session.execute(
+        sqlalchemy.update(Transfer).where(Transfer.id == transfer_id).values(
+            task_id=str(task_id)))
+    postgres_database_access.session.commit()
+    statements = []
+
+    def before_cursor_execute(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    with postgres_db_engine.connect().execution_options(
+            isolation_level='AUTOCOMMIT') as connection:
+        connection.exec_driver_sql(f'LISTEN {TRANSFERS_NOTIFICATION_CHANNEL}')
+        sqlalchemy.event.listen(sqlalchemy.Engine, 'before_cursor_execute',
+                                before_cursor_execute)
+        try:
+            postgres_database_access.update_transfer_status(
+                transfer_id, TransferStatus.CONFIRMED)
+        finally:
+            sqlalchemy.event.remove(sqlalchemy.Engine, 'before_cursor_execute',
+                                    before_cursor_execute)
+
+        notifications = list(
+            connection.connection.driver_connection.notifies(
+                timeout=5.0, stop_after=1))
+    assert len(notifications) == 1
+    assert parse_transfer_notification_payload(
+        notifications[0].payload) == (task_id, TransferStatus.CONFIRMED)
+    # The notification is sent by the updating statement itself
+    assert len(statements) == 1
@@ -0,0 +1,111 @@
+import datetime
+import unittest.mock
+
+import sqlalchemy
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import archive_transfers
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import populate_transfer_database
+
+_NOW = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+def _populate_transfers(session, statuses, nonces, ages,
+                        statistics_rolled_up=True):
+    transfer_ids = populate_transfer_database(
+        session, [Blockchain.ETHEREUM.value] * len(statuses),
+        [status.value for status in statuses], nonces)
+    for transfer_id, status, age in zip(transfer_ids, statuses, ages):
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == transfer_id).values(
+                    created=_NOW - datetime.timedelta(days=age + 1),
+                    updated=_NOW - datetime.timedelta(days=age),
+                    statistics_status_id=status.value
+                    if statistics_rolled_up else None))
+    session.commit()
+    return transfer_ids
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_archive_transfers_correct(mocked_get_session_maker,
+                                   db_initialized_session,
+                                   embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(db_initialized_session, [
+        TransferStatus.CONFIRMED, TransferStatus.REVERTED,
+        TransferStatus.FAILED, TransferStatus.FAILED, TransferStatus.ACCEPTED,
+        TransferStatus.SUBMITTED, TransferStatus.CONFIRMED
+    ], [0, 1, None, 2, None, 3, 4], [10, 10, 10, 10, 10, 10, 0])
+
+    archived = archive_transfers(_NOW - datetime.timedelta(days=1), 10)
+
+    assert archived == 3
+    remaining_ids = db_initialized_session.execute(
+        sqlalchemy.select(Transfer.id).order_by(Transfer.id)).scalars().all()
+    assert remaining_ids == [transfer_ids[index] for index in (3, 4, 5, 6)]
+    archived_transfers = db_initialized_session.execute(
+        sqlalchemy.select(ArchivedTransfer).order_by(
+            ArchivedTransfer.id)).scalars().all()
+    assert [archived_transfer.id for archived_transfer in archived_transfers
+            ] == [transfer_ids[index] for index in (0, 1, 2)]
+    assert [
+        archived_transfer.status_id for archived_transfer in archived_transfers
+    ] == [
+        TransferStatus.CONFIRMED.value, TransferStatus.REVERTED.value,
+        TransferStatus.FAILED.value
+    ]
+    assert [
+        archived_transfer.nonce for archived_transfer in archived_transfers
+    ] == [0, 1, None]
+    assert all(archived_transfer.archived is not None
+               for archived_transfer in archived_transfers)
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_archive_transfers_batch_size_correct(mocked_get_session_maker,
+                                              db_initialized_session,
+                                              embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(db_initialized_session,
+                                       [TransferStatus.CONFIRMED] * 3,
+                                       [0, 1, 2], [10, 10, 10])
+
+    archived = archive_transfers(_NOW - datetime.timedelta(days=1), 2)
+
+    assert archived == 2
+    remaining_ids = db_initialized_session.execute(
+        sqlalchemy.select(Transfer.id)).scalars().all()
+    assert remaining_ids == [transfer_ids[2]]
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_archive_transfers_none_archivable(mocked_get_session_maker,
+                                           db_initialized_session,
+                                           embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    _populate_transfers(db_initialized_session, [TransferStatus.ACCEPTED],
+                        [None], [10])
+
+    archived = archive_transfers(_NOW - datetime.timedelta(days=1), 10)
+
+    assert archived == 0
+    assert db_initialized_session.execute(
+        sqlalchemy.select(sqlalchemy.func.count()).select_from(
+            ArchivedTransfer)).scalar_one() == 0
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_archive_transfers_statistics_not_rolled_up(mocked_get_session_maker,
+                                                    db_initialized_session,
+                                                    embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    _populate_transfers(db_initialized_session, [TransferStatus.CONFIRMED],
+                        [0], [10], statistics_rolled_up=False)
+
+    archived = archive_transfers(_NOW - datetime.timedelta(days=1), 10)
+
+    assert archived == 0
@@ -0,0 +1,102 @@
+import datetime
+import unittest.mock
+
+import sqlalchemy
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import claim_stale_transfers
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import populate_transfer_database
+
+_NOW = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+def _populate_transfers(session, source_blockchains, statuses, ages,
+                        updated=True):
+    transfer_ids = populate_transfer_database(
+        session, [blockchain.value for blockchain in source_blockchains],
+        [status.value for status in statuses], [None] * len(statuses))
+    for transfer_id, age in zip(transfer_ids, ages):
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == transfer_id).values(
+                    created=_NOW - datetime.timedelta(hours=age + 1),
+                    updated=_NOW -
+                    datetime.timedelta(hours=age) if updated else None))
+    session.commit()
+    return transfer_ids
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_stale_transfers_correct(mocked_get_session_maker,
+                                       db_initialized_session,
+                                       embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(db_initialized_session, [
+        Blockchain.ETHEREUM, Blockchain.ETHEREUM, Blockchain.ETHEREUM,
+        Blockchain.ETHEREUM, Blockchain.ETHEREUM, Blockchain.BNB_CHAIN
+    ], [
+        TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED,
+        TransferStatus.SUBMITTED, TransferStatus.CONFIRMED,
+        TransferStatus.ACCEPTED, TransferStatus.ACCEPTED
+    ], [10, 10, 10, 10, 0, 10])
+
+    transfers = claim_stale_transfers(Blockchain.ETHEREUM,
+                                      _NOW - datetime.timedelta(hours=1), 10)
+
+    assert [transfer.id for transfer in transfers] == transfer_ids[:3]
+    # The token contracts are loaded with the transfers
+    assert all(transfer.source_token_contract.address == ''
+               for transfer in transfers)
+    # Claimed transfers are not stale anymore
+    assert claim_stale_transfers(Blockchain.ETHEREUM,
+                                 _NOW - datetime.timedelta(hours=1), 10) == []
+    unclaimed_transfer = db_initialized_session.get(Transfer, transfer_ids[3])
+    assert unclaimed_transfer.updated.replace(
+        tzinfo=datetime.UTC) < _NOW - datetime.timedelta(hours=1)
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_stale_transfers_never_updated_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(
+        db_initialized_session, [Blockchain.ETHEREUM, Blockchain.ETHEREUM],
+        [TransferStatus.ACCEPTED, TransferStatus.ACCEPTED], [10, 0],
+        updated=False)
+
+    transfers = claim_stale_transfers(Blockchain.ETHEREUM,
+                                      _NOW - datetime.timedelta(hours=2), 10)
+
+    assert [transfer.id for transfer in transfers] == transfer_ids[:1]
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_stale_transfers_limit_correct(mocked_get_session_maker,
+                                             db_initialized_session,
+                                             embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(db_initialized_session,
+                                       [Blockchain.ETHEREUM] * 3,
+                                       [TransferStatus.ACCEPTED] * 3,
+                                       [10, 10, 10])
+
+    first_transfers = claim_stale_transfers(Blockchain.ETHEREUM,
+                                            _NOW - datetime.timedelta(hours=1),
+                                            2)
+    second_transfers = claim_stale_transfers(
+        Blockchain.ETHEREUM, _NOW - datetime.timedelta(hours=1), 2)
+
+    assert [transfer.id for transfer in first_transfers] == transfer_ids[:2]
+    assert [transfer.id for transfer in second_transfers] == transfer_ids[2:]
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_stale_transfers_no_transfers_correct(mocked_get_session_maker,
+                                                    db_initialized_session,
+                                                    embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+
+    assert claim_stale_transfers(Blockchain.ETHEREUM, _NOW, 10) == []
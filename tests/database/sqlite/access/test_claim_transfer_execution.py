@@ -0,0 +1,96 @@
+import datetime
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import claim_transfer_execution
+from pantos.servicenode.database.access import release_transfer_execution
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import populate_transfer_database
+
+_CLAIM_AGE = datetime.timedelta(hours=1)
+
+
+def _claimed_before():
+    return datetime.datetime.now(datetime.UTC) - _CLAIM_AGE
+
+
+@pytest.mark.parametrize(
+    'status',
+    [TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED])
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_transfer_execution_correct(mocked_get_session_maker,
+                                          db_initialized_session,
+                                          embedded_db_session_maker, status):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = populate_transfer_database(db_initialized_session,
+                                              [Blockchain.ETHEREUM.value],
+                                              [status.value], [None])
+
+    assert claim_transfer_execution(transfer_ids[0], _claimed_before())
+    # A claimed transfer cannot be claimed again by another task
+    assert not claim_transfer_execution(transfer_ids[0], _claimed_before())
+    transfer = db_initialized_session.get(Transfer, transfer_ids[0])
+    assert transfer.execution_claimed is not None
+    assert transfer.updated == transfer.execution_claimed
+
+
+@pytest.mark.parametrize('status', [
+    TransferStatus.SUBMITTED, TransferStatus.FAILED, TransferStatus.CONFIRMED
+])
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_transfer_execution_not_executable_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker, status):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = populate_transfer_database(db_initialized_session,
+                                              [Blockchain.ETHEREUM.value],
+                                              [status.value], [None])
+
+    assert not claim_transfer_execution(transfer_ids[0], _claimed_before())
+    assert db_initialized_session.get(
+        Transfer, transfer_ids[0]).execution_claimed is None
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_transfer_execution_abandoned_claim_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = populate_transfer_database(db_initialized_session,
+                                              [Blockchain.ETHEREUM.value],
+                                              [TransferStatus.ACCEPTED.value],
+                                              [None])
+    transfer = db_initialized_session.get(Transfer, transfer_ids[0])
+    transfer.execution_claimed = _claimed_before() - _CLAIM_AGE
+    db_initialized_session.commit()
+
+    assert claim_transfer_execution(transfer_ids[0], _claimed_before())
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_claim_transfer_execution_unknown_transfer_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+
+    assert not claim_transfer_execution(1, _claimed_before())
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_release_transfer_execution_correct(mocked_get_session_maker,
+                                            db_initialized_session,
+                                            embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = populate_transfer_database(db_initialized_session,
+                                              [Blockchain.ETHEREUM.value],
+                                              [TransferStatus.ACCEPTED.value],
+                                              [None])
+    assert claim_transfer_execution(transfer_ids[0], _claimed_before())
+
+    release_transfer_execution(transfer_ids[0])
+
+    # The retried task can claim the transfer again immediately
+    assert claim_transfer_execution(transfer_ids[0], _claimed_before())
@@ -0,0 +1,49 @@
+import unittest.mock
+import uuid
+
+import sqlalchemy
+
+from pantos.servicenode.database.access import create_idempotency_key
+from pantos.servicenode.database.models import IdempotencyKey
+
+_IDEMPOTENCY_KEY = 'a4d1c2e8-6d4b-4c55-9c4e-0e6a8b0f6d21'
+
+_REQUEST_HASH = 'request_hash'
+
+_OTHER_REQUEST_HASH = 'other_request_hash'
+
+_TASK_ID = uuid.UUID('17df868e-b120-4dd2-b551-85a0c78a86d6')
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_create_idempotency_key_correct(mocked_get_session_maker,
+                                        db_initialized_session,
+                                        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+
+    created = create_idempotency_key(_IDEMPOTENCY_KEY, _REQUEST_HASH, _TASK_ID)
+
+    assert created
+    idempotency_key = db_initialized_session.execute(
+        sqlalchemy.select(IdempotencyKey)).one()[0]
+    assert idempotency_key.key == _IDEMPOTENCY_KEY
+    assert idempotency_key.request_hash == _REQUEST_HASH
+    assert idempotency_key.task_id == str(_TASK_ID)
+    assert idempotency_key.created is not None
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_create_idempotency_key_already_existing(mocked_get_session_maker,
+                                                 db_initialized_session,
+                                                 embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    create_idempotency_key(_IDEMPOTENCY_KEY, _REQUEST_HASH, _TASK_ID)
+
+    created = create_idempotency_key(_IDEMPOTENCY_KEY, _OTHER_REQUEST_HASH,
+                                     uuid.uuid4())
+
+    assert not created
+    idempotency_key = db_initialized_session.execute(
+        sqlalchemy.select(IdempotencyKey)).one()[0]
+    assert idempotency_key.request_hash == _REQUEST_HASH
+    assert idempotency_key.task_id == str(_TASK_ID)
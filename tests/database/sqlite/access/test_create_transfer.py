@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import unittest.mock
 
@@ -6,10 +7,12 @@ import sqlalchemy
 import sqlalchemy.exc
 from pantos.common.blockchains.enums import Blockchain
 
+from pantos.servicenode.database import async_access
 from pantos.servicenode.database.access import create_transfer
 from pantos.servicenode.database.enums import TransferStatus
 from pantos.servicenode.database.exceptions import SenderNonceNotUniqueError
 from pantos.servicenode.database.models import UNIQUE_SENDER_NONCE_CONSTRAINT
+from pantos.servicenode.database.models import ArchivedTransfer
 from pantos.servicenode.database.models import Transfer
 
 
@@ -17,39 +20,35 @@ from pantos.servicenode.database.models import Transfer
 @pytest.mark.parametrize('hub_contract_existent', [True, False])
 @pytest.mark.parametrize('destination_token_contract_existent', [True, False])
 @pytest.mark.parametrize('source_token_contract_existent', [True, False])
-@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
 def test_create_transfer_correct(
-        mock_get_session_maker, source_token_contract_existent,
-        destination_token_contract_existent, hub_contract_existent,
-        forwarder_contract_existent, db_initialized_session,
-        embedded_db_session_maker, bid, source_token_contract,
-        destination_token_contract, hub_contract, forwarder_contract,
-        source_blockchain_id, destination_blockchain_id,
+        source_token_contract_existent, destination_token_contract_existent,
+        hub_contract_existent, forwarder_contract_existent, database_access,
+        bid, source_token_contract, destination_token_contract, hub_contract,
+        forwarder_contract, source_blockchain_id, destination_blockchain_id,
         transfer_sender_address, transfer_recipient_address,
         source_token_address, destination_token_address, transfer_amount,
-        bid_fee, transfer_sender_nonce, transfer_signature, hub_address,
-        forwarder_address):
-    mock_get_session_maker.return_value = embedded_db_session_maker
-    db_initialized_session.add(bid)
+        bid_fee, transfer_sender_nonce, transfer_signature,
+        transfer_valid_until, hub_address, forwarder_address):
+    database_access.session.add(bid)
     if source_token_contract_existent:
-        db_initialized_session.add(source_token_contract)
+        database_access.session.add(source_token_contract)
     if destination_token_contract_existent:
-        db_initialized_session.add(destination_token_contract)
+        database_access.session.add(destination_token_contract)
     if hub_contract_existent:
-        db_initialized_session.add(hub_contract)
+        database_access.session.add(hub_contract)
     if forwarder_contract_existent:
-        db_initialized_session.add(forwarder_contract)
-    db_initialized_session.commit()
+        database_access.session.add(forwarder_contract)
+    database_access.session.commit()
 
-    internal_transfer_id = create_transfer(
+    internal_transfer_id = database_access.create_transfer(
         Blockchain(source_blockchain_id),
         Blockchain(destination_blockchain_id), transfer_sender_address,
         transfer_recipient_address, source_token_address,
         destination_token_address, transfer_amount, bid_fee,
-        transfer_sender_nonce, transfer_signature, hub_address,
-        forwarder_address)
+        transfer_sender_nonce, transfer_signature, transfer_valid_until,
+        hub_address, forwarder_address)
 
-    transfer = db_initialized_session.execute(
+    transfer = database_access.session.execute(
         sqlalchemy.select(Transfer)).one_or_none()[0]
     assert transfer.id == internal_transfer_id
     assert (not source_token_contract_existent
@@ -65,46 +64,68 @@ def test_create_transfer_correct(
                     transfer_sender_address, transfer_recipient_address,
                     source_token_address, destination_token_address,
                     transfer_amount, transfer_sender_nonce, transfer_signature,
-                    hub_address, forwarder_address, bid.execution_time,
-                    bid.valid_until, bid.fee)
+                    transfer_valid_until, hub_address, forwarder_address,
+                    bid.execution_time, bid.valid_until, bid.fee)
+
+
+def test_create_transfer_created_correct(
+        database_access, bid, source_blockchain_id, destination_blockchain_id,
+        transfer_sender_address, transfer_recipient_address,
+        source_token_address, destination_token_address, transfer_amount,
+        bid_fee, transfer_sender_nonce, transfer_signature,
+        transfer_valid_until, hub_address, forwarder_address):
+    database_access.session.add(bid)
+    database_access.session.commit()
+    # The creation time must be determined for each transfer (and not
+    # only once when the models module is imported)
+    before = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+    internal_transfer_id = database_access.create_transfer(
+        Blockchain(source_blockchain_id),
+        Blockchain(destination_blockchain_id), transfer_sender_address,
+        transfer_recipient_address, source_token_address,
+        destination_token_address, transfer_amount, bid_fee,
+        transfer_sender_nonce, transfer_signature, transfer_valid_until,
+        hub_address, forwarder_address)
+
+    after = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    transfer = database_access.session.get(Transfer, internal_transfer_id)
+    assert before <= transfer.created.replace(tzinfo=None) <= after
 
 
 @unittest.mock.patch(
     'sqlalchemy.orm.session.Session.begin_nested',
     side_effect=sqlalchemy.exc.IntegrityError('', None, Exception()))
-@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
 def test_create_transfer_race_conditions_correct(
-        mock_get_session_maker, mock_begin_nested, db_initialized_session,
-        embedded_db_session_maker, bid, source_token_contract,
+        mock_begin_nested, database_access, bid, source_token_contract,
         destination_token_contract, hub_contract, forwarder_contract,
         source_blockchain_id, destination_blockchain_id,
         transfer_sender_address, transfer_recipient_address,
         source_token_address, destination_token_address, transfer_amount,
-        bid_fee, transfer_sender_nonce, transfer_signature, hub_address,
-        forwarder_address):
-    mock_get_session_maker.return_value = embedded_db_session_maker
-    db_initialized_session.add(bid)
-    db_initialized_session.add(source_token_contract)
-    db_initialized_session.add(destination_token_contract)
-    db_initialized_session.add(hub_contract)
-    db_initialized_session.add(forwarder_contract)
-    db_initialized_session.commit()
+        bid_fee, transfer_sender_nonce, transfer_signature,
+        transfer_valid_until, hub_address, forwarder_address):
+    database_access.session.add(bid)
+    database_access.session.add(source_token_contract)
+    database_access.session.add(destination_token_contract)
+    database_access.session.add(hub_contract)
+    database_access.session.add(forwarder_contract)
+    database_access.session.commit()
     read_id_return_values = [
         None, source_token_contract.id, None, destination_token_contract.id,
         None, hub_contract.id, None, forwarder_contract.id
     ]
 
-    with unittest.mock.patch('pantos.servicenode.database.access._read_id',
+    with unittest.mock.patch('pantos.servicenode.database.operations._read_id',
                              side_effect=read_id_return_values):
-        internal_transfer_id = create_transfer(
+        internal_transfer_id = database_access.create_transfer(
             Blockchain(source_blockchain_id),
             Blockchain(destination_blockchain_id), transfer_sender_address,
             transfer_recipient_address, source_token_address,
             destination_token_address, transfer_amount, bid_fee,
-            transfer_sender_nonce, transfer_signature, hub_address,
-            forwarder_address)
+            transfer_sender_nonce, transfer_signature, transfer_valid_until,
+            hub_address, forwarder_address)
 
-    transfer = db_initialized_session.execute(
+    transfer = database_access.session.execute(
         sqlalchemy.select(Transfer)).one_or_none()[0]
     assert transfer.id == internal_transfer_id
     assert transfer.source_token_contract_id == source_token_contract.id
@@ -116,8 +137,53 @@ def test_create_transfer_race_conditions_correct(
                     transfer_sender_address, transfer_recipient_address,
                     source_token_address, destination_token_address,
                     transfer_amount, transfer_sender_nonce, transfer_signature,
-                    hub_address, forwarder_address, bid.execution_time,
-                    bid.valid_until, bid.fee)
+                    transfer_valid_until, hub_address, forwarder_address,
+                    bid.execution_time, bid.valid_until, bid.fee)
+
+
+def test_create_transfer_archived_sender_nonce_error(
+        database_access, source_token_contract, destination_token_contract,
+        hub_contract, forwarder_contract, source_blockchain_id,
+        destination_blockchain_id, transfer_sender_address,
+        transfer_recipient_address, source_token_address,
+        destination_token_address, transfer_amount, bid_fee,
+        transfer_sender_nonce, transfer_signature, transfer_valid_until,
+        hub_address, forwarder_address):
+    database_access.session.add_all([
+        source_token_contract, destination_token_contract, hub_contract,
+        forwarder_contract
+    ])
+    database_access.session.flush()
+    now = datetime.datetime.now(datetime.UTC)
+    # Archived transfers are not covered by the unique sender nonce
+    # constraint of the transfers table
+    database_access.session.add(
+        ArchivedTransfer(
+            id=1, source_blockchain_id=source_blockchain_id,
+            destination_blockchain_id=destination_blockchain_id,
+            sender_address=transfer_sender_address,
+            recipient_address=transfer_recipient_address,
+            source_token_contract_id=source_token_contract.id,
+            destination_token_contract_id=destination_token_contract.id,
+            amount=transfer_amount, fee=bid_fee,
+            sender_nonce=transfer_sender_nonce, signature=transfer_signature,
+            hub_contract_id=hub_contract.id,
+            forwarder_contract_id=forwarder_contract.id,
+            status_id=TransferStatus.CONFIRMED.value, created=now, updated=now,
+            archived=now))
+    database_access.session.commit()
+
+    with pytest.raises(SenderNonceNotUniqueError):
+        database_access.create_transfer(
+            Blockchain(source_blockchain_id),
+            Blockchain(destination_blockchain_id), transfer_sender_address,
+            transfer_recipient_address, source_token_address,
+            destination_token_address, transfer_amount, bid_fee,
+            transfer_sender_nonce, transfer_signature, transfer_valid_until,
+            hub_address, forwarder_address)
+
+    assert database_access.session.execute(
+        sqlalchemy.select(Transfer)).one_or_none() is None
 
 
 @pytest.mark.parametrize(
@@ -133,8 +199,8 @@ def test_create_transfer_error(mock_get_session_maker, error,
                                transfer_recipient_address,
                                source_token_address, destination_token_address,
                                transfer_amount, bid_fee, transfer_sender_nonce,
-                               transfer_signature, hub_address,
-                               forwarder_address):
+                               transfer_signature, transfer_valid_until,
+                               hub_address, forwarder_address):
     mock_get_session_maker().begin().__enter__().execute.side_effect = error[0]
 
     with pytest.raises(error[1]):
@@ -143,15 +209,45 @@ def test_create_transfer_error(mock_get_session_maker, error,
                         transfer_sender_address, transfer_recipient_address,
                         source_token_address, destination_token_address,
                         transfer_amount, bid_fee, transfer_sender_nonce,
-                        transfer_signature, hub_address, forwarder_address)
+                        transfer_signature, transfer_valid_until, hub_address,
+                        forwarder_address)
+
+
+@pytest.mark.parametrize(
+    'error',
+    [(sqlalchemy.exc.IntegrityError(UNIQUE_SENDER_NONCE_CONSTRAINT, None,
+                                    Exception()), SenderNonceNotUniqueError),
+     (sqlalchemy.exc.IntegrityError(
+         '', None, Exception()), sqlalchemy.exc.IntegrityError)])
+@unittest.mock.patch(
+    'pantos.servicenode.database.async_access.get_async_session_maker')
+def test_create_transfer_async_error(
+        mock_get_async_session_maker, error, source_blockchain_id,
+        destination_blockchain_id, transfer_sender_address,
+        transfer_recipient_address, source_token_address,
+        destination_token_address, transfer_amount, bid_fee,
+        transfer_sender_nonce, transfer_signature, transfer_valid_until,
+        hub_address, forwarder_address):
+    mock_get_async_session_maker().begin().__aenter__.return_value.run_sync.\
+        side_effect = error[0]
+
+    with pytest.raises(error[1]):
+        asyncio.run(
+            async_access.create_transfer(
+                Blockchain(source_blockchain_id),
+                Blockchain(destination_blockchain_id), transfer_sender_address,
+                transfer_recipient_address, source_token_address,
+                destination_token_address, transfer_amount, bid_fee,
+                transfer_sender_nonce, transfer_signature,
+                transfer_valid_until, hub_address, forwarder_address))
 
 
 def _check_transfer(transfer, source_blockchain_id, destination_blockchain_id,
                     transfer_sender_address, transfer_recipient_address,
                     source_token_address, destination_token_address,
                     transfer_amount, transfer_sender_nonce, transfer_signature,
-                    hub_address, forwarder_address, bid_execution_time,
-                    bid_valid_until, bid_fee):
+                    transfer_valid_until, hub_address, forwarder_address,
+                    bid_execution_time, bid_valid_until, bid_fee):
     assert transfer.source_blockchain_id == source_blockchain_id
     assert transfer.destination_blockchain_id == destination_blockchain_id
     assert transfer.sender_address == transfer_sender_address
@@ -166,6 +262,7 @@ def _check_transfer(transfer, source_blockchain_id, destination_blockchain_id,
     assert transfer.amount == transfer_amount
     assert transfer.sender_nonce == transfer_sender_nonce
     assert transfer.signature == transfer_signature
+    assert transfer.valid_until == transfer_valid_until
     assert transfer.hub_contract.blockchain_id == source_blockchain_id
     assert transfer.hub_contract.address == hub_address
     assert transfer.forwarder_contract.blockchain_id == source_blockchain_id
@@ -174,6 +271,7 @@ def _check_transfer(transfer, source_blockchain_id, destination_blockchain_id,
     assert transfer.on_chain_transfer_id is None
     assert transfer.transaction_id is None
     assert transfer.nonce is None
+    assert transfer.internal_transaction_id is None
     assert transfer.status_id == TransferStatus.ACCEPTED.value
     assert transfer.created < datetime.datetime.utcnow()
     assert transfer.updated is None
@@ -0,0 +1,30 @@
+import datetime
+import unittest.mock
+
+import sqlalchemy
+
+from pantos.servicenode.database.access import delete_idempotency_keys
+from pantos.servicenode.database.models import IdempotencyKey
+
+_NOW = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+_TASK_ID = '17df868e-b120-4dd2-b551-85a0c78a86d6'
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_delete_idempotency_keys_correct(mocked_get_session_maker,
+                                         db_initialized_session,
+                                         embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    for key, age in (('expired', 2), ('unexpired', 0)):
+        db_initialized_session.add(
+            IdempotencyKey(key=key, request_hash='', task_id=_TASK_ID,
+                           created=_NOW - datetime.timedelta(days=age)))
+    db_initialized_session.commit()
+
+    deleted = delete_idempotency_keys(_NOW - datetime.timedelta(days=1))
+
+    assert deleted == 1
+    keys = db_initialized_session.execute(sqlalchemy.select(
+        IdempotencyKey.key)).scalars().all()
+    assert keys == ['unexpired']
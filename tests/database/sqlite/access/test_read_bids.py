@@ -1,9 +1,4 @@
-import unittest.mock
-
-from pantos.common.blockchains.enums import Blockchain
-
-from pantos.servicenode.database.access import create_bid
-from pantos.servicenode.database.access import read_bids
+from pantos.servicenode.database.models import Bid
 
 _SOURCE_BLOCKCHAIN_ID = 0
 
@@ -18,20 +13,21 @@ _DOUBLE_FEE = 10**8 * 2
 _BID_VALID_UNTIL = 1000
 
 
-@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
-@unittest.mock.patch('pantos.servicenode.database.access.get_session')
-def test_read_bids_correct(mocked_session, mocked_session_maker,
-                           db_initialized_session, embedded_db_session_maker):
-    mocked_session.side_effect = embedded_db_session_maker
-    mocked_session_maker.return_value = embedded_db_session_maker
-    create_bid(Blockchain(_SOURCE_BLOCKCHAIN_ID),
-               Blockchain(_DESTINATION_BLOCKCHAIN_ID), _EXECUTION_TIME,
-               _BID_VALID_UNTIL, _FEE)
-    create_bid(Blockchain(_SOURCE_BLOCKCHAIN_ID),
-               Blockchain(_DESTINATION_BLOCKCHAIN_ID), _EXECUTION_TIME * 2,
-               _BID_VALID_UNTIL, _DOUBLE_FEE)
+def test_read_bids_correct(database_access):
+    database_access.session.add_all([
+        Bid(source_blockchain_id=_SOURCE_BLOCKCHAIN_ID,
+            destination_blockchain_id=_DESTINATION_BLOCKCHAIN_ID,
+            execution_time=_EXECUTION_TIME, valid_until=_BID_VALID_UNTIL,
+            fee=_FEE),
+        Bid(source_blockchain_id=_SOURCE_BLOCKCHAIN_ID,
+            destination_blockchain_id=_DESTINATION_BLOCKCHAIN_ID,
+            execution_time=_EXECUTION_TIME * 2, valid_until=_BID_VALID_UNTIL,
+            fee=_DOUBLE_FEE)
+    ])
+    database_access.session.commit()
 
-    bids = read_bids(_SOURCE_BLOCKCHAIN_ID, _DESTINATION_BLOCKCHAIN_ID)
+    bids = database_access.read_bids(_SOURCE_BLOCKCHAIN_ID,
+                                     _DESTINATION_BLOCKCHAIN_ID)
 
     assert bids[0].fee == _FEE
     assert bids[0].destination_blockchain_id == _DESTINATION_BLOCKCHAIN_ID
@@ -42,18 +38,16 @@ def test_read_bids_correct(mocked_session, mocked_session_maker,
     assert bids[1].execution_time == _EXECUTION_TIME * 2
 
 
-@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
-@unittest.mock.patch('pantos.servicenode.database.access.get_session')
-def test_read_bids_non_existent_correct(mocked_session, mocked_session_maker,
-                                        db_initialized_session,
-                                        embedded_db_session_maker):
-    mocked_session.side_effect = embedded_db_session_maker
-    mocked_session_maker.return_value = embedded_db_session_maker
-    create_bid(Blockchain(_SOURCE_BLOCKCHAIN_ID),
-               Blockchain(_DESTINATION_BLOCKCHAIN_ID), _EXECUTION_TIME,
-               _BID_VALID_UNTIL, _DOUBLE_FEE)
+def test_read_bids_non_existent_correct(database_access):
+    database_access.session.add(
+        Bid(source_blockchain_id=_SOURCE_BLOCKCHAIN_ID,
+            destination_blockchain_id=_DESTINATION_BLOCKCHAIN_ID,
+            execution_time=_EXECUTION_TIME, valid_until=_BID_VALID_UNTIL,
+            fee=_DOUBLE_FEE))
+    database_access.session.commit()
 
     # the chain ids have been switched
-    bids = read_bids(_DESTINATION_BLOCKCHAIN_ID, _SOURCE_BLOCKCHAIN_ID)
+    bids = database_access.read_bids(_DESTINATION_BLOCKCHAIN_ID,
+                                     _SOURCE_BLOCKCHAIN_ID)
 
     assert len(bids) == 0
@@ -0,0 +1,44 @@
+import unittest.mock
+
+from pantos.servicenode.database.access import read_bids_snapshot
+from pantos.servicenode.database.access import replace_bids
+
+_SOURCE_BLOCKCHAIN_ID = 0
+
+_DESTINATION_BLOCKCHAIN_IDS = [1, 3]
+
+_BIDS = [{
+    'source_blockchain_id': _SOURCE_BLOCKCHAIN_ID,
+    'destination_blockchain_id': destination_blockchain_id,
+    'fee': 10**8,
+    'execution_time': 600,
+    'valid_until': 1000
+} for destination_blockchain_id in _DESTINATION_BLOCKCHAIN_IDS]
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_bids_snapshot_correct(mocked_session, mocked_session_maker,
+                                    db_initialized_session,
+                                    embedded_db_session_maker):
+    mocked_session.side_effect = embedded_db_session_maker
+    mocked_session_maker.return_value = embedded_db_session_maker
+    replace_bids(_SOURCE_BLOCKCHAIN_ID,
+                 {bid['destination_blockchain_id']: [bid]
+                  for bid in _BIDS})
+
+    version, bids = read_bids_snapshot()
+
+    assert version == 1
+    assert len(bids) == len(_DESTINATION_BLOCKCHAIN_IDS)
+    assert {bid.destination_blockchain_id
+            for bid in bids} == set(_DESTINATION_BLOCKCHAIN_IDS)
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_bids_snapshot_empty_correct(mocked_session,
+                                          db_initialized_session,
+                                          embedded_db_session_maker):
+    mocked_session.side_effect = embedded_db_session_maker
+
+    assert read_bids_snapshot() == (0, [])
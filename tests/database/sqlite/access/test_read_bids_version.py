@@ -0,0 +1,32 @@
+import unittest.mock
+
+import sqlalchemy
+
+from pantos.servicenode.database.access import read_bids_version
+from pantos.servicenode.database.models import BidVersion
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_bids_version_correct(mocked_session, db_initialized_session,
+                                   embedded_db_session_maker):
+    mocked_session.side_effect = embedded_db_session_maker
+    db_initialized_session.execute(
+        sqlalchemy.insert(BidVersion).values([{
+            'source_blockchain_id': 0,
+            'version': 3
+        }, {
+            'source_blockchain_id': 1,
+            'version': 4
+        }]))
+    db_initialized_session.commit()
+
+    assert read_bids_version() == 7
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_bids_version_no_bids_correct(mocked_session,
+                                           db_initialized_session,
+                                           embedded_db_session_maker):
+    mocked_session.side_effect = embedded_db_session_maker
+
+    assert read_bids_version() == 0
@@ -0,0 +1,61 @@
+import datetime
+import unittest.mock
+
+from pantos.servicenode.database.access import read_idempotency_key
+from pantos.servicenode.database.models import IdempotencyKey
+
+_IDEMPOTENCY_KEY = 'a4d1c2e8-6d4b-4c55-9c4e-0e6a8b0f6d21'
+
+_REQUEST_HASH = 'request_hash'
+
+_TASK_ID = '17df868e-b120-4dd2-b551-85a0c78a86d6'
+
+_NOW = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_idempotency_key_correct(mocked_get_session,
+                                      db_initialized_session,
+                                      embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+    db_initialized_session.add(
+        IdempotencyKey(key=_IDEMPOTENCY_KEY, request_hash=_REQUEST_HASH,
+                       task_id=_TASK_ID, created=_NOW))
+    db_initialized_session.commit()
+
+    idempotency_key = read_idempotency_key(_IDEMPOTENCY_KEY,
+                                           _NOW - datetime.timedelta(days=1))
+
+    assert idempotency_key is not None
+    assert idempotency_key.key == _IDEMPOTENCY_KEY
+    assert idempotency_key.request_hash == _REQUEST_HASH
+    assert idempotency_key.task_id == _TASK_ID
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_idempotency_key_not_found(mocked_get_session,
+                                        db_initialized_session,
+                                        embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+
+    idempotency_key = read_idempotency_key(_IDEMPOTENCY_KEY,
+                                           _NOW - datetime.timedelta(days=1))
+
+    assert idempotency_key is None
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_idempotency_key_expired(mocked_get_session,
+                                      db_initialized_session,
+                                      embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+    db_initialized_session.add(
+        IdempotencyKey(key=_IDEMPOTENCY_KEY, request_hash=_REQUEST_HASH,
+                       task_id=_TASK_ID,
+                       created=_NOW - datetime.timedelta(days=2)))
+    db_initialized_session.commit()
+
+    idempotency_key = read_idempotency_key(_IDEMPOTENCY_KEY,
+                                           _NOW - datetime.timedelta(days=1))
+
+    assert idempotency_key is None
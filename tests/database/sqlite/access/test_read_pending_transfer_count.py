@@ -0,0 +1,39 @@
+import unittest.mock
+
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import read_pending_transfer_count
+from pantos.servicenode.database.enums import TransferStatus
+from tests.database.conftest import populate_transfer_database
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_pending_transfer_count_correct(mocked_get_session,
+                                             db_initialized_session,
+                                             embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+    populate_transfer_database(db_initialized_session, [
+        Blockchain.ETHEREUM.value, Blockchain.ETHEREUM.value,
+        Blockchain.ETHEREUM.value, Blockchain.ETHEREUM.value,
+        Blockchain.BNB_CHAIN.value
+    ], [
+        TransferStatus.ACCEPTED.value,
+        TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value,
+        TransferStatus.SUBMITTED.value, TransferStatus.CONFIRMED.value,
+        TransferStatus.ACCEPTED.value
+    ], [None, 1, 2, 3, None])
+
+    pending_transfer_count = read_pending_transfer_count(Blockchain.ETHEREUM)
+
+    assert pending_transfer_count == 2
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_pending_transfer_count_no_transfers(mocked_get_session,
+                                                  db_initialized_session,
+                                                  embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+
+    pending_transfer_count = read_pending_transfer_count(Blockchain.ETHEREUM)
+
+    assert pending_transfer_count == 0
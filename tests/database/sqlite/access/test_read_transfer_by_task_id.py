@@ -1,21 +1,22 @@
+import datetime
 import unittest.mock
 import uuid
 
-from pantos.servicenode.database.access import read_transfer_by_task_id
+import pytest
+import sqlalchemy
 
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Transfer
 
-@unittest.mock.patch('pantos.servicenode.database.access.get_session')
-def test_read_transfer_by_task_id_correct(mocked_session,
-                                          db_initialized_session,
-                                          embedded_db_session_maker, transfer):
-    mocked_session.side_effect = embedded_db_session_maker
-    db_initialized_session.add(transfer)
-    db_initialized_session.commit()
+
+def test_read_transfer_by_task_id_correct(database_access, transfer):
+    database_access.session.add(transfer)
+    database_access.session.commit()
     task_id_uuid = uuid.UUID(transfer.task_id)
     result_attributes = {}
     transfer_attributes = {}
 
-    result = read_transfer_by_task_id(task_id_uuid)
+    result = database_access.read_transfer_by_task_id(task_id_uuid)
 
     assert result is not None
     for column in result.__table__.columns:
@@ -23,14 +24,130 @@ def test_read_transfer_by_task_id_correct(mocked_session,
         transfer_attributes[column.name] = str(getattr(transfer, column.name))
     assert result.__table__ == transfer.__table__
     assert result_attributes == transfer_attributes
+    assert (result.source_token_contract.address ==
+            transfer.source_token_contract.address)
 
 
-@unittest.mock.patch('pantos.servicenode.database.access.get_session')
-def test_read_transfer_by_task_id_not_found(mocked_session,
-                                            embedded_db_session_maker):
-    mocked_session.side_effect = embedded_db_session_maker
+def test_read_transfer_by_task_id_not_found(database_access):
     task_id = uuid.uuid4()
 
-    result = read_transfer_by_task_id(task_id)
+    result = database_access.read_transfer_by_task_id(task_id)
 
     assert result is None
+
+
+def test_read_transfer_by_task_id_archived(database_access, transfer):
+    database_access.session.add(transfer)
+    database_access.session.commit()
+    transfer_id = transfer.id
+    task_id_uuid = uuid.UUID(transfer.task_id)
+    source_token_address = transfer.source_token_contract.address
+    transfer_columns = [
+        column.name for column in ArchivedTransfer.__table__.columns
+        if column.name != 'archived'
+    ]
+    database_access.session.execute(
+        sqlalchemy.insert(ArchivedTransfer).from_select(
+            transfer_columns + ['archived'],
+            sqlalchemy.select(
+                *[getattr(Transfer, column) for column in transfer_columns],
+                sqlalchemy.literal(datetime.datetime.now(datetime.UTC)))))
+    database_access.session.execute(sqlalchemy.delete(Transfer))
+    database_access.session.commit()
+
+    result = database_access.read_transfer_by_task_id(task_id_uuid)
+
+    assert isinstance(result, ArchivedTransfer)
+    assert result.id == transfer_id
+    assert result.source_token_contract.address == source_token_address
+
+
+@pytest.mark.parametrize('database_access', ['access'], indirect=True)
+@unittest.mock.patch(
+    'pantos.servicenode.database.access.get_replica_session_maker')
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_transfer_by_task_id_replica(mocked_session,
+                                          mocked_get_replica_session_maker,
+                                          database_access,
+                                          embedded_db_session_maker, transfer):
+    mocked_get_replica_session_maker.return_value = embedded_db_session_maker
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    result = database_access.read_transfer_by_task_id(
+        uuid.UUID(transfer.task_id))
+
+    assert result is not None
+    assert result.id == transfer.id
+    mocked_session.assert_not_called()
+
+
+@pytest.mark.parametrize('database_access', ['access'], indirect=True)
+@unittest.mock.patch(
+    'pantos.servicenode.database.access.get_replica_session_maker')
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_transfer_by_task_id_not_yet_replicated(
+        mocked_session, mocked_get_replica_session_maker, database_access,
+        embedded_db_session_maker, transfer):
+    mocked_replica_session = unittest.mock.MagicMock()
+    mocked_replica_session.__enter__().execute().scalar_one_or_none.\
+        return_value = None
+    mocked_get_replica_session_maker.return_value.return_value = \
+        mocked_replica_session
+    mocked_session.side_effect = embedded_db_session_maker
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    result = database_access.read_transfer_by_task_id(
+        uuid.UUID(transfer.task_id))
+
+    assert result is not None
+    assert result.id == transfer.id
+    mocked_session.assert_called_once()
+
+
+@pytest.mark.parametrize('database_access', ['async_access'], indirect=True)
+@unittest.mock.patch(
+    'pantos.servicenode.database.async_access.get_async_replica_session_maker')
+@unittest.mock.patch(
+    'pantos.servicenode.database.async_access.get_async_session_maker')
+def test_read_transfer_by_task_id_async_replica(
+        mocked_get_async_session_maker, mocked_get_async_replica_session_maker,
+        database_access, async_embedded_db_session_maker, transfer):
+    mocked_get_async_replica_session_maker.return_value = \
+        async_embedded_db_session_maker
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    result = database_access.read_transfer_by_task_id(
+        uuid.UUID(transfer.task_id))
+
+    assert result is not None
+    assert result.id == transfer.id
+    mocked_get_async_session_maker.assert_not_called()
+
+
+@pytest.mark.parametrize('database_access', ['async_access'], indirect=True)
+@unittest.mock.patch(
+    'pantos.servicenode.database.async_access.get_async_replica_session_maker')
+@unittest.mock.patch(
+    'pantos.servicenode.database.async_access.get_async_session_maker')
+def test_read_transfer_by_task_id_async_not_yet_replicated(
+        mocked_get_async_session_maker, mocked_get_async_replica_session_maker,
+        database_access, async_embedded_db_session_maker, transfer):
+    mocked_replica_session = unittest.mock.MagicMock()
+    mocked_replica_session.__aenter__.return_value.run_sync = \
+        unittest.mock.AsyncMock(return_value=None)
+    mocked_get_async_replica_session_maker.return_value.return_value = \
+        mocked_replica_session
+    mocked_get_async_session_maker.return_value = \
+        async_embedded_db_session_maker
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    result = database_access.read_transfer_by_task_id(
+        uuid.UUID(transfer.task_id))
+
+    assert result is not None
+    assert result.id == transfer.id
+    mocked_get_async_session_maker.assert_called_once()
@@ -0,0 +1,99 @@
+import datetime
+import unittest.mock
+import uuid
+
+import pytest
+import sqlalchemy
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import read_transfer_exports
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import ArchivedTransfer
+from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import populate_transfer_database
+
+_NOW = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+_SOURCE_BLOCKCHAINS = [
+    Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, Blockchain.ETHEREUM,
+    Blockchain.ETHEREUM, Blockchain.ETHEREUM
+]
+
+_AGES = [3, 2, 1, 0, 0]
+
+
+@pytest.fixture
+def transfer_ids(db_initialized_session):
+    transfer_ids = populate_transfer_database(
+        db_initialized_session,
+        [blockchain.value for blockchain in _SOURCE_BLOCKCHAINS],
+        [TransferStatus.CONFIRMED.value] * len(_SOURCE_BLOCKCHAINS),
+        [None] * len(_SOURCE_BLOCKCHAINS))
+    for index, (transfer_id, age) in enumerate(zip(transfer_ids, _AGES)):
+        # The last transfer has no task ID yet
+        db_initialized_session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == transfer_id).values(
+                    created=_NOW - datetime.timedelta(days=age),
+                    task_id=None if index == len(_AGES) -
+                    1 else str(uuid.uuid4())))
+    # The first transfer has been archived
+    transfer_columns = [
+        column.name for column in ArchivedTransfer.__table__.columns
+        if column.name != 'archived'
+    ]
+    db_initialized_session.execute(
+        sqlalchemy.insert(ArchivedTransfer).from_select(
+            transfer_columns + ['archived'],
+            sqlalchemy.select(
+                *[getattr(Transfer, column) for column in transfer_columns],
+                sqlalchemy.literal(_NOW)).filter(
+                    Transfer.id == transfer_ids[0])))
+    db_initialized_session.execute(
+        sqlalchemy.delete(Transfer).filter(Transfer.id == transfer_ids[0]))
+    db_initialized_session.commit()
+    return transfer_ids
+
+
+@pytest.mark.parametrize(
+    'created_from,created_until,source_blockchain,expected_indexes',
+    [(None, None, None, [0, 1, 2, 3]),
+     (_NOW - datetime.timedelta(days=2), None, None, [1, 2, 3]),
+     (None, _NOW - datetime.timedelta(days=1), None, [0, 1]),
+     (None, None, Blockchain.ETHEREUM, [0, 2, 3]),
+     (_NOW, None, Blockchain.BNB_CHAIN, [])])
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_transfer_exports_correct(mocked_get_session, created_from,
+                                       created_until, source_blockchain,
+                                       expected_indexes,
+                                       embedded_db_session_maker,
+                                       transfer_ids):
+    mocked_get_session.side_effect = embedded_db_session_maker
+
+    rows = list(
+        read_transfer_exports(created_from, created_until, source_blockchain,
+                              None, 2))
+
+    assert [row.id for row in rows
+            ] == [transfer_ids[index] for index in expected_indexes]
+    for row in rows:
+        assert row.source_token_address == ''
+        assert row.hub_address == ''
+        assert row.forwarder_address == ''
+        assert row.status_id == TransferStatus.CONFIRMED.value
+
+
+@pytest.mark.parametrize('destination_blockchain,expected_indexes',
+                         [(Blockchain.ETHEREUM, [0, 1, 2, 3]),
+                          (Blockchain.BNB_CHAIN, [])])
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_transfer_exports_destination_blockchain_correct(
+        mocked_get_session, destination_blockchain, expected_indexes,
+        embedded_db_session_maker, transfer_ids):
+    mocked_get_session.side_effect = embedded_db_session_maker
+
+    rows = list(
+        read_transfer_exports(None, None, None, destination_blockchain, 10))
+
+    assert [row.id for row in rows
+            ] == [transfer_ids[index] for index in expected_indexes]
@@ -0,0 +1,79 @@
+import datetime
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import read_transfer_statistics
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import TokenContract
+from pantos.servicenode.database.models import TransferStatistics
+
+_HOUR = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+_TOKEN_ADDRESS = 'token_address'
+
+_STATISTICS = [
+    # hour offset, source blockchain, destination blockchain, status,
+    # transfer count
+    (0, Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, TransferStatus.CONFIRMED, 2
+     ),
+    (0, Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, TransferStatus.ACCEPTED, 0),
+    (1, Blockchain.BNB_CHAIN, Blockchain.ETHEREUM, TransferStatus.ACCEPTED, 1),
+    (2, Blockchain.ETHEREUM, Blockchain.ETHEREUM, TransferStatus.FAILED, 3)
+]
+
+
+@pytest.fixture(autouse=True)
+def populate_statistics(db_initialized_session):
+    for blockchain in (Blockchain.ETHEREUM, Blockchain.BNB_CHAIN):
+        db_initialized_session.add(
+            TokenContract(id=blockchain.value + 1,
+                          blockchain_id=blockchain.value,
+                          address=_TOKEN_ADDRESS))
+    db_initialized_session.flush()
+    for (hour_offset, source_blockchain, destination_blockchain, status,
+         transfer_count) in _STATISTICS:
+        db_initialized_session.add(
+            TransferStatistics(
+                hour=_HOUR + datetime.timedelta(hours=hour_offset),
+                source_blockchain_id=source_blockchain.value,
+                destination_blockchain_id=destination_blockchain.value,
+                source_token_contract_id=source_blockchain.value + 1,
+                status_id=status.value, transfer_count=transfer_count,
+                amount=100 * transfer_count, fee=transfer_count))
+    db_initialized_session.commit()
+
+
+@pytest.mark.parametrize(
+    'hour_from,hour_until,source_blockchain,destination_blockchain,'
+    'expected_indexes',
+    [(None, None, None, None, [0, 2, 3]),
+     (_HOUR + datetime.timedelta(hours=1), None, None, None, [2, 3]),
+     (None, _HOUR + datetime.timedelta(hours=2), None, None, [0, 2]),
+     (None, None, Blockchain.ETHEREUM, None, [0, 3]),
+     (None, None, None, Blockchain.ETHEREUM, [2, 3]),
+     (None, None, Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, [0]),
+     (_HOUR, _HOUR, None, None, [])])
+@unittest.mock.patch('pantos.servicenode.database.access.get_session')
+def test_read_transfer_statistics_correct(mocked_get_session, hour_from,
+                                          hour_until, source_blockchain,
+                                          destination_blockchain,
+                                          expected_indexes,
+                                          embedded_db_session_maker):
+    mocked_get_session.side_effect = embedded_db_session_maker
+
+    rows = read_transfer_statistics(hour_from, hour_until, source_blockchain,
+                                    destination_blockchain)
+
+    assert [(row.hour.replace(tzinfo=datetime.UTC), row.source_blockchain_id,
+             row.destination_blockchain_id, row.status_id, row.transfer_count)
+            for row in rows
+            ] == [(_HOUR + datetime.timedelta(hours=_STATISTICS[index][0]),
+                   _STATISTICS[index][1].value, _STATISTICS[index][2].value,
+                   _STATISTICS[index][3].value, _STATISTICS[index][4])
+                  for index in expected_indexes]
+    for row in rows:
+        assert row.source_token_address == _TOKEN_ADDRESS
+        assert int(row.amount) == 100 * row.transfer_count
+        assert int(row.fee) == row.transfer_count
@@ -0,0 +1,75 @@
+import uuid
+
+import pytest
+import sqlalchemy
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import populate_transfer_database
+
+_SENDER_ADDRESSES = ['sender_1', 'sender_2', 'sender_1', 'sender_1', None]
+
+_STATUSES = [
+    TransferStatus.ACCEPTED, TransferStatus.CONFIRMED,
+    TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED, TransferStatus.CONFIRMED,
+    TransferStatus.ACCEPTED
+]
+
+
+@pytest.fixture
+def transfer_ids(database_access):
+    transfer_ids = populate_transfer_database(
+        database_access.session, [Blockchain.ETHEREUM.value] * len(_STATUSES),
+        [status.value for status in _STATUSES], [None] * len(_STATUSES))
+    for transfer_id, sender_address in zip(transfer_ids, _SENDER_ADDRESSES):
+        # Transfers without a sender address have no task ID yet
+        database_access.session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == transfer_id).values(
+                    sender_address=sender_address or '', task_id=None
+                    if sender_address is None else str(uuid.uuid4())))
+    database_access.session.commit()
+    return transfer_ids
+
+
+@pytest.mark.parametrize(
+    'sender_address,statuses,expected_indexes',
+    [(None, None, [0, 1, 2, 3]), ('sender_1', None, [0, 2, 3]),
+     (None, [TransferStatus.CONFIRMED], [1, 3]),
+     ('sender_1', [
+         TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED
+     ], [0, 2]), ('sender_3', None, []), (None, [], [])])
+def test_read_transfers_correct(sender_address, statuses, expected_indexes,
+                                database_access, transfer_ids):
+
+    transfers = database_access.read_transfers(sender_address, statuses, None,
+                                               10)
+
+    assert [transfer.id for transfer in transfers
+            ] == [transfer_ids[index] for index in expected_indexes]
+
+
+def test_read_transfers_paginated_correct(database_access, transfer_ids):
+
+    first_page = database_access.read_transfers('sender_1', None, None, 2)
+    second_page = database_access.read_transfers('sender_1', None,
+                                                 transfer_ids[2], 2)
+
+    assert [transfer.id
+            for transfer in first_page] == [transfer_ids[0], transfer_ids[2]]
+    assert [transfer.id for transfer in second_page] == [transfer_ids[3]]
+    assert second_page[0].source_token_contract.address == ''
+
+
+def test_read_transfers_paginated_statuses_correct(database_access,
+                                                   transfer_ids):
+    statuses = [TransferStatus.CONFIRMED, TransferStatus.ACCEPTED]
+
+    first_page = database_access.read_transfers(None, statuses, None, 2)
+    second_page = database_access.read_transfers(None, statuses,
+                                                 transfer_ids[1], 2)
+
+    assert [transfer.id
+            for transfer in first_page] == [transfer_ids[0], transfer_ids[1]]
+    assert [transfer.id for transfer in second_page] == [transfer_ids[3]]
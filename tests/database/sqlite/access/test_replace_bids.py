@@ -1,12 +1,14 @@
 import unittest.mock
 
 import sqlalchemy
+import sqlalchemy.event
 import sqlalchemy.exc
 from pantos.common.blockchains.enums import Blockchain
 
 from pantos.servicenode.database.access import create_bid
 from pantos.servicenode.database.access import replace_bids
 from pantos.servicenode.database.models import Bid
+from pantos.servicenode.database.models import BidVersion
 
 _SOURCE_BLOCKCHAIN_ID = 0
 
@@ -24,13 +26,17 @@ _TRIPLE_FEE = _FEE * 3
 
 _BID_VALID_UNTIL = 1000
 
-_NEW_BID = [{
-    'source_blockchain_id': _SOURCE_BLOCKCHAIN_ID,
-    'destination_blockchain_id': _DESTINATION_BLOCKCHAIN_ID,
-    'fee': _TRIPLE_FEE,
-    'execution_time': _EXECUTION_TIME * 3,
-    'valid_until': _BID_VALID_UNTIL * 3
-}]
+_THIRD_DESTINATION_BLOCKCHAIN_ID = 4
+
+
+def _bid(destination_blockchain_id, execution_time, valid_until, fee):
+    return {
+        'source_blockchain_id': _SOURCE_BLOCKCHAIN_ID,
+        'destination_blockchain_id': destination_blockchain_id,
+        'fee': fee,
+        'execution_time': execution_time,
+        'valid_until': valid_until
+    }
 
 
 def create_bids():
@@ -56,12 +62,89 @@ def test_replace_bids_correct(mocked_session, db_initialized_session,
     assert bid[0][0].fee == _FEE
     assert bid[1][0].fee == _FEE * 2
 
-    replace_bids(Blockchain(_SOURCE_BLOCKCHAIN_ID),
-                 Blockchain(_DESTINATION_BLOCKCHAIN_ID), _NEW_BID)
+    replace_bids(
+        _SOURCE_BLOCKCHAIN_ID, {
+            _DESTINATION_BLOCKCHAIN_ID: [
+                _bid(_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME,
+                     _BID_VALID_UNTIL * 3, _TRIPLE_FEE),
+                _bid(_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME * 3,
+                     _BID_VALID_UNTIL, _FEE)
+            ],
+            _THIRD_DESTINATION_BLOCKCHAIN_ID: [
+                _bid(_THIRD_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME,
+                     _BID_VALID_UNTIL, _FEE)
+            ]
+        })
+
+    db_initialized_session.expire_all()
+    bids = {
+        (bid.destination_blockchain_id, bid.execution_time): (bid.valid_until,
+                                                              bid.fee)
+        for bid in db_initialized_session.execute(sqlalchemy.select(
+            Bid)).scalars()
+    }
+    assert bids == {
+        # Updated
+        (_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME): (_BID_VALID_UNTIL * 3,
+                                                        _TRIPLE_FEE),
+        # Inserted
+        (_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME * 3): (_BID_VALID_UNTIL,
+                                                            _FEE),
+        (_THIRD_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME): (_BID_VALID_UNTIL,
+                                                              _FEE),
+        # Unchanged (destination blockchain not replaced)
+        (_ANOTHER_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME * 2): (
+            _BID_VALID_UNTIL, _DOUBLE_FEE)
+    }
+    assert db_initialized_session.execute(
+        sqlalchemy.select(BidVersion.version).filter_by(
+            source_blockchain_id=_SOURCE_BLOCKCHAIN_ID)).scalar_one() == 1
 
-    bid = db_initialized_session.execute(sqlalchemy.select(Bid)).all()
-    assert len(bid) == 2
-    assert bid[0][0].destination_blockchain_id == \
-        _ANOTHER_DESTINATION_BLOCKCHAIN_ID
-    assert bid[1][0].destination_blockchain_id == _DESTINATION_BLOCKCHAIN_ID
-    assert bid[1][0].fee == _TRIPLE_FEE
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_replace_bids_unchanged_bids_not_updated(mocked_session,
+                                                 db_initialized_session,
+                                                 embedded_db_session_maker):
+    mocked_session.return_value = embedded_db_session_maker
+    create_bids()
+    updated_rows = []
+
+    def count_updated_rows(connection, cursor, statement, parameters, context,
+                           executemany):
+        if statement.startswith('INSERT INTO bids'):
+            updated_rows.append(cursor.rowcount)
+
+    engine = embedded_db_session_maker.kw['bind']
+    sqlalchemy.event.listen(engine, 'after_cursor_execute', count_updated_rows)
+    try:
+        replace_bids(
+            _SOURCE_BLOCKCHAIN_ID, {
+                _DESTINATION_BLOCKCHAIN_ID: [
+                    _bid(_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME,
+                         _BID_VALID_UNTIL, _FEE),
+                    _bid(_DESTINATION_BLOCKCHAIN_ID, _EXECUTION_TIME * 2,
+                         _BID_VALID_UNTIL, _DOUBLE_FEE)
+                ]
+            })
+    finally:
+        sqlalchemy.event.remove(engine, 'after_cursor_execute',
+                                count_updated_rows)
+
+    assert updated_rows == [0]
+    assert len(db_initialized_session.execute(
+        sqlalchemy.select(Bid)).all()) == 3
+    assert db_initialized_session.execute(sqlalchemy.select(
+        BidVersion.version)).scalar_one_or_none() is None
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_replace_bids_all_bids_removed(mocked_session, db_initialized_session,
+                                       embedded_db_session_maker):
+    mocked_session.return_value = embedded_db_session_maker
+    create_bids()
+
+    replace_bids(_SOURCE_BLOCKCHAIN_ID, {_DESTINATION_BLOCKCHAIN_ID: []})
+
+    bids = db_initialized_session.execute(sqlalchemy.select(Bid)).scalars()
+    assert [bid.destination_blockchain_id
+            for bid in bids] == [_ANOTHER_DESTINATION_BLOCKCHAIN_ID]
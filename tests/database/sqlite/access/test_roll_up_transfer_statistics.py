@@ -0,0 +1,124 @@
+import datetime
+import unittest.mock
+
+import sqlalchemy
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.database.access import roll_up_transfer_statistics
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.models import Transfer
+from pantos.servicenode.database.models import TransferStatistics
+from tests.database.conftest import populate_transfer_database
+
+_HOUR = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+def _populate_transfers(session, statuses, minutes):
+    transfer_ids = populate_transfer_database(
+        session, [Blockchain.ETHEREUM.value] * len(statuses),
+        [status.value for status in statuses], [None] * len(statuses))
+    for index, (transfer_id, minute) in enumerate(zip(transfer_ids, minutes)):
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == transfer_id).values(
+                    created=_HOUR + datetime.timedelta(minutes=minute),
+                    amount=10 * (index + 1), fee=index + 1))
+    session.commit()
+    return transfer_ids
+
+
+def _read_statistics(session):
+    return {
+        (statistics.hour.replace(tzinfo=datetime.UTC), statistics.status_id): (
+            statistics.transfer_count, int(statistics.amount),
+            int(statistics.fee))
+        for statistics in session.execute(sqlalchemy.select(
+            TransferStatistics)).scalars()
+    }
+
+
+def _update_status(session, transfer_id, status):
+    session.execute(
+        sqlalchemy.update(Transfer).where(Transfer.id == transfer_id).values(
+            status_id=status.value))
+    session.commit()
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_roll_up_transfer_statistics_new_transfers_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    _populate_transfers(db_initialized_session, [
+        TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED,
+        TransferStatus.CONFIRMED, TransferStatus.ACCEPTED
+    ], [0, 59, 30, 60])
+
+    rolled_up = roll_up_transfer_statistics(10)
+
+    assert rolled_up == 4
+    next_hour = _HOUR + datetime.timedelta(hours=1)
+    assert _read_statistics(db_initialized_session) == {
+        (_HOUR, TransferStatus.ACCEPTED.value): (2, 30, 3),
+        (_HOUR, TransferStatus.CONFIRMED.value): (1, 30, 3),
+        (next_hour, TransferStatus.ACCEPTED.value): (1, 40, 4)
+    }
+    assert roll_up_transfer_statistics(10) == 0
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_roll_up_transfer_statistics_status_changes_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    transfer_ids = _populate_transfers(
+        db_initialized_session,
+        [TransferStatus.ACCEPTED, TransferStatus.ACCEPTED], [0, 1])
+    roll_up_transfer_statistics(10)
+    _update_status(db_initialized_session, transfer_ids[0],
+                   TransferStatus.SUBMITTED)
+    _update_status(db_initialized_session, transfer_ids[1],
+                   TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED)
+
+    rolled_up = roll_up_transfer_statistics(10)
+
+    assert rolled_up == 2
+    assert _read_statistics(db_initialized_session) == {
+        (_HOUR, TransferStatus.ACCEPTED.value): (1, 20, 2),
+        (_HOUR, TransferStatus.SUBMITTED.value): (1, 10, 1)
+    }
+    statistics_status_ids = db_initialized_session.execute(
+        sqlalchemy.select(Transfer.statistics_status_id).order_by(
+            Transfer.id)).scalars().all()
+    assert statistics_status_ids == [
+        TransferStatus.SUBMITTED.value,
+        TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED.value
+    ]
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_roll_up_transfer_statistics_batch_size_correct(
+        mocked_get_session_maker, db_initialized_session,
+        embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+    _populate_transfers(db_initialized_session, [TransferStatus.ACCEPTED] * 3,
+                        [0, 1, 2])
+
+    assert roll_up_transfer_statistics(2) == 2
+    assert _read_statistics(db_initialized_session) == {
+        (_HOUR, TransferStatus.ACCEPTED.value): (2, 30, 3)
+    }
+    assert roll_up_transfer_statistics(2) == 1
+    assert _read_statistics(db_initialized_session) == {
+        (_HOUR, TransferStatus.ACCEPTED.value): (3, 60, 6)
+    }
+
+
+@unittest.mock.patch('pantos.servicenode.database.access.get_session_maker')
+def test_roll_up_transfer_statistics_no_transfers(mocked_get_session_maker,
+                                                  db_initialized_session,
+                                                  embedded_db_session_maker):
+    mocked_get_session_maker.return_value = embedded_db_session_maker
+
+    assert roll_up_transfer_statistics(10) == 0
+    assert _read_statistics(db_initialized_session) == {}
@@ -0,0 +1,63 @@
+import uuid
+
+import pytest
+
+from pantos.servicenode.database.access import TransferUpdate
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.exceptions import DatabaseError
+
+
+def test_update_transfer_correct(database_access, transfer):
+    transfer.nonce = 5
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    database_access.update_transfer(
+        TransferUpdate(transfer.id, status=TransferStatus.CONFIRMED,
+                       transaction_id='new_transaction_id',
+                       on_chain_transfer_id=12345))
+
+    database_access.session.refresh(transfer)
+    assert transfer.status_id == TransferStatus.CONFIRMED.value
+    assert transfer.transaction_id == 'new_transaction_id'
+    assert transfer.on_chain_transfer_id == 12345
+    assert transfer.nonce == 5
+    assert transfer.updated is not None
+
+
+def test_update_transfer_submitted_correct(database_access, transfer):
+    database_access.session.add(transfer)
+    database_access.session.commit()
+    internal_transaction_id = uuid.uuid4()
+
+    database_access.update_transfer(
+        TransferUpdate(transfer.id, status=TransferStatus.SUBMITTED,
+                       internal_transaction_id=internal_transaction_id))
+
+    database_access.session.refresh(transfer)
+    assert transfer.status_id == TransferStatus.SUBMITTED.value
+    assert transfer.internal_transaction_id == str(internal_transaction_id)
+    assert transfer.updated is not None
+
+
+def test_update_transfer_failed_correct(database_access, transfer,
+                                        transfer_transaction_id):
+    transfer.nonce = 5
+    database_access.session.add(transfer)
+    database_access.session.commit()
+
+    database_access.update_transfer(
+        TransferUpdate(transfer.id, status=TransferStatus.FAILED,
+                       reset_nonce=True))
+
+    database_access.session.refresh(transfer)
+    assert transfer.status_id == TransferStatus.FAILED.value
+    assert transfer.nonce is None
+    assert transfer.sender_nonce is None
+    assert transfer.transaction_id == transfer_transaction_id
+
+
+def test_update_transfer_database_error(database_access, transfer):
+    with pytest.raises(DatabaseError):
+        database_access.update_transfer(
+            TransferUpdate(transfer.id, status=TransferStatus.CONFIRMED))
@@ -1,4 +1,8 @@
 import pytest
+import sqlalchemy  # type: ignore
+import sqlalchemy.ext.asyncio  # type: ignore
+import sqlalchemy.orm  # type: ignore
+import sqlalchemy.pool  # type: ignore
 from pantos.common.blockchains.enums import Blockchain
 
 from pantos.servicenode.database.enums import TransferStatus
@@ -7,6 +11,8 @@ from pantos.servicenode.database.models import ForwarderContract
 from pantos.servicenode.database.models import HubContract
 from pantos.servicenode.database.models import TokenContract
 from pantos.servicenode.database.models import Transfer
+from tests.database.conftest import access_database
+from tests.database.conftest import create_embedded_database_models
 
 _BID_EXECUTION_TIME = 1200
 
@@ -46,9 +52,64 @@ _TRANSFER_TASK_ID = '17df868e-b120-4dd2-b551-85a0c78a86d6'
 
 _TRANSFER_TRANSACTION_ID = 'transaction_hash'
 
+_TRANSFER_VALID_UNTIL = 1400
+
 _UUID = '64814d84-e4fb-11ed-b5ea-0242ac120002'
 
 
+@pytest.fixture(scope='session')
+def embedded_file_db_path(tmp_path_factory):
+    """Provides the path of an embedded database file, which (unlike an
+    in-memory database) can be shared by a synchronous and an asyncio
+    engine.
+
+    """
+    return tmp_path_factory.mktemp('database') / 'service-node.db'
+
+
+@pytest.fixture(scope='session')
+def embedded_file_db_session_maker(embedded_file_db_path):
+    """Provides a session maker of an embedded database file, with all
+    the models created.
+
+    """
+    sql_engine = sqlalchemy.create_engine(f'sqlite:///{embedded_file_db_path}')
+    create_embedded_database_models(sql_engine)
+    return sqlalchemy.orm.sessionmaker(bind=sql_engine)
+
+
+@pytest.fixture(scope='session')
+def async_embedded_db_session_maker(embedded_file_db_path,
+                                    embedded_file_db_session_maker):
+    """Provides an asyncio session maker of the embedded database file.
+
+    """
+    # Pooled connections must not outlive the event loop of a test
+    sql_engine = sqlalchemy.ext.asyncio.create_async_engine(
+        f'sqlite+aiosqlite:///{embedded_file_db_path}',
+        poolclass=sqlalchemy.pool.NullPool)
+    return sqlalchemy.ext.asyncio.async_sessionmaker(bind=sql_engine)
+
+
+@pytest.fixture(params=['access', 'async_access'])
+def database_access(request, embedded_db_session_maker):
+    """Provides the functions of the access and (in a second run of the
+    test) the async_access module, accessing an embedded database.
+
+    """
+    if request.param == 'access':
+        session_maker = embedded_db_session_maker
+        async_session_maker = None
+    else:
+        session_maker = request.getfixturevalue(
+            'embedded_file_db_session_maker')
+        async_session_maker = request.getfixturevalue(
+            'async_embedded_db_session_maker')
+    with access_database(request.param, session_maker,
+                         async_session_maker) as database_access:
+        yield database_access
+
+
 @pytest.fixture
 def bid(source_blockchain_id, destination_blockchain_id, bid_execution_time,
         bid_valid_until, bid_fee):
@@ -199,6 +260,11 @@ def transfer_transaction_id():
     return _TRANSFER_TRANSACTION_ID
 
 
+@pytest.fixture(scope='module')
+def transfer_valid_until():
+    return _TRANSFER_VALID_UNTIL
+
+
 @pytest.fixture(scope='module')
 def uuid_():
     return _UUID
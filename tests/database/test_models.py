@@ -0,0 +1,39 @@
+import pytest
+
+from pantos.servicenode.database.models import BlockchainAddressType
+
+_CHECKSUM_ADDRESS = '0x52908400098527886E0F7030069857D2E4169EE7'
+
+
+@pytest.mark.parametrize('address,expected_length,expected_address',
+                         [(_CHECKSUM_ADDRESS, 21, _CHECKSUM_ADDRESS),
+                          (_CHECKSUM_ADDRESS.lower(), 21, _CHECKSUM_ADDRESS),
+                          ('So11111111111111111111111111111111111111112', 44,
+                           'So11111111111111111111111111111111111111112'),
+                          ('0x1234', 7, '0x1234'), ('', 1, '')])
+def test_blockchain_address_type_round_trip(address, expected_length,
+                                            expected_address):
+    address_type = BlockchainAddressType()
+
+    encoded_address = address_type.process_bind_param(address, None)
+    decoded_address = address_type.process_result_value(encoded_address, None)
+
+    assert encoded_address is not None
+    assert len(encoded_address) == expected_length
+    assert decoded_address == expected_address
+
+
+def test_blockchain_address_type_none():
+    address_type = BlockchainAddressType()
+
+    assert address_type.process_bind_param(None, None) is None
+    assert address_type.process_result_value(None, None) is None
+
+
+def test_blockchain_address_type_evm_addresses_equal():
+    address_type = BlockchainAddressType()
+
+    assert (address_type.process_bind_param(
+        _CHECKSUM_ADDRESS,
+        None) == address_type.process_bind_param(_CHECKSUM_ADDRESS.lower(),
+                                                 None))
@@ -0,0 +1,145 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.database.exceptions import DatabaseError
+from pantos.servicenode.database.notifications import NotificationListener
+from pantos.servicenode.database.notifications import \
+    create_transfer_notification_payload
+from pantos.servicenode.database.notifications import \
+    parse_transfer_notification_payload
+
+_CHANNEL = 'channel'
+
+_TASK_ID = uuid.uuid4().hex
+
+_TIMEOUT = 5.0
+
+
+@pytest.fixture
+def mocked_create_engine():
+    with unittest.mock.patch(
+            'pantos.servicenode.database.notifications.sqlalchemy.'
+            'create_engine') as mocked_create_engine:
+        mocked_create_engine().dialect.name = 'postgresql'
+        yield mocked_create_engine
+
+
+@pytest.fixture
+def mocked_connection(mocked_create_engine):
+    return mocked_create_engine().connect().execution_options()
+
+
+@pytest.mark.parametrize('notifications',
+                         [[], [unittest.mock.Mock(payload='payload')]])
+@unittest.mock.patch('pantos.servicenode.database.notifications.'
+                     'get_direct_url')
+def test_wait_correct(mocked_get_direct_url, notifications, mocked_connection):
+    driver_connection = mocked_connection.connection.driver_connection
+    driver_connection.notifies.return_value = iter(notifications)
+    listener = NotificationListener(_CHANNEL)
+
+    notified = listener.wait(_TIMEOUT)
+
+    assert notified == (len(notifications) > 0)
+    mocked_connection.exec_driver_sql.assert_called_once_with(
+        f'LISTEN {_CHANNEL}')
+    driver_connection.notifies.assert_called_once_with(timeout=_TIMEOUT,
+                                                       stop_after=1)
+
+
+@unittest.mock.patch('pantos.servicenode.database.notifications.time.sleep')
+@unittest.mock.patch('pantos.servicenode.database.notifications.'
+                     'get_direct_url')
+def test_wait_not_postgresql_correct(mocked_get_direct_url, mocked_sleep,
+                                     mocked_create_engine):
+    mocked_create_engine().dialect.name = 'sqlite'
+    listener = NotificationListener(_CHANNEL)
+
+    notified = listener.wait(_TIMEOUT)
+
+    assert not notified
+    mocked_sleep.assert_called_once_with(_TIMEOUT)
+    mocked_create_engine().connect.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.database.notifications.'
+                     'get_direct_url')
+def test_wait_database_error(mocked_get_direct_url, mocked_connection):
+    driver_connection = mocked_connection.connection.driver_connection
+    driver_connection.notifies.side_effect = Exception
+    listener = NotificationListener(_CHANNEL)
+
+    with pytest.raises(DatabaseError):
+        listener.wait(_TIMEOUT)
+
+    mocked_connection.close.assert_called_once()
+    # The connection is reestablished with the next call
+    driver_connection.notifies.side_effect = None
+    driver_connection.notifies.return_value = iter([])
+    assert not listener.wait(_TIMEOUT)
+    assert mocked_connection.exec_driver_sql.call_count == 2
+
+
+@unittest.mock.patch('pantos.servicenode.database.notifications.'
+                     'get_direct_url')
+def test_receive_correct(mocked_get_direct_url, mocked_connection):
+    driver_connection = mocked_connection.connection.driver_connection
+    driver_connection.notifies.return_value = iter([
+        unittest.mock.Mock(payload='first'),
+        unittest.mock.Mock(payload='second')
+    ])
+    listener = NotificationListener(_CHANNEL)
+
+    payloads = listener.receive(_TIMEOUT)
+
+    assert payloads == ['first', 'second']
+    driver_connection.notifies.assert_called_once_with(timeout=_TIMEOUT,
+                                                       stop_after=1)
+
+
+@unittest.mock.patch('pantos.servicenode.database.notifications.time.sleep')
+@unittest.mock.patch('pantos.servicenode.database.notifications.'
+                     'get_direct_url')
+def test_receive_not_postgresql_correct(mocked_get_direct_url, mocked_sleep,
+                                        mocked_create_engine):
+    mocked_create_engine().dialect.name = 'sqlite'
+    listener = NotificationListener(_CHANNEL)
+
+    payloads = listener.receive(_TIMEOUT)
+
+    assert payloads == []
+    mocked_sleep.assert_called_once_with(_TIMEOUT)
+
+
+@pytest.mark.parametrize('status', list(TransferStatus))
+def test_transfer_notification_payload_correct(status):
+    task_id = uuid.uuid4()
+
+    payload = create_transfer_notification_payload(task_id, status)
+
+    assert len(payload) < 64
+    assert parse_transfer_notification_payload(payload) == (task_id, status)
+
+
+@pytest.mark.parametrize('payload', ['', 'abc', 'abc:1', f'{_TASK_ID}:x'])
+def test_parse_transfer_notification_payload_error(payload):
+    with pytest.raises(ValueError):
+        parse_transfer_notification_payload(payload)
+
+
+@unittest.mock.patch('pantos.servicenode.database.notifications.time.sleep')
+@unittest.mock.patch(
+    'pantos.servicenode.database.notifications.'
+    'get_direct_url', return_value=None)
+def test_receive_no_direct_url_correct(mocked_get_direct_url, mocked_sleep,
+                                       mocked_create_engine):
+    listener = NotificationListener(_CHANNEL)
+
+    payloads = listener.receive(_TIMEOUT)
+
+    assert payloads == []
+    mocked_sleep.assert_called_once_with(_TIMEOUT)
+    mocked_create_engine().connect.assert_not_called()
@@ -0,0 +1,53 @@
+import pytest
+import sqlalchemy  # type: ignore
+import sqlalchemy.exc  # type: ignore
+
+from pantos.servicenode.database.pools import CHECKOUT_WAIT_TIME_BUCKETS
+from pantos.servicenode.database.pools import MeteredQueuePool
+from pantos.servicenode.database.pools import PoolMetrics
+
+
+def test_pool_metrics_saturation_correct():
+    pool_metrics = PoolMetrics(2, 2, 3, 0, 0, 0.0,
+                               (0, ) * len(CHECKOUT_WAIT_TIME_BUCKETS))
+
+    assert pool_metrics.saturation == 0.75
+
+
+def test_metered_queue_pool_correct():
+    sql_engine = sqlalchemy.create_engine('sqlite://',
+                                          poolclass=MeteredQueuePool,
+                                          pool_size=1, max_overflow=1)
+    assert isinstance(sql_engine.pool, MeteredQueuePool)
+
+    with sql_engine.connect(), sql_engine.connect():
+        pool_metrics = sql_engine.pool.get_metrics()
+        assert pool_metrics.checked_out == 2
+        assert pool_metrics.saturation == 1.0
+    sql_engine.dispose()
+    assert isinstance(sql_engine.pool, MeteredQueuePool)
+    pool_metrics = sql_engine.pool.get_metrics()
+
+    assert pool_metrics.pool_size == 1
+    assert pool_metrics.max_overflow == 1
+    assert pool_metrics.checked_out == 0
+    assert pool_metrics.checkouts == 2
+    assert pool_metrics.checkout_timeouts == 0
+    assert pool_metrics.checkout_wait_time > 0
+    assert pool_metrics.checkout_wait_time_buckets[-1] == 2
+
+
+def test_metered_queue_pool_timeout_correct():
+    sql_engine = sqlalchemy.create_engine('sqlite://',
+                                          poolclass=MeteredQueuePool,
+                                          pool_size=1, max_overflow=0,
+                                          pool_timeout=0.01)
+    assert isinstance(sql_engine.pool, MeteredQueuePool)
+
+    with sql_engine.connect():
+        with pytest.raises(sqlalchemy.exc.TimeoutError):
+            sql_engine.connect()
+    pool_metrics = sql_engine.pool.get_metrics()
+
+    assert pool_metrics.checkouts == 1
+    assert pool_metrics.checkout_timeouts == 1
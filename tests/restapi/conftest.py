@@ -1,10 +1,13 @@
 import time
+import unittest.mock
 
 import pytest
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.entities import ServiceNodeBid
 
+from pantos.servicenode.business.ratelimits import RateLimitInteractor
 from pantos.servicenode.business.transfers import TransferInteractor
+from pantos.servicenode.cache import LruCache
 from pantos.servicenode.database.enums import TransferStatus
 from pantos.servicenode.restapi import flask_app
 
@@ -65,6 +68,42 @@ _BIDS = [{
 _BID_VALID_UNTIL = time.time() * 2
 
 
+@pytest.fixture(autouse=True)
+def mocked_consume_tokens():
+    """Disable the rate limits of the REST endpoints.
+
+    """
+    with unittest.mock.patch.object(RateLimitInteractor,
+                                    'consume_tokens') as mocked_consume_tokens:
+        yield mocked_consume_tokens
+
+
+@pytest.fixture(autouse=True)
+def valid_addresses():
+    """Provide an empty valid address cache for each test.
+
+    """
+    valid_addresses: LruCache = LruCache(10)
+    with unittest.mock.patch('pantos.servicenode.restapi._valid_addresses',
+                             valid_addresses):
+        yield valid_addresses
+
+
+@pytest.fixture(autouse=True)
+def transfer_status_response_caches():
+    """Provide empty transfer status response caches for each test.
+
+    """
+    terminal_response_cache: LruCache = LruCache(10)
+    response_cache: LruCache = LruCache(10, time_to_live=60)
+    with unittest.mock.patch(
+            'pantos.servicenode.restapi._terminal_transfer_status_responses',
+            terminal_response_cache), unittest.mock.patch(
+                'pantos.servicenode.restapi._transfer_status_responses',
+                response_cache):
+        yield terminal_response_cache, response_cache
+
+
 @pytest.fixture()
 def test_client():
     """Flask test client, used for calling REST endpoints.
@@ -3,6 +3,8 @@ import unittest.mock
 
 import pytest
 
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
 from pantos.servicenode.restapi import BidInteractor
 from pantos.servicenode.restapi import _BidsSchema
 
@@ -72,3 +74,18 @@ def test_transfer_exception(mocked_load, mocked_internal_server_error,
 
     mocked_internal_server_error.assert_called_once_with()
     assert response.status_code == 500
+
+
+def test_bids_rate_limit_exceeded(mocked_consume_tokens, test_client):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=1)
+
+    with unittest.mock.patch.object(
+            BidInteractor, 'get_current_bids') as mocked_get_current_bids:
+        response = test_client.get(
+            '/bids?source_blockchain=1&destination_blockchain=3')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
+    mocked_consume_tokens.assert_called_once_with('bids', ['ip:127.0.0.1'])
+    mocked_get_current_bids.assert_not_called()
@@ -0,0 +1,49 @@
+import os
+import unittest.mock
+
+from pantos.servicenode.database.pools import PoolMetrics
+from pantos.servicenode.database.pools import ProcessRole
+
+
+@unittest.mock.patch('pantos.servicenode.restapi.get_process_role',
+                     return_value=ProcessRole.WEB)
+@unittest.mock.patch('pantos.servicenode.restapi.get_pool_metrics')
+def test_metrics_correct(mocked_get_pool_metrics, mocked_get_process_role,
+                         test_client):
+    mocked_get_pool_metrics.return_value = {
+        'primary': PoolMetrics(20, 50, 7, 100, 2, 1.5,
+                               (90, 95, 96, 97, 98, 99, 100, 100, 100, 100))
+    }
+    labels = f'role="web",pid="{os.getpid()}",engine="primary"'
+
+    response = test_client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    lines = response.text.splitlines()
+    assert ('# TYPE pantos_service_node_database_pool_saturation gauge'
+            in lines)
+    assert (f'pantos_service_node_database_pool_connections_checked_out'
+            f'{{{labels}}} 7' in lines)
+    assert (f'pantos_service_node_database_pool_connections_max'
+            f'{{{labels}}} 70' in lines)
+    assert (f'pantos_service_node_database_pool_saturation{{{labels}}} 0.1'
+            in lines)
+    assert (f'pantos_service_node_database_pool_checkout_timeouts_total'
+            f'{{{labels}}} 2' in lines)
+    assert (f'pantos_service_node_database_pool_checkout_wait_seconds_bucket'
+            f'{{{labels},le="0.001"}} 90' in lines)
+    assert (f'pantos_service_node_database_pool_checkout_wait_seconds_bucket'
+            f'{{{labels},le="+Inf"}} 100' in lines)
+    assert (f'pantos_service_node_database_pool_checkout_wait_seconds_sum'
+            f'{{{labels}}} 1.5' in lines)
+    assert (f'pantos_service_node_database_pool_checkout_wait_seconds_count'
+            f'{{{labels}}} 100' in lines)
+
+
+@unittest.mock.patch('pantos.servicenode.restapi.get_pool_metrics',
+                     side_effect=Exception)
+def test_metrics_exception(mocked_get_pool_metrics, test_client):
+    response = test_client.get('/metrics')
+
+    assert response.status_code == 500
@@ -0,0 +1,95 @@
+import datetime
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.restapi import StatisticsInteractor
+
+_HOUR = datetime.datetime(2024, 5, 1, 12, tzinfo=datetime.UTC)
+
+
+@unittest.mock.patch.object(StatisticsInteractor, 'find_transfer_statistics')
+def test_stats_correct(mocked_find_transfer_statistics, test_client):
+    mocked_find_transfer_statistics.return_value = [
+        StatisticsInteractor.TransferStatistics(_HOUR, Blockchain.ETHEREUM,
+                                                Blockchain.BNB_CHAIN,
+                                                'token_address',
+                                                TransferStatus.CONFIRMED, 3,
+                                                10**30, 3)
+    ]
+
+    response = test_client.get(
+        '/stats?hour_from=2024-05-01T00:00:00&hour_until=2024-05-02T00:00:00'
+        '%2B02:00&source_blockchain=0&destination_blockchain=1')
+
+    assert response.status_code == 200
+    assert response.json == {
+        'statistics': [{
+            'hour': '2024-05-01T12:00:00+00:00',
+            'source_blockchain_id': Blockchain.ETHEREUM.value,
+            'destination_blockchain_id': Blockchain.BNB_CHAIN.value,
+            'source_token_address': 'token_address',
+            'status': 'confirmed',
+            'transfer_count': 3,
+            'amount': 10**30,
+            'fee': 3
+        }]
+    }
+    mocked_find_transfer_statistics.assert_called_once_with(
+        StatisticsInteractor.FindTransferStatisticsRequest(
+            datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC),
+            datetime.datetime(
+                2024, 5, 2,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+            Blockchain.ETHEREUM, Blockchain.BNB_CHAIN))
+
+
+@unittest.mock.patch.object(StatisticsInteractor, 'find_transfer_statistics',
+                            return_value=[])
+def test_stats_no_parameters_correct(mocked_find_transfer_statistics,
+                                     test_client):
+    response = test_client.get('/stats')
+
+    assert response.status_code == 200
+    assert response.json == {'statistics': []}
+    mocked_find_transfer_statistics.assert_called_once_with(
+        StatisticsInteractor.FindTransferStatisticsRequest())
+
+
+@pytest.mark.parametrize('query', [
+    'hour_from=yesterday', 'source_blockchain=-1',
+    'destination_blockchain=ethereum', 'unknown=1'
+])
+@unittest.mock.patch.object(StatisticsInteractor, 'find_transfer_statistics')
+def test_stats_bad_request(mocked_find_transfer_statistics, query,
+                           test_client):
+    response = test_client.get(f'/stats?{query}')
+
+    assert response.status_code == 400
+    mocked_find_transfer_statistics.assert_not_called()
+
+
+@unittest.mock.patch.object(StatisticsInteractor, 'find_transfer_statistics',
+                            side_effect=Exception)
+def test_stats_error(mocked_find_transfer_statistics, test_client):
+    response = test_client.get('/stats')
+
+    assert response.status_code == 500
+
+
+@unittest.mock.patch.object(StatisticsInteractor, 'find_transfer_statistics')
+def test_stats_rate_limit_exceeded(mocked_find_transfer_statistics,
+                                   mocked_consume_tokens, test_client):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=2)
+
+    response = test_client.get('/stats')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    mocked_consume_tokens.assert_called_once_with('stats', ['ip:127.0.0.1'])
+    mocked_find_transfer_statistics.assert_not_called()
@@ -5,9 +5,17 @@ import flask_restful  # type: ignore
 import marshmallow
 from pantos.common.blockchains.enums import Blockchain
 
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
 from pantos.servicenode.business.transfers import SenderNonceNotUniqueError
 from pantos.servicenode.business.transfers import \
     TransferInteractorBidNotAcceptedError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorIdempotencyKeyConflictError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorInvalidSignatureError
+from pantos.servicenode.business.transfers import \
+    TransferInteractorOverloadedError
 from pantos.servicenode.restapi import TransferInteractor
 from pantos.servicenode.restapi import _TransferSchema
 
@@ -81,6 +89,121 @@ def test_transfer_bid_not_accepted_error(mocked_load, mocked_initiate_transfer,
         'bid has been rejected by service node: bid not accepted')
 
 
+@unittest.mock.patch('pantos.servicenode.restapi.not_acceptable')
+@unittest.mock.patch.object(
+    TransferInteractor, 'initiate_transfer',
+    side_effect=TransferInteractorInvalidSignatureError(
+        'sender signature is invalid'))
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_invalid_signature_error(mocked_load,
+                                          mocked_initiate_transfer,
+                                          mocked_not_acceptable, test_client,
+                                          initiate_transfer_request):
+    mocked_load.return_value = initiate_transfer_request
+    mocked_not_acceptable.side_effect = \
+        lambda error_message: flask_restful.abort(  # noqa: E731
+            406, message=error_message)
+
+    response = test_client.post('/transfer', json={})
+
+    assert response.status_code == 406
+    mocked_not_acceptable.assert_called_once_with(
+        'sender signature is invalid')
+
+
+@unittest.mock.patch.object(
+    TransferInteractor, 'initiate_transfer',
+    side_effect=TransferInteractorOverloadedError('too many pending transfers',
+                                                  retry_after=30))
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_overloaded_error(mocked_load, mocked_initiate_transfer,
+                                   test_client, initiate_transfer_request):
+    mocked_load.return_value = initiate_transfer_request
+
+    response = test_client.post('/transfer', json={})
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '30'
+    assert json.loads(response.text)['message'] == (
+        'service node has too many pending transfers on '
+        f'{initiate_transfer_request.source_blockchain.name}')
+
+
+@unittest.mock.patch('pantos.servicenode.restapi.ok_response',
+                     lambda data: data)
+@unittest.mock.patch.object(TransferInteractor, 'store_idempotent_transfer')
+@unittest.mock.patch.object(TransferInteractor, 'find_idempotent_transfer',
+                            return_value=None)
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_idempotency_key_correct(mocked_load,
+                                          mocked_find_idempotent_transfer,
+                                          mocked_store_idempotent_transfer,
+                                          test_client, uuid_,
+                                          initiate_transfer_request):
+    mocked_load.return_value = initiate_transfer_request
+    with unittest.mock.patch.object(TransferInteractor, 'initiate_transfer',
+                                    return_value=uuid_):
+        response = test_client.post('/transfer', json={},
+                                    headers={'Idempotency-Key': 'key'})
+
+    assert response.status_code == 200
+    assert json.loads(response.text)['task_id'] == str(uuid_)
+    request_hash = mocked_find_idempotent_transfer.call_args.args[1]
+    mocked_find_idempotent_transfer.assert_called_once_with(
+        'key', request_hash)
+    mocked_store_idempotent_transfer.assert_called_once_with(
+        'key', request_hash, uuid_)
+
+
+@unittest.mock.patch('pantos.servicenode.restapi.ok_response',
+                     lambda data: data)
+@unittest.mock.patch.object(TransferInteractor, 'initiate_transfer')
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_idempotency_key_replayed(mocked_load,
+                                           mocked_initiate_transfer,
+                                           test_client, uuid_):
+    with unittest.mock.patch.object(TransferInteractor,
+                                    'find_idempotent_transfer',
+                                    return_value=uuid_):
+        response = test_client.post('/transfer', json={},
+                                    headers={'Idempotency-Key': 'key'})
+
+    assert response.status_code == 200
+    assert json.loads(response.text)['task_id'] == str(uuid_)
+    mocked_load.assert_not_called()
+    mocked_initiate_transfer.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.restapi.conflict')
+@unittest.mock.patch.object(
+    TransferInteractor, 'find_idempotent_transfer',
+    side_effect=TransferInteractorIdempotencyKeyConflictError(
+        'idempotency key already used'))
+def test_transfer_idempotency_key_conflict_error(
+        mocked_find_idempotent_transfer, mocked_conflict, test_client):
+    mocked_conflict.side_effect = \
+        lambda error_message: flask_restful.abort(  # noqa: E731
+            409, message=error_message)
+
+    response = test_client.post('/transfer', json={},
+                                headers={'Idempotency-Key': 'key'})
+
+    assert response.status_code == 409
+    mocked_conflict.assert_called_once_with(
+        'Idempotency-Key has already been used for a different transfer '
+        'request')
+
+
+@unittest.mock.patch.object(TransferInteractor, 'find_idempotent_transfer')
+def test_transfer_idempotency_key_invalid(mocked_find_idempotent_transfer,
+                                          test_client):
+    response = test_client.post('/transfer', json={},
+                                headers={'Idempotency-Key': 'k' * 256})
+
+    assert response.status_code == 400
+    mocked_find_idempotent_transfer.assert_not_called()
+
+
 @unittest.mock.patch('pantos.servicenode.restapi.internal_server_error')
 @unittest.mock.patch.object(_TransferSchema, 'load', side_effect=Exception)
 def test_transfer_exception(mocked_load, mocked_internal_server_error,
@@ -93,3 +216,34 @@ def test_transfer_exception(mocked_load, mocked_internal_server_error,
 
     mocked_internal_server_error.assert_called_once_with()
     assert response.status_code == 500
+
+
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_rate_limit_exceeded(mocked_load, mocked_consume_tokens,
+                                      test_client, sender_address):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=3)
+
+    response = test_client.post('/transfer',
+                                json={'sender_address': sender_address})
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '3'
+    # The unvalidated sender address is not used for rate limiting
+    mocked_consume_tokens.assert_called_once_with('transfer', ['ip:127.0.0.1'])
+    mocked_load.assert_not_called()
+
+
+@unittest.mock.patch.object(TransferInteractor, 'initiate_transfer')
+@unittest.mock.patch.object(_TransferSchema, 'load')
+def test_transfer_sender_rate_limit_exceeded(mocked_load,
+                                             mocked_initiate_transfer,
+                                             test_client):
+    mocked_initiate_transfer.side_effect = \
+        RateLimitInteractorLimitExceededError('rate limit exceeded',
+                                              retry_after=5)
+
+    response = test_client.post('/transfer', json={})
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '5'
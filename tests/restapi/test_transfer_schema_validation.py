@@ -7,14 +7,12 @@ from pantos.common.blockchains.enums import Blockchain
 from pantos.servicenode.restapi import _TransferSchema
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
 def test_transfer_schema_correct(mocked_blockchain_client,
-                                 mocked_get_blockchain_config,
+                                 mocked_get_active_registered_blockchains,
                                  source_blockchain, destination_blockchain,
                                  sender_address, source_token_address,
                                  destination_token_address, bid_id, fee,
@@ -30,7 +28,7 @@ def test_transfer_schema_correct(mocked_blockchain_client,
 
     request = _TransferSchema().load(transfer_request)
 
-    mocked_get_blockchain_config.assert_called_once_with(source_blockchain)
+    mocked_get_active_registered_blockchains.assert_called_once()
     mocked_blockchain_client().is_valid_address.assert_has_calls(
         is_valid_address_calls)
     assert request == initiate_transfer_request
@@ -57,18 +55,12 @@ def test_transfer_schema_source_blockchain_id_not_in_supported(
     patcher.stop()
 
 
-@pytest.mark.parametrize('registered', [True, False])
-@pytest.mark.parametrize('active', [True, False])
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config')
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset())
 def test_transfer_schema_source_blockchain_id_inactive(
-        mocked_get_blockchain_config, active, registered, transfer_request,
+        mocked_get_active_registered_blockchains, transfer_request,
         inactive_blockchain_id):
-    if active and registered:
-        pytest.skip('blockchain must be inactive or service node unregistered')
-    mocked_get_blockchain_config.return_value = {
-        'active': False,
-        'registered': False
-    }
     patcher = unittest.mock.patch.dict(
         transfer_request, {'source_blockchain_id': inactive_blockchain_id})
     patcher.start()
@@ -84,16 +76,13 @@ def test_transfer_schema_source_blockchain_id_inactive(
     patcher.stop()
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
-def test_transfer_schema_sender_address_not_valid(mocked_blockchain_client,
-                                                  mocked_get_blockchain_config,
-                                                  source_blockchain,
-                                                  transfer_request):
+def test_transfer_schema_sender_address_not_valid(
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
+        source_blockchain, transfer_request):
     mocked_blockchain_client().is_valid_address.return_value = False
 
     with pytest.raises(marshmallow.ValidationError) as exc_info:
@@ -108,14 +97,12 @@ def test_transfer_schema_sender_address_not_valid(mocked_blockchain_client,
     assert exc_info.value.messages == expected_message
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
 def test_transfer_schema_recipient_address_not_valid(
-        mocked_blockchain_client, mocked_get_blockchain_config,
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
         destination_blockchain, transfer_request):
     mocked_blockchain_client().is_valid_address.return_value = True
     mocked_blockchain_client().is_valid_recipient_address.return_value = False
@@ -133,15 +120,14 @@ def test_transfer_schema_recipient_address_not_valid(
     assert exc_info.value.messages == expected_message
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
 def test_transfer_schema_source_token_address_not_valid(
-        mocked_blockchain_client, mocked_get_blockchain_config, sender_address,
-        source_token_address, transfer_request, source_blockchain):
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
+        sender_address, source_token_address, transfer_request,
+        source_blockchain):
     mocked_blockchain_client().is_valid_address.side_effect = lambda x: {
         sender_address: True,
         source_token_address: False
@@ -160,14 +146,12 @@ def test_transfer_schema_source_token_address_not_valid(
     assert exc_info.value.messages == expected_message
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
 def test_transfer_schema_destination_token_address_not_valid(
-        mocked_blockchain_client, mocked_get_blockchain_config,
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
         destination_blockchain, sender_address, source_token_address,
         destination_token_address, transfer_request):
     mocked_blockchain_client().is_valid_address.side_effect = lambda x: {
@@ -189,15 +173,13 @@ def test_transfer_schema_destination_token_address_not_valid(
     assert exc_info.value.messages == expected_message
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_config',
-                     return_value={
-                         'active': True,
-                         'registered': True
-                     })
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
 @unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
-def test_transfer_schema_amount_not_valid(mocked_blockchain_client,
-                                          mocked_get_blockchain_config,
-                                          transfer_request):
+def test_transfer_schema_amount_not_valid(
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
+        transfer_request):
     mocked_blockchain_client().is_valid_address.return_value = True
     mocked_blockchain_client().is_valid_recipient_address.return_value = True
     patcher = unittest.mock.patch.dict(transfer_request, {'amount': -1})
@@ -213,3 +195,38 @@ def test_transfer_schema_amount_not_valid(mocked_blockchain_client,
     }
     assert exc_info.value.messages == expected_message
     patcher.stop()
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
+@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
+def test_transfer_schema_valid_addresses_cached(
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
+        transfer_request, initiate_transfer_request):
+    mocked_blockchain_client().is_valid_address.return_value = True
+    mocked_blockchain_client().is_valid_recipient_address.return_value = True
+
+    _TransferSchema().load(transfer_request)
+    request = _TransferSchema().load(transfer_request)
+
+    assert mocked_blockchain_client().is_valid_address.call_count == 3
+    assert mocked_blockchain_client(
+    ).is_valid_recipient_address.call_count == 1
+    assert request == initiate_transfer_request
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.restapi.get_active_registered_blockchains',
+    return_value=frozenset(Blockchain))
+@unittest.mock.patch('pantos.servicenode.restapi.get_blockchain_client')
+def test_transfer_schema_invalid_addresses_not_cached(
+        mocked_blockchain_client, mocked_get_active_registered_blockchains,
+        transfer_request):
+    mocked_blockchain_client().is_valid_address.return_value = False
+
+    for _ in range(2):
+        with pytest.raises(marshmallow.ValidationError):
+            _TransferSchema().load(transfer_request)
+
+    assert mocked_blockchain_client().is_valid_address.call_count == 2
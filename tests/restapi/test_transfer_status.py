@@ -1,18 +1,22 @@
+import dataclasses
 import json
 import unittest.mock
 import uuid
 
 import flask_restful  # type: ignore
 import marshmallow
+import pytest
 
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
 from pantos.servicenode.business.transfers import \
     TransferInteractorResourceNotFoundError
+from pantos.servicenode.database.enums import TransferStatus
 from pantos.servicenode.restapi import TransferInteractor
+from pantos.servicenode.restapi import _remove_transfer_status_response
 from pantos.servicenode.restapi import _TransferStatusSchema
 
 
-@unittest.mock.patch('pantos.servicenode.restapi.ok_response',
-                     lambda data: data)
 @unittest.mock.patch.object(TransferInteractor, 'find_transfer')
 @unittest.mock.patch.object(_TransferStatusSchema, 'load')
 def test_transfer_status_correct(mocked_load, mocked_find_transfer,
@@ -42,6 +46,7 @@ def test_transfer_status_correct(mocked_load, mocked_find_transfer,
     response = test_client.get(f'/transfer/{uuid_}/status')
     assert response.status_code == 200
     assert json.loads(response.text) == expected_transfer_status
+    assert 'immutable' in response.headers['Cache-Control']
 
 
 @unittest.mock.patch(
@@ -83,3 +88,102 @@ def test_transfer_status_internal_error(mocked_load, test_client, uuid_):
     response = test_client.get(f'/transfer/{uuid_}/status')
 
     assert response.status_code == 500
+
+
+@unittest.mock.patch.object(TransferInteractor, 'find_transfer')
+def test_transfer_status_rate_limit_exceeded(mocked_find_transfer,
+                                             mocked_consume_tokens,
+                                             test_client, uuid_):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=2)
+
+    response = test_client.get(f'/transfer/{uuid_}/status')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    mocked_consume_tokens.assert_called_once_with('transfer_status',
+                                                  ['ip:127.0.0.1'])
+    mocked_find_transfer.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    'terminal_status',
+    [TransferStatus.CONFIRMED, TransferStatus.REVERTED, TransferStatus.FAILED])
+@unittest.mock.patch.object(TransferInteractor, 'find_transfer')
+def test_transfer_status_terminal_cached(mocked_find_transfer, terminal_status,
+                                         test_client, uuid_,
+                                         find_transfer_response,
+                                         transfer_status_response_caches):
+    mocked_find_transfer.return_value = dataclasses.replace(
+        find_transfer_response, status=terminal_status)
+    terminal_response_cache, response_cache = transfer_status_response_caches
+
+    first_response = test_client.get(f'/transfer/{uuid_}/status')
+    second_response = test_client.get(f'/transfer/{uuid_}/status')
+
+    mocked_find_transfer.assert_called_once()
+    assert first_response.status_code == 200
+    assert second_response.status_code == 200
+    assert first_response.text == second_response.text
+    assert json.loads(
+        second_response.text)['status'] == terminal_status.name.lower()
+    assert 'immutable' in second_response.headers['Cache-Control']
+    assert terminal_response_cache.get(uuid_) is not None
+    assert response_cache.get(uuid_) is None
+
+
+@pytest.mark.parametrize('non_terminal_status', [
+    TransferStatus.ACCEPTED, TransferStatus.ACCEPTED_NEW_NONCE_ASSIGNED,
+    TransferStatus.SUBMITTED
+])
+@unittest.mock.patch.object(TransferInteractor, 'find_transfer')
+def test_transfer_status_non_terminal_cached(mocked_find_transfer,
+                                             non_terminal_status, test_client,
+                                             uuid_, find_transfer_response,
+                                             transfer_status_response_caches):
+    mocked_find_transfer.return_value = dataclasses.replace(
+        find_transfer_response, status=non_terminal_status)
+    terminal_response_cache, response_cache = transfer_status_response_caches
+
+    first_response = test_client.get(f'/transfer/{uuid_}/status')
+    second_response = test_client.get(f'/transfer/{uuid_}/status')
+
+    mocked_find_transfer.assert_called_once()
+    assert first_response.text == second_response.text
+    assert json.loads(second_response.text)['status'] == \
+        non_terminal_status.to_public_status().name.lower()
+    assert 'Cache-Control' not in second_response.headers
+    assert terminal_response_cache.get(uuid_) is None
+    assert response_cache.get(uuid_) is not None
+
+
+@unittest.mock.patch('pantos.servicenode.restapi._transfer_status_responses',
+                     None)
+@unittest.mock.patch.object(TransferInteractor, 'find_transfer')
+def test_transfer_status_non_terminal_cache_disabled(mocked_find_transfer,
+                                                     test_client, uuid_,
+                                                     find_transfer_response):
+    mocked_find_transfer.return_value = dataclasses.replace(
+        find_transfer_response, status=TransferStatus.SUBMITTED)
+
+    test_client.get(f'/transfer/{uuid_}/status')
+    test_client.get(f'/transfer/{uuid_}/status')
+
+    assert mocked_find_transfer.call_count == 2
+
+
+@unittest.mock.patch.object(TransferInteractor, 'find_transfer')
+def test_transfer_status_non_terminal_cache_invalidated(
+        mocked_find_transfer, test_client, uuid_, find_transfer_response,
+        transfer_status_response_caches):
+    mocked_find_transfer.return_value = dataclasses.replace(
+        find_transfer_response, status=TransferStatus.SUBMITTED)
+    _, response_cache = transfer_status_response_caches
+
+    test_client.get(f'/transfer/{uuid_}/status')
+    _remove_transfer_status_response(uuid.UUID(uuid_),
+                                     TransferStatus.CONFIRMED)
+    test_client.get(f'/transfer/{uuid_}/status')
+
+    assert mocked_find_transfer.call_count == 2
+    assert response_cache.get(uuid_) is not None
@@ -0,0 +1,124 @@
+import json
+import unittest.mock
+import uuid
+
+import pytest
+
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.business.transfers import TransferInteractorError
+from pantos.servicenode.database.enums import TransferStatus
+from pantos.servicenode.restapi import TransferInteractor
+
+
+@pytest.mark.parametrize('next_after', [None, 12])
+@unittest.mock.patch.object(TransferInteractor, 'list_transfers')
+def test_transfers_correct(mocked_list_transfers, next_after, test_client,
+                           uuid_, source_blockchain, destination_blockchain,
+                           sender_address, recipient_address,
+                           source_token_address, destination_token_address,
+                           amount, fee, status, transfer_id, transaction_id,
+                           find_transfer_response):
+    mocked_list_transfers.return_value = \
+        TransferInteractor.ListTransfersResponse([
+            TransferInteractor.ListedTransfer(uuid.UUID(uuid_),
+                                              find_transfer_response)
+        ], next_after)
+
+    response = test_client.get(
+        f'/transfers?sender={sender_address}&status=confirmed&after=3'
+        '&limit=1')
+
+    assert response.status_code == 200
+    assert json.loads(response.text) == {
+        'transfers': [{
+            'task_id': uuid_,
+            'source_blockchain_id': source_blockchain.value,
+            'destination_blockchain_id': destination_blockchain.value,
+            'sender_address': sender_address,
+            'recipient_address': recipient_address,
+            'source_token_address': source_token_address,
+            'destination_token_address': destination_token_address,
+            'amount': amount,
+            'fee': fee,
+            'status': status.name.lower(),
+            'transfer_id': transfer_id,
+            'transaction_id': transaction_id
+        }],
+        'next': next_after
+    }
+    mocked_list_transfers.assert_called_once_with(
+        TransferInteractor.ListTransfersRequest(1, sender_address,
+                                                TransferStatus.CONFIRMED, 3))
+
+
+@unittest.mock.patch.object(TransferInteractor, 'list_transfers')
+def test_transfers_default_limit(mocked_list_transfers, test_client):
+    mocked_list_transfers.return_value = \
+        TransferInteractor.ListTransfersResponse([])
+
+    response = test_client.get('/transfers')
+
+    assert response.status_code == 200
+    assert json.loads(response.text) == {'transfers': [], 'next': None}
+    mocked_list_transfers.assert_called_once_with(
+        TransferInteractor.ListTransfersRequest(20))
+
+
+@pytest.mark.parametrize(
+    'query_param,expected_response',
+    [('limit=0', {
+        'limit': [
+            'Must be greater than or equal to 1 and less than or equal to '
+            '100.'
+        ]
+    }),
+     ('limit=101', {
+         'limit': [
+             'Must be greater than or equal to 1 and less than or equal to '
+             '100.'
+         ]
+     }), ('after=-1', {
+         'after': ['Must be greater than or equal to 0.']
+     }), ('after=abc', {
+         'after': ['Not a valid integer.']
+     }),
+     ('status=accepted_new_nonce_assigned', {
+         'status': [
+             'Must be one of: accepted, failed, submitted, reverted, '
+             'confirmed.'
+         ]
+     }), ('offset=20', {
+         'offset': ['Unknown field.']
+     })])
+@unittest.mock.patch.object(TransferInteractor, 'list_transfers')
+def test_transfers_bad_request(mocked_list_transfers, query_param,
+                               expected_response, test_client):
+    response = test_client.get(f'/transfers?{query_param}')
+
+    assert response.status_code == 400
+    assert json.loads(response.text)['message'] == expected_response
+    mocked_list_transfers.assert_not_called()
+
+
+@unittest.mock.patch.object(TransferInteractor, 'list_transfers',
+                            side_effect=TransferInteractorError(''))
+def test_transfers_interactor_error(mocked_list_transfers, test_client):
+    response = test_client.get('/transfers')
+
+    assert response.status_code == 500
+
+
+def test_transfers_rate_limit_exceeded(mocked_consume_tokens, test_client):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=2)
+
+    with unittest.mock.patch.object(TransferInteractor,
+                                    'list_transfers') as mocked_list_transfers:
+        response = test_client.get('/transfers')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    mocked_consume_tokens.assert_called_once_with('transfers',
+                                                  ['ip:127.0.0.1'])
+    mocked_list_transfers.assert_not_called()
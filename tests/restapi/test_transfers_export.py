@@ -0,0 +1,118 @@
+import datetime
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.exports import ExportFormat
+from pantos.servicenode.business.exports import ExportInteractorError
+from pantos.servicenode.business.ratelimits import \
+    RateLimitInteractorLimitExceededError
+from pantos.servicenode.restapi import ExportInteractor
+
+
+@pytest.fixture(autouse=True)
+def transfers_export_config():
+    """Enable the transfers export endpoint.
+
+    """
+    config = {'application': {'transfers_export_enabled': True}}
+    with unittest.mock.patch('pantos.servicenode.restapi.config', config):
+        yield config
+
+
+@pytest.mark.parametrize('export_format,mimetype',
+                         [('csv', 'text/csv'),
+                          ('ndjson', 'application/x-ndjson')])
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_correct(mocked_export_transfers, export_format,
+                                  mimetype, test_client):
+    mocked_export_transfers.return_value = iter(['chunk_1', 'chunk_2'])
+
+    response = test_client.get(
+        f'/transfers/export?format={export_format}'
+        '&created_from=2024-05-01T00:00:00&created_until=2024-06-01T00:00:00'
+        '%2B02:00&source_blockchain=1')
+
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+    assert response.headers['Content-Disposition'] == \
+        f'attachment; filename=transfers.{export_format}'
+    assert response.text == 'chunk_1chunk_2'
+    mocked_export_transfers.assert_called_once_with(
+        ExportInteractor.ExportTransfersRequest(
+            ExportFormat(export_format),
+            datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC),
+            datetime.datetime(
+                2024, 6, 1,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+            Blockchain(1), None))
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_default_format_correct(mocked_export_transfers,
+                                                 test_client):
+    mocked_export_transfers.return_value = iter([])
+
+    response = test_client.get('/transfers/export')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    assert response.text == ''
+    mocked_export_transfers.assert_called_once_with(
+        ExportInteractor.ExportTransfersRequest(ExportFormat.CSV))
+
+
+@pytest.mark.parametrize('query', [
+    'format=xml', 'created_from=yesterday', 'source_blockchain=2',
+    'destination_blockchain=-1', 'unknown=1'
+])
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_bad_request(mocked_export_transfers, query,
+                                      test_client):
+    response = test_client.get(f'/transfers/export?{query}')
+
+    assert response.status_code == 400
+    mocked_export_transfers.assert_not_called()
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_error(mocked_export_transfers, test_client):
+    def export_transfers(request):
+        raise ExportInteractorError('')
+        yield
+
+    mocked_export_transfers.side_effect = export_transfers
+
+    response = test_client.get('/transfers/export')
+
+    assert response.status_code == 500
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_disabled(mocked_export_transfers,
+                                   mocked_consume_tokens,
+                                   transfers_export_config, test_client):
+    transfers_export_config['application']['transfers_export_enabled'] = False
+
+    response = test_client.get('/transfers/export')
+
+    assert response.status_code == 404
+    mocked_consume_tokens.assert_not_called()
+    mocked_export_transfers.assert_not_called()
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers')
+def test_transfers_export_rate_limit_exceeded(mocked_export_transfers,
+                                              mocked_consume_tokens,
+                                              test_client):
+    mocked_consume_tokens.side_effect = RateLimitInteractorLimitExceededError(
+        'rate limit exceeded', retry_after=2)
+
+    response = test_client.get('/transfers/export')
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    mocked_consume_tokens.assert_called_once_with('transfers_export',
+                                                  ['ip:127.0.0.1'])
+    mocked_export_transfers.assert_not_called()
@@ -1,10 +1,12 @@
 import unittest.mock
 
 import pytest
+import werkzeug.middleware.proxy_fix
 from pantos.common.logging import LogFormat
 
 from pantos.servicenode.application import create_application
 from pantos.servicenode.application import initialize_application
+from pantos.servicenode.application import initialize_worker_process
 from pantos.servicenode.business.node import NodeInteractor
 
 
@@ -168,19 +170,59 @@ def test_initialize_application_initialize_logger_exception(
 
 
 @unittest.mock.patch.object(NodeInteractor, 'update_node_registrations')
+@unittest.mock.patch('pantos.servicenode.application.initialize_token_buckets')
 @unittest.mock.patch('pantos.servicenode.application.initialize_application')
 @unittest.mock.patch('pantos.servicenode.application.initialize_plugins')
 @unittest.mock.patch('pantos.servicenode.restapi.flask_app')
+@unittest.mock.patch(
+    'pantos.servicenode.application.config',
+    {'application': {
+        'max_request_body_size': 1024,
+        'trusted_proxy_count': 0
+    }})
 @unittest.mock.patch('pantos.servicenode.configuration.config')
 def test_create_application_correct(mock_config, mock_flask_app,
                                     mock_initialized_plugins,
                                     mock_initialize_application,
+                                    mock_initialize_token_buckets,
                                     mock_update_bid_registration):
+    wsgi_app = mock_flask_app.wsgi_app
+
     returned_flask_app = create_application()
 
     mock_initialize_application.assert_called_once_with(True)
     mock_update_bid_registration.assert_called_once_with()
+    mock_initialize_token_buckets.assert_called_once_with()
     assert returned_flask_app == mock_flask_app
+    assert returned_flask_app.wsgi_app is wsgi_app
+    mock_flask_app.config.__setitem__.assert_called_once_with(
+        'MAX_CONTENT_LENGTH', 1024)
+
+
+@unittest.mock.patch.object(NodeInteractor, 'update_node_registrations')
+@unittest.mock.patch('pantos.servicenode.application.initialize_token_buckets')
+@unittest.mock.patch('pantos.servicenode.application.initialize_application')
+@unittest.mock.patch('pantos.servicenode.application.initialize_plugins')
+@unittest.mock.patch('pantos.servicenode.restapi.flask_app')
+@unittest.mock.patch(
+    'pantos.servicenode.application.config',
+    {'application': {
+        'max_request_body_size': 1024,
+        'trusted_proxy_count': 2
+    }})
+@unittest.mock.patch('pantos.servicenode.configuration.config')
+def test_create_application_trusted_proxies_correct(
+        mock_config, mock_flask_app, mock_initialized_plugins,
+        mock_initialize_application, mock_initialize_token_buckets,
+        mock_update_bid_registration):
+    wsgi_app = mock_flask_app.wsgi_app
+
+    returned_flask_app = create_application()
+
+    assert isinstance(returned_flask_app.wsgi_app,
+                      werkzeug.middleware.proxy_fix.ProxyFix)
+    assert returned_flask_app.wsgi_app.app is wsgi_app
+    assert returned_flask_app.wsgi_app.x_for == 2
 
 
 @unittest.mock.patch.object(NodeInteractor, 'update_node_registrations',
@@ -193,3 +235,46 @@ def test_create_application_unable_to_update_node_registration(
         mock_update_node_registration):
     with pytest.raises(SystemExit):
         create_application()
+
+
+@pytest.mark.parametrize('replica_configured', [True, False])
+@unittest.mock.patch(
+    'pantos.servicenode.application.initialize_blockchain_clients')
+@unittest.mock.patch('pantos.servicenode.application.get_replica_engine')
+@unittest.mock.patch('pantos.servicenode.application.get_engine')
+def test_initialize_worker_process_correct(mock_get_engine,
+                                           mock_get_replica_engine,
+                                           mock_initialize_blockchain_clients,
+                                           replica_configured):
+    mock_replica_engine = unittest.mock.MagicMock()
+    mock_get_replica_engine.return_value = (mock_replica_engine
+                                            if replica_configured else None)
+
+    initialize_worker_process()
+
+    mock_get_engine().dispose.assert_called_once_with(close=False)
+    if replica_configured:
+        mock_replica_engine.dispose.assert_called_once_with(close=False)
+    mock_initialize_blockchain_clients.assert_called_once()
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.application.initialize_blockchain_clients')
+@unittest.mock.patch('pantos.servicenode.application.get_engine',
+                     side_effect=Exception)
+def test_initialize_worker_process_database_error(
+        mock_get_engine, mock_initialize_blockchain_clients):
+    with pytest.raises(SystemExit):
+        initialize_worker_process()
+
+    mock_initialize_blockchain_clients.assert_not_called()
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.application.initialize_blockchain_clients',
+    side_effect=Exception)
+@unittest.mock.patch('pantos.servicenode.application.get_engine')
+def test_initialize_worker_process_blockchain_clients_error(
+        mock_get_engine, mock_initialize_blockchain_clients):
+    with pytest.raises(SystemExit):
+        initialize_worker_process()
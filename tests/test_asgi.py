@@ -0,0 +1,230 @@
+import asyncio
+import json
+import threading
+import unittest.mock
+
+import flask
+import pytest
+
+from pantos.servicenode import asgi
+
+_test_app = flask.Flask(__name__)
+
+
+@_test_app.route('/echo', methods=['GET', 'POST'])
+def _echo():
+    response = flask.jsonify({
+        'method': flask.request.method,
+        'path': flask.request.path,
+        'args': flask.request.args,
+        'body': flask.request.get_data(as_text=True),
+        'header': flask.request.headers.get('Idempotency-Key'),
+        'remote_addr': flask.request.remote_addr
+    })
+    response.headers['Retry-After'] = '3'
+    return response, 201
+
+
+def _call_application(scope, messages):
+    received_messages = list(messages)
+    sent_messages = []
+
+    async def receive():
+        return received_messages.pop(0)
+
+    async def send(message):
+        sent_messages.append(message)
+
+    asyncio.run(asgi.application(scope, receive, send))
+    return sent_messages
+
+
+def _http_scope(method, path, query_string=b'', headers=None):
+    return {
+        'type': 'http',
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'query_string': query_string,
+        'root_path': '',
+        'headers': [] if headers is None else headers,
+        'client': ('127.0.0.1', 12345),
+        'server': ('localhost', 8080)
+    }
+
+
+@_test_app.route('/stream')
+def _stream():
+    return flask.Response((chunk for chunk in [b'a', b'b']),
+                          mimetype='text/plain')
+
+
+_concurrent_requests_barrier = threading.Barrier(2, timeout=5)
+
+
+@_test_app.route('/concurrent')
+def _concurrent():
+    # Only passed if both requests are handled at the same time
+    _concurrent_requests_barrier.wait()
+    return flask.jsonify(threading.current_thread().name)
+
+
+@pytest.fixture(autouse=True)
+def flask_app():
+    with unittest.mock.patch('pantos.servicenode.asgi._flask_app', None), \
+            unittest.mock.patch('pantos.servicenode.asgi._flask_app_lock',
+                                None), \
+            unittest.mock.patch('pantos.servicenode.asgi.config',
+                                {'application': {
+                                    'max_request_body_size': 16
+                                }}):
+        yield
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application')
+def test_health_live_correct(mocked_create_application):
+    sent_messages = _call_application(_http_scope('GET', '/health/live'), [])
+
+    assert sent_messages[0]['status'] == 200
+    assert sent_messages[1]['body'] == b'null\n'
+    mocked_create_application.assert_not_called()
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_http_request_correct(mocked_create_application):
+    scope = _http_scope('POST', '/echo', b'a=1',
+                        [(b'content-type', b'application/json'),
+                         (b'idempotency-key', b'key')])
+    messages = [{
+        'type': 'http.request',
+        'body': b'{"x":',
+        'more_body': True
+    }, {
+        'type': 'http.request',
+        'body': b' 1}',
+        'more_body': False
+    }]
+
+    sent_messages = _call_application(scope, messages)
+
+    assert sent_messages[0]['type'] == 'http.response.start'
+    assert sent_messages[0]['status'] == 201
+    headers = dict(sent_messages[0]['headers'])
+    assert headers[b'retry-after'] == b'3'
+    assert headers[b'content-length'] == str(len(
+        sent_messages[1]['body'])).encode()
+    assert json.loads(sent_messages[1]['body']) == {
+        'method': 'POST',
+        'path': '/echo',
+        'args': {
+            'a': '1'
+        },
+        'body': '{"x": 1}',
+        'header': 'key',
+        'remote_addr': '127.0.0.1'
+    }
+    mocked_create_application.assert_called_once()
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_http_request_not_found(mocked_create_application):
+    sent_messages = _call_application(_http_scope('GET', '/unknown'), [{
+        'type': 'http.request',
+        'body': b''
+    }])
+
+    assert sent_messages[0]['status'] == 404
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_lifespan_correct(mocked_create_application):
+    sent_messages = _call_application({'type': 'lifespan'}, [{
+        'type': 'lifespan.startup'
+    }, {
+        'type': 'lifespan.shutdown'
+    }])
+
+    assert [message['type'] for message in sent_messages
+            ] == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    mocked_create_application.assert_called_once()
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     side_effect=SystemExit(1))
+def test_lifespan_startup_failed(mocked_create_application):
+    sent_messages = _call_application({'type': 'lifespan'}, [{
+        'type': 'lifespan.startup'
+    }])
+
+    assert sent_messages[0]['type'] == 'lifespan.startup.failed'
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_http_request_streamed_response(mocked_create_application):
+    sent_messages = _call_application(_http_scope('GET', '/stream'), [{
+        'type': 'http.request',
+        'body': b''
+    }])
+
+    assert sent_messages[0]['status'] == 200
+    assert b'content-length' not in dict(sent_messages[0]['headers'])
+    assert [message.get('body', b'')
+            for message in sent_messages[1:]] == [b'a', b'b', b'']
+
+
+@pytest.mark.parametrize('headers, messages',
+                         [([(b'content-length', b'17')], []),
+                          ([], [{
+                              'type': 'http.request',
+                              'body': b'x' * 10,
+                              'more_body': True
+                          }, {
+                              'type': 'http.request',
+                              'body': b'x' * 7,
+                              'more_body': False
+                          }])])
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_http_request_body_too_large(mocked_create_application, headers,
+                                     messages):
+    sent_messages = _call_application(
+        _http_scope('POST', '/echo', headers=headers), messages)
+
+    assert sent_messages[0]['status'] == 413
+    assert len(sent_messages) == 2
+
+
+@unittest.mock.patch('pantos.servicenode.asgi.create_application',
+                     return_value=_test_app)
+def test_http_requests_concurrent(mocked_create_application):
+    async def call_application():
+        received_messages = [{'type': 'http.request', 'body': b''}]
+        sent_messages = []
+
+        async def receive():
+            return received_messages.pop(0)
+
+        async def send(message):
+            sent_messages.append(message)
+
+        await asgi.application(_http_scope('GET', '/concurrent'), receive,
+                               send)
+        return sent_messages
+
+    async def call_application_concurrently():
+        return await asyncio.gather(call_application(), call_application())
+
+    _concurrent_requests_barrier.reset()
+    sent_messages = asyncio.run(call_application_concurrently())
+
+    assert [messages[0]['status'] for messages in sent_messages] == [200, 200]
+    thread_names = {
+        json.loads(messages[1]['body'])
+        for messages in sent_messages
+    }
+    assert len(thread_names) == 2
@@ -0,0 +1,58 @@
+import unittest.mock
+
+from pantos.servicenode.cache import LruCache
+
+
+def test_lru_cache_get_correct():
+    cache: LruCache[str, int] = LruCache(2)
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LruCache[str, int] = LruCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert len(cache) == 2
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+@unittest.mock.patch('pantos.servicenode.cache.time')
+def test_lru_cache_entry_expired(mocked_time):
+    cache: LruCache[str, int] = LruCache(2, time_to_live=10)
+    mocked_time.monotonic.return_value = 100
+    cache.set('a', 1)
+
+    mocked_time.monotonic.return_value = 109
+    assert cache.get('a') == 1
+    mocked_time.monotonic.return_value = 110
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_remove_correct():
+    cache: LruCache[str, int] = LruCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.remove('a')
+    cache.remove('unknown')
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+
+def test_lru_cache_clear_correct():
+    cache: LruCache[str, int] = LruCache(2)
+    cache.set('a', 1)
+
+    cache.clear()
+
+    assert len(cache) == 0
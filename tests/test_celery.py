@@ -1,8 +1,12 @@
+import logging
 import unittest.mock
 
 import pytest
 from pantos.common.logging import LogFormat
 
+from pantos.servicenode.database.pools import PoolMetrics
+from pantos.servicenode.database.pools import ProcessRole
+
 
 @pytest.mark.parametrize('file_enabled', [True, False])
 @pytest.mark.parametrize('console_enabled', [True, False])
@@ -72,3 +76,46 @@ def test_setup_logger_initialize_logger_exception(mocked_config,
 
     with pytest.raises(SystemExit):
         setup_logger(mocked_logger)
+
+
+@pytest.mark.parametrize(
+    'queue_names,pool_cls,process_role,process_concurrency',
+    [(['transfers', 'bids', 'transactions', 'maintenance'
+       ], 'prefork', ProcessRole.TRANSFER_WORKER, 1),
+     (['bids'], 'prefork', ProcessRole.BID_WORKER, 1),
+     (['bids'], 'threads', ProcessRole.BID_WORKER, 4),
+     (['transfers'], 'solo', ProcessRole.TRANSFER_WORKER, 1)])
+@unittest.mock.patch('pantos.servicenode.celery._start_pool_metrics_logging')
+@unittest.mock.patch('pantos.servicenode.celery.initialize_pools')
+def test_initialize_worker_pools_correct(mocked_initialize_pools,
+                                         mocked_start_pool_metrics_logging,
+                                         queue_names, pool_cls, process_role,
+                                         process_concurrency):
+    from pantos.servicenode.celery import initialize_worker_pools
+    sender = unittest.mock.MagicMock(pool_cls=pool_cls, concurrency=4)
+    sender.app.amqp.queues.consume_from = {
+        queue_name: unittest.mock.MagicMock()
+        for queue_name in queue_names
+    }
+
+    initialize_worker_pools(sender)
+
+    mocked_initialize_pools.assert_called_once_with(process_role,
+                                                    process_concurrency)
+    assert mocked_start_pool_metrics_logging.called == (pool_cls != 'prefork')
+
+
+@unittest.mock.patch('pantos.servicenode.celery.get_pool_metrics')
+def test_log_pool_metrics_correct(mocked_get_pool_metrics, caplog):
+    from pantos.servicenode.celery import _log_pool_metrics
+    mocked_get_pool_metrics.return_value = {
+        'primary': PoolMetrics(1, 1, 1, 4, 0, 0.2,
+                               (4, 4, 4, 4, 4, 4, 4, 4, 4, 4))
+    }
+
+    with caplog.at_level(logging.INFO, logger='pantos.servicenode.celery'):
+        _log_pool_metrics()
+
+    assert ('database pool primary: 1 of 2 connections checked out '
+            '(saturation 0.50), 4 checkouts (mean wait time 0.0500 s), 0 '
+            'checkout timeouts') in caplog.text
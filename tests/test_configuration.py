@@ -1,9 +1,11 @@
 import unittest.mock
 
+import pytest
 from pantos.common.blockchains.enums import Blockchain
 
 from pantos.servicenode.configuration import _DEFAULT_FILE_NAME
 from pantos.servicenode.configuration import Config
+from pantos.servicenode.configuration import get_active_registered_blockchains
 from pantos.servicenode.configuration import get_blockchain_config
 from pantos.servicenode.configuration import get_blockchains_rpc_nodes
 from pantos.servicenode.configuration import get_plugin_config
@@ -93,3 +95,43 @@ def test_get_blockchain_rpc_nodes_with_fallback_providers_correct(
     }
 
     assert expected_rpc_nodes == get_blockchains_rpc_nodes()
+
+
+@pytest.mark.parametrize('registered', [True, False])
+@pytest.mark.parametrize('active', [True, False])
+@unittest.mock.patch(
+    'pantos.servicenode.configuration._active_registered_blockchains', None)
+@unittest.mock.patch('pantos.servicenode.configuration.get_blockchain_config')
+def test_get_active_registered_blockchains_correct(
+        mocked_get_blockchain_config, active, registered):
+    mocked_get_blockchain_config.side_effect = lambda blockchain: {
+        'active': active or blockchain is Blockchain.ETHEREUM,
+        'registered': registered or blockchain is Blockchain.ETHEREUM
+    }
+
+    blockchains = get_active_registered_blockchains()
+
+    assert blockchains == (frozenset(Blockchain) if active and registered else
+                           frozenset({Blockchain.ETHEREUM}))
+
+
+@unittest.mock.patch(
+    'pantos.servicenode.configuration._active_registered_blockchains', None)
+@unittest.mock.patch('pantos.servicenode.configuration.get_blockchain_config',
+                     return_value={
+                         'active': True,
+                         'registered': True
+                     })
+def test_get_active_registered_blockchains_refreshed_on_reload(
+        mocked_get_blockchain_config):
+    config_mock = Config(_DEFAULT_FILE_NAME)
+    with unittest.mock.patch('pantos.servicenode.configuration.config',
+                             config_mock):
+        get_active_registered_blockchains()
+        get_active_registered_blockchains()
+        calls_before_reload = mocked_get_blockchain_config.call_count
+        load_config()
+        get_active_registered_blockchains()
+
+    assert calls_before_reload == 2 * len(Blockchain)
+    assert mocked_get_blockchain_config.call_count == 4 * len(Blockchain)
@@ -0,0 +1,75 @@
+import datetime
+import unittest.mock
+
+import pytest
+from pantos.common.blockchains.enums import Blockchain
+
+from pantos.servicenode.business.exports import ExportFormat
+from pantos.servicenode.export import ExportInteractor
+from pantos.servicenode.export import main
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers',
+                            return_value=iter(['chunk_1', 'chunk_2']))
+@unittest.mock.patch('pantos.servicenode.export.initialize_database_package')
+@unittest.mock.patch('pantos.servicenode.export.load_config')
+def test_main_correct(mocked_load_config, mocked_initialize_database_package,
+                      mocked_export_transfers, tmp_path):
+    output_path = tmp_path / 'transfers.ndjson'
+
+    exit_status = main([
+        '--format', 'ndjson', '--created-from', '2024-05-01',
+        '--source-blockchain', 'bnb_chain', '--destination-blockchain', '0',
+        '--output',
+        str(output_path)
+    ])
+
+    assert exit_status == 0
+    assert output_path.read_text() == 'chunk_1chunk_2'
+    mocked_initialize_database_package.assert_called_once_with(False)
+    mocked_export_transfers.assert_called_once_with(
+        ExportInteractor.ExportTransfersRequest(
+            ExportFormat.NDJSON,
+            datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC), None,
+            Blockchain.BNB_CHAIN, Blockchain.ETHEREUM))
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers',
+                            return_value=iter(['chunk']))
+@unittest.mock.patch('pantos.servicenode.export.initialize_database_package')
+@unittest.mock.patch('pantos.servicenode.export.load_config')
+def test_main_standard_output_correct(mocked_load_config,
+                                      mocked_initialize_database_package,
+                                      mocked_export_transfers, capsys):
+    exit_status = main([])
+
+    assert exit_status == 0
+    assert capsys.readouterr().out == 'chunk'
+    mocked_export_transfers.assert_called_once_with(
+        ExportInteractor.ExportTransfersRequest(ExportFormat.CSV))
+
+
+@unittest.mock.patch.object(ExportInteractor, 'export_transfers',
+                            side_effect=Exception)
+@unittest.mock.patch('pantos.servicenode.export.initialize_database_package')
+@unittest.mock.patch('pantos.servicenode.export.load_config')
+def test_main_export_error(mocked_load_config,
+                           mocked_initialize_database_package,
+                           mocked_export_transfers):
+    assert main([]) == 1
+
+
+@unittest.mock.patch('pantos.servicenode.export.initialize_database_package',
+                     side_effect=Exception)
+@unittest.mock.patch('pantos.servicenode.export.load_config')
+def test_main_initialization_error(mocked_load_config,
+                                   mocked_initialize_database_package):
+    assert main([]) == 1
+
+
+@pytest.mark.parametrize(
+    'arguments', [['--format', 'xml'], ['--source-blockchain', 'unknown'],
+                  ['--created-until', 'yesterday']])
+def test_main_invalid_arguments(arguments):
+    with pytest.raises(SystemExit):
+        main(arguments)
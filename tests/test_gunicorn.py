@@ -0,0 +1,16 @@
+import unittest.mock
+
+import pytest
+
+from pantos.servicenode.gunicorn import post_fork
+
+
+@pytest.mark.parametrize('preload_app', [True, False])
+@unittest.mock.patch('pantos.servicenode.gunicorn.initialize_worker_process')
+def test_post_fork_correct(mock_initialize_worker_process, preload_app):
+    server = unittest.mock.MagicMock()
+    server.cfg.preload_app = preload_app
+
+    post_fork(server, unittest.mock.MagicMock())
+
+    assert mock_initialize_worker_process.call_count == int(preload_app)